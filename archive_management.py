@@ -27,9 +27,14 @@ import dvdarch_utils
 import QTPYGUI.file_utils as file_utils
 import sys_consts
 
-from break_circular import Task_Def
-from dvdarch_utils import Get_File_Encoding_Info
-from sys_config import Video_Data
+from break_circular import PRIORITY_BACKGROUND, Task_Def
+from dvdarch_utils import (
+    FFV1_Fan_Out_Output,
+    Fan_Out_Output,
+    Get_File_Encoding_Info,
+    H26x_Fan_Out_Output,
+)
+from sys_config import Encoding_Details, Video_Data
 from QTPYGUI.utils import Text_To_File_Name, Get_Unique_Id
 
 from background_task_manager import Task_Dispatcher, Unpack_Result_Tuple
@@ -56,6 +61,169 @@ ARCHIVING_PREFIX: Final[str] = "AM_AR"
 DEBUG: Final[bool] = False
 
 
+def Streaming_Transcode_Needed(encoding_info: Encoding_Details) -> bool:
+    """
+    Works out if a source video has to be transcoded to H.264 for streaming, rather than copied
+
+    Args:
+        encoding_info (Encoding_Details): The encoding details of the source video
+
+    Returns:
+        bool: True if the source video has to be transcoded
+    """
+    assert isinstance(encoding_info, Encoding_Details), (
+        f"{encoding_info=}. Must be Encoding_Details"
+    )
+
+    return (
+        encoding_info.all_I_frames or "h264" not in encoding_info.video_format.lower()
+    )
+
+
+def Master_Transcode_Needed(
+    encoding_info: Encoding_Details, transcode_type: str
+) -> bool:
+    """
+    Works out if a source video has to be transcoded to make its preservation master, rather than copied
+
+    Args:
+        encoding_info (Encoding_Details): The encoding details of the source video
+        transcode_type (str): The preservation master transcode type, a sys_consts.TRANSCODE_ constant
+
+    Returns:
+        bool: True if the source video has to be transcoded
+    """
+    assert isinstance(encoding_info, Encoding_Details), (
+        f"{encoding_info=}. Must be Encoding_Details"
+    )
+    assert isinstance(transcode_type, str), f"{transcode_type=}. Must be str"
+
+    if transcode_type == sys_consts.TRANSCODE_FFV1ARCHIVAL:
+        return True
+
+    if transcode_type in (sys_consts.TRANSCODE_H264, sys_consts.TRANSCODE_H265):
+        return (
+            encoding_info.all_I_frames
+            and (
+                (
+                    "h264" not in encoding_info.video_format.lower()
+                    and transcode_type == sys_consts.TRANSCODE_H264
+                )
+                or (
+                    "h265" not in encoding_info.video_format.lower()
+                    and transcode_type == sys_consts.TRANSCODE_H265
+                )
+            )
+        ) or not encoding_info.all_I_frames
+
+    return False
+
+
+def Archive_Fan_Out_Outputs(
+    video_data: Video_Data, transcode_type: str, output_folder: str
+) -> list[Fan_Out_Output]:
+    """
+    Makes the Transcode_Fan_Out outputs of the streaming and preservation master encodes archive_dvd_build would do
+    for a source video, so they can be encoded from the same decode as its DVD VOB. A copied file has no output
+
+    Args:
+        video_data (Video_Data): The source video
+        transcode_type (str): The preservation master transcode type, a sys_consts.TRANSCODE_ constant
+        output_folder (str): The folder the outputs are encoded into, each in a STREAMING or PRESERVATION_MASTER
+            sub folder
+
+    Returns:
+        list[Fan_Out_Output]: The outputs, named STREAMING and PRESERVATION_MASTER. Empty if there are none or the
+        source video or sub folders are unusable, archive_dvd_build then encodes the source itself
+    """
+    assert isinstance(video_data, Video_Data), (
+        f"{video_data=}. Must be instance of Video_Data"
+    )
+    assert isinstance(transcode_type, str), f"{transcode_type=}. Must be str"
+    assert isinstance(output_folder, str) and output_folder.strip() != "", (
+        f"{output_folder=}. Must be a non-empty str"
+    )
+
+    file_handler = file_utils.File()
+    encoding_info = Get_File_Encoding_Info(video_data.video_path)
+
+    if encoding_info.error:
+        return []
+
+    fan_out_outputs = []
+
+    if Streaming_Transcode_Needed(encoding_info):
+        fan_out_outputs.append(
+            H26x_Fan_Out_Output(
+                name=STREAMING,
+                input_file=video_data.video_path,
+                output_folder=file_handler.file_join(output_folder, STREAMING),
+                width=encoding_info.video_width,
+                height=encoding_info.video_height,
+                frame_rate=encoding_info.video_frame_rate,
+                interlaced=encoding_info.video_scan_type.lower() == "interlaced",
+                bottom_field_first=encoding_info.video_scan_order.lower() == "bff",
+                h265=False,
+                high_quality=True,
+                black_border=True,
+                auto_bright=video_data.video_file_settings.auto_bright,
+                normalise=video_data.video_file_settings.normalise,
+                white_balance=video_data.video_file_settings.white_balance,
+                denoise=video_data.video_file_settings.denoise,
+                sharpen=video_data.video_file_settings.sharpen,
+                filters_off=video_data.video_file_settings.filters_off,
+                normalise_audio=True,
+            )
+        )
+
+    if Master_Transcode_Needed(encoding_info, transcode_type):
+        if transcode_type == sys_consts.TRANSCODE_FFV1ARCHIVAL:
+            fan_out_outputs.append(
+                FFV1_Fan_Out_Output(
+                    name=PRESERVATION_MASTER,
+                    input_file=video_data.video_path,
+                    output_folder=file_handler.file_join(
+                        output_folder, PRESERVATION_MASTER
+                    ),
+                    width=video_data.encoding_info.video_width,
+                    height=video_data.encoding_info.video_height,
+                    frame_rate=video_data.encoding_info.video_frame_rate,
+                )
+            )
+        else:
+            fan_out_outputs.append(
+                H26x_Fan_Out_Output(
+                    name=PRESERVATION_MASTER,
+                    input_file=video_data.video_path,
+                    output_folder=file_handler.file_join(
+                        output_folder, PRESERVATION_MASTER
+                    ),
+                    width=encoding_info.video_width,
+                    height=encoding_info.video_height,
+                    frame_rate=encoding_info.video_frame_rate,
+                    interlaced=encoding_info.video_scan_type.lower() == "interlaced",
+                    bottom_field_first=encoding_info.video_scan_order.lower() == "bff",
+                    h265=transcode_type == sys_consts.TRANSCODE_H265,
+                    high_quality=True,
+                    iframe_only=True,
+                    encode_10bit=True,
+                    mkv_container=True,
+                    black_border=False,
+                )
+            )
+
+    for fan_out_output in fan_out_outputs:
+        output_path, _, _ = file_handler.split_file_path(fan_out_output.output_file)
+
+        if (
+            not file_handler.path_exists(output_path)
+            and file_handler.make_dir(output_path) == -1
+        ):
+            return []
+
+    return fan_out_outputs
+
+
 @dataclasses.dataclass
 class Archive_Manager:
     """Manages archiving of video artefacts - dvd_image, video source files etc"""
@@ -64,6 +232,7 @@ class Archive_Manager:
     streaming_folder: str = ""
     archive_size: str = sys_consts.DVD_ARCHIVE_SIZE
     transcode_type: str = sys_consts.TRANSCODE_NONE
+    chunked_encode: bool = False  # Long videos are encoded in chunks at the same time
 
     # Private instance variables
     _error_messages: list[str] = dataclasses.field(default_factory=list)
@@ -112,6 +281,9 @@ class Archive_Manager:
             f"{self.transcode_type=}, Must be Be TRANSCODE_NONE |"
             " TRANSCODE_FFV1ARCHIVAL | TRANSCODE_H264 | TRANSCODE_H265"
         )
+        assert isinstance(self.chunked_encode, bool), (
+            f"{self.chunked_encode=}. Must be bool"
+        )
 
         self._session_id: str = Get_Unique_Id()
 
@@ -352,6 +524,7 @@ class Archive_Manager:
         iso_folder: str,
         menu_layout: list[tuple[str, list[Video_Data]]],
         overwrite_existing: bool = True,
+        encoded_files: dict[str, dict[str, str]] | None = None,
     ) -> tuple[int, str]:
         """
         Archives a DVD build and its source video files.
@@ -363,6 +536,9 @@ class Archive_Manager:
             menu_layout (list[tuple[str, list[Video_Data]]]): A list of tuples (menu title,Video_Data) representing the
             DVD folder/file names
             overwrite_existing (bool): Whether to overwrite existing DVD backup folder
+            encoded_files (dict[str, dict[str, str]] | None): The streaming and preservation master files already
+            encoded from a source video by a fan out encode, keyed by source video path and then STREAMING or
+            PRESERVATION_MASTER. These are copied rather than encoded again. Defaults to None
 
         Returns:
             tuple(int,str)
@@ -371,6 +547,57 @@ class Archive_Manager:
         """
 
         ##### Helper functions
+        def _copy_encoded_file(source: str, destination_path: str) -> tuple[int, str]:
+            """Copies a file encoded by a fan out encode into the archive
+
+            Args:
+                source (str): The encoded file
+                destination_path (str): The file path it is copied to
+
+            Returns:
+                tuple[int, str]:
+                    - arg 1: 1 if ok, -1 if error
+                    - arg 2: The destination file path if ok, otherwise an error message
+            """
+            result, message = self._file_handler.copy_file(
+                source=source, destination_path=destination_path
+            )
+
+            if result == -1:
+                return -1, message
+
+            return 1, destination_path
+
+        def _playlist_remux_file(
+            playlist_file: str, output_folder: str, output_name: str
+        ) -> str:
+            """Works out the video file an ffconcat playlist is remuxed to, in the container of its source file
+
+            Args:
+                playlist_file (str): The ffconcat playlist
+                output_folder (str): The folder the video file is written to
+                output_name (str): The video file name, without an extension
+
+            Returns:
+                str: The video file or an empty string if the playlist has no source file, the error is recorded
+            """
+            source_file = dvdarch_utils.Playlist_Source_File(playlist_file)
+
+            if not source_file:
+                message = f"No Source File In Playlist {sys_consts.SDELIM}{playlist_file}{sys_consts.SDELIM}"
+
+                self._errored = True
+                self._error_code = -1
+                self._error_message = message
+                self._error_messages.append(message)
+                return ""
+
+            _, _, source_extension = self._file_handler.split_file_path(source_file)
+
+            return self._file_handler.file_join(
+                output_folder, output_name, source_extension
+            )
+
         def _get_video_file_paths(
             preservation_master_folder: str, streaming_folder: str
         ) -> list[dict[str, dict[str, Any]]]:
@@ -834,39 +1061,57 @@ class Archive_Manager:
             task_def = Task_Def(
                 task_id=task_id,
                 task_prefix=task_prefix,
+                priority=PRIORITY_BACKGROUND,
             )
 
-            if (
-                encoding_info.all_I_frames
-                or "h264" not in encoding_info.video_format.lower()
-            ):  # Check if we need to transcode
-                task_def.worker_function = dvdarch_utils.Transcode_H26x
-                task_def.kwargs = {
-                    "input_file": video_data.video_path,
-                    "output_folder": streaming_menu_path,
-                    "width": encoding_info.video_width,
-                    "height": encoding_info.video_height,
-                    "frame_rate": encoding_info.video_frame_rate,
-                    "interlaced": (
-                        True
-                        if encoding_info.video_scan_type.lower() == "interlaced"
-                        else False
-                    ),
-                    "bottom_field_first": (
-                        True
-                        if encoding_info.video_scan_order.lower() == "bff"
-                        else False
-                    ),
-                    "h265": False,
-                    "high_quality": True,
-                    "black_border": True,
-                    "auto_bright": video_data.video_file_settings.auto_bright,
-                    "normalise": video_data.video_file_settings.normalise,
-                    "white_balance": video_data.video_file_settings.white_balance,
-                    "denoise": video_data.video_file_settings.denoise,
-                    "sharpen": video_data.video_file_settings.sharpen,
-                    "filters_off": video_data.video_file_settings.filters_off,
-                }
+            encoded_file = encoded_files.get(video_data.video_path, {}).get(
+                STREAMING, ""
+            )
+
+            if encoded_file or Streaming_Transcode_Needed(encoding_info):
+                if encoded_file:  # Already encoded along with the DVD VOB
+                    _, encoded_file_name, _ = self._file_handler.split_file_path(
+                        encoded_file
+                    )
+
+                    task_def.worker_function = _copy_encoded_file
+                    task_def.kwargs = {
+                        "source": encoded_file,
+                        "destination_path": self._file_handler.file_join(
+                            streaming_menu_path, encoded_file_name, file_extension
+                        ),
+                    }
+                else:
+                    task_def.worker_function = dvdarch_utils.Transcode_H26x
+                    task_def.kwargs = {
+                        "input_file": video_data.video_path,
+                        "output_folder": streaming_menu_path,
+                        "width": encoding_info.video_width,
+                        "height": encoding_info.video_height,
+                        "frame_rate": encoding_info.video_frame_rate,
+                        "duration": encoding_info.video_duration,
+                        "interlaced": (
+                            True
+                            if encoding_info.video_scan_type.lower() == "interlaced"
+                            else False
+                        ),
+                        "bottom_field_first": (
+                            True
+                            if encoding_info.video_scan_order.lower() == "bff"
+                            else False
+                        ),
+                        "h265": False,
+                        "high_quality": True,
+                        "black_border": True,
+                        "auto_bright": video_data.video_file_settings.auto_bright,
+                        "normalise": video_data.video_file_settings.normalise,
+                        "white_balance": video_data.video_file_settings.white_balance,
+                        "denoise": video_data.video_file_settings.denoise,
+                        "sharpen": video_data.video_file_settings.sharpen,
+                        "filters_off": video_data.video_file_settings.filters_off,
+                        "normalise_audio": True,
+                        "chunked": self.chunked_encode,
+                    }
 
                 task_def.cargo = {
                     OP_TYPE: OP_STREAMING,
@@ -918,17 +1163,51 @@ class Archive_Manager:
                 ]
 
             else:  # Copy
-                streaming_file = self._file_handler.file_join(
-                    streaming_menu_path,
-                    button_file_name,
-                    file_extension,
-                )
+                # A playlist only points into its source, so it is remuxed rather than copied
+                if video_data.video_path.lower().endswith(
+                    f".{sys_consts.FFCONCAT_EXTN}"
+                ):
+                    _, playlist_name, _ = self._file_handler.split_file_path(
+                        video_data.video_path
+                    )
+                    streaming_file = _playlist_remux_file(
+                        video_data.video_path, streaming_menu_path, playlist_name
+                    )
 
-                task_def.worker_function = self._file_handler.copy_file
-                task_def.kwargs = {
-                    "source": video_data.video_path,
-                    "destination_path": streaming_file,
-                }
+                    if not streaming_file:
+                        return None, []
+
+                    _, _, file_extension = self._file_handler.split_file_path(
+                        streaming_file
+                    )
+
+                    task_def.worker_function = dvdarch_utils.Remux_Video_Playlist
+                    task_def.kwargs = {
+                        "playlist_file": video_data.video_path,
+                        "output_file": streaming_file,
+                    }
+
+                    task_def.cargo = {
+                        OP_TYPE: OP_STREAMING,
+                        "task_def": task_def,
+                        "output_file": "",
+                        "streaming_menu_path": streaming_menu_path,
+                        "streaming_path": streaming_path,
+                        "button_file_name": button_file_name,
+                        "file_extension": file_extension,
+                    }
+                else:
+                    streaming_file = self._file_handler.file_join(
+                        streaming_menu_path,
+                        button_file_name,
+                        file_extension,
+                    )
+
+                    task_def.worker_function = self._file_handler.copy_file
+                    task_def.kwargs = {
+                        "source": video_data.video_path,
+                        "destination_path": streaming_file,
+                    }
 
                 return task_def, [
                     {
@@ -1017,6 +1296,7 @@ class Archive_Manager:
             task_def = Task_Def(
                 task_id=task_id,
                 task_prefix=task_prefix,
+                priority=PRIORITY_BACKGROUND,
                 cargo={
                     OP_TYPE: TRANSCODE,
                     "preservation_master_path": preservation_master_path,
@@ -1026,20 +1306,104 @@ class Archive_Manager:
                 },
             )
 
-            if self.transcode_type == sys_consts.TRANSCODE_NONE:
-                video_dir, video_file, video_extension = (
-                    self._file_handler.split_file_path(video_data.video_path)
+            encoded_file = encoded_files.get(video_data.video_path, {}).get(
+                PRESERVATION_MASTER, ""
+            )
+
+            if encoded_file:  # Already encoded along with the DVD VOB
+                _, encoded_file_name, encoded_file_extension = (
+                    self._file_handler.split_file_path(encoded_file)
                 )
                 output_file = self._file_handler.file_join(
-                    preservation_master_path, video_file, video_extension
+                    preservation_master_path, encoded_file_name, encoded_file_extension
                 )
 
                 task_def.worker_function = self._file_handler.copy_file
                 task_def.kwargs = {
-                    "source": video_data.video_path,
+                    "source": encoded_file,
                     "destination_path": output_file,
                 }
 
+                task_def.cargo[OP_TYPE] = TRANSCOPY
+                task_def.cargo["output_file"] = output_file
+                task_def.cargo["file_extension"] = encoded_file_extension
+
+                return (
+                    task_def,
+                    [
+                        {
+                            "task_dispatch_name": f"{task_dispatcher_name}_{button_index}",
+                            "callback": "start",
+                            "operation": TRANSCOPY,
+                            "method": _start_task,
+                            "kwargs": {
+                                "task_def": task_def,
+                            },
+                        },
+                        {
+                            "task_dispatch_name": f"{task_dispatcher_name}_{button_index}",
+                            "callback": "finish",
+                            "operation": TRANSCOPY,
+                            "method": _finish_transcoding_task,
+                            "kwargs": {
+                                "task_def": task_def,
+                            },
+                        },
+                        {
+                            "task_dispatch_name": f"{task_dispatcher_name}_{button_index}",
+                            "callback": "error",
+                            "operation": TRANSCOPY,
+                            "method": _error_task,
+                            "kwargs": {
+                                "task_def": task_def,
+                            },
+                        },
+                        {
+                            "task_dispatch_name": f"{task_dispatcher_name}_{button_index}",
+                            "callback": "abort",
+                            "operation": TRANSCOPY,
+                            "method": _abort_task,
+                            "kwargs": {
+                                "task_def": task_def,
+                            },
+                        },
+                    ],
+                )
+
+            if self.transcode_type == sys_consts.TRANSCODE_NONE:
+                video_dir, video_file, video_extension = (
+                    self._file_handler.split_file_path(video_data.video_path)
+                )
+
+                if video_extension.lower() == sys_consts.FFCONCAT_EXTN:
+                    output_file = _playlist_remux_file(
+                        video_data.video_path, preservation_master_path, video_file
+                    )
+
+                    if not output_file:
+                        return None, []
+
+                    _, _, video_extension = self._file_handler.split_file_path(
+                        output_file
+                    )
+
+                    task_def.worker_function = dvdarch_utils.Remux_Video_Playlist
+                    task_def.kwargs = {
+                        "playlist_file": video_data.video_path,
+                        "output_file": output_file,
+                    }
+                    task_def.cargo["file_extension"] = video_extension
+                else:
+                    output_file = self._file_handler.file_join(
+                        preservation_master_path, video_file, video_extension
+                    )
+
+                    task_def.worker_function = self._file_handler.copy_file
+                    task_def.kwargs = {
+                        "source": video_data.video_path,
+                        "destination_path": output_file,
+                    }
+
                 task_def.cargo[OP_TYPE] = TRANSCOPY
                 task_def.cargo["output_file"] = output_file
 
@@ -1099,19 +1463,7 @@ class Archive_Manager:
 
                     return None, []
 
-                if (
-                    encoding_info.all_I_frames
-                    and (
-                        (
-                            "h264" not in encoding_info.video_format.lower()
-                            and self.transcode_type == sys_consts.TRANSCODE_H264
-                        )
-                        or (
-                            "h265" not in encoding_info.video_format.lower()
-                            and self.transcode_type == sys_consts.TRANSCODE_H265
-                        )
-                    )
-                ) or not encoding_info.all_I_frames:  # Check if we need to transcode
+                if Master_Transcode_Needed(encoding_info, self.transcode_type):
                     file_extension = "mkv"
 
                     task_def.cargo[OP_TYPE] = TRANSCODE
@@ -1123,6 +1475,7 @@ class Archive_Manager:
                         "width": encoding_info.video_width,
                         "height": encoding_info.video_height,
                         "frame_rate": encoding_info.video_frame_rate,
+                        "duration": encoding_info.video_duration,
                         "interlaced": (
                             True
                             if encoding_info.video_scan_type.lower() == "interlaced"
@@ -1141,6 +1494,7 @@ class Archive_Manager:
                         "encode_10bit": True,
                         "mkv_container": True,
                         "black_border": False,
+                        "chunked": self.chunked_encode,
                     }
 
                     task_def.cargo["file_extension"] = file_extension
@@ -1188,15 +1542,35 @@ class Archive_Manager:
                     video_dir, video_file, video_extension = (
                         self._file_handler.split_file_path(video_data.video_path)
                     )
-                    output_file = self._file_handler.file_join(
-                        preservation_master_path, video_file, video_extension
-                    )
 
-                    task_def.worker_function = self._file_handler.copy_file
-                    task_def.kwargs = {
-                        "source": video_data.video_path,
-                        "destination_path": output_file,
-                    }
+                    if video_extension.lower() == sys_consts.FFCONCAT_EXTN:
+                        output_file = _playlist_remux_file(
+                            video_data.video_path, preservation_master_path, video_file
+                        )
+
+                        if not output_file:
+                            return None, []
+
+                        _, _, video_extension = self._file_handler.split_file_path(
+                            output_file
+                        )
+
+                        task_def.worker_function = dvdarch_utils.Remux_Video_Playlist
+                        task_def.kwargs = {
+                            "playlist_file": video_data.video_path,
+                            "output_file": output_file,
+                        }
+                        task_def.cargo["file_extension"] = video_extension
+                    else:
+                        output_file = self._file_handler.file_join(
+                            preservation_master_path, video_file, video_extension
+                        )
+
+                        task_def.worker_function = self._file_handler.copy_file
+                        task_def.kwargs = {
+                            "source": video_data.video_path,
+                            "destination_path": output_file,
+                        }
 
                     task_def.cargo[OP_TYPE] = TRANSCOPY
                     task_def.cargo["output_file"] = output_file
@@ -1250,6 +1624,8 @@ class Archive_Manager:
                     "width": video_data.encoding_info.video_width,
                     "height": video_data.encoding_info.video_height,
                     "frame_rate": video_data.encoding_info.video_frame_rate,
+                    "duration": video_data.encoding_info.video_duration,
+                    "chunked": self.chunked_encode,
                 }
 
                 task_def.cargo["file_extension"] = file_extension
@@ -1745,6 +2121,9 @@ class Archive_Manager:
             f"{menu_layout=} must be a list of tuples of str,Video_Data"
         )
 
+        if encoded_files is None:
+            encoded_files = {}
+
         self._reset_new_state()
         task_dispatcher = Task_Dispatcher()
         video_file_copier = dvdarch_utils.Video_File_Copier()
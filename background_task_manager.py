@@ -19,6 +19,7 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import dataclasses
 import functools
+import inspect
 import pprint
 import threading
 # import traceback # for debug
@@ -44,7 +45,14 @@ from PySide6.QtCore import (
 
 from QTPYGUI.utils import Singleton
 
-from break_circular import Cancel_Task, Execute_Check_Output, Task_Def
+from break_circular import (
+    PRIORITY_INTERACTIVE,
+    Cancel_Task,
+    Execute_Check_Output,
+    Task_Def,
+    Task_Priority,
+)
+from command_metrics import Command_Metrics
 
 DEBUG = False
 QOBJECT_METACLASS = type(QObject)
@@ -245,11 +253,6 @@ class Worker_Runnable(QRunnable):
 
             task_kwargs = self._task.kwargs.copy()
 
-            if worker_facing_progress_callback:
-                task_kwargs["progress_callback"] = (
-                    worker_facing_progress_callback  # Pass it to the worker_function as 'progress_callback' keyword
-                )
-
             if DEBUG:
                 print(
                     f"    DBG Worker_Runnable: Calling worker_function '{self._task.worker_function.__name__}'"
@@ -261,9 +264,27 @@ class Worker_Runnable(QRunnable):
                 del task_kwargs["args"]
 
             if "kwargs" in task_kwargs:
-                task_kwargs = task_kwargs["kwargs"]
+                task_kwargs = task_kwargs["kwargs"].copy()
+
+            if worker_facing_progress_callback and self._accepts_progress_callback():
+                task_kwargs["progress_callback"] = (
+                    worker_facing_progress_callback  # Pass it to the worker_function as 'progress_callback' keyword
+                )
+            task_priority = (
+                self._task.task_def.priority
+                if self._task.task_def is not None
+                else PRIORITY_INTERACTIVE
+            )
+
             # try:
-            result = self._task.worker_function(*self._task.args, **task_kwargs)
+            # Tags the external tool calls the worker makes, the worker function names the stage
+            with (
+                Command_Metrics().scope(
+                    task_id=task_id, stage=self._task.worker_function.__name__
+                ),
+                Task_Priority(task_priority),
+            ):
+                result = self._task.worker_function(*self._task.args, **task_kwargs)
             # except Exception as e:
             #    raise RuntimeError(
             #        f"DBG_ERROR: {e} \n {self._task.worker_function}  \n {task_kwargs} \n {self._task}"
@@ -316,6 +337,23 @@ class Worker_Runnable(QRunnable):
                     f"--> DBG WorkerRunnable: EXITING run() for task {task_id[:8]}..."
                 )
 
+    def _accepts_progress_callback(self) -> bool:
+        """
+        Checks if the worker function can be handed a 'progress_callback' keyword argument
+
+        Returns:
+            bool: True if the worker function has a progress_callback parameter or takes **kwargs, False otherwise
+        """
+        try:
+            parameters = inspect.signature(self._task.worker_function).parameters
+        except (TypeError, ValueError):
+            return False  # Builtins and some C callables have no signature
+
+        return "progress_callback" in parameters or any(
+            parameter.kind == inspect.Parameter.VAR_KEYWORD
+            for parameter in parameters.values()
+        )
+
     def cancel(self):
         """
         Marks the task for cancellation. The task's function must check this flag.
@@ -621,6 +659,15 @@ class Thread_Pool_Executor(QObject):
 
         if cancel_task and add_cancellation_callback:
             self._active_task_cancel_callbacks[task.task_id] = cancel_task
+        else:
+            # A worker handed its own Cancel_Task can still be cancelled from the Task Manager
+            worker_kwargs = kwargs.get("kwargs", kwargs)
+            callback_owner = getattr(
+                worker_kwargs.get("cancellation_callback"), "__self__", None
+            )
+
+            if isinstance(callback_owner, Cancel_Task):
+                self._active_task_cancel_callbacks[task.task_id] = callback_owner
 
         runnable = Worker_Runnable(task, self._shared_worker_signals)
 
@@ -0,0 +1,519 @@
+"""
+Micro-benchmarks for the hot paths of the DVD Archiver. Run with python benchmarks.py
+
+Copyright (C) 2025  David Worboys (-:alumnus Moyhu Primary School et al.:-)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable
+
+import sys_consts
+from break_circular import Execute_Check_Output
+from dvdarch_utils import (
+    Generate_Filmstrip,
+    Get_File_Encoding_Info,
+    Get_Keyframe_Index,
+    Probe_Stream_Entries,
+    Seek_Options,
+    Transcode_DVD_VOB,
+)
+from filmstrip_cache import FILMSTRIP_THUMB_HEIGHT, Filmstrip_Cache
+from frame_server import Frame_Server
+from passlog_cache import Passlog_Cache
+
+
+def _Time_Calls(func: Callable[[], object], iterations: int) -> tuple[float, float]:
+    """
+    Times repeated calls of a function
+
+    Args:
+        func (Callable[[], object]): The function to time
+        iterations (int): The number of calls
+
+    Returns:
+        tuple[float, float]: The mean and median call time in milliseconds
+    """
+    assert callable(func), f"{func=}. Must be callable"
+    assert isinstance(iterations, int) and iterations > 0, (
+        f"{iterations=}. Must be an int > 0"
+    )
+
+    timings = []
+
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return statistics.mean(timings), statistics.median(timings)
+
+
+def Benchmark_Execute_Check_Output(
+    image_file: str = "", iterations: int = 50
+) -> dict[str, dict[str, tuple[float, float]]]:
+    """
+    Compares the per-call overhead of Execute_Check_Output against a bare subprocess.run for short commands,
+    the kind a menu build runs hundreds of times.
+
+    Args:
+        image_file (str): The image file the ImageMagick commands inspect. Defaults to the program logo
+        iterations (int): The number of calls per command
+
+    Returns:
+        dict[str, dict[str, tuple[float, float]]]: Command name -> runner name -> (mean ms, median ms)
+    """
+    if image_file == "":
+        image_file = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), "logo.png"
+        )
+
+    assert isinstance(image_file, str) and os.path.exists(image_file), (
+        f"{image_file=}. Must be an existing image file"
+    )
+    assert isinstance(iterations, int) and iterations > 0, (
+        f"{iterations=}. Must be an int > 0"
+    )
+
+    benchmark_commands = {
+        "true": ["true"],
+        "identify": [sys_consts.IDENTIFY, "-format", "%wx%h", image_file],
+        "convert info:": [
+            sys_consts.CONVERT,
+            image_file,
+            "-format",
+            "%[fx:w]x%[fx:h]",
+            "info:",
+        ],
+    }
+
+    results = {}
+
+    for name, commands in benchmark_commands.items():
+        results[name] = {
+            "subprocess.run": _Time_Calls(
+                lambda: subprocess.run(commands, capture_output=True), iterations
+            ),
+            "Execute_Check_Output": _Time_Calls(
+                lambda: Execute_Check_Output(commands=commands, debug=False),
+                iterations,
+            ),
+        }
+
+    return results
+
+
+def _Peak_Memory(func: Callable[[], object]) -> tuple[float, float]:
+    """
+    Runs a function once under tracemalloc
+
+    Args:
+        func (Callable[[], object]): The function to measure
+
+    Returns:
+        tuple[float, float]: The run time in milliseconds and the peak Python memory allocated in MiB
+    """
+    assert callable(func), f"{func=}. Must be callable"
+
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    try:
+        func()
+        run_time = (time.perf_counter() - start) * 1000
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return run_time, peak / (1024 * 1024)
+
+
+def Benchmark_Probe_Frames(
+    video_file: str,
+) -> dict[str, dict[str, tuple[float, float]]]:
+    """
+    Compares parsing a whole ffprobe -show_frames JSON document against streaming the same frames through
+    Probe_Stream_Entries, for a full frame scan and for finding the first I-frame
+
+    Args:
+        video_file (str): The video file probed, a long 4K or 50p file shows the difference best
+
+    Returns:
+        dict[str, dict[str, tuple[float, float]]]: Scan name -> reader name -> (ms, peak MiB)
+    """
+    assert isinstance(video_file, str) and os.path.exists(video_file), (
+        f"{video_file=}. Must be an existing video file"
+    )
+
+    def _json_frames() -> list[dict]:
+        """Runs ffprobe the historical way and returns the video frame dicts"""
+        _, output = Execute_Check_Output(
+            commands=[
+                sys_consts.FFPROBE,
+                "-v",
+                "quiet",
+                "-print_format",
+                "json",
+                "-show_frames",
+                video_file,
+            ],
+            debug=False,
+        )
+
+        return [
+            frame
+            for frame in json.loads(output).get("frames", [])
+            if frame.get("media_type") == "video"
+        ]
+
+    def _json_first_i_frame() -> dict:
+        """Finds the first I-frame in the JSON frame dicts"""
+        return next(
+            (frame for frame in _json_frames() if frame.get("pict_type") == "I"), {}
+        )
+
+    def _stream_frames() -> list[tuple[str, ...]]:
+        """Streams the frame type of every video frame into tuples"""
+        frames = []
+        Probe_Stream_Entries(
+            video_file=video_file,
+            section="frame",
+            entries=("key_frame", "pict_type"),
+            entry_callback=lambda frame: frames.append(frame) or True,
+        )
+        return frames
+
+    def _stream_first_i_frame() -> tuple[str, ...]:
+        """Streams frames until the first I-frame"""
+        found = []
+        Probe_Stream_Entries(
+            video_file=video_file,
+            section="frame",
+            entries=("key_frame", "pict_type", "width", "height"),
+            entry_callback=lambda frame: frame[1] != "I" or found.append(frame),
+        )
+        return found[0] if found else ()
+
+    return {
+        "all frames": {
+            "json.loads": _Peak_Memory(_json_frames),
+            "Probe_Stream_Entries": _Peak_Memory(_stream_frames),
+        },
+        "first I-frame": {
+            "json.loads": _Peak_Memory(_json_first_i_frame),
+            "Probe_Stream_Entries": _Peak_Memory(_stream_first_i_frame),
+        },
+    }
+
+
+def Benchmark_Cut_Seek(
+    video_file: str,
+    segment_seconds: float = 2.0,
+    positions: tuple[float, ...] = (0.05, 0.25, 0.5, 0.75, 0.95),
+) -> dict[str, dict[str, float]]:
+    """
+    Times the stream copy of a short segment at positions through a file, with the historical output side -ss and
+    with the keyframe snapped input side -ss of Seek_Options. The output side time grows with the position, the
+    Seek_Options time should not
+
+    Args:
+        video_file (str): The video file cut, a long multi-GB capture shows the difference best
+        segment_seconds (float): The length of each segment in seconds
+        positions (tuple[float, ...]): Where the segments start, as fractions of the file duration
+
+    Returns:
+        dict[str, dict[str, float]]: Position label -> seek name -> ms
+    """
+    assert isinstance(video_file, str) and os.path.exists(video_file), (
+        f"{video_file=}. Must be an existing video file"
+    )
+    assert isinstance(segment_seconds, float) and segment_seconds > 0, (
+        f"{segment_seconds=}. Must be a float > 0"
+    )
+    assert isinstance(positions, tuple) and all(
+        0.0 <= position < 1.0 for position in positions
+    ), f"{positions=}. Must be a tuple of fractions >= 0 and < 1"
+
+    duration = Get_File_Encoding_Info(video_file).video_duration
+    Get_Keyframe_Index(video_file)  # Built once per file, so kept out of the timings
+    timings = {}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_file = os.path.join(
+            temp_dir, f"segment{os.path.splitext(video_file)[1]}"
+        )
+
+        def _copy_segment(seek_input: list[str], seek_output: list[str]) -> float:
+            """Stream copies the segment and returns the run time in ms"""
+            start = time.perf_counter()
+            Execute_Check_Output(
+                commands=[
+                    sys_consts.FFMPG,
+                    *seek_input,
+                    "-i",
+                    video_file,
+                    *seek_output,
+                    "-t",
+                    f"{segment_seconds}",
+                    "-c",
+                    "copy",
+                    output_file,
+                    "-y",
+                ],
+                debug=False,
+            )
+            return (time.perf_counter() - start) * 1000
+
+        for position in positions:
+            start_time = position * duration
+            seek_input, seek_output, _ = Seek_Options(
+                input_file=video_file, start_time=start_time, stream_copy=True
+            )
+
+            timings[f"{position:.0%} ({start_time:.0f}s)"] = {
+                "output -ss": _copy_segment([], ["-ss", f"{start_time}"]),
+                "Seek_Options": _copy_segment(seek_input, seek_output),
+            }
+
+    return timings
+
+
+def Benchmark_Frame_Stepping(
+    video_file: str, steps: int = 50, position: float = 0.5
+) -> dict[str, float]:
+    """
+    Times single frame steps backwards and forwards from a position in a file through the Frame_Server. Only the
+    first frame and the steps that leave the prefetched frames should cost a GOP decode
+
+    Args:
+        video_file (str): The video file, long GOP MPEG-2 or H.264 shows the difference best
+        steps (int): The number of frames stepped in each direction
+        position (float): Where stepping starts, as a fraction of the file duration
+
+    Returns:
+        dict[str, float]: Step name -> ms, the step times being the mean and the worst of the steps
+    """
+    assert isinstance(video_file, str) and os.path.exists(video_file), (
+        f"{video_file=}. Must be an existing video file"
+    )
+    assert isinstance(steps, int) and steps > 0, f"{steps=}. Must be an int > 0"
+    assert isinstance(position, float) and 0.0 <= position < 1.0, (
+        f"{position=}. Must be a fraction >= 0 and < 1"
+    )
+
+    encoding_info = Get_File_Encoding_Info(video_file)
+    Get_Keyframe_Index(video_file)  # Built once per file, so kept out of the timings
+    frame_server = Frame_Server(
+        video_file=video_file,
+        frame_rate=float(encoding_info.video_frame_rate),
+        output_width=encoding_info.video_width // 2,
+        output_height=encoding_info.video_height // 2,
+    )
+    start_frame = max(
+        steps,
+        round(encoding_info.video_duration * position * encoding_info.video_frame_rate),
+    )
+
+    def _step(frame_num: int) -> float:
+        """Gets a frame and returns the time taken in ms"""
+        start = time.perf_counter()
+        frame_server.frame_get(frame_num)
+        return (time.perf_counter() - start) * 1000
+
+    try:
+        timings = {"first frame": _step(start_frame)}
+
+        for step_name, step_frames in (
+            ("backward", range(start_frame - 1, start_frame - steps - 1, -1)),
+            ("forward", range(start_frame + 1, start_frame + steps + 1)),
+        ):
+            step_times = []
+
+            for frame_num in step_frames:
+                step_times.append(_step(frame_num))
+                time.sleep(1 / encoding_info.video_frame_rate)  # Someone stepping fast
+
+            timings[f"{step_name} mean"] = statistics.mean(step_times)
+            timings[f"{step_name} worst"] = max(step_times)
+    finally:
+        frame_server.stop()
+
+    return timings
+
+
+def Benchmark_Filmstrip(video_file: str, scrubs: int = 20) -> dict[str, float]:
+    """
+    Times making and loading the filmstrip of a file, then scrubbing to frames spread across it from the filmstrip and,
+    for comparison, from the Frame_Server. The filmstrip is only made if it is not already cached
+
+    Args:
+        video_file (str): The video file
+        scrubs (int): The number of frames scrubbed to
+
+    Returns:
+        dict[str, float]: Step name -> ms, the scrub times being the mean of the scrubs
+    """
+    assert isinstance(video_file, str) and os.path.exists(video_file), (
+        f"{video_file=}. Must be an existing video file"
+    )
+    assert isinstance(scrubs, int) and scrubs > 0, f"{scrubs=}. Must be an int > 0"
+
+    encoding_info = Get_File_Encoding_Info(video_file)
+    last_frame = max(
+        0, round(encoding_info.video_duration * encoding_info.video_frame_rate) - 1
+    )
+    scrub_frames = [last_frame * scrub // scrubs for scrub in range(scrubs)]
+    timings = {}
+
+    start = time.perf_counter()
+    result, message = Generate_Filmstrip(
+        video_file=video_file,
+        frame_rate=float(encoding_info.video_frame_rate),
+        duration=float(encoding_info.video_duration),
+    )
+    timings["make"] = (time.perf_counter() - start) * 1000
+
+    if result != 1:
+        raise RuntimeError(message)
+
+    start = time.perf_counter()
+    filmstrip = Filmstrip_Cache().get(video_file, FILMSTRIP_THUMB_HEIGHT)
+    timings["load"] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+
+    for frame_num in scrub_frames:
+        filmstrip.thumbnail_get(frame_num)
+
+    timings["filmstrip scrub"] = (time.perf_counter() - start) * 1000 / scrubs
+
+    Get_Keyframe_Index(video_file)  # Built once per file, so kept out of the timings
+    frame_server = Frame_Server(
+        video_file=video_file,
+        frame_rate=float(encoding_info.video_frame_rate),
+        output_width=encoding_info.video_width // 2,
+        output_height=encoding_info.video_height // 2,
+    )
+
+    try:
+        start = time.perf_counter()
+
+        for frame_num in scrub_frames:
+            frame_server.frame_get(frame_num)
+
+        timings["decoded scrub"] = (time.perf_counter() - start) * 1000 / scrubs
+    finally:
+        frame_server.stop()
+
+    return timings
+
+
+def Benchmark_VOB_Rebuild(video_file: str) -> dict[str, float]:
+    """
+    Times the DVD VOB encode of a file as a first build, as a rebuild that reuses the cached pass logs and as a
+    single pass draft. The first build only runs the analysis pass if its pass logs are not already cached
+
+    Args:
+        video_file (str): The video file
+
+    Returns:
+        dict[str, float]: Build name -> seconds
+    """
+    assert isinstance(video_file, str) and os.path.exists(video_file), (
+        f"{video_file=}. Must be an existing video file"
+    )
+
+    encoding_info = Get_File_Encoding_Info(video_file)
+    timings = {}
+
+    with tempfile.TemporaryDirectory() as output_folder:
+        for build_name, draft in (
+            ("build", False),
+            ("rebuild", False),
+            ("draft", True),
+        ):
+            hits = Passlog_Cache().hits
+            start = time.perf_counter()
+            result, message = Transcode_DVD_VOB(
+                input_file=video_file,
+                output_folder=output_folder,
+                input_video_width=encoding_info.video_width,
+                input_video_height=encoding_info.video_height,
+                input_video_ar=encoding_info.video_ar,
+                input_video_scan_type=encoding_info.video_scan_type,
+                input_video_frame_rate=encoding_info.video_frame_rate,
+                input_video_duration=encoding_info.video_duration,
+                auto_bright=False,
+                normalise=False,
+                white_balance=False,
+                denoise=False,
+                sharpen=False,
+                filters_off=True,
+                black_border=True,
+                dvd_standard=(
+                    sys_consts.PAL
+                    if encoding_info.video_frame_rate == 25
+                    else sys_consts.NTSC
+                ),
+                draft=draft,
+            )
+
+            if result != 1:
+                raise RuntimeError(message)
+
+            cached = " (cached pass 1)" if Passlog_Cache().hits > hits else ""
+            timings[f"{build_name}{cached}"] = time.perf_counter() - start
+
+    return timings
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "frames":
+        # python benchmarks.py frames <video file>
+        for step_name, run_ms in Benchmark_Frame_Stepping(sys.argv[2]).items():
+            print(f"{step_name:<16} {run_ms:10.1f} ms")
+    elif len(sys.argv) > 2 and sys.argv[1] == "filmstrip":
+        # python benchmarks.py filmstrip <video file>
+        for step_name, run_ms in Benchmark_Filmstrip(sys.argv[2]).items():
+            print(f"{step_name:<16} {run_ms:10.3f} ms")
+    elif len(sys.argv) > 2 and sys.argv[1] == "vob":
+        # python benchmarks.py vob <video file>
+        for build_name, run_s in Benchmark_VOB_Rebuild(sys.argv[2]).items():
+            print(f"{build_name:<24} {run_s:10.1f} s")
+    elif len(sys.argv) > 2 and sys.argv[1] == "seek":
+        # python benchmarks.py seek <video file>
+        for position_name, seeks in Benchmark_Cut_Seek(sys.argv[2]).items():
+            for seek_name, run_ms in seeks.items():
+                print(f"{position_name:<16} {seek_name:<14} {run_ms:10.1f} ms")
+    elif len(sys.argv) > 1:
+        # python benchmarks.py <video file>
+        for scan_name, readers in Benchmark_Probe_Frames(sys.argv[1]).items():
+            for reader_name, (run_ms, peak_mib) in readers.items():
+                print(
+                    f"{scan_name:<16} {reader_name:<22} {run_ms:10.1f} ms  peak {peak_mib:8.2f} MiB"
+                )
+    else:
+        for command_name, runners in Benchmark_Execute_Check_Output().items():
+            for runner_name, (mean_ms, median_ms) in runners.items():
+                print(
+                    f"{command_name:<16} {runner_name:<22} mean {mean_ms:8.3f} ms  median {median_ms:8.3f} ms"
+                )
@@ -0,0 +1,449 @@
+"""
+Plans the average video bitrate of each title of a DVD, so the titles fill the disc at an even quality rather than
+each being encoded at sys_consts.AVERAGE_BITRATE. The complexity of a title is the bitrate mpeg2 needs to encode
+samples spread through it at a fixed quantiser, and is cached per file. Bits are then shared across the titles in
+proportion to their complexity, within the DVD bitrate limits.
+
+Copyright (C) 2025  David Worboys (-:alumnus Moyhu Primary School et al.:-)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import json
+import os
+import statistics
+import tempfile
+from typing import Callable, Final, Optional
+
+from QTPYGUI.utils import Singleton
+
+import sys_consts
+from break_circular import Execute_Check_Output
+from dvdarch_utils import Input_Options
+from folder_cache import Folder_Cache
+
+# Bump when the complexity measure changes, so older complexities are not reused
+COMPLEXITY_CACHE_VERSION: Final[int] = 1
+COMPLEXITY_CACHE_MAX_SIZE: Final[int] = 4 * 1024**2  # Bytes, LRU evicted past this
+COMPLEXITY_SAMPLES: Final[int] = 10  # Spread evenly through a title
+COMPLEXITY_SAMPLE_SECONDS: Final[float] = 2.0
+COMPLEXITY_QSCALE: Final[int] = 4  # The fixed mpeg2 quantiser of the samples
+
+PLAN_MIN_VIDEO_BITRATE: Final[int] = 2000  # kbps, below this a title is not worth it
+# kbps, an average at the peak rate would leave a VBR encode no room for its peaks
+PLAN_MAX_VIDEO_BITRATE: Final[int] = min(
+    8000,
+    sys_consts.DVD_MAX_VIDEO_BITRATE,
+    sys_consts.DVD_MAX_BITRATE - sys_consts.AUDIO_BITRATE,
+)
+
+
+class Complexity_Cache(Folder_Cache, metaclass=Singleton):
+    """Holds title complexities in the complexity cache folder of the video editor folder"""
+
+    def __init__(self):
+        super().__init__(
+            folder_name=sys_consts.COMPLEXITY_CACHE_FOLDER_NAME,
+            max_size=COMPLEXITY_CACHE_MAX_SIZE,
+            version=COMPLEXITY_CACHE_VERSION,
+        )
+
+    def _complexity_file(self, video_file: str, dvd_standard: str) -> str:
+        """Works out the file the complexity of a video file is kept in
+
+        Args:
+            video_file (str): The source video file
+            dvd_standard (str): The DVD standard the samples are encoded to, sys_consts.PAL or sys_consts.NTSC
+
+        Returns:
+            str: The complexity file or an empty string if there is no cache folder or the source file cannot be read
+        """
+        complexity_key = self._cache_key(
+            video_file,
+            [
+                dvd_standard,
+                str(COMPLEXITY_SAMPLES),
+                str(COMPLEXITY_SAMPLE_SECONDS),
+                str(COMPLEXITY_QSCALE),
+            ],
+        )
+
+        return self._cache_file(complexity_key, ".json")
+
+    def get(self, video_file: str, dvd_standard: str) -> float | None:
+        """Gets the cached complexity of a video file
+
+        Args:
+            video_file (str): The source video file
+            dvd_standard (str): The DVD standard the samples are encoded to, sys_consts.PAL or sys_consts.NTSC
+
+        Returns:
+            float | None: The complexity in kbps, or None if it is not cached
+        """
+        assert isinstance(video_file, str) and video_file.strip() != "", (
+            f"{video_file=}. Must be a non-empty str"
+        )
+        assert dvd_standard in (sys_consts.PAL, sys_consts.NTSC), (
+            f"{dvd_standard=}. Must be sys_consts.PAL or sys_consts.NTSC"
+        )
+
+        complexity_file = self._complexity_file(video_file, dvd_standard)
+
+        if not complexity_file:
+            return None
+
+        try:
+            with open(complexity_file, "r", encoding="utf-8") as complexity_handle:
+                complexity = float(json.load(complexity_handle)["complexity"])
+
+            os.utime(complexity_file)  # Marks it as the most recently used
+        except (OSError, ValueError, KeyError, TypeError):
+            return None  # Missing or damaged, it is just measured again
+
+        return complexity
+
+    def put(self, video_file: str, dvd_standard: str, complexity: float) -> None:
+        """Caches the complexity of a video file, then evicts the least recently used complexities while the cache is
+        too big
+
+        Args:
+            video_file (str): The source video file
+            dvd_standard (str): The DVD standard the samples are encoded to, sys_consts.PAL or sys_consts.NTSC
+            complexity (float): The complexity in kbps
+        """
+        assert isinstance(video_file, str) and video_file.strip() != "", (
+            f"{video_file=}. Must be a non-empty str"
+        )
+        assert dvd_standard in (sys_consts.PAL, sys_consts.NTSC), (
+            f"{dvd_standard=}. Must be sys_consts.PAL or sys_consts.NTSC"
+        )
+        assert isinstance(complexity, float) and complexity >= 0, (
+            f"{complexity=}. Must be a float >= 0"
+        )
+
+        complexity_file = self._complexity_file(video_file, dvd_standard)
+
+        if not complexity_file:
+            return None
+
+        def _write_complexity(temp_file: str) -> None:
+            """Writes the complexity to the temporary file"""
+            with open(temp_file, "w", encoding="utf-8") as complexity_handle:
+                json.dump({"complexity": complexity}, complexity_handle)
+
+        if self._write(complexity_file, _write_complexity):
+            self._evict()
+
+        return None
+
+
+def Measure_Complexity(
+    video_file: str,
+    duration: float,
+    dvd_standard: str,
+    cancellation_callback: Optional[Callable[[], bool]] = None,
+) -> tuple[int, str, float]:
+    """
+    Measures the complexity of a video file, the bitrate mpeg2 needs to encode it at DVD size and COMPLEXITY_QSCALE.
+    Only COMPLEXITY_SAMPLES samples of COMPLEXITY_SAMPLE_SECONDS, spread evenly through the file, are encoded and a
+    cached complexity is not measured again
+
+    Args:
+        video_file (str): The video file
+        duration (float): The duration of the video file in seconds
+        dvd_standard (str): The DVD standard the samples are encoded to, sys_consts.PAL or sys_consts.NTSC
+        cancellation_callback (Optional[Callable[[], bool]]): Returns True when the measurement is to be cancelled.
+            Defaults to None (Cancel_All_Tasks)
+
+    Returns:
+        tuple[int, str, float]:
+        - arg 1: 1 if ok, -1 if error, -2 if cancelled
+        - arg 2: Empty string if all good, otherwise error message
+        - arg 3: The complexity in kbps, 0.0 if there was an error
+    """
+    assert isinstance(video_file, str) and video_file.strip() != "", (
+        f"{video_file=}. Must be a non-empty str"
+    )
+    assert isinstance(duration, (int, float)) and duration > 0, (
+        f"{duration=}. Must be an int | float > 0"
+    )
+    assert dvd_standard in (sys_consts.PAL, sys_consts.NTSC), (
+        f"{dvd_standard=}. Must be sys_consts.PAL or sys_consts.NTSC"
+    )
+    assert callable(cancellation_callback) or cancellation_callback is None, (
+        f"{cancellation_callback=}. Must be a function or None"
+    )
+
+    complexity_cache = Complexity_Cache()
+    complexity = complexity_cache.get(video_file, dvd_standard)
+
+    if complexity is not None:
+        return 1, "", complexity
+
+    if not os.path.exists(video_file):
+        return -1, f"File Does Not Exist {video_file}", 0.0
+
+    if dvd_standard == sys_consts.PAL:
+        frame_rate = f"{sys_consts.PAL_FRAME_RATE}"
+        frame_size = f"{sys_consts.PAL_SPECS.width_43}x{sys_consts.PAL_SPECS.height_43}"
+    else:
+        frame_rate = f"{sys_consts.NTSC_FRAME_RATE}"
+        frame_size = (
+            f"{sys_consts.NTSC_SPECS.width_43}x{sys_consts.NTSC_SPECS.height_43}"
+        )
+
+    # Short, so all of it
+    if duration <= COMPLEXITY_SAMPLES * COMPLEXITY_SAMPLE_SECONDS:
+        samples = [(0.0, float(duration))]
+    else:
+        samples = [
+            (
+                duration * (sample + 0.5) / COMPLEXITY_SAMPLES
+                - COMPLEXITY_SAMPLE_SECONDS / 2,
+                COMPLEXITY_SAMPLE_SECONDS,
+            )
+            for sample in range(COMPLEXITY_SAMPLES)
+        ]
+
+    sample_bits = 0
+    sample_seconds = 0.0
+
+    with tempfile.TemporaryDirectory() as sample_folder:
+        sample_file = os.path.join(sample_folder, "sample.m2v")
+
+        for sample_start, sample_duration in samples:
+            commands = [
+                sys_consts.FFMPG,
+                "-hide_banner",
+                "-nostdin",
+                "-ss",
+                f"{sample_start:.3f}",
+                "-t",
+                f"{sample_duration:.3f}",
+                *Input_Options(video_file),
+                "-map",
+                "0:v:0",
+                "-s",
+                frame_size,
+                "-r",
+                frame_rate,
+                "-c:v",
+                "mpeg2video",
+                "-q:v",
+                str(COMPLEXITY_QSCALE),
+                "-g",
+                "15",
+                "-an",
+                "-f",
+                "mpeg2video",
+                sample_file,
+                "-y",
+            ]
+
+            result, message = Execute_Check_Output(
+                commands=commands,
+                debug=False,
+                cancellation_callback=cancellation_callback,
+            )
+
+            if result != 1:
+                return result, message, 0.0
+
+            sample_bits += os.path.getsize(sample_file) * 8
+            sample_seconds += sample_duration
+
+    if sample_bits == 0:
+        return -1, f"No Video Could Be Sampled From {video_file}", 0.0
+
+    complexity = sample_bits / sample_seconds / 1000
+    complexity_cache.put(video_file, dvd_standard, complexity)
+
+    return 1, "", complexity
+
+
+def Allocate_Bitrates(
+    durations: list[float], complexities: list[float], video_capacity: float
+) -> list[int]:
+    """
+    Shares the video capacity of a disc across its titles in proportion to their complexity, so every title is
+    encoded at about the same quality. A title is held between PLAN_MIN_VIDEO_BITRATE and PLAN_MAX_VIDEO_BITRATE and
+    the others share what that gives or takes
+
+    Args:
+        durations (list[float]): The duration of each title in seconds
+        complexities (list[float]): The complexity of each title in kbps
+        video_capacity (float): The kilobits of the disc available for video
+
+    Returns:
+        list[int]: The average video bitrate of each title in kbps. Empty if the titles do not fit at
+        PLAN_MIN_VIDEO_BITRATE
+    """
+    assert isinstance(durations, list) and all(
+        isinstance(duration, (int, float)) and duration >= 0 for duration in durations
+    ), f"{durations=}. Must be a list of int | float >= 0"
+    assert isinstance(complexities, list) and len(complexities) == len(durations), (
+        f"{complexities=}. Must be a list the same length as durations"
+    )
+    assert isinstance(video_capacity, (int, float)), (
+        f"{video_capacity=}. Must be int | float"
+    )
+
+    #### Helper
+    def _planned_size(scale: float) -> float:
+        """
+        Works out the kilobits of video the titles need when each is encoded at scale times its complexity
+
+        Args:
+            scale (float): The kbps of bitrate per kbps of complexity
+
+        Returns:
+            float: The kilobits of video
+        """
+        return sum(
+            min(
+                PLAN_MAX_VIDEO_BITRATE,
+                max(PLAN_MIN_VIDEO_BITRATE, scale * complexity),
+            )
+            * duration
+            for complexity, duration in zip(complexities, durations)
+        )
+
+    #### Main
+    # Too big with every title at PLAN_MIN_VIDEO_BITRATE
+    if _planned_size(0.0) > video_capacity:
+        return []
+
+    # The planned size only grows with the scale, so the scale that fills the disc is found by bisection
+    low_scale = 0.0
+    high_scale = PLAN_MAX_VIDEO_BITRATE / min(
+        [complexity for complexity in complexities if complexity > 0], default=1.0
+    )
+
+    # Fits with every title at its top bitrate
+    if _planned_size(high_scale) <= video_capacity:
+        low_scale = high_scale
+    else:
+        for _ in range(64):
+            scale = (low_scale + high_scale) / 2
+
+            if _planned_size(scale) <= video_capacity:
+                low_scale = scale
+            else:
+                high_scale = scale
+
+    bitrates = [
+        min(PLAN_MAX_VIDEO_BITRATE, max(PLAN_MIN_VIDEO_BITRATE, low_scale * complexity))
+        for complexity in complexities
+    ]
+
+    return [int(bitrate) for bitrate in bitrates]
+
+
+def Plan_Title_Bitrates(
+    titles: list[tuple[str, float, str]],
+    title_bitrates: dict[str, int],
+    disc_size: int = sys_consts.SINGLE_SIDED_DVD_SIZE,
+    cancellation_callback: Optional[Callable[[], bool]] = None,
+    progress_callback: Optional[Callable[[float, str], None]] = None,
+) -> tuple[int, str]:
+    """
+    Plans the average video bitrate of each title of a DVD. The titles, with their audio, fill the disc less
+    sys_consts.PERCENT_SAFTEY_BUFFER. A title whose complexity can not be measured is planned as a title of median
+    complexity.
+
+    Args:
+        titles (list[tuple[str, float, str]]): The video file, duration in seconds and DVD standard of each title
+        title_bitrates (dict[str, int]): Pass by ref, filled with the average video bitrate in kbps of each video file
+        disc_size (int): The size of the disc in kilobits. Defaults to sys_consts.SINGLE_SIDED_DVD_SIZE
+        cancellation_callback (Optional[Callable[[], bool]]): Returns True when planning is to be cancelled.
+            Defaults to None (Cancel_All_Tasks)
+        progress_callback (Optional[Callable[[float, str], None]]): Receives the percentage of titles measured and
+            the title being measured. Defaults to None
+
+    Returns:
+        tuple[int, str]:
+        - arg 1: 1 if ok, -1 if the titles do not fit on the disc, -2 if cancelled
+        - arg 2: Empty string if all good, otherwise error message
+    """
+    assert isinstance(titles, list) and titles, (
+        f"{titles=}. Must be a non-empty list of (video file, duration, DVD standard)"
+    )
+    assert isinstance(title_bitrates, dict), f"{title_bitrates=}. Must be a dict"
+    assert isinstance(disc_size, int) and disc_size > 0, (
+        f"{disc_size=}. Must be an int > 0"
+    )
+    assert callable(cancellation_callback) or cancellation_callback is None, (
+        f"{cancellation_callback=}. Must be a function or None"
+    )
+    assert callable(progress_callback) or progress_callback is None, (
+        f"{progress_callback=}. Must be a function or None"
+    )
+
+    durations = []
+    complexities: list[float | None] = []
+
+    for title_index, (video_file, duration, dvd_standard) in enumerate(titles):
+        if progress_callback is not None:
+            progress_callback(
+                title_index * 100.0 / len(titles),
+                f"Measuring {os.path.basename(video_file)}",
+            )
+
+        durations.append(float(duration))
+
+        if duration <= 0:
+            complexities.append(None)
+            continue
+
+        result, message, complexity = Measure_Complexity(
+            video_file=video_file,
+            duration=duration,
+            dvd_standard=dvd_standard,
+            cancellation_callback=cancellation_callback,
+        )
+
+        if result == -2:
+            return -2, message
+
+        complexities.append(complexity if result == 1 else None)
+
+    measured = [complexity for complexity in complexities if complexity is not None]
+    median_complexity = statistics.median(measured) if measured else 1.0
+
+    usable_capacity = disc_size * (100.0 - sys_consts.PERCENT_SAFTEY_BUFFER) / 100.0
+    video_capacity = usable_capacity - sys_consts.AUDIO_BITRATE * sum(durations)
+
+    bitrates = Allocate_Bitrates(
+        durations=durations,
+        complexities=[
+            median_complexity if complexity is None else complexity
+            for complexity in complexities
+        ],
+        video_capacity=video_capacity,
+    )
+
+    if not bitrates:
+        return (
+            -1,
+            f"The {len(titles)} Titles Will Not Fit On The DVD At"
+            f" {PLAN_MIN_VIDEO_BITRATE} kbps",
+        )
+
+    for (video_file, _, _), bitrate in zip(titles, bitrates):
+        title_bitrates[video_file] = bitrate
+
+    if progress_callback is not None:
+        progress_callback(100.0, "Bitrates Planned")
+
+    return 1, ""
@@ -17,19 +17,494 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+import asyncio
+import concurrent.futures
+import contextlib
+import ctypes
 import dataclasses
+import functools
+import io
 import os
+import platform
+import selectors
 import subprocess
 import threading
 import shlex
+import tempfile
+import time
 import traceback
-from time import sleep
-from typing import Callable, Any, Optional
+from collections import deque
+from typing import TYPE_CHECKING, BinaryIO, Callable, Any, Final, Optional
 
 from QTPYGUI.utils import Singleton, Is_Complied
 
+from command_metrics import Command_Metrics
+
+if TYPE_CHECKING:
+    import resource
+
 
 #### Start From dvdarch_utils
+ECO_READ_SIZE: int = 1024 * 1024  # Pipe read block size, fits most ffprobe JSON
+ECO_POLL_TIMEOUT: float = 0.1  # Only used without a pidfd/cancel pipe wakeup
+
+CAPTURE_FULL: Final[str] = "full"  # Keep everything in memory, the historical behaviour
+CAPTURE_TAIL: Final[str] = "tail"  # Keep only the last limit bytes, for errors
+CAPTURE_SPILL: Final[str] = "spill"  # Memory up to limit bytes, then a temp file
+
+# Async_Tool_Engine concurrency classes
+TOOL_FFMPEG: Final[str] = "ffmpeg"
+TOOL_FFPROBE: Final[str] = "ffprobe"
+TOOL_IMAGEMAGICK: Final[str] = "imagemagick"
+TOOL_OTHER: Final[str] = "other"
+
+# Process priority classes, see Task_Priority
+PRIORITY_INTERACTIVE: Final[str] = "interactive"  # UI probes, default priority
+PRIORITY_BACKGROUND: Final[str] = "background"  # Encodes that must not stall the UI
+PRIORITY_IDLE: Final[str] = "idle"  # Only uses CPU and disk time nothing else wants
+
+# Priority class -> (niceness, Linux I/O priority as (class << 13) | level)
+_PRIORITY_SETTINGS: Final[dict[str, tuple[int, int]]] = {
+    PRIORITY_BACKGROUND: (10, (2 << 13) | 7),  # Best effort class, lowest level
+    PRIORITY_IDLE: (19, 3 << 13),  # Idle class
+}
+_IOPRIO_SET_SYSCALLS: Final[dict[str, int]] = {
+    "x86_64": 251,
+    "i686": 289,
+    "aarch64": 30,
+    "armv7l": 314,
+    "ppc64le": 273,
+}
+
+_task_priority = threading.local()
+
+
+def _Decode_Output(chunks: list[bytes] | deque[bytes]) -> str:
+    """
+    Decodes the raw pipe chunks captured from a child process into text, translating newlines the same way
+    universal_newlines does.
+
+    Args:
+        chunks (list[bytes] | deque[bytes]): The raw chunks read from the pipe
+
+    Returns:
+        str: The decoded text
+    """
+    assert isinstance(chunks, (list, deque)), f"{chunks=}. Must be a list of bytes"
+
+    text = b"".join(chunks).decode("utf-8", errors="replace")
+
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+@dataclasses.dataclass(slots=True)
+class Output_Capture:
+    """Collects the output of a child process under a memory policy.
+
+    - CAPTURE_FULL keeps all output in memory.
+    - CAPTURE_TAIL keeps only the last limit bytes, for error messages from chatty tools (genisoimage -v etc.).
+    - CAPTURE_SPILL keeps up to limit bytes in memory and then spools to a temporary file, read back via file().
+    """
+
+    policy: str = CAPTURE_FULL
+    limit: int = 1024 * 1024  # Bytes
+    size: int = 0  # Total bytes written, including any dropped by the tail policy
+    _chunks: deque[bytes] = dataclasses.field(default_factory=deque)
+    _held: int = 0
+    _spool: BinaryIO | None = None
+
+    def __post_init__(self) -> None:
+        assert self.policy in (CAPTURE_FULL, CAPTURE_TAIL, CAPTURE_SPILL), (
+            f"{self.policy=}. Must be CAPTURE_FULL, CAPTURE_TAIL or CAPTURE_SPILL"
+        )
+        assert isinstance(self.limit, int) and self.limit > 0, (
+            f"{self.limit=}. Must be int > 0"
+        )
+
+    @property
+    def spilled(self) -> bool:
+        """True if the output overflowed the memory limit into a temporary file"""
+        return self._spool is not None
+
+    @property
+    def truncated(self) -> bool:
+        """True if the tail policy dropped the start of the output"""
+        return self.policy == CAPTURE_TAIL and self.size > self._held
+
+    def write(self, chunk: bytes) -> None:
+        """
+        Appends a chunk of raw output
+
+        Args:
+            chunk (bytes): The raw output read from the pipe
+        """
+        self.size += len(chunk)
+
+        if self._spool is not None:
+            self._spool.write(chunk)
+            return
+
+        self._chunks.append(chunk)
+        self._held += len(chunk)
+
+        if self._held <= self.limit:
+            return
+
+        if self.policy == CAPTURE_TAIL:
+            while self._held - len(self._chunks[0]) >= self.limit:
+                self._held -= len(self._chunks.popleft())
+        elif self.policy == CAPTURE_SPILL:
+            self._spool = tempfile.TemporaryFile(mode="w+b")
+
+            for held_chunk in self._chunks:
+                self._spool.write(held_chunk)
+
+            self._chunks.clear()
+            self._held = 0
+
+    def text(self) -> str:
+        """
+        Returns the captured output as text. A spilled capture is read back from its temporary file.
+
+        Returns:
+            str: The decoded output, only the last limit bytes for the tail policy
+        """
+        if self._spool is not None:
+            return _Decode_Output([self.file().read()])
+
+        if self.policy == CAPTURE_TAIL and self._held > self.limit:
+            return _Decode_Output([b"".join(self._chunks)[-self.limit :]])
+
+        return _Decode_Output(self._chunks)
+
+    def file(self) -> BinaryIO:
+        """
+        Returns a binary file-like handle, positioned at the start, holding the captured output
+
+        Returns:
+            BinaryIO: The temporary file if spilled, otherwise an in-memory copy
+        """
+        if self._spool is not None:
+            self._spool.flush()
+            self._spool.seek(0)
+            return self._spool
+
+        return io.BytesIO(b"".join(self._chunks))
+
+    def close(self) -> None:
+        """Releases the captured output and removes any temporary file"""
+        if self._spool is not None:
+            self._spool.close()
+            self._spool = None
+
+        self._chunks.clear()
+        self._held = 0
+
+
+def _Drain_Fd(fd: int, write: Callable[[bytes], Any]) -> bool:
+    """
+    Reads whatever is immediately available on a non-blocking fd and hands it to the writer
+
+    Args:
+        fd (int): The non-blocking file descriptor
+        write (Callable[[bytes], Any]): Receives each chunk read
+
+    Returns:
+        bool: True if end of file was reached, False otherwise
+    """
+    while True:
+        try:
+            chunk = os.read(fd, ECO_READ_SIZE)
+        except (BlockingIOError, InterruptedError):
+            return False
+        except OSError:
+            return True
+
+        if not chunk:
+            return True
+
+        write(chunk)
+
+
+@dataclasses.dataclass(slots=True)
+class FFmpeg_Progress:
+    """Accumulates the key=value blocks ffmpeg writes with -progress and converts them into a percentage and ETA"""
+
+    # Seconds, from Encoding_Details.video_duration. 0.0 if unknown
+    duration: float = 0.0
+    frame: int = 0
+    fps: float = 0.0
+    speed: float = 0.0
+    out_time: float = 0.0
+    finished: bool = False
+    _pending: bytes = b""
+    _values: dict[str, str] = dataclasses.field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        assert isinstance(self.duration, (int, float)) and self.duration >= 0, (
+            f"{self.duration=}. Must be int | float >= 0"
+        )
+
+    def feed(self, data: bytes) -> int:
+        """
+        Feeds raw bytes read from the progress pipe into the parser
+
+        Args:
+            data (bytes): The raw bytes, not necessarily line aligned
+
+        Returns:
+            int: The number of progress blocks completed by this data
+        """
+        assert isinstance(data, bytes), f"{data=}. Must be bytes"
+
+        blocks = 0
+        *lines, self._pending = (self._pending + data).split(b"\n")
+
+        for line in lines:
+            key, _, value = (
+                line.decode("utf-8", errors="replace").strip().partition("=")
+            )
+
+            if key != "progress":
+                self._values[key] = value.strip()
+                continue
+
+            blocks += 1
+            self.finished = value.strip() == "end"
+
+            try:
+                self.frame = int(self._values.get("frame", self.frame))
+            except ValueError:
+                pass
+
+            try:
+                self.fps = float(self._values.get("fps", self.fps))
+            except ValueError:
+                pass
+
+            try:
+                self.speed = float(self._values.get("speed", "").rstrip("x"))
+            except ValueError:
+                pass  # "N/A" until the encoder gets going
+
+            try:  # Despite its name, out_time_ms is also reported in microseconds
+                self.out_time = int(self._values.get("out_time_us", "")) / 1_000_000
+            except ValueError:
+                pass
+
+            self._values.clear()
+
+        return blocks
+
+    @property
+    def percentage(self) -> float:
+        """The percentage complete, 0.0 if the duration is unknown"""
+        if self.finished:
+            return 100.0
+
+        if self.duration <= 0:
+            return 0.0
+
+        return max(0.0, min(100.0, self.out_time / self.duration * 100))
+
+    @property
+    def eta(self) -> float:
+        """The estimated seconds remaining, -1.0 if it can not be determined yet"""
+        if self.finished:
+            return 0.0
+
+        if self.duration <= 0 or self.speed <= 0:
+            return -1.0
+
+        return max(0.0, (self.duration - self.out_time) / self.speed)
+
+    @property
+    def message(self) -> str:
+        """A human-readable progress line: frame, fps, speed, and ETA"""
+
+        def _hms(seconds: float) -> str:
+            minutes, secs = divmod(int(seconds), 60)
+            hours, minutes = divmod(minutes, 60)
+            return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+        eta = self.eta
+
+        return (
+            f"frame={self.frame} fps={self.fps:.1f} speed={self.speed:.2f}x"
+            f" time={_hms(self.out_time)}"
+            f" eta={_hms(eta) if eta >= 0 else '--:--:--'}"
+        )
+
+
+def _Return_Code_Result(
+    return_code: int,
+    commands: list[str],
+    output: str,
+    stderr_output: str,
+    debug: bool,
+) -> tuple[int, str]:
+    """
+    Converts the return code of a finished command into the Execute_Check_Output result tuple
+
+    Args:
+        return_code (int): The command return code
+        commands (list[str]): The command that was run
+        output (str): The stdout text
+        stderr_output (str): The stderr text
+        debug (bool): If True, debug information will be printed
+
+    Returns:
+        tuple[int, str]:
+        - arg1: 1 if the command is successful, -1 if the command fails.
+        - arg2: The output if the command is successful, if the command fails, an error message.
+    """
+    if return_code == 0 or return_code == 1:  # ffmpeg special case
+        return 1, str(output)
+
+    if return_code == 127:
+        message = (
+            f"Program Not Found Or Exited Abnormally \n {' '.join(commands)} ::"
+            f" {stderr_output or output}"
+        )
+    elif return_code <= 125:
+        message = f"{return_code} Command Failed!\n {' '.join(commands)} :: {stderr_output or output}"
+    else:
+        message = (
+            f"{return_code} Command Crashed!\n {' '.join(commands)} ::"
+            f" {stderr_output or output}"
+        )
+    if debug and not Is_Complied():
+        print(f"DBG {message} {return_code=} :: {output}")
+
+    return -1, message
+
+
+def _Child_Exited(process: subprocess.Popen) -> bool:
+    """
+    Checks if a child has exited without reaping it, so its resource usage can still be collected by os.wait4
+
+    Args:
+        process (subprocess.Popen): The child process
+
+    Returns:
+        bool: True if the child has exited
+    """
+    try:
+        return (
+            os.waitid(os.P_PID, process.pid, os.WEXITED | os.WNOHANG | os.WNOWAIT)
+            is not None
+        )
+    except ChildProcessError:  # Already reaped
+        return True
+
+
+def _Reap_Child(process: subprocess.Popen) -> "resource.struct_rusage | None":
+    """
+    Waits for a child to exit and collects the resources it used
+
+    Args:
+        process (subprocess.Popen): The child process
+
+    Returns:
+        resource.struct_rusage | None: The child resource usage or None if the child was already reaped
+    """
+    try:
+        _, status, rusage = os.wait4(process.pid, 0)
+    except ChildProcessError:
+        process.wait()
+        return None
+
+    process.returncode = os.waitstatus_to_exitcode(status)
+
+    return rusage
+
+
+@functools.cache
+def _IO_Priority_Setter() -> Callable[[int], int] | None:
+    """
+    Looks up the Linux ioprio_set syscall, Python has no wrapper for it. Resolved in the parent so the child only has
+    to make the call
+
+    Returns:
+        Callable[[int], int] | None: Sets the I/O priority of the calling process, or None if not available
+    """
+    syscall_number = _IOPRIO_SET_SYSCALLS.get(platform.machine())
+
+    if platform.system() != "Linux" or syscall_number is None:
+        return None
+
+    try:
+        libc_syscall = ctypes.CDLL(None, use_errno=True).syscall
+    except (OSError, AttributeError):
+        return None
+
+    # IOPRIO_WHO_PROCESS, this process
+    return functools.partial(libc_syscall, syscall_number, 1, 0)
+
+
+def _Priority_Preexec(priority: str) -> Callable[[], None] | None:
+    """
+    Builds the preexec_fn that lowers the CPU and I/O priority of a child before it execs, so every thread and
+    child process the tool starts inherits it
+
+    Args:
+        priority (str): PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND or PRIORITY_IDLE
+
+    Returns:
+        Callable[[], None] | None: The preexec_fn or None when the priority is left alone, which keeps the faster
+        vfork/posix_spawn start up for interactive commands
+    """
+    if priority not in _PRIORITY_SETTINGS or not hasattr(os, "setpriority"):
+        return None
+
+    niceness, io_priority = _PRIORITY_SETTINGS[priority]
+    io_priority_setter = _IO_Priority_Setter()
+
+    def _lower_priority() -> None:
+        try:
+            if os.getpriority(os.PRIO_PROCESS, 0) < niceness:
+                os.setpriority(os.PRIO_PROCESS, 0, niceness)
+        except OSError:
+            pass
+
+        if io_priority_setter is not None:
+            io_priority_setter(io_priority)  # Failure leaves the inherited I/O priority
+
+    return _lower_priority
+
+
+@contextlib.contextmanager
+def Task_Priority(priority: str):
+    """
+    Sets the priority class of the external tools the calling thread starts inside the with block, unless a call
+    passes its own priority
+
+    Args:
+        priority (str): PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND or PRIORITY_IDLE
+    """
+    assert priority in (PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND, PRIORITY_IDLE), (
+        f"{priority=}. Must be a PRIORITY_ constant"
+    )
+
+    previous = Current_Priority()
+    _task_priority.priority = priority
+
+    try:
+        yield
+    finally:
+        _task_priority.priority = previous
+
+
+def Current_Priority() -> str:
+    """
+    Returns the priority class set by Task_Priority for the calling thread
+
+    Returns:
+        str: The priority class, PRIORITY_INTERACTIVE if none is set
+    """
+    return getattr(_task_priority, "priority", PRIORITY_INTERACTIVE)
+
+
 def Execute_Check_Output(
     commands: list[str],
     env: dict | None = None,
@@ -38,11 +513,20 @@ def Execute_Check_Output(
     shell: bool = False,
     stderr_to_stdout: bool = False,
     cancellation_callback: Optional[Callable[[], bool]] = None,
+    progress_callback: Optional[Callable[[float, str], None]] = None,
+    progress_duration: float = 0.0,
+    stdout_capture: Output_Capture | None = None,
+    stderr_capture: Output_Capture | None = None,
+    priority: str = "",
+    line_callback: Optional[Callable[[str], bool]] = None,
+    stdout_callback: Optional[Callable[[bytes], bool]] = None,
+    pass_fds: tuple[int, ...] = (),
 ) -> tuple[int, str]:
     """
     Executes the given command(s) with the subprocess.Popen method.
 
-    This wrapper provides better error and debug handling
+    This wrapper provides better error and debug handling. Output is gathered with a selector so the calling
+    thread only wakes when the child writes output, exits or a cancellation is requested.
 
     Args:
         commands (list[str]): non-empty list of commands and options to be executed.
@@ -51,12 +535,36 @@ def Execute_Check_Output(
         debug (bool): If True, debug information will be printed. Defaults to False
         shell (bool): If True,  the command will be executed using the shell. Defaults to False
         stderr_to_stdout (bool): If True, the command will feed the stderr to stdout. Defaults to False.
+        cancellation_callback (Optional[Callable[[], bool]]): Returns True when the command is to be cancelled.
+            Defaults to None (Cancel_All_Tasks)
+        progress_callback (Optional[Callable[[float, str], None]]): If supplied and the command is ffmpeg, ffmpeg
+            reports through -progress on a private pipe and this is called with the percentage and a
+            frame/fps/speed/ETA message. Defaults to None
+        progress_duration (float): The input duration in seconds used to turn ffmpeg's out_time into a percentage.
+            Defaults to 0.0 (unknown, the percentage stays at 0.0 until ffmpeg finishes)
+        stdout_capture (Output_Capture | None): How stdout is held. Defaults to None (CAPTURE_FULL). If a
+            CAPTURE_SPILL capture overflows, the returned output is "" and is read from stdout_capture.file()
+        stderr_capture (Output_Capture | None): How stderr is held. Defaults to None (CAPTURE_TAIL)
+        priority (str): PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND or PRIORITY_IDLE. Defaults to "" (the
+            Task_Priority of the calling thread)
+        line_callback (Optional[Callable[[str], bool]]): If supplied, stdout is decoded a line at a time and passed
+            to this instead of being captured. Returning False stops the command early, which counts as success.
+            Defaults to None
+        stdout_callback (Optional[Callable[[bytes], bool]]): If supplied, raw stdout is passed to this as it is
+            read, in chunks of any size, instead of being captured. Returning False stops the command early, which
+            counts as success. Defaults to None
+        pass_fds (tuple[int, ...]): Extra file descriptors the command inherits, such as the write end of a pipe
+            it outputs a second stream to. They are closed in this process when the command is started, even if
+            it fails to start. Defaults to ()
 
     Returns:
         tuple[int, str]: A tuple containing the status code and the output of the command.
 
-        - arg1: 1 if the command is successful, -1 if the command fails.
+        - arg1: 1 if the command is successful, -1 if the command fails, -2 if the command was cancelled.
         - arg2: "" if the command is successful, if the command fails, an error message.
+
+    Note:
+        If Command_Metrics is enabled the wall time, CPU time, peak RSS and block I/O of the child are recorded
     """
     final_result: int = -1
     final_message: str = "Command did not execute or an unexpected error occurred."
@@ -75,9 +583,56 @@ def Execute_Check_Output(
     assert callable(cancellation_callback) or cancellation_callback is None, (
         f"{cancellation_callback=}. Must be a function or None"
     )
+    assert callable(progress_callback) or progress_callback is None, (
+        f"{progress_callback=}. Must be a function or None"
+    )
+    assert isinstance(progress_duration, (int, float)) and progress_duration >= 0, (
+        f"{progress_duration=}. Must be int | float >= 0"
+    )
+    assert isinstance(stdout_capture, Output_Capture) or stdout_capture is None, (
+        f"{stdout_capture=}. Must be Output_Capture or None"
+    )
+    assert isinstance(stderr_capture, Output_Capture) or stderr_capture is None, (
+        f"{stderr_capture=}. Must be Output_Capture or None"
+    )
+    assert priority in ("", PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND, PRIORITY_IDLE), (
+        f"{priority=}. Must be a PRIORITY_ constant or empty"
+    )
+    assert callable(line_callback) or line_callback is None, (
+        f"{line_callback=}. Must be a function or None"
+    )
+    assert callable(stdout_callback) or stdout_callback is None, (
+        f"{stdout_callback=}. Must be a function or None"
+    )
+    assert line_callback is None or stdout_callback is None, (
+        f"{line_callback=}, {stdout_callback=}. Only one of them can be supplied"
+    )
+    assert isinstance(pass_fds, tuple) and all(
+        isinstance(fd, int) and fd >= 0 for fd in pass_fds
+    ), f"{pass_fds=}. Must be a tuple of int >= 0"
+
+    if stdout_capture is None:
+        stdout_capture = Output_Capture()
+
+    # stderr only ever feeds error messages, so the tail is enough
+    if stderr_capture is None:
+        stderr_capture = Output_Capture(policy=CAPTURE_TAIL)
+
+    cancel_all_tasks = Cancel_All_Tasks()
 
     if cancellation_callback is None:
-        cancellation_callback = Cancel_All_Tasks().is_cancellation_requested
+        cancellation_callback = cancel_all_tasks.is_cancellation_requested
+
+    # Cancellation sources that can wake the selector. A bare callback has no fd, so it must be polled
+    cancel_sources: list[Cancel_Task] = [cancel_all_tasks]
+    callback_owner = getattr(cancellation_callback, "__self__", None)
+
+    if isinstance(callback_owner, Cancel_Task):
+        if callback_owner is not cancel_all_tasks:
+            cancel_sources.append(callback_owner)
+        cancel_polled = False
+    else:
+        cancel_polled = True
 
     if debug and not Is_Complied():
         print(f"DBG Call command *** {' '.join(commands)}")
@@ -88,136 +643,258 @@ def Execute_Check_Output(
             )
         print("DBG Lets Do It!")
 
+    run_commands = commands
+    progress = None
+    progress_read_fd = None
+    progress_write_fd = None
+
+    if progress_callback is not None and os.path.basename(commands[0]).startswith(
+        "ffmpeg"
+    ):
+        # ffmpeg writes its progress blocks to a private pipe, so stdout/stderr capture stays untouched
+        progress = FFmpeg_Progress(duration=float(progress_duration))
+        progress_read_fd, progress_write_fd = os.pipe()
+        run_commands = [
+            commands[0],
+            "-progress",
+            f"pipe:{progress_write_fd}",
+            "-nostats",
+            *commands[1:],
+        ]
+
     subprocess_args = {
-        "args": commands if not execute_as_string else shlex.split(" ".join(commands)),
+        "args": run_commands
+        if not execute_as_string
+        else shlex.split(" ".join(run_commands)),
         "shell": shell,
-        "universal_newlines": True,
         "env": env,
         "stdout": subprocess.PIPE,
         "stderr": subprocess.STDOUT if stderr_to_stdout else subprocess.PIPE,
+        "pass_fds": (
+            (progress_write_fd, *pass_fds)
+            if progress_write_fd is not None
+            else pass_fds
+        ),
+        "preexec_fn": _Priority_Preexec(priority or Current_Priority()),
     }
 
     process = None
-    stdout_fd = None
-    stderr_fd = None
+    pid_fd = None
+    finished = False
+    line_buffer = bytearray()
+    line_state = {"stopped": False, "bytes": 0}
 
-    communicated_already = False
+    def _feed_lines(chunk: bytes) -> None:
+        """
+        Hands each complete stdout line to the line_callback, holding back any trailing partial line
 
-    try:
-        process = subprocess.Popen(**subprocess_args)
+        Args:
+            chunk (bytes): The stdout bytes just read, b"" flushes the held partial line
+        """
+        if line_state["stopped"]:
+            return
 
-        if debug and not Is_Complied():
-            print(
-                f"DBG Popen: Started process with PID {process.pid} for {' '.join(commands)}"
-            )
+        line_state["bytes"] += len(chunk)
+        line_buffer.extend(chunk)
 
-        stdout_buffer = []
-        stderr_buffer = []
+        if chunk:
+            line_end = line_buffer.rfind(b"\n")
 
-        if process.stdout:
-            stdout_fd = process.stdout.fileno()
-            os.set_blocking(stdout_fd, False)
+            if line_end == -1:
+                return
 
-        if process.stderr and not stderr_to_stdout:
-            stderr_fd = process.stderr.fileno()
-            os.set_blocking(stderr_fd, False)
+            lines = line_buffer[:line_end].split(b"\n")
+            del line_buffer[: line_end + 1]
+        else:
+            lines = [bytes(line_buffer)] if line_buffer.strip() else []
+            line_buffer.clear()
 
-        # Polling loop for cooperative cancellation and incremental output capture
-        while process.poll() is None:
+        for line in lines:
             if (
-                cancellation_callback and cancellation_callback()
-            ) or Cancel_All_Tasks().is_cancellation_requested():
-                if debug and not Is_Complied():
-                    print(
-                        f"DBG ECO: Cancellation detected for PID {process.pid}. Terminating..."
-                    )
+                line_callback(line.decode("utf-8", errors="replace").rstrip("\r"))
+                is False
+            ):
+                line_state["stopped"] = True
+                return
 
-                process.terminate()
+    def _feed_stdout(chunk: bytes) -> None:
+        """
+        Hands raw stdout to the stdout_callback as it is read
 
-                try:
-                    process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    if debug and not Is_Complied():
-                        print(
-                            f"DBG ECO: Process {process.pid} did not terminate gracefully. Killing it."
-                        )
-                    process.kill()
-                    process.wait()
+        Args:
+            chunk (bytes): The stdout bytes just read
+        """
+        if line_state["stopped"]:
+            return
 
-                stdout_rem, stderr_rem = process.communicate()
+        line_state["bytes"] += len(chunk)
 
-                if stdout_rem:
-                    stdout_buffer.append(stdout_rem)
-                if not stderr_to_stdout and stderr_rem:
-                    stderr_buffer.append(stderr_rem)
-                communicated_already = True
+        if stdout_callback(chunk) is False:
+            line_state["stopped"] = True
 
-                final_result = -2
-                final_message = "".join(stdout_buffer).strip()
-                break
+    command_metrics = Command_Metrics()
+    collect_rusage = command_metrics.enabled and hasattr(os, "wait4")
+    rusage = None
+    start_time = time.perf_counter()
 
-            # Read non-blocking output
-            if process.stdout:
-                try:
-                    chunk = process.stdout.read(4096)
-                    if chunk:
-                        stdout_buffer.append(chunk)
-                except BlockingIOError:
-                    pass
-                except ValueError:
-                    pass
+    try:
+        try:
+            process = subprocess.Popen(**subprocess_args)
+        finally:
+            # Only the child writes to the progress pipe
+            if progress_write_fd is not None:
+                os.close(progress_write_fd)
 
-            if process.stderr and not stderr_to_stdout:
-                try:
-                    chunk = process.stderr.read(4096)
-                    if chunk:
-                        stderr_buffer.append(chunk)
-                except BlockingIOError:
-                    pass
-                except ValueError:
-                    pass
+            for fd in pass_fds:  # Or to the caller's pipes
+                os.close(fd)
 
-            sleep(0.01)
+        if debug and not Is_Complied():
+            print(
+                f"DBG Popen: Started process with PID {process.pid} for {' '.join(commands)}"
+            )
 
-        if (
-            not communicated_already
-        ):  # Process completed normally or due to external factors.
-            stdout_final, stderr_final = process.communicate()
+        pipe_buffers: dict[int, Callable[[bytes], None]] = {}
 
-            if stdout_final:
-                stdout_buffer.append(stdout_final)
+        if process.stdout:
+            if line_callback is not None:
+                pipe_buffers[process.stdout.fileno()] = _feed_lines
+            elif stdout_callback is not None:
+                pipe_buffers[process.stdout.fileno()] = _feed_stdout
+            else:
+                pipe_buffers[process.stdout.fileno()] = stdout_capture.write
 
-            if not stderr_to_stdout and stderr_final:
-                stderr_buffer.append(stderr_final)
+        if process.stderr and not stderr_to_stdout:
+            pipe_buffers[process.stderr.fileno()] = stderr_capture.write
 
-            communicated_already = True
+        with selectors.DefaultSelector() as selector:
+            for fd, buffer in pipe_buffers.items():
+                os.set_blocking(fd, False)
+                selector.register(fd, selectors.EVENT_READ, buffer)
 
-            output = "".join(stdout_buffer).strip()
-            final_stderr_output = "".join(stderr_buffer).strip()
+            if progress_read_fd is not None:
+                os.set_blocking(progress_read_fd, False)
+                selector.register(progress_read_fd, selectors.EVENT_READ, "progress")
 
-            return_code = process.returncode
+            for cancel_source in cancel_sources:
+                selector.register(
+                    cancel_source.wakeup_fileno(), selectors.EVENT_READ, "cancel"
+                )
 
-            if return_code == 0 or return_code == 1:  # ffmpeg special case
-                final_result = 1
-                final_message = str(output)
-            else:
-                if return_code == 127:
-                    message = (
-                        f"Program Not Found Or Exited Abnormally \n {' '.join(commands)} ::"
-                        f" {final_stderr_output or output}"
+            # Linux 5.3+, the pidfd becomes readable on exit
+            if hasattr(os, "pidfd_open"):
+                try:
+                    pid_fd = os.pidfd_open(process.pid)
+                    selector.register(pid_fd, selectors.EVENT_READ, "exit")
+                except OSError:
+                    pid_fd = None
+
+            open_pipes = len(pipe_buffers)
+            exited = False
+
+            while True:
+                if (
+                    cancellation_callback()
+                    or cancel_all_tasks.is_cancellation_requested()
+                ):
+                    if debug and not Is_Complied():
+                        print(
+                            f"DBG ECO: Cancellation detected for PID {process.pid}. Terminating..."
+                        )
+
+                    process.terminate()
+
+                    try:
+                        process.wait(timeout=5)
+                    except subprocess.TimeoutExpired:
+                        if debug and not Is_Complied():
+                            print(
+                                f"DBG ECO: Process {process.pid} did not terminate gracefully. Killing it."
+                            )
+                        process.kill()
+                        process.wait()
+
+                    for fd, buffer in pipe_buffers.items():
+                        _Drain_Fd(fd, buffer)
+
+                    finished = True
+                    final_result = -2
+                    final_message = (
+                        "" if stdout_capture.spilled else stdout_capture.text().strip()
                     )
-                elif return_code <= 125:
-                    message = f"{return_code} Command Failed!\n {' '.join(commands)} :: {final_stderr_output or output}"
+                    break
+
+                # The line or stdout callback has all it needs
+                if line_state["stopped"]:
+                    process.terminate()
+
+                    try:
+                        process.wait(timeout=5)
+                    except subprocess.TimeoutExpired:
+                        process.kill()
+                        process.wait()
+
+                    finished = True
+                    final_result = 1
+                    final_message = ""
+                    break
+
+                if not exited:
+                    # poll() would reap the child and lose its rusage
+                    if collect_rusage:
+                        exited = _Child_Exited(process)
+                    else:
+                        exited = process.poll() is not None
+
+                if exited and open_pipes == 0:
+                    break
+
+                if cancel_polled or (open_pipes == 0 and pid_fd is None):
+                    timeout = ECO_POLL_TIMEOUT
                 else:
-                    message = (
-                        f"{return_code} Command Crashed!\n {' '.join(commands)} ::"
-                        f" {final_stderr_output or output}"
-                    )
-                if debug and not Is_Complied():
-                    print(f"DBG {message} {return_code=} :: {output}")
+                    timeout = None
+
+                for key, _ in selector.select(timeout):
+                    if key.data == "cancel":
+                        continue  # Handled at the top of the loop
+                    elif key.data == "exit":
+                        selector.unregister(key.fd)
+                        exited = True
+                    elif key.data == "progress":
+                        progress_data = []
+
+                        if _Drain_Fd(key.fd, progress_data.append):
+                            selector.unregister(key.fd)
+
+                        if progress.feed(b"".join(progress_data)) > 0:
+                            progress_callback(progress.percentage, progress.message)
+                    elif _Drain_Fd(key.fd, key.data):
+                        selector.unregister(key.fd)
+                        open_pipes -= 1
+
+        if not finished:  # Process completed normally or due to external factors.
+            if collect_rusage:
+                rusage = _Reap_Child(process)
+            else:
+                process.wait()
+            finished = True
+
+            if line_callback is not None:
+                _feed_lines(b"")
 
-                final_result = -1
-                final_message = message
+            final_stderr_output = stderr_capture.text().strip()
+
+            if stdout_capture.spilled:
+                output = ""  # Left in the spill file for the caller
+            else:
+                output = stdout_capture.text().strip()
+
+            final_result, final_message = _Return_Code_Result(
+                return_code=process.returncode,
+                commands=commands,
+                output=output,
+                stderr_output=final_stderr_output,
+                debug=debug,
+            )
 
     except FileNotFoundError:
         message = f"Command not found: '{commands[0]}'. Check your PATH."
@@ -237,18 +914,13 @@ def Execute_Check_Output(
         final_result = -1
         final_message = message
     finally:  # Clean up
-        if stdout_fd is not None:
-            try:
-                os.set_blocking(stdout_fd, True)
-            except OSError:
-                pass
-        if stderr_fd is not None:
-            try:
-                os.set_blocking(stderr_fd, True)
-            except OSError:
-                pass
+        if pid_fd is not None:
+            os.close(pid_fd)
+
+        if progress_read_fd is not None:
+            os.close(progress_read_fd)
 
-        if process and process.poll() is None and not communicated_already:
+        if process and process.poll() is None and not finished:
             if debug and not Is_Complied():
                 print(
                     f"DBG Execute_Check_Output: Ensuring process {process.pid} is terminated in finally block."
@@ -258,17 +930,467 @@ def Execute_Check_Output(
 
             try:
                 process.wait(timeout=1)
-                return final_result, final_message
-
             except subprocess.TimeoutExpired:
                 process.kill()
                 process.wait()
 
-                return final_result, final_message
+        if process:
+            for pipe in (process.stdout, process.stderr):
+                if pipe:
+                    pipe.close()
+
+            if command_metrics.enabled:
+                command_metrics.record(
+                    commands=commands,
+                    result=final_result,
+                    exit_code=process.returncode
+                    if process.returncode is not None
+                    else -1,
+                    wall_time=time.perf_counter() - start_time,
+                    rusage=rusage,
+                    output_bytes=stdout_capture.size
+                    + stderr_capture.size
+                    + line_state["bytes"],
+                )
 
     return final_result, final_message
 
 
+def Tool_Class(command: str) -> str:
+    """
+    Returns the concurrency class of an external tool, used to pick the Async_Tool_Engine limit that applies
+
+    Args:
+        command (str): The executable, e.g. sys_consts.FFMPG
+
+    Returns:
+        str: TOOL_FFMPEG, TOOL_FFPROBE, TOOL_IMAGEMAGICK or TOOL_OTHER
+    """
+    assert isinstance(command, str), f"{command=}. Must be str"
+
+    tool_name = os.path.basename(command)
+
+    if tool_name.startswith("ffprobe"):
+        return TOOL_FFPROBE
+    elif tool_name.startswith("ffmpeg"):
+        return TOOL_FFMPEG
+    elif tool_name in ("magick", "convert", "identify", "composite", "mogrify"):
+        return TOOL_IMAGEMAGICK
+
+    return TOOL_OTHER
+
+
+class Async_Tool_Engine(metaclass=Singleton):
+    """Runs external tools as asyncio subprocesses on one private event loop thread.
+
+    Each tool class has its own semaphore, so a batch of hundreds of ImageMagick or ffprobe calls is limited to a few
+    concurrent processes without tying up a Python thread per process. Cancellation follows Cancel_All_Tasks and any
+    per-task Cancel_Task, using their wakeup pipes.
+    """
+
+    def __init__(self):
+        cpu_count = os.cpu_count() or 2
+
+        self._tool_limits: dict[str, int] = {
+            TOOL_FFMPEG: max(1, cpu_count // 4),  # Encoders are already multithreaded
+            TOOL_FFPROBE: max(4, cpu_count),  # Mostly waiting on I/O
+            TOOL_IMAGEMAGICK: cpu_count,
+            TOOL_OTHER: max(4, cpu_count),
+        }
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._cancel_waiters: dict[int, set[asyncio.Event]] = {}
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="Async_Tool_Engine", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The event loop the engine runs its subprocesses on"""
+        return self._loop
+
+    def tool_limit(self, tool_class: str) -> int:
+        """
+        Returns the number of concurrent processes allowed for a tool class
+
+        Args:
+            tool_class (str): TOOL_FFMPEG, TOOL_FFPROBE, TOOL_IMAGEMAGICK or TOOL_OTHER
+
+        Returns:
+            int: The maximum number of concurrent processes
+        """
+        assert tool_class in self._tool_limits, (
+            f"{tool_class=}. Must be a TOOL_ constant"
+        )
+
+        return self._tool_limits[tool_class]
+
+    def set_tool_limit(self, tool_class: str, limit: int) -> None:
+        """
+        Sets the number of concurrent processes allowed for a tool class. Takes effect for commands not yet queued
+
+        Args:
+            tool_class (str): TOOL_FFMPEG, TOOL_FFPROBE, TOOL_IMAGEMAGICK or TOOL_OTHER
+            limit (int): The maximum number of concurrent processes
+        """
+        assert tool_class in self._tool_limits, (
+            f"{tool_class=}. Must be a TOOL_ constant"
+        )
+        assert isinstance(limit, int) and limit > 0, f"{limit=}. Must be int > 0"
+
+        def _set_limit() -> None:
+            self._tool_limits[tool_class] = limit
+            self._semaphores.pop(tool_class, None)
+
+        self._loop.call_soon_threadsafe(_set_limit)
+
+    def _semaphore(self, tool_class: str) -> asyncio.Semaphore:
+        """Returns the semaphore for the tool class. Only called on the engine loop"""
+        if tool_class not in self._semaphores:
+            self._semaphores[tool_class] = asyncio.Semaphore(
+                self._tool_limits[tool_class]
+            )
+
+        return self._semaphores[tool_class]
+
+    def _watch_cancel(self, fd: int, event: asyncio.Event) -> None:
+        """Sets the event when the cancellation wakeup fd becomes readable. Only called on the engine loop"""
+        waiters = self._cancel_waiters.setdefault(fd, set())
+
+        if not waiters:
+            self._loop.add_reader(fd, self._cancel_wakeup, fd)
+
+        waiters.add(event)
+
+    def _unwatch_cancel(self, fd: int, event: asyncio.Event) -> None:
+        """Stops the event being set by the cancellation wakeup fd. Only called on the engine loop"""
+        waiters = self._cancel_waiters.get(fd, set())
+        waiters.discard(event)
+
+        if not waiters and self._cancel_waiters.pop(fd, None) is not None:
+            self._loop.remove_reader(fd)
+
+    def _cancel_wakeup(self, fd: int) -> None:
+        """
+        The wakeup pipe is not drained (other threads may be selecting on it), so the reader is removed once the
+        waiters are woken; anyone still running re-arms it after checking the cancellation flag.
+        """
+        for event in self._cancel_waiters.pop(fd, set()):
+            event.set()
+
+        self._loop.remove_reader(fd)
+
+    async def execute(
+        self,
+        commands: list[str],
+        env: dict | None = None,
+        stderr_to_stdout: bool = False,
+        cancellation_callback: Optional[Callable[[], bool]] = None,
+        tool_class: str = "",
+        debug: bool = False,
+        metric_tags: tuple[str, str] = ("", ""),
+        priority: str = PRIORITY_INTERACTIVE,
+        stdout_capture: Output_Capture | None = None,
+        stderr_capture: Output_Capture | None = None,
+    ) -> tuple[int, str]:
+        """
+        Runs a command on the engine loop. Use Execute_Async or Execute_Batch rather than calling this directly
+
+        Args:
+            commands (list[str]): non-empty list of commands and options to be executed.
+            env (dict | None): A dictionary of environment variables to be set for the command. Defaults to None
+            stderr_to_stdout (bool): If True, the command will feed the stderr to stdout. Defaults to False.
+            cancellation_callback (Optional[Callable[[], bool]]): Returns True when the command is to be cancelled.
+                Defaults to None (Cancel_All_Tasks)
+            tool_class (str): The concurrency class. Defaults to "" (worked out from the command)
+            debug (bool): If True, debug information will be printed. Defaults to False
+            metric_tags (tuple[str, str]): The Command_Metrics task_id and stage of the submitting thread
+            priority (str): The priority class the command runs at. Defaults to PRIORITY_INTERACTIVE
+            stdout_capture (Output_Capture | None): How stdout is held. Defaults to None (CAPTURE_FULL). If a
+                CAPTURE_SPILL capture overflows, the returned output is "" and is read from stdout_capture.file()
+            stderr_capture (Output_Capture | None): How stderr is held. Defaults to None (CAPTURE_TAIL)
+
+        Returns:
+            tuple[int, str]: Same contract as Execute_Check_Output
+        """
+        assert isinstance(stdout_capture, Output_Capture) or stdout_capture is None, (
+            f"{stdout_capture=}. Must be Output_Capture or None"
+        )
+        assert isinstance(stderr_capture, Output_Capture) or stderr_capture is None, (
+            f"{stderr_capture=}. Must be Output_Capture or None"
+        )
+
+        if stdout_capture is None:
+            stdout_capture = Output_Capture()
+
+        # stderr only ever feeds error messages, so the tail is enough
+        if stderr_capture is None:
+            stderr_capture = Output_Capture(policy=CAPTURE_TAIL)
+
+        cancel_all_tasks = Cancel_All_Tasks()
+
+        if cancellation_callback is None:
+            cancellation_callback = cancel_all_tasks.is_cancellation_requested
+
+        cancel_fds = [cancel_all_tasks.wakeup_fileno()]
+        callback_owner = getattr(cancellation_callback, "__self__", None)
+        cancel_polled = not isinstance(callback_owner, Cancel_Task)
+
+        if not cancel_polled and callback_owner is not cancel_all_tasks:
+            cancel_fds.append(callback_owner.wakeup_fileno())
+
+        def _cancelled() -> bool:
+            return (
+                cancellation_callback() or cancel_all_tasks.is_cancellation_requested()
+            )
+
+        async with self._semaphore(tool_class or Tool_Class(commands[0])):
+            if _cancelled():  # Cancelled while queued
+                return -2, ""
+
+            if debug and not Is_Complied():
+                print(f"DBG Async command *** {' '.join(commands)}")
+
+            # asyncio reaps its children, so only wall time and the exit code are measured
+            command_metrics = Command_Metrics()
+            start_time = time.perf_counter()
+
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *commands,
+                    env={} if env is None else env,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.STDOUT
+                    if stderr_to_stdout
+                    else asyncio.subprocess.PIPE,
+                    preexec_fn=_Priority_Preexec(priority),
+                )
+            except FileNotFoundError:
+                return -1, f"Command not found: '{commands[0]}'. Check your PATH."
+            except Exception as e:
+                return -1, f"Error executing command {' '.join(commands)}: {e}"
+
+            async def _read_pipe(
+                stream: asyncio.StreamReader, write: Callable[[bytes], None]
+            ) -> None:
+                """Hands the output of a pipe to its capture as it is read"""
+                while chunk := await stream.read(ECO_READ_SIZE):
+                    write(chunk)
+
+            async def _communicate() -> None:
+                """Reads stdout and stderr until the command closes them, then waits for it to exit"""
+                await asyncio.gather(
+                    _read_pipe(process.stdout, stdout_capture.write),
+                    *(
+                        ()
+                        if stderr_to_stdout
+                        else (_read_pipe(process.stderr, stderr_capture.write),)
+                    ),
+                )
+                await process.wait()
+
+            def _output() -> str:
+                """Returns the stdout text, "" if it spilled to a file for the caller"""
+                return "" if stdout_capture.spilled else stdout_capture.text().strip()
+
+            communicate = asyncio.ensure_future(_communicate())
+            cancel_event = asyncio.Event()
+
+            try:
+                while not communicate.done():
+                    if _cancelled():
+                        process.terminate()
+
+                        try:
+                            await asyncio.wait_for(asyncio.shield(communicate), 5)
+                        except asyncio.TimeoutError:
+                            process.kill()
+
+                        await communicate
+
+                        if command_metrics.enabled:
+                            command_metrics.record(
+                                commands=commands,
+                                result=-2,
+                                exit_code=process.returncode,
+                                wall_time=time.perf_counter() - start_time,
+                                output_bytes=stdout_capture.size + stderr_capture.size,
+                                tags=metric_tags,
+                            )
+
+                        return -2, _output()
+
+                    cancel_event.clear()
+
+                    for fd in cancel_fds:
+                        self._watch_cancel(fd, cancel_event)
+
+                    cancel_wait = asyncio.ensure_future(cancel_event.wait())
+
+                    await asyncio.wait(
+                        (communicate, cancel_wait),
+                        timeout=ECO_POLL_TIMEOUT if cancel_polled else None,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+
+                    cancel_wait.cancel()
+            finally:
+                for fd in cancel_fds:
+                    self._unwatch_cancel(fd, cancel_event)
+
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
+
+                if not communicate.done():
+                    communicate.cancel()
+
+            communicate.result()
+
+            result, message = _Return_Code_Result(
+                return_code=process.returncode,
+                commands=commands,
+                output=_output(),
+                stderr_output=stderr_capture.text().strip(),
+                debug=debug,
+            )
+
+            if command_metrics.enabled:
+                command_metrics.record(
+                    commands=commands,
+                    result=result,
+                    exit_code=process.returncode,
+                    wall_time=time.perf_counter() - start_time,
+                    output_bytes=stdout_capture.size + stderr_capture.size,
+                    tags=metric_tags,
+                )
+
+            return result, message
+
+    def submit(
+        self, commands: list[str], **kwargs
+    ) -> concurrent.futures.Future[tuple[int, str]]:
+        """
+        Queues a command from any thread
+
+        Args:
+            commands (list[str]): non-empty list of commands and options to be executed.
+            **kwargs: The keyword arguments of execute
+
+        Returns:
+            concurrent.futures.Future[tuple[int, str]]: Resolves to the Execute_Check_Output style result
+        """
+        # The loop thread has no Command_Metrics scope or Task_Priority of its own, so carry the submitter's across
+        kwargs.setdefault("metric_tags", Command_Metrics().tags)
+        kwargs.setdefault("priority", Current_Priority())
+
+        return asyncio.run_coroutine_threadsafe(
+            self.execute(commands, **kwargs), self._loop
+        )
+
+
+async def Execute_Async(
+    commands: list[str],
+    env: dict | None = None,
+    stderr_to_stdout: bool = False,
+    cancellation_callback: Optional[Callable[[], bool]] = None,
+    tool_class: str = "",
+    debug: bool = False,
+) -> tuple[int, str]:
+    """
+    Asyncio counterpart of Execute_Check_Output. The command runs on the Async_Tool_Engine loop under its tool class
+    concurrency limit, so it may be awaited from any event loop.
+
+    Args:
+        commands (list[str]): non-empty list of commands and options to be executed.
+        env (dict | None): A dictionary of environment variables to be set for the command. Defaults to None
+        stderr_to_stdout (bool): If True, the command will feed the stderr to stdout. Defaults to False.
+        cancellation_callback (Optional[Callable[[], bool]]): Returns True when the command is to be cancelled.
+            Defaults to None (Cancel_All_Tasks)
+        tool_class (str): The concurrency class. Defaults to "" (worked out from the command)
+        debug (bool): If True, debug information will be printed. Defaults to False
+
+    Returns:
+        tuple[int, str]: A tuple containing the status code and the output of the command.
+
+        - arg1: 1 if the command is successful, -1 if the command fails, -2 if the command was cancelled.
+        - arg2: The output if the command is successful, if the command fails, an error message.
+    """
+    assert isinstance(commands, list) and len(commands) > 0, (
+        f"{commands=} must be a non-empty list of commands and options"
+    )
+    assert isinstance(env, dict) or env is None, f"{env=} must be dict or None"
+    assert isinstance(stderr_to_stdout, bool), f"{stderr_to_stdout=}. Must be bool"
+    assert callable(cancellation_callback) or cancellation_callback is None, (
+        f"{cancellation_callback=}. Must be a function or None"
+    )
+    assert isinstance(tool_class, str), f"{tool_class=}. Must be str"
+    assert isinstance(debug, bool), f"{debug=} must be bool"
+
+    engine = Async_Tool_Engine()
+    kwargs = {
+        "env": env,
+        "stderr_to_stdout": stderr_to_stdout,
+        "cancellation_callback": cancellation_callback,
+        "tool_class": tool_class,
+        "debug": debug,
+    }
+
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+
+    if running_loop is engine.loop:
+        return await engine.execute(commands, **kwargs)
+
+    return await asyncio.wrap_future(engine.submit(commands, **kwargs))
+
+
+def Execute_Batch(
+    command_list: list[list[str]],
+    env: dict | None = None,
+    stderr_to_stdout: bool = False,
+    cancellation_callback: Optional[Callable[[], bool]] = None,
+    debug: bool = False,
+) -> list[tuple[int, str]]:
+    """
+    Runs many short commands concurrently on the Async_Tool_Engine and waits for them all. Intended for synchronous
+    callers (worker threads) that would otherwise call Execute_Check_Output in a loop.
+
+    Args:
+        command_list (list[list[str]]): The commands, each a non-empty list of commands and options.
+        env (dict | None): A dictionary of environment variables to be set for every command. Defaults to None
+        stderr_to_stdout (bool): If True, the commands will feed the stderr to stdout. Defaults to False.
+        cancellation_callback (Optional[Callable[[], bool]]): Returns True when the batch is to be cancelled.
+            Defaults to None (Cancel_All_Tasks)
+        debug (bool): If True, debug information will be printed. Defaults to False
+
+    Returns:
+        list[tuple[int, str]]: The Execute_Check_Output style result of each command, in command_list order
+    """
+    assert isinstance(command_list, list) and all(
+        isinstance(commands, list) and len(commands) > 0 for commands in command_list
+    ), f"{command_list=}. Must be a list of non-empty command lists"
+
+    engine = Async_Tool_Engine()
+
+    futures = [
+        engine.submit(
+            commands,
+            env=env,
+            stderr_to_stdout=stderr_to_stdout,
+            cancellation_callback=cancellation_callback,
+            debug=debug,
+        )
+        for commands in command_list
+    ]
+
+    return [future.result() for future in futures]
+
+
 #### End From dvdarch_utils
 
 
@@ -288,6 +1410,8 @@ class Task_Def:
     aborted_callback: Callable = None
     progress_callback: Callable = None
     cargo: dict = dataclasses.field(default_factory=dict)
+    # The priority class of the external tools the task runs
+    priority: str = PRIORITY_INTERACTIVE
 
     def __post_init__(self):
         assert isinstance(self.task_id, str) and self.task_id.strip() != "", (
@@ -318,28 +1442,83 @@ class Task_Def:
         ), f"{self.progress_callback=}.Must be callable or None"
 
         assert isinstance(self.cargo, dict), f"{self.cargo=} Must be dict"
+        assert self.priority in (
+            PRIORITY_INTERACTIVE,
+            PRIORITY_BACKGROUND,
+            PRIORITY_IDLE,
+        ), f"{self.priority=}. Must be a PRIORITY_ constant"
 
 
 class Cancel_Task:
-    """ " Manages a cancellation signal for a specific task."""
+    """Manages a cancellation signal for a specific task.
+
+    Besides the thread-safe flag, a wakeup pipe is lazily created so that a selector can sleep on it and be woken the
+    moment cancellation is requested.
+    """
 
     def __init__(self):
         # threading.Event is thread-safe and efficient for signaling
         self._cancel_event = threading.Event()
+        self._wakeup_lock = threading.Lock()
+        self._wakeup_read_fd: int | None = None
+        self._wakeup_write_fd: int | None = None
+
+    def __del__(self):
+        for fd in (self._wakeup_read_fd, self._wakeup_write_fd):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+
+    def _wakeup_signal(self) -> None:
+        """Writes a byte to the wakeup pipe (if one exists) so any selector waiting on it returns."""
+        if self._wakeup_write_fd is not None:
+            try:
+                os.write(self._wakeup_write_fd, b"\0")
+            except (BlockingIOError, OSError):
+                pass  # Pipe already full, the waiters are already awake
 
     def request_cancellation(self):
         """Sets the internal flag to indicate cancellation is requested."""
 
-        self._cancel_event.set()  # Set the event, signaling cancellation
+        with self._wakeup_lock:
+            self._cancel_event.set()  # Set the event, signaling cancellation
+            self._wakeup_signal()
 
     def reset_cancellation(self):
         """Clears the internal flag, allowing new tasks to run without immediate cancellation."""
-        self._cancel_event.clear()  # Clear the event
+        with self._wakeup_lock:
+            self._cancel_event.clear()  # Clear the event
+
+            if self._wakeup_read_fd is not None:
+                try:
+                    while os.read(self._wakeup_read_fd, 4096):
+                        pass
+                except (BlockingIOError, OSError):
+                    pass
 
     def is_cancellation_requested(self) -> bool:
         """Checks if cancellation has been requested."""
         return self._cancel_event.is_set()
 
+    def wakeup_fileno(self) -> int:
+        """Returns the read end of the wakeup pipe, readable once cancellation has been requested.
+
+        Returns:
+            int: The file descriptor suitable for select/poll/epoll
+        """
+        with self._wakeup_lock:
+            if self._wakeup_read_fd is None:
+                self._wakeup_read_fd, self._wakeup_write_fd = os.pipe()
+                os.set_blocking(self._wakeup_read_fd, False)
+                os.set_blocking(self._wakeup_write_fd, False)
+
+                if self._cancel_event.is_set():
+                    self._wakeup_signal()
+
+            return self._wakeup_read_fd
+
 
 class Cancel_All_Tasks(Cancel_Task, metaclass=Singleton):
     """Manages a global cancellation signal for all tasks."""
@@ -0,0 +1,493 @@
+"""
+Records the resources (wall time, CPU time, peak memory and I/O) used by each external tool call so the costly
+stages of a DVD build or archive run can be found from data. Run python command_metrics.py for a report.
+
+Copyright (C) 2025  David Worboys (-:alumnus Moyhu Primary School et al.:-)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import atexit
+import contextlib
+import dataclasses
+import os
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Final, Iterator
+
+import platformdirs
+import QTPYGUI.sqldb as sqldb
+from QTPYGUI.utils import Singleton
+
+import sys_consts
+
+if TYPE_CHECKING:
+    import resource
+
+FLUSH_COUNT: Final[int] = 50  # Metrics are buffered and written in batches of this size
+REPORT_GROUPS: Final[tuple[str, ...]] = ("tool", "stage", "project")
+
+
+@dataclasses.dataclass(slots=True)
+class Command_Metric:
+    """The resources used by one external tool call"""
+
+    tool: str
+    command: str
+    result: int  # Execute_Check_Output result, 1: ok, -1: error, -2: cancelled
+    exit_code: int
+    wall_time: float  # Seconds
+    user_time: float = 0.0  # Seconds
+    sys_time: float = 0.0  # Seconds
+    max_rss_kb: int = 0
+    bytes_read: int = 0  # Block I/O, ru_inblock * 512
+    bytes_written: int = 0  # Block I/O, ru_oublock * 512
+    output_bytes: int = 0  # stdout and stderr bytes captured
+    task_id: str = ""
+    stage: str = ""
+    project: str = ""
+    started: float = 0.0  # Epoch seconds
+
+    def __post_init__(self) -> None:
+        assert isinstance(self.tool, str), f"{self.tool=}. Must be str"
+        assert isinstance(self.command, str), f"{self.command=}. Must be str"
+        assert isinstance(self.result, int), f"{self.result=}. Must be int"
+        assert isinstance(self.exit_code, int), f"{self.exit_code=}. Must be int"
+        assert isinstance(self.wall_time, (int, float)) and self.wall_time >= 0, (
+            f"{self.wall_time=}. Must be int | float >= 0"
+        )
+        assert isinstance(self.task_id, str), f"{self.task_id=}. Must be str"
+        assert isinstance(self.stage, str), f"{self.stage=}. Must be str"
+        assert isinstance(self.project, str), f"{self.project=}. Must be str"
+
+
+class Command_Metrics(metaclass=Singleton):
+    """Buffers Command_Metric records and writes them to the command_metrics table of the application database.
+
+    Collection is switched on and off with the COMMAND_METRICS_DBK setting. Each thread carries its own task_id and
+    stage tags (see scope), while the project tag is shared as a DVD build or archive run covers all its tasks.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._pending: list[Command_Metric] = []
+        self._project = ""
+
+        db_settings = sqldb.App_Settings(sys_consts.PROGRAM_NAME)
+        self._enabled = bool(db_settings.setting_get(sys_consts.COMMAND_METRICS_DBK))
+
+        atexit.register(self.flush)
+
+    @property
+    def enabled(self) -> bool:
+        """True if external tool calls are being measured"""
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        """Turns measurement on or off and saves the choice in the application settings
+
+        Args:
+            value (bool): True to measure external tool calls
+        """
+        assert isinstance(value, bool), f"{value=}. Must be bool"
+
+        self._enabled = value
+        sqldb.App_Settings(sys_consts.PROGRAM_NAME).setting_set(
+            sys_consts.COMMAND_METRICS_DBK, value
+        )
+
+    @property
+    def project(self) -> str:
+        """The project the current DVD build or archive run belongs to"""
+        return self._project
+
+    @project.setter
+    def project(self, value: str) -> None:
+        """Sets the project tag applied to subsequent records
+
+        Args:
+            value (str): The project name
+        """
+        assert isinstance(value, str), f"{value=}. Must be str"
+
+        self._project = value
+
+    @contextlib.contextmanager
+    def scope(self, task_id: str = "", stage: str = "") -> Iterator[None]:
+        """Tags the tool calls made by this thread inside the with block
+
+        Args:
+            task_id (str): The background task id. Defaults to ""
+            stage (str): The stage of the build the calls belong to. Defaults to ""
+        """
+        assert isinstance(task_id, str), f"{task_id=}. Must be str"
+        assert isinstance(stage, str), f"{stage=}. Must be str"
+
+        previous = self.tags
+        self._local.tags = (task_id, stage)
+
+        try:
+            yield
+        finally:
+            self._local.tags = previous
+
+    @property
+    def tags(self) -> tuple[str, str]:
+        """The task_id and stage of the calling thread's scope"""
+        return getattr(self._local, "tags", ("", ""))
+
+    def record(
+        self,
+        commands: list[str],
+        result: int,
+        exit_code: int,
+        wall_time: float,
+        rusage: "resource.struct_rusage | None" = None,
+        output_bytes: int = 0,
+        tool: str = "",
+        tags: tuple[str, str] | None = None,
+    ) -> None:
+        """Buffers the metrics of a finished tool call, writing the buffer out once it is FLUSH_COUNT long
+
+        Args:
+            commands (list[str]): The command and its options
+            result (int): The Execute_Check_Output result, 1: ok, -1: error, -2: cancelled
+            exit_code (int): The process return code
+            wall_time (float): Seconds from start to exit
+            rusage (resource.struct_rusage | None): The resources the child used, from os.wait4. Defaults to None
+            output_bytes (int): Bytes of output captured. Defaults to 0
+            tool (str): The tool name. Defaults to "" (the executable name)
+            tags (tuple[str, str] | None): The task_id and stage. Defaults to None (the calling thread's scope)
+        """
+        assert isinstance(commands, list) and len(commands) > 0, (
+            f"{commands=}. Must be a non-empty list"
+        )
+
+        task_id, stage = self.tags if tags is None else tags
+
+        metric = Command_Metric(
+            tool=tool or os.path.basename(commands[0]),
+            command=" ".join(str(command) for command in commands),
+            result=result,
+            exit_code=exit_code,
+            wall_time=wall_time,
+            output_bytes=output_bytes,
+            task_id=task_id,
+            stage=stage,
+            project=self._project,
+            started=time.time() - wall_time,
+        )
+
+        if rusage is not None:
+            metric.user_time = rusage.ru_utime
+            metric.sys_time = rusage.ru_stime
+            # Linux reports KB, macOS reports bytes
+            metric.max_rss_kb = (
+                rusage.ru_maxrss // 1024
+                if sys.platform == "darwin"
+                else rusage.ru_maxrss
+            )
+            metric.bytes_read = rusage.ru_inblock * 512
+            metric.bytes_written = rusage.ru_oublock * 512
+
+        with self._lock:
+            self._pending.append(metric)
+            flush_due = len(self._pending) >= FLUSH_COUNT
+
+        if flush_due:
+            self.flush()
+
+    def _db_open(self) -> sqldb.SQLDB | None:
+        """Opens the application database on the calling thread, creating the metrics table if needed
+
+        Returns:
+            sqldb.SQLDB | None: The database or None if it could not be opened
+        """
+        data_path = platformdirs.user_data_dir(sys_consts.PROGRAM_NAME)
+
+        if not os.path.exists(data_path):
+            return None
+
+        app_database = sqldb.SQLDB(
+            appname=sys_consts.PROGRAM_NAME,
+            dbpath=data_path,
+            dbfile=sys_consts.PROGRAM_NAME,
+            suffix=".db",
+            dbpassword="666evil",
+        )
+
+        if app_database.get_error_status().code == -1:
+            return None
+
+        if not app_database.table_exists(sys_consts.COMMAND_METRICS):
+            command_metrics_def = (
+                sqldb.ColDef(
+                    name="id",
+                    description="pk_id",
+                    data_type=sqldb.SQL.INTEGER,
+                    primary_key=True,
+                ),
+                sqldb.ColDef(
+                    name="tool",
+                    description="Tool Name",
+                    data_type=sqldb.SQL.VARCHAR,
+                    size=40,
+                    index=True,
+                ),
+                sqldb.ColDef(
+                    name="command",
+                    description="Command Line",
+                    data_type=sqldb.SQL.TEXT,
+                ),
+                sqldb.ColDef(
+                    name="result",
+                    description="1 ok, -1 error, -2 cancelled",
+                    data_type=sqldb.SQL.INTEGER,
+                ),
+                sqldb.ColDef(
+                    name="exit_code",
+                    description="Process Return Code",
+                    data_type=sqldb.SQL.INTEGER,
+                ),
+                sqldb.ColDef(
+                    name="wall_time",
+                    description="Wall Time Seconds",
+                    data_type=sqldb.SQL.DECIMAL,
+                    size=12,
+                    num_decs=3,
+                ),
+                sqldb.ColDef(
+                    name="user_time",
+                    description="User CPU Seconds",
+                    data_type=sqldb.SQL.DECIMAL,
+                    size=12,
+                    num_decs=3,
+                ),
+                sqldb.ColDef(
+                    name="sys_time",
+                    description="System CPU Seconds",
+                    data_type=sqldb.SQL.DECIMAL,
+                    size=12,
+                    num_decs=3,
+                ),
+                sqldb.ColDef(
+                    name="max_rss_kb",
+                    description="Peak Resident Memory KB",
+                    data_type=sqldb.SQL.INTEGER,
+                ),
+                sqldb.ColDef(
+                    name="bytes_read",
+                    description="Block Bytes Read",
+                    data_type=sqldb.SQL.INTEGER,
+                ),
+                sqldb.ColDef(
+                    name="bytes_written",
+                    description="Block Bytes Written",
+                    data_type=sqldb.SQL.INTEGER,
+                ),
+                sqldb.ColDef(
+                    name="output_bytes",
+                    description="Output Bytes Captured",
+                    data_type=sqldb.SQL.INTEGER,
+                ),
+                sqldb.ColDef(
+                    name="task_id",
+                    description="Background Task Id",
+                    data_type=sqldb.SQL.VARCHAR,
+                    size=255,
+                ),
+                sqldb.ColDef(
+                    name="stage",
+                    description="Build Stage",
+                    data_type=sqldb.SQL.VARCHAR,
+                    size=80,
+                    index=True,
+                ),
+                sqldb.ColDef(
+                    name="project",
+                    description="Project Name",
+                    data_type=sqldb.SQL.VARCHAR,
+                    size=255,
+                    index=True,
+                ),
+                sqldb.ColDef(
+                    name="started",
+                    description="Start Time Epoch Seconds",
+                    data_type=sqldb.SQL.DECIMAL,
+                    size=16,
+                    num_decs=3,
+                ),
+            )
+
+            if (
+                app_database.table_create(
+                    table_name=sys_consts.COMMAND_METRICS,
+                    col_defs=command_metrics_def,
+                )
+                == -1
+            ):
+                app_database.disconnect()
+                return None
+
+        return app_database
+
+    def flush(self) -> tuple[int, str]:
+        """Writes the buffered metrics to the database
+
+        Returns:
+            tuple[int, str]:
+            - arg1 1: ok, -1: fail
+            - arg2: error message or "" if ok
+        """
+        with self._lock:
+            pending = self._pending
+            self._pending = []
+
+        if not pending:
+            return 1, ""
+
+        app_database = self._db_open()
+
+        if app_database is None:
+            return -1, "Failed To Open The Command Metrics Table"
+
+        columns = [field.name for field in dataclasses.fields(Command_Metric)]
+
+        try:
+            connection = app_database.get_connection
+            connection.executemany(
+                f"INSERT INTO {sys_consts.COMMAND_METRICS} ({','.join(columns)})"
+                f" VALUES ({','.join('?' * len(columns))})",
+                [[getattr(metric, column) for column in columns] for metric in pending],
+            )
+            connection.commit()
+        except Exception as error:
+            return -1, f"Failed To Write Command Metrics - {error}"
+        finally:
+            app_database.disconnect()
+
+        return 1, ""
+
+    def report(
+        self, group_by: tuple[str, ...] = REPORT_GROUPS, project: str = ""
+    ) -> list[dict]:
+        """Aggregates the recorded metrics
+
+        Args:
+            group_by (tuple[str, ...]): The columns to group by, from tool, stage, project and task_id.
+                Defaults to REPORT_GROUPS
+            project (str): Only report this project. Defaults to "" (all projects)
+
+        Returns:
+            list[dict]: One dict per group holding the group columns, calls, failures, wall_time, cpu_time,
+            max_rss_kb, bytes_read and bytes_written, most wall time first. Empty if there is nothing recorded
+        """
+        assert isinstance(group_by, tuple) and all(
+            column in ("tool", "stage", "project", "task_id") for column in group_by
+        ), f"{group_by=}. Must be a tuple of tool, stage, project and task_id"
+        assert isinstance(project, str), f"{project=}. Must be str"
+
+        self.flush()
+
+        app_database = self._db_open()
+
+        if app_database is None:
+            return []
+
+        group_columns = ",".join(group_by)
+        aggregates = (
+            "COUNT(*) AS calls,"
+            " SUM(CASE WHEN result = 1 THEN 0 ELSE 1 END) AS failures,"
+            " SUM(wall_time) AS wall_time,"
+            " SUM(user_time + sys_time) AS cpu_time,"
+            " MAX(max_rss_kb) AS max_rss_kb,"
+            " SUM(bytes_read) AS bytes_read,"
+            " SUM(bytes_written) AS bytes_written"
+        )
+
+        try:
+            cursor = app_database.get_connection.execute(
+                f"SELECT {group_columns + ',' if group_columns else ''} {aggregates}"
+                f" FROM {sys_consts.COMMAND_METRICS}"
+                f"{' WHERE project = ?' if project else ''}"
+                f"{' GROUP BY ' + group_columns if group_columns else ''}"
+                " ORDER BY wall_time DESC",
+                (project,) if project else (),
+            )
+            column_names = [description[0] for description in cursor.description]
+
+            return [dict(zip(column_names, row)) for row in cursor.fetchall()]
+        finally:
+            app_database.disconnect()
+
+
+def Command_Metrics_Report(
+    group_by: tuple[str, ...] = REPORT_GROUPS, project: str = ""
+) -> str:
+    """Formats the command metrics report as a text table
+
+    Args:
+        group_by (tuple[str, ...]): The columns to group by. Defaults to REPORT_GROUPS
+        project (str): Only report this project. Defaults to "" (all projects)
+
+    Returns:
+        str: The report or a message if nothing has been recorded
+    """
+    rows = Command_Metrics().report(group_by=group_by, project=project)
+
+    if not rows:
+        return "No Command Metrics Recorded"
+
+    lines = [
+        " ".join(f"{column:<24}" for column in group_by)
+        + f" {'calls':>7} {'fails':>6} {'wall s':>10} {'cpu s':>10} {'max rss MB':>11}"
+        f" {'read MB':>10} {'write MB':>10}"
+    ]
+
+    for row in rows:
+        lines.append(
+            " ".join(f"{str(row[column])[:24]:<24}" for column in group_by)
+            + f" {row['calls']:>7} {row['failures']:>6} {row['wall_time'] or 0:>10.1f}"
+            f" {row['cpu_time'] or 0:>10.1f} {(row['max_rss_kb'] or 0) / 1024:>11.1f}"
+            f" {(row['bytes_read'] or 0) / 1048576:>10.1f} {(row['bytes_written'] or 0) / 1048576:>10.1f}"
+        )
+
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    # python command_metrics.py [on|off|tool|stage|project|task_id ...] [--project=name]
+    arguments = sys.argv[1:]
+
+    if arguments and arguments[0] in ("on", "off"):
+        Command_Metrics().enabled = arguments[0] == "on"
+        print(f"Command Metrics {'On' if Command_Metrics().enabled else 'Off'}")
+    else:
+        report_project = ""
+        report_groups = []
+
+        for argument in arguments:
+            if argument.startswith("--project="):
+                report_project = argument.split("=", 1)[1]
+            else:
+                report_groups.append(argument)
+
+        print(
+            Command_Metrics_Report(
+                group_by=tuple(report_groups) or REPORT_GROUPS, project=report_project
+            )
+        )
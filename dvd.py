@@ -32,15 +32,24 @@ import dvdarch_utils
 import QTPYGUI.file_utils as file_utils
 import sys_consts
 import QTPYGUI.utils as utils
-from archive_management import Archive_Manager
+from archive_management import Archive_Fan_Out_Outputs, Archive_Manager
+from bitrate_planner import Plan_Title_Bitrates
 from background_task_manager import Unpack_Result_Tuple, Task_Dispatcher
 from bkp.utils import Get_Unique_Id
-from break_circular import Execute_Check_Output, Task_Def
+from break_circular import (
+    CAPTURE_TAIL,
+    PRIORITY_BACKGROUND,
+    Execute_Check_Output,
+    Output_Capture,
+    Task_Def,
+)
+from command_metrics import Command_Metrics
 from sys_config import Video_Data
 
 DEBUG: Final[bool] = False
 
 # Note this is the sequence in which operations must happen
+PLAN_BITRATES: Final[str] = "plan_bitrates"
 VOB_ENCODING: Final[str] = "vob_encoding"
 EXTRACT_MENU_IMAGES: Final[str] = "extract_menu_images"
 CREATE_DVD_MENU: Final[str] = "create_dvd_menu"
@@ -68,6 +77,8 @@ class DVD_Config:
     _button_font_point_size: int = 12
     _button_font: str = ""
     _disk_title: str = ""
+    _draft_encode: bool = False
+    _chunked_encode: bool = False
     _menu_aspect_ratio: str = sys_consts.AR43  #
     _menu_buttons_across: int = 2
     _menu_buttons_per_page: int = 4
@@ -147,6 +158,44 @@ class DVD_Config:
         ), f"{value=}, Must be BLUERAY_ARCHIVE_SIZE | DVD_ARCHIVE_SIZE"
         self._archive_size = value
 
+    @property
+    def draft_encode(self) -> bool:
+        """
+            Gets the draft encode setting
+        Returns:
+            bool: True if the VOBs are single pass draft encodes, False for two pass encodes
+        """
+        return self._draft_encode
+
+    @draft_encode.setter
+    def draft_encode(self, value: bool):
+        """
+            Sets the draft encode setting
+        Args:
+            value (bool): True if the VOBs are single pass draft encodes, False for two pass encodes
+        """
+        assert isinstance(value, bool), f"{value=}. Must be bool"
+        self._draft_encode = value
+
+    @property
+    def chunked_encode(self) -> bool:
+        """
+            Gets the chunked encode setting
+        Returns:
+            bool: True if long videos are encoded in chunks at the same time, False for whole encodes
+        """
+        return self._chunked_encode
+
+    @chunked_encode.setter
+    def chunked_encode(self, value: bool):
+        """
+            Sets the chunked encode setting
+        Args:
+            value (bool): True if long videos are encoded in chunks at the same time, False for whole encodes
+        """
+        assert isinstance(value, bool), f"{value=}. Must be bool"
+        self._chunked_encode = value
+
     @property
     def input_videos(self) -> list[Video_Data] | tuple[Video_Data]:
         """
@@ -924,6 +973,7 @@ class DVD:
     _menu_image_folder: str = ""
     _tmp_folder: str = ""
     _vob_folder: str = ""
+    _fan_out_folder: str = ""
 
     _error_messages: list = dataclasses.field(default_factory=list)
     _errored: bool = False
@@ -936,6 +986,12 @@ class DVD:
     _archive_complete: bool = False
     _final_report_triggered: bool = False
 
+    # The planned average video bitrate in kbps of each source video file
+    _title_bitrates: dict[str, int] = dataclasses.field(default_factory=dict)
+
+    # The archive files encoded along with the DVD VOBs, keyed by source video file then archive output name
+    _fan_out_files: dict[str, dict[str, str]] = dataclasses.field(default_factory=dict)
+
     # file names
     _background_canvas_file: str = ""
 
@@ -1424,6 +1480,9 @@ class DVD:
 
         self._reset_new_state()
 
+        # Every external tool call of the build, archiving included, is charged to this project
+        Command_Metrics().project = self.dvd_config.project_name
+
         error_no, error_message = self._build_working_folders()
 
         if error_no == -1:
@@ -1443,7 +1502,7 @@ class DVD:
         if result == -1:
             return -1, message
 
-        self._build_sequence(VOB_ENCODING)
+        self._build_sequence(PLAN_BITRATES)
 
         return 1, ""
 
@@ -1455,8 +1514,9 @@ class DVD:
         Note: If then else order must not be changed due to external file dependencies
 
         Args:
-            build_action (str):  The build operation that needs to be performed. Must be one of VOB_ENCODING,
-                                EXTRACT_MENU_IMAGES, CREATE_DVD_MENU, CREATE_DVD_IMAGE, ARCHIVE_DVD_FILES
+            build_action (str):  The build operation that needs to be performed. Must be one of PLAN_BITRATES,
+                                VOB_ENCODING, EXTRACT_MENU_IMAGES, CREATE_DVD_MENU, CREATE_DVD_IMAGE,
+                                ARCHIVE_DVD_FILES
 
         Returns:
             None
@@ -1464,6 +1524,87 @@ class DVD:
         """
 
         #### Helper
+        def _start_plan_bitrates_task(task_def: Task_Def) -> None:
+            """
+            Handles the bitrate planning start task
+
+            Args:
+                task_def (Task_Def): Task Definition object
+
+            Returns:
+                None
+
+            """
+            assert isinstance(task_def, Task_Def), (
+                f"{task_def=}. Must be an instance of Task_Def"
+            )
+
+            if DEBUG:
+                print(f"DBG DVD SPBT Started {task_def.task_id=}")
+
+            if self.component_event_handler:
+                self.component_event_handler(
+                    sys_consts.NOTIFICATION_EVENT, "Planning DVD Title Bitrates"
+                )
+
+            return None
+
+        def _finish_plan_bitrates_task(task_def: Task_Def) -> None:
+            """
+            Handles the bitrate planning finish task
+
+            Args:
+                task_def (Task_Def): Task Definition object
+
+            Returns:
+                None
+
+            """
+            assert isinstance(task_def, Task_Def), (
+                f"{task_def=}. Must be an instance of Task_Def"
+            )
+
+            if DEBUG:
+                print(f"DBG DVD FPBT Finished {task_def.task_id=}")
+
+            if self.component_event_handler:
+                self.component_event_handler(
+                    sys_consts.NOTIFICATION_EVENT,
+                    "Finished Planning DVD Title Bitrates",
+                )
+
+            task_error_no, task_message, worker_error_no, worker_message = (
+                Unpack_Result_Tuple(task_def)
+            )
+
+            if (
+                task_error_no == 1
+                and worker_error_no == 1
+                and task_message.lower() == "all done"
+            ):
+                if DEBUG:
+                    print(f"DBG DVD FPBT: {self._title_bitrates=}")
+
+                self._build_sequence(VOB_ENCODING)
+
+            elif task_error_no != 1 or worker_error_no != 1:
+                self._error_messages.append(
+                    f"task {task_def.task_id} reported an error: TaskError={task_error_no}, "
+                    f"WorkerError={worker_error_no}, Message='{worker_message}'"
+                )
+
+                if self._component_event_handler:
+                    self.component_event_handler(
+                        sys_consts.NOTIFICATION_EVENT,
+                        self._error_messages[-1],
+                    )
+
+                self._errored = True
+
+            self._check_all_groups_completed()
+
+            return None
+
         def _start_menu_images_task(task_def: Task_Def) -> None:
             """
             Handles the menu image start task
@@ -1831,9 +1972,76 @@ class DVD:
         )
 
         # Note: The if/elif order is the build sequence and must be followed sequentially
-        if not self._errored and build_action == VOB_ENCODING:  # 1
+        if not self._errored and build_action == PLAN_BITRATES:  # 1
+            if self.dvd_config.draft_encode:  # A draft is encoded at a fixed quantiser
+                self._build_sequence(VOB_ENCODING)
+                return None
+
+            task_id = f"{PLAN_BITRATES}_{self._session_id}"
+            task_dispatch_name = f"D_{PLAN_BITRATES}_{self._session_id}"
+            task_prefix = f"P_PLAN_BITRATES_{self._session_id}"
+
+            task_def = Task_Def(
+                task_id=task_id,
+                task_prefix=task_prefix,
+                worker_function=Plan_Title_Bitrates,
+                kwargs={
+                    "titles": [
+                        (
+                            video_file.video_path,
+                            float(video_file.encoding_info.video_duration),
+                            self._title_dvd_standard(video_file),
+                        )
+                        for video_file in self.dvd_config.input_videos
+                    ],
+                    "title_bitrates": self._title_bitrates,
+                },
+            )
+
+            Task_Dispatcher().submit_task(
+                task_def=task_def,
+                task_dispatch_methods=[
+                    {
+                        "task_dispatch_name": task_dispatch_name,
+                        "callback": "start",
+                        "operation": task_prefix,
+                        "method": _start_plan_bitrates_task,
+                        "kwargs": {
+                            "task_def": task_def,
+                        },
+                    },
+                    {
+                        "task_dispatch_name": task_dispatch_name,
+                        "callback": "finish",
+                        "operation": task_prefix,
+                        "method": _finish_plan_bitrates_task,
+                        "kwargs": {
+                            "task_def": task_def,
+                        },
+                    },
+                    {
+                        "task_dispatch_name": task_dispatch_name,
+                        "callback": "error",
+                        "operation": task_prefix,
+                        "method": _error_task,
+                        "kwargs": {
+                            "task_def": task_def,
+                        },
+                    },
+                    {
+                        "task_dispatch_name": task_dispatch_name,
+                        "callback": "abort",
+                        "operation": task_prefix,
+                        "method": _abort_task,
+                        "kwargs": {
+                            "task_def": task_def,
+                        },
+                    },
+                ],
+            )
+        elif not self._errored and build_action == VOB_ENCODING:  # 2
             self._encode_video()
-        elif not self._errored and build_action == EXTRACT_MENU_IMAGES:  # 2
+        elif not self._errored and build_action == EXTRACT_MENU_IMAGES:  # 3
             task_id = f"{EXTRACT_MENU_IMAGES}_{self._session_id}"
             task_dispatch_name = f"D_{EXTRACT_MENU_IMAGES}_{self._session_id}"
             task_prefix = f"P_EXTRACT_MENU_IMAGES_{self._session_id}"
@@ -1887,7 +2095,7 @@ class DVD:
                 ],
             )
 
-        elif not self._errored and build_action == CREATE_DVD_MENU:  # 3
+        elif not self._errored and build_action == CREATE_DVD_MENU:  # 4
             task_id = f"{CREATE_DVD_MENU}_{self._session_id}"
             task_dispatch_ame = f"D_{CREATE_DVD_MENU}_{self._session_id}"
             task_prefix = f"P_CREATE_DVD_MENU_{self._session_id}"
@@ -1951,7 +2159,7 @@ class DVD:
                     ],
                 )
 
-        elif not self._errored and build_action == CREATE_DVD_IMAGE:  # 4
+        elif not self._errored and build_action == CREATE_DVD_IMAGE:  # 5
             task_id = f"{CREATE_DVD_IMAGE}_{self._session_id}"
             task_dispatch_name = f"D_{CREATE_DVD_IMAGE}_{self._session_id}"
             task_prefix = f"P_CREATE_DVD_IMAGE_{self._session_id}"
@@ -2014,7 +2222,7 @@ class DVD:
                     ],
                 )
 
-        elif not self._errored and build_action == ARCHIVE_DVD_FILES:  # 5
+        elif not self._errored and build_action == ARCHIVE_DVD_FILES:  # 6
             task_id = f"{ARCHIVE_DVD_FILES}_{self._session_id}"
             task_dispatch_name = f"D_{ARCHIVE_DVD_FILES}_{self._session_id}"
             task_prefix = f"P_{ARCHIVE_DVD_FILES}_{self._session_id}"
@@ -2099,6 +2307,9 @@ class DVD:
         self._create_dvd_image_complete = False
         self._archive_complete = False
 
+        self._title_bitrates = {}
+        self._fan_out_files = {}
+
         return None
 
     def _check_all_groups_completed(self) -> None:
@@ -2167,6 +2378,7 @@ class DVD:
                 streaming_folder=self.dvd_config.streaming_folder,
                 archive_size=self.dvd_config.archive_size,
                 transcode_type=self.dvd_config.transcode_type,
+                chunked_encode=self.dvd_config.chunked_encode,
             )
 
             archive_manager.component_event_handler = self.component_event_handler
@@ -2211,6 +2423,7 @@ class DVD:
                 dvd_folder=self.dvd_image_folder,
                 iso_folder=self.iso_folder,
                 menu_layout=menu_layout,
+                encoded_files=self._fan_out_files,
             )
 
             if result == -1:
@@ -2274,6 +2487,9 @@ class DVD:
             )
             self._tmp_folder = file_handler.file_join(self._dvd_working_folder, "tmp")
             self._vob_folder = file_handler.file_join(self._dvd_working_folder, "vobs")
+            self._fan_out_folder = file_handler.file_join(
+                self._dvd_working_folder, "fan_out"
+            )
 
             if file_handler.make_dir(self._dvd_out_folder) == -1:
                 return (
@@ -2309,6 +2525,14 @@ class DVD:
                     -1,
                     f"{self._vob_folder=}. Could Not Be Created Or Is Not Writeable",
                 )
+            if file_handler.make_dir(self._fan_out_folder) == -1:
+                return (
+                    -1,
+                    (
+                        f"{self._fan_out_folder=}. Could Not Be Created Or Is Not"
+                        " Writeable"
+                    ),
+                )
 
         if not file_handler.path_exists(
             self._dvd_working_folder
@@ -2328,6 +2552,26 @@ class DVD:
 
         return 1, ""
 
+    def _title_dvd_standard(self, video_data: Video_Data) -> str:
+        """Works out the DVD standard a source video is encoded to
+
+        Args:
+            video_data (Video_Data): The source video
+
+        Returns:
+            str: sys_consts.PAL or sys_consts.NTSC
+        """
+        assert isinstance(video_data, Video_Data), (
+            f"{video_data=}. Must be an instance of Video_Data"
+        )
+
+        return (
+            sys_consts.PAL
+            if video_data.encoding_info.video_frame_rate == 25
+            or video_data.encoding_info.video_height > sys_consts.NTSC_SPECS.height_43
+            else sys_consts.NTSC
+        )
+
     def _encode_video(self) -> tuple[int, str]:
         """Encodes the input video files as DVD VOB (mpeg2) files
 
@@ -2394,6 +2638,15 @@ class DVD:
                 Unpack_Result_Tuple(task_def)
             )
 
+            # An archive file that failed to encode along with the VOB is left to the archive to encode
+            for output_name, (output_result, output_file) in task_def.kwargs.get(
+                "output_results", {}
+            ).items():
+                if output_name != "vob" and output_result == 1:
+                    self._fan_out_files.setdefault(task_def.kwargs["input_file"], {})[
+                        output_name
+                    ] = output_file
+
             if (
                 task_error_no == 1
                 and worker_error_no == 1
@@ -2485,6 +2738,8 @@ class DVD:
             return None
 
         #### Main
+        file_handler = file_utils.File()
+
         for video_index, video_file in enumerate(self.dvd_config.input_videos):
             task_id = f"vob_{video_index}_{self._session_id}"
             dispatch_name = f"D_{VOB_ENCODING}_{video_index}_{self._session_id}"
@@ -2494,6 +2749,7 @@ class DVD:
                 task_id=task_id,
                 task_prefix=task_prefix,
                 worker_function=dvdarch_utils.Transcode_DVD_VOB,
+                priority=PRIORITY_BACKGROUND,
                 kwargs={
                     "input_file": video_file.video_path,
                     "output_folder": self._vob_folder,
@@ -2502,6 +2758,7 @@ class DVD:
                     "input_video_ar": video_file.encoding_info.video_ar,
                     "input_video_scan_type": video_file.encoding_info.video_scan_type,
                     "input_video_frame_rate": video_file.encoding_info.video_frame_rate,
+                    "input_video_duration": video_file.encoding_info.video_duration,
                     "auto_bright": video_file.video_file_settings.auto_bright,
                     "normalise": video_file.video_file_settings.normalise,
                     "white_balance": video_file.video_file_settings.white_balance,
@@ -2509,14 +2766,26 @@ class DVD:
                     "sharpen": video_file.video_file_settings.sharpen,
                     "filters_off": video_file.video_file_settings.filters_off,
                     "black_border": True,
-                    "dvd_standard": sys_consts.PAL
-                    if video_file.encoding_info.video_frame_rate == 25
-                    or video_file.encoding_info.video_height
-                    > sys_consts.NTSC_SPECS.height_43
-                    else sys_consts.NTSC,
+                    "draft": self.dvd_config.draft_encode,
+                    "chunked": self.dvd_config.chunked_encode,
+                    "video_bitrate": self._title_bitrates.get(video_file.video_path, 0),
+                    "dvd_standard": self._title_dvd_standard(video_file),
                 },
             )
 
+            if self.dvd_config.archive_folder:  # Archive encodes share the VOB decode
+                fan_out_outputs = Archive_Fan_Out_Outputs(
+                    video_data=video_file,
+                    transcode_type=self.dvd_config.transcode_type,
+                    output_folder=file_handler.file_join(
+                        self._fan_out_folder, str(video_index)
+                    ),
+                )
+
+                if fan_out_outputs:
+                    task_def.kwargs["fan_out_outputs"] = fan_out_outputs
+                    task_def.kwargs["output_results"] = {}
+
             Task_Dispatcher().submit_task(
                 task_def=task_def,
                 task_dispatch_methods=[
@@ -3561,19 +3830,18 @@ class DVD:
                 isinstance(canvas_select_file, str) and canvas_select_file.strip() != ""
             ), f"{canvas_select_file=}. Cannot be empty."
 
-            for file in (
-                canvas_overlay_file,
-                canvas_highlight_file,
-                canvas_select_file,
-            ):
-                result, message = dvdarch_utils.Create_Transparent_File(
-                    width=width,
-                    height=height,
-                    out_file=file,
-                )
+            result, message = dvdarch_utils.Create_Transparent_Files(
+                width=width,
+                height=height,
+                files=(
+                    (canvas_overlay_file, ""),
+                    (canvas_highlight_file, ""),
+                    (canvas_select_file, ""),
+                ),
+            )
 
-                if result == -1:
-                    return -1, message
+            if result != 1:
+                return -1, message
             return 1, ""
 
         def _create_outline_files(
@@ -3622,23 +3890,18 @@ class DVD:
             ), f"{select_border_colour=} . Must be non-empty str"
 
             # Create the 3 outline files we will need - highlight, select, overlay
-            for file in (
-                (overlay_file, "transparent"),
-                (highlight_file, highlight_border_colour),
-                (selected_file, select_border_colour),
-            ):
-                out_file = file[0]
-                border_color = file[1]
-
-                result, message = dvdarch_utils.Create_Transparent_File(
-                    width=width,
-                    height=height,
-                    out_file=out_file,
-                    border_color=border_color,
-                )
+            result, message = dvdarch_utils.Create_Transparent_Files(
+                width=width,
+                height=height,
+                files=(
+                    (overlay_file, "transparent"),
+                    (highlight_file, highlight_border_colour),
+                    (selected_file, select_border_colour),
+                ),
+            )
 
-                if result == -1:
-                    return -1, message
+            if result != 1:
+                return -1, message
 
             return 1, ""
 
@@ -4270,7 +4533,10 @@ class DVD:
                     ac3_file,
                 ]
 
-                result, message = Execute_Check_Output(commands=commands)
+                result, message = Execute_Check_Output(
+                    commands=commands,
+                    stdout_capture=Output_Capture(policy=CAPTURE_TAIL),
+                )
 
                 if result == -1:
                     return -1, message
@@ -4330,7 +4596,10 @@ class DVD:
                     ac3_file,
                 ]
 
-                result, message = Execute_Check_Output(commands=commands)
+                result, message = Execute_Check_Output(
+                    commands=commands,
+                    stdout_capture=Output_Capture(policy=CAPTURE_TAIL),
+                )
 
                 if result == -1:
                     return -1, message
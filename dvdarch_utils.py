@@ -17,6 +17,7 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+import concurrent.futures
 import dataclasses
 import fractions
 import glob
@@ -46,7 +47,42 @@ import QTPYGUI.utils as utils
 
 from background_task_manager import Task_QManager, Task_Dispatcher, Unpack_Result_Tuple
 from bkp.utils import Get_Unique_Id
-from break_circular import Execute_Check_Output, Task_Def
+from break_circular import (
+    CAPTURE_SPILL,
+    CAPTURE_TAIL,
+    PRIORITY_BACKGROUND,
+    TOOL_FFMPEG,
+    Async_Tool_Engine,
+    Execute_Batch,
+    Execute_Check_Output,
+    Output_Capture,
+    Task_Def,
+)
+from loudness_cache import (
+    Loudness_Cache,
+    Loudness_Measurement,
+    Loudnorm_Commands,
+    Loudnorm_Filter,
+    Loudnorm_Measure_Filter,
+    Parse_Loudnorm_Output,
+)
+from filmstrip_cache import (
+    FILMSTRIP_MAX_THUMBNAILS,
+    FILMSTRIP_MIN_SPACING,
+    FILMSTRIP_THUMB_HEIGHT,
+    Filmstrip,
+    Filmstrip_Cache,
+)
+from probe_cache import (
+    PROBE_DURATION,
+    PROBE_IDENTITY,
+    PROBE_PROFILES,
+    Keyframe_Index,
+    Probe_Cache,
+)
+from proxy_cache import PROXY_EXTN, PROXY_HEIGHT, Proxy_Cache
+from passlog_cache import Pass_Log_Files, Passlog_Cache
+from render_cache import Render_Cache
 from sys_config import Encoding_Details, DVD_Menu_Page, Get_Video_Editor_Folder
 
 
@@ -201,6 +237,49 @@ class Cut_Video_Def:
         return self.end_cut / self.frame_rate
 
 
+@dataclasses.dataclass(slots=True)
+class Fan_Out_Output:
+    """One output of Transcode_Fan_Out. Each output is fed the shared decode of the input through its own filter chain"""
+
+    name: str  # Keys the output in the output results
+    output_file: str
+    # A filter chain as Build_Video_Filters makes it, without the "-vf"
+    video_filters: str = ""
+    # Used by both passes of a two pass output
+    video_options: list[str] = dataclasses.field(default_factory=list)
+    # No audio options means no audio
+    audio_options: list[str] = dataclasses.field(default_factory=list)
+    muxer_options: list[str] = dataclasses.field(default_factory=list)
+    # Makes the output two pass, the pass logs are removed once the output is done
+    passlog_file: str = ""
+
+    def __post_init__(self) -> None:
+        assert isinstance(self.name, str) and self.name.strip() != "", (
+            f"{self.name=}. Must be a non-empty str"
+        )
+        assert isinstance(self.output_file, str) and self.output_file.strip() != "", (
+            f"{self.output_file=}. Must be a non-empty str"
+        )
+        assert isinstance(self.video_filters, str), (
+            f"{self.video_filters=}. Must be str"
+        )
+        assert isinstance(self.video_options, list), (
+            f"{self.video_options=}. Must be a list"
+        )
+        assert isinstance(self.audio_options, list), (
+            f"{self.audio_options=}. Must be a list"
+        )
+        assert isinstance(self.muxer_options, list), (
+            f"{self.muxer_options=}. Must be a list"
+        )
+        assert isinstance(self.passlog_file, str), f"{self.passlog_file=}. Must be str"
+
+    @property
+    def two_pass(self) -> bool:
+        """True if the output is encoded in two passes"""
+        return self.passlog_file != ""
+
+
 def DVD_Percent_Used(total_duration: float, pop_error_message: bool = True) -> int:
     """
     Calculates the percentage of the DVD used based on the total duration of the videos assigned to that DVD.
@@ -1133,6 +1212,7 @@ def Concatenate_Videos(
                     task_id=f"CT_V_{video_index}_{video_file}_{session_id}",
                     task_prefix=operation,
                     worker_function=_transcode_video,
+                    priority=PRIORITY_BACKGROUND,
                     kwargs={
                         "input_file": video_file,
                         "transcode_path": transcode_path,
@@ -1422,7 +1502,10 @@ def Create_DVD_Iso(input_dir: str, output_file: str) -> tuple[int, str]:
         f"VIDEO_TS={input_dir}/VIDEO_TS",
     ]
 
-    return Execute_Check_Output(command)
+    # genisoimage -v lists every file it writes, only the tail is of any use for error reporting
+    return Execute_Check_Output(
+        command, stdout_capture=Output_Capture(policy=CAPTURE_TAIL)
+    )
 
 
 def Create_DVD_Case_Insert(
@@ -2809,13 +2892,11 @@ def Make_Opaque(color: str, opacity: float) -> tuple[int, str]:
     return 1, hex_color + opacity_hex
 
 
-def Create_Transparent_File(
-    width: int, height: int, out_file: str, border_color=""
-) -> tuple[int, str]:
+def _Transparent_File_Command(
+    width: int, height: int, out_file: str, border_color: str = ""
+) -> list[str]:
     """
-    Creates a transparent file of a given width and height.
-    If a border color is provided, a rectangle of that color is drawn
-    around the edge of the file
+    Returns the ImageMagick command that creates a transparent file of a given width and height.
 
     Args:
         width (int): Width of the new file
@@ -2825,9 +2906,7 @@ def Create_Transparent_File(
         file. Defaults to "".
 
     Returns:
-        tuple[int,str]:
-        - arg1 1: ok, -1: fail,
-        - arg2: error message or "" if ok
+        list[str]: The command
     """
     border_width = 10
 
@@ -2856,7 +2935,67 @@ def Create_Transparent_File(
             out_file,
         ]
 
-    return Execute_Check_Output(commands=command)
+    return command
+
+
+def Create_Transparent_File(
+    width: int, height: int, out_file: str, border_color=""
+) -> tuple[int, str]:
+    """
+    Creates a transparent file of a given width and height.
+    If a border color is provided, a rectangle of that color is drawn
+    around the edge of the file
+
+    Args:
+        width (int): Width of the new file
+        height (int): Height of the new file
+        out_file (str): The path for the new transparent file
+        border_color (str, optional): The border color of the transparent
+        file. Defaults to "".
+
+    Returns:
+        tuple[int,str]:
+        - arg1 1: ok, -1: fail,
+        - arg2: error message or "" if ok
+    """
+    return Execute_Check_Output(
+        commands=_Transparent_File_Command(width, height, out_file, border_color)
+    )
+
+
+def Create_Transparent_Files(
+    width: int, height: int, files: tuple[tuple[str, str], ...]
+) -> tuple[int, str]:
+    """
+    Creates several transparent files of a given width and height concurrently.
+
+    Args:
+        width (int): Width of the new files
+        height (int): Height of the new files
+        files (tuple[tuple[str, str], ...]): tuple[0] is the path for the new transparent file, tuple[1] the border
+        color ("" for no border)
+
+    Returns:
+        tuple[int,str]:
+        - arg1 1: ok, -1: fail, -2: cancelled
+        - arg2: error message or "" if ok
+    """
+    assert isinstance(width, int) and width > 0, f"{width=}. Must be int > 0"
+    assert isinstance(height, int) and height > 0, f"{height=}. Must be int > 0"
+    assert isinstance(files, tuple) and all(
+        isinstance(file_tuple, tuple) and len(file_tuple) == 2 for file_tuple in files
+    ), f"{files=}. Must be tuple of (out_file, border_color) tuples"
+
+    results = Execute_Batch([
+        _Transparent_File_Command(width, height, out_file, border_color)
+        for out_file, border_color in files
+    ])
+
+    for result, message in results:
+        if result != 1:
+            return result, message
+
+    return 1, ""
 
 
 def Overlay_File(
@@ -3392,707 +3531,1218 @@ def Build_Video_Filters(
     return ["-vf", vf_string] if vf_string else []
 
 
-def Transcode_DVD_VOB(
+def _Loudness_Measure_Output() -> list[str]:
+    """
+    Makes the ffmpeg output that measures the loudness of the first audio stream of the input. Appended to a command,
+    the audio is measured from the same decode as the other outputs
+
+    Returns:
+        list[str]: The output options and output, the measurement is logged to stderr for Parse_Loudnorm_Output
+    """
+    return [
+        "-map",
+        "0:a:0",
+        "-filter:a:0",
+        Loudnorm_Measure_Filter(),
+        "-f",
+        "null",
+        os.devnull,
+    ]
+
+
+def Measure_Loudness(
     input_file: str,
-    output_folder: str,
-    input_video_width: int,
-    input_video_height: int,
-    input_video_ar: str,  # e.g., "4:3", "16:9"
-    input_video_scan_type: str,  # "interlaced" or "progressive"
-    input_video_frame_rate: float,  # Actual frame rate of the input video
-    auto_bright: bool,
-    normalise: bool,
-    white_balance: bool,
-    denoise: bool,
-    sharpen: bool,
-    filters_off: bool,
-    black_border: bool = False,
-    dvd_standard: str = "",
-    task_def: Task_Def = None,
-) -> tuple[int, str]:
+    duration: float = 0.0,
+    cancellation_callback: Optional[Callable[[], bool]] = None,
+    progress_callback: Optional[Callable[[float, str], None]] = None,
+) -> tuple[int, str, Loudness_Measurement | None]:
     """
-    Encodes the input video file as a DVD VOB (mpeg2) file.
+    Measures the loudness of the first audio stream of a video file, decoding only the audio. A cached measurement is
+    not measured again
 
     Args:
-        input_file (str): The path to the input video file.
-        output_folder (str): The path to the output folder.
-        input_video_width (int): Original width of the input video.
-        input_video_height (int): Original height of the input video.
-        input_video_ar (str): Original aspect ratio of the input video (e.g., "4:3", "16:9").
-        input_video_scan_type (str): Scan type of the input video ("interlaced" or "progressive").
-        input_video_frame_rate (float): Frame rate of the input video.
-        auto_bright (bool): Whether to apply auto-brightening filter.
-        normalise (bool): Whether to apply video normalization filter.
-        white_balance (bool): Whether to apply color correction filter.
-        denoise (bool): Whether to apply denoise filter.
-        sharpen (bool): Whether to apply a sharpen filter.
-        filters_off (bool): If True, skips all video processing filters except black borders.
-        black_border (bool, optional): Whether to add black borders to the video. Defaults to False.
-        dvd_standard (str): The target DVD standard (e.s., sys_consts.PAL, sys_consts.NTSC).
-        task_def (Task_Def, optional): The task definition. If supplied, this becomes a background task. Defaults to None.
+        input_file (str): The video file
+        duration (float): Duration of the video file in seconds, used for progress percentages. Defaults to 0.0
+            (unknown)
+        cancellation_callback (Optional[Callable[[], bool]]): Returns True when the measurement is to be cancelled.
+            Defaults to None (Cancel_All_Tasks)
+        progress_callback (Optional[Callable[[float, str], None]]): Receives the percentage complete and a
+            frame/fps/speed/ETA message. Defaults to None
 
     Returns:
-        tuple[int, str]:
-            - arg 1: 1 if ok, -1 if error, 0 if task_def supplied and this becomes a background task.
-            - arg 2: error message if error (-1) else output file path (1 or 0).
+        tuple[int, str, Loudness_Measurement | None]:
+        - arg 1: 1 if ok, -1 if error, -2 if cancelled
+        - arg 2: Empty string if all good, otherwise error message
+        - arg 3: The measurement, None if there was an error or the file has no audio that linear loudnorm can use
     """
-
     assert isinstance(input_file, str) and input_file.strip() != "", (
         f"{input_file=}. Must be a non-empty str"
     )
-    assert isinstance(output_folder, str) and output_folder.strip() != "", (
-        f"{output_folder=}. Must be a non-empty str"
+    assert isinstance(duration, (int, float)) and duration >= 0, (
+        f"{duration=}. Must be int | float >= 0"
     )
-    assert isinstance(input_video_width, int) and input_video_width > 0, (
-        f"{input_video_width=}. Must be int > 0"
+    assert callable(cancellation_callback) or cancellation_callback is None, (
+        f"{cancellation_callback=}. Must be a function or None"
     )
-    assert isinstance(input_video_height, int) and input_video_height > 0, (
-        f"{input_video_height=}. Must be int > 0"
+    assert callable(progress_callback) or progress_callback is None, (
+        f"{progress_callback=}. Must be a function or None"
     )
-    assert isinstance(input_video_ar, str) and input_video_ar.strip() != "", (
-        f"{input_video_ar=}. Must be a non-empty str"
+
+    loudness_cache = Loudness_Cache()
+    measurement = loudness_cache.get(input_file)
+
+    if measurement is not None:
+        return 1, "", measurement
+
+    if not os.path.exists(input_file):
+        return -1, f"File Does Not Exist {input_file}", None
+
+    encoding_info = Get_File_Encoding_Info(input_file)
+
+    if encoding_info.error:
+        return -1, encoding_info.error, None
+
+    if encoding_info.audio_tracks <= 0:
+        return 1, "", None
+
+    loudness_capture = Output_Capture(policy=CAPTURE_TAIL)
+
+    try:
+        result, message = Execute_Check_Output(
+            commands=[
+                sys_consts.FFMPG,
+                "-hide_banner",
+                "-nostdin",
+                *Input_Options(input_file),
+                *_Loudness_Measure_Output(),
+            ],
+            debug=False,
+            cancellation_callback=cancellation_callback,
+            progress_callback=progress_callback,
+            progress_duration=duration,
+            stderr_capture=loudness_capture,
+        )
+
+        if result != 1:
+            return result, message, None
+
+        measurement = Parse_Loudnorm_Output(loudness_capture.text())
+    finally:
+        loudness_capture.close()
+
+    if measurement is not None:
+        loudness_cache.put(input_file, measurement)
+
+    return 1, "", measurement
+
+
+def Transcode_Fan_Out(
+    input_file: str,
+    outputs: list[Fan_Out_Output],
+    duration: float = 0.0,
+    output_results: Optional[dict[str, tuple[int, str]]] = None,
+    cancellation_callback: Optional[Callable[[], bool]] = None,
+    progress_callback: Optional[Callable[[float, str], None]] = None,
+) -> tuple[int, str]:
+    """
+    Encodes several outputs from one decode of the input file. The decoded video is split in a single filter graph
+    and each output gets its own filter chain and its own encoder, audio and muxer options. The two pass outputs share
+    one analysis pass, so the input is decoded at most twice however many outputs there are. The analysis pass is
+    skipped when the pass logs of every two pass output are in the Passlog_Cache.
+
+    If the shared encode fails, each output is encoded again on its own, so one bad output does not cost the others
+    and every output reports its own error.
+
+    Outputs whose audio options hold the dynamic Loudnorm_Filter are normalised with linear loudnorm instead. The
+    loudness is taken from the Loudness_Cache or measured in the analysis pass, and only if neither has it is the
+    audio decoded on its own to measure it. Without any analysis pass the dynamic loudnorm filter is kept.
+
+    Args:
+        input_file (str): The input video file
+        outputs (list[Fan_Out_Output]): The outputs, each with a unique name
+        duration (float): Duration of the input video in seconds, used for progress percentages. Defaults to 0.0
+            (unknown)
+        output_results (Optional[dict[str, tuple[int, str]]]): Pass by ref, filled with the result of each output by
+            name. 1 and the output file if it was encoded, otherwise -1 or -2 and an error message. Defaults to None
+        cancellation_callback (Optional[Callable[[], bool]]): Returns True when the encode is to be cancelled.
+            Defaults to None (Cancel_All_Tasks)
+        progress_callback (Optional[Callable[[float, str], None]]): Receives the percentage complete and a
+            frame/fps/speed/ETA message. With two pass outputs the analysis pass is 0-50% and the encoding pass
+            50-100%. Defaults to None
+
+    Returns:
+        tuple[int, str]:
+        - arg 1: 1 if every output was encoded, -1 if any output failed, -2 if cancelled
+        - arg 2: Empty string if all good, otherwise the error message of each failed output
+    """
+    assert isinstance(input_file, str) and input_file.strip() != "", (
+        f"{input_file=}. Must be a non-empty str"
     )
     assert (
-        isinstance(input_video_scan_type, str) and input_video_scan_type.strip() != ""
-    ), f"{input_video_scan_type=}. Must be a non-empty str"
-    assert (
-        isinstance(input_video_frame_rate, (float, int)) and input_video_frame_rate > 0
-    ), f"{input_video_frame_rate=}. Must be float/int > 0"
-    assert isinstance(auto_bright, bool), f"{auto_bright=}. Must be bool"
-    assert isinstance(normalise, bool), f"{normalise=}. Must be bool"
-    assert isinstance(white_balance, bool), f"{white_balance=}. Must be bool"
-    assert isinstance(denoise, bool), f"{denoise=}. Must be bool"
-    assert isinstance(sharpen, bool), f"{sharpen=}. Must be bool"
-    assert isinstance(filters_off, bool), f"{filters_off=}. Must be bool"
-    assert isinstance(black_border, bool), f"{black_border=}. Must be bool"
-    assert dvd_standard in [sys_consts.PAL, sys_consts.NTSC], (
-        f"{dvd_standard=}. Must be sys_consts.PAL or sys_consts.NTSC"
+        isinstance(outputs, list)
+        and outputs
+        and all(isinstance(output, Fan_Out_Output) for output in outputs)
+    ), f"{outputs=}. Must be a non-empty list of Fan_Out_Output"
+    assert len({output.name for output in outputs}) == len(outputs), (
+        f"{[output.name for output in outputs]=}. Output names must be unique"
     )
-    assert isinstance(task_def, Task_Def) or task_def is None, (
-        f"{task_def=}. Must be Task_Def or None"
+    assert isinstance(duration, (int, float)) and duration >= 0, (
+        f"{duration=}. Must be int | float >= 0"
+    )
+    assert isinstance(output_results, dict) or output_results is None, (
+        f"{output_results=}. Must be a dict or None"
+    )
+    assert callable(cancellation_callback) or cancellation_callback is None, (
+        f"{cancellation_callback=}. Must be a function or None"
+    )
+    assert callable(progress_callback) or progress_callback is None, (
+        f"{progress_callback=}. Must be a function or None"
     )
 
-    #### Helper
-    def _two_pass_encoder_worker(
-        commands_1: list[str], commands_2: list[str], log_path: str, *args, **kwargs
-    ) -> tuple[int, str]:
+    #### Helpers
+    def _fan_out_commands(
+        pass_outputs: list[Fan_Out_Output], analysis: bool
+    ) -> list[str]:
         """
-        Worker function to execute both passes of FFmpeg and handle log cleanup.
-        Note: This is designed to be submitted to Task_QManager.
+        Makes the ffmpeg command that encodes a pass of the outputs from one decode
+
+        Args:
+            pass_outputs (list[Fan_Out_Output]): The outputs in the pass
+            analysis (bool): True for the analysis pass of two pass outputs, False for the encoding pass
+
+        Returns:
+            list[str]: The ffmpeg command
         """
-        file_handler = file_utils.File()
+        filter_graph = f"[0:v:0]split={len(pass_outputs)}" + "".join(
+            f"[fan_{output_index}]" for output_index in range(len(pass_outputs))
+        )
 
-        # Execute Pass 1 (Analysis)
-        result_1, message_1 = Execute_Check_Output(commands=commands_1, *args, **kwargs)
-        if result_1 == -1:
-            # Attempt to clean up log file on error
-            if file_handler.file_exists(log_path):
-                file_handler.remove_file(log_path)
-            return result_1, f"Pass 1 Error: {message_1}"
+        for output_index, output in enumerate(pass_outputs):
+            filter_graph += (
+                f";[fan_{output_index}]{output.video_filters or 'null'}"
+                f"[fan_video_{output_index}]"
+            )
 
-        # Execute Pass 2 (Encoding)
-        result_2, message_2 = Execute_Check_Output(commands=commands_2, *args, **kwargs)
+        commands = [
+            sys_consts.FFMPG,
+            "-hide_banner",
+            "-nostdin",
+            "-y",
+            "-fflags",
+            "+genpts",
+            *Input_Options(input_file),
+            "-filter_complex",
+            filter_graph,
+        ]
 
-        # Cleanup the log files
-        if file_handler.file_exists(log_path):
-            file_handler.remove_file(log_path)
+        # A two pass output maps the same streams in both passes, so ffmpeg numbers its pass logs the same
+        for output_index, output in enumerate(pass_outputs):
+            commands += ["-map", f"[fan_video_{output_index}]"]
 
-        if result_2 == -1:
-            return result_2, f"Pass 2 Error: {message_2}"
+            if output.audio_options:
+                commands += ["-map", "0:a?"]
 
-        return result_2, message_2
+            commands += output.video_options
 
-    #### Main
+            if analysis:
+                commands += ["-pass", "1", "-passlogfile", output.passlog_file]
 
-    file_handler = file_utils.File()
+                if output.audio_options:
+                    commands += ["-c:a", "copy"]
 
-    if not file_handler.path_exists(output_folder):
-        return -1, f"{output_folder} Does not exist"
+                commands += ["-f", "null", os.devnull]
+            else:
+                if output.two_pass:
+                    commands += ["-pass", "2", "-passlogfile", output.passlog_file]
 
-    if not file_handler.path_writeable(output_folder):
-        return -1, f"{output_folder} Cannot Be Written To"
+                commands += [
+                    *output.audio_options,
+                    *output.muxer_options,
+                    output.output_file,
+                ]
+
+        return commands
+
+    def _pass_progress(
+        pass_number: int, pass_count: int
+    ) -> Optional[Callable[[float, str], None]]:
+        """
+        Scales the progress of a pass into the progress of the whole encode
+
+        Args:
+            pass_number (int): The pass, 1 or 2
+            pass_count (int): The number of passes
+
+        Returns:
+            Optional[Callable[[float, str], None]]: The progress callback of the pass
+        """
+        if progress_callback is None or pass_count == 1:
+            return progress_callback
+
+        return lambda percentage, message: progress_callback(
+            (pass_number - 1) * 50.0 + percentage / 2, f"Pass {pass_number}: {message}"
+        )
+
+    #### Main
+    if output_results is None:
+        output_results = {}
+
+    if not os.path.exists(input_file):
+        for output in outputs:
+            output_results[output.name] = (-1, f"File Does Not Exist {input_file}")
 
-    if not file_handler.file_exists(input_file):
         return -1, f"File Does Not Exist {input_file}"
 
-    _, input_file_name_base, _ = file_handler.split_file_path(input_file)
+    # Two pass outputs go first, so they are numbered the same in the analysis and encoding passes
+    outputs = sorted(outputs, key=lambda output: not output.two_pass)
+    two_pass_outputs = [output for output in outputs if output.two_pass]
+    passlog_cache = Passlog_Cache()
+    passlog_keys = []
 
-    vob_file = file_handler.file_join(output_folder, f"{input_file_name_base}.vob")
+    if two_pass_outputs:
+        analysis_commands = _fan_out_commands(two_pass_outputs, analysis=True)
 
-    log_file_path = file_handler.file_join(
-        output_folder, f"{input_file_name_base}_2pass.log"
+        # Keyed by position too, ffmpeg may number a pass log by the stream's index across all the outputs
+        passlog_keys = [
+            passlog_cache.passlog_key(
+                input_file, [*analysis_commands, str(output_index)]
+            )
+            for output_index in range(len(two_pass_outputs))
+        ]
+
+    analysis_needed = not all(
+        passlog_cache.get(passlog_key, output.passlog_file)
+        for passlog_key, output in zip(passlog_keys, two_pass_outputs)
     )
+    pass_count = 2 if two_pass_outputs and analysis_needed else 1
 
-    interlaced_video = input_video_scan_type.lower().startswith("interlaced")
+    loudness_cache = Loudness_Cache()
+    loudness_measured = False
+    measurement = None
 
-    if input_video_width <= 0 or input_video_height <= 0:
-        return (
-            -1,
-            f"Input video {input_file=} does not specify valid height and/or width.",
+    if any(Loudnorm_Filter() in output.audio_options for output in outputs):
+        measurement = loudness_cache.get(input_file)
+        encoding_info = Get_File_Encoding_Info(input_file)
+        loudness_measured = (
+            measurement is None
+            and len(two_pass_outputs) > 0
+            and not encoding_info.error
+            and encoding_info.audio_tracks > 0
         )
 
-    if not input_video_ar:
-        return -1, f"Unrecognised Aspect Ratio : {input_video_ar} for {input_file=}"
+    result, message = 1, ""
 
-    if dvd_standard == sys_consts.PAL:
-        target_frame_rate = f"{sys_consts.PAL_FRAME_RATE}"
-        target_width = sys_consts.PAL_SPECS.width_43
-        target_height = sys_consts.PAL_SPECS.height_43
-        target_video_size = f"{target_width}x{target_height}"
+    if pass_count == 2:
+        loudness_capture = Output_Capture(policy=CAPTURE_TAIL)
 
-        if input_video_ar not in ["4:3", "16:9"]:
-            return (
-                -1,
-                f"Video {input_video_width=}x{input_video_height=} with AR {input_video_ar} does not conform to PAL "
-                f"specifications for DVD.",
+        try:
+            result, message = Execute_Check_Output(
+                commands=[
+                    *analysis_commands,
+                    *(_Loudness_Measure_Output() if loudness_measured else []),
+                ],
+                debug=False,
+                cancellation_callback=cancellation_callback,
+                progress_callback=_pass_progress(1, pass_count),
+                progress_duration=duration,
+                stderr_capture=loudness_capture,
             )
 
-    else:  # NTSC
-        target_frame_rate = f"{sys_consts.NTSC_FRAME_RATE}"
-        target_width = sys_consts.NTSC_SPECS.width_43
-        target_height = sys_consts.NTSC_SPECS.height_43
-        target_video_size = f"{target_width}x{target_height}"
+            if result == 1 and loudness_measured:
+                measurement = Parse_Loudnorm_Output(loudness_capture.text())
+        finally:
+            loudness_capture.close()
 
-    video_filters = Build_Video_Filters(
-        auto_bright=auto_bright,
-        normalise=normalise,
-        white_balance=white_balance,
-        denoise=denoise,
-        sharpen=sharpen,
-        filters_off=filters_off,
-        black_border=black_border,
-        target_width=-1 if target_width == input_video_width else target_width,
-        target_height=-1 if target_height == input_video_height else target_height,
-        include_dvd_interlacing=True,
-        input_video_frame_rate=input_video_frame_rate,
-        video_interlaced=interlaced_video,
-        dvd_standard=dvd_standard,
-    )
-
-    average_bit_rate = sys_consts.AVERAGE_BITRATE
-    audio_bit_rate_bps = str(sys_consts.AUDIO_BITRATE * 1000)
+        if result == 1:
+            for passlog_key, output in zip(passlog_keys, two_pass_outputs):
+                passlog_cache.put(passlog_key, output.passlog_file)
 
-    interlaced_flags = []
+            if measurement is not None and loudness_measured:
+                loudness_cache.put(input_file, measurement)
+    elif loudness_measured:  # The pass logs were cached but the loudness was not
+        loudness_result, loudness_message, measurement = Measure_Loudness(
+            input_file=input_file, cancellation_callback=cancellation_callback
+        )
 
-    if interlaced_video:
-        interlaced_flags = [
-            "-flags:v:0",
-            "+ilme+ildct",
-            "-alternate_scan:v:0",
-            "1",
-        ]
+        if loudness_result == -2:  # A failed measurement only costs linear loudnorm
+            result, message = loudness_result, loudness_message
 
-    # --- 💥 PASS 1: Analysis Command ---
-    command_pass1 = [
-        sys_consts.FFMPG,
-        "-fflags",
-        "+genpts",
-        "-i",
-        input_file,
-        *interlaced_flags,
-        "-f",
-        "dvd",
-        "-c:v:0",
-        "mpeg2video",
-        "-aspect",
-        input_video_ar,
-        "-s",
-        target_video_size,
-        "-r",
-        target_frame_rate,
-        "-g",
-        "15",
-        "-pix_fmt",
-        "yuv420p",
-        "-b:v",
-        f"{average_bit_rate}k",
-        "-maxrate:v",
-        "9000k",
-        "-minrate:v",
-        "0",
-        "-bufsize:v",
-        "1835008",
-        # 2-Pass VBR Settings
-        "-pass",
-        "1",
-        "-passlogfile",
-        log_file_path,
-        "-an",  # Disable audio for Pass 1
-        "-map",
-        "0:V",
-        "-threads",
-        "0",
-        os.devnull,  # Outputs to the null device
-        "-y",
-    ]
+    if result == 1:
+        result, message = Execute_Check_Output(
+            commands=Loudnorm_Commands(
+                _fan_out_commands(outputs, analysis=False), measurement
+            ),
+            debug=False,
+            cancellation_callback=cancellation_callback,
+            progress_callback=_pass_progress(pass_count, pass_count),
+            progress_duration=duration,
+        )
 
-    # --- 💥 PASS 2: Encoding Command ---
-    command_pass2 = [
-        sys_consts.FFMPG,
-        "-fflags",
-        "+genpts",
-        "-i",
-        input_file,
-        *interlaced_flags,
-        "-f",
-        "dvd",
-        "-c:v:0",
-        "mpeg2video",
-        "-aspect",
-        input_video_ar,
-        "-s",
-        target_video_size,
-        "-r",
-        target_frame_rate,
-        "-g",
-        "15",
-        "-pix_fmt",
-        "yuv420p",
-        "-b:v",
-        f"{average_bit_rate}k",
-        "-maxrate:v",
-        "9000k",
-        "-minrate:v",
-        "0",
-        "-bufsize:v",
-        "1835008",
-        # 2-Pass VBR Settings
-        "-pass",
-        "2",
-        "-passlogfile",
-        log_file_path,
-        # Audio, Muxing, and Output
-        "-packetsize",
-        "2048",
-        "-muxrate",
-        "10080000",
-        "-force_key_frames",
-        "expr:if(isnan(prev_forced_n),1,eq(n,prev_forced_n + 15))",
-        *video_filters,
-        "-b:a",
-        audio_bit_rate_bps,
-        "-ar",
-        "48000",
-        "-c:a:0",
-        "ac3",
-        "-filter:a:0",
-        "loudnorm=I=-16:LRA=11:TP=-1.5",
-        "-map",
-        "0:V",
-        "-map",
-        "0:a?",
-        "-map",
-        "-0:s",
-        "-threads",
-        "0",
-        vob_file,
-        "-y",
-    ]
+    for output in two_pass_outputs:
+        for passlog_file in Pass_Log_Files(output.passlog_file):
+            os.remove(passlog_file)
 
-    if task_def:  # Run as a background task
-        background_task_qmanager = Task_QManager()
+    if result == -1 and len(outputs) > 1:
+        for output_index, output in enumerate(outputs):
+            if result == -2:
+                output_results[output.name] = (-2, message)
+                continue
 
-        # Submit the helper worker function to manage the sequential passes
-        background_task_qmanager.submit_task(
-            worker_function=_two_pass_encoder_worker,
-            commands_1=command_pass1,
-            commands_2=command_pass2,
-            log_path=log_file_path,
-            debug=False,
-            stderr_to_stdout=False,
-            task_id=task_def.task_id,
-            started_callback=task_def.started_callback,
-            progress_callback=task_def.progress_callback,
-            finished_callback=task_def.finished_callback,
-            error_callback=task_def.error_callback,
-            aborted_callback=task_def.aborted_callback,
-        )
-        return 0, vob_file
+            result, message = Transcode_Fan_Out(
+                input_file=input_file,
+                outputs=[output],
+                duration=duration,
+                output_results=output_results,
+                cancellation_callback=cancellation_callback,
+                progress_callback=(
+                    None
+                    if progress_callback is None
+                    else lambda percentage, message, output_index=output_index: (
+                        progress_callback(
+                            (output_index * 100.0 + percentage) / len(outputs),
+                            f"{outputs[output_index].name}: {message}",
+                        )
+                    )
+                ),
+            )
+    else:
+        for output in outputs:
+            if (
+                result == 1
+                and os.path.exists(output.output_file)
+                and os.path.getsize(output.output_file) > 0
+            ):
+                output_results[output.name] = (1, output.output_file)
+                continue
 
-    else:  # Run in the foreground
-        # Execute Pass 1
-        result, message = Execute_Check_Output(
-            commands=command_pass1, debug=True, stderr_to_stdout=False
-        )
+            if os.path.exists(output.output_file):  # Never leave a partial output
+                os.remove(output.output_file)
 
-        if result == -1:
-            return -1, f"Pass 1 failed: {message}"
+            if result == 1:
+                output_results[output.name] = (
+                    -1,
+                    f"{output.output_file} Was Not Written",
+                )
+            else:
+                output_results[output.name] = (result, message)
 
-        # Execute Pass 2
-        result, message = Execute_Check_Output(
-            commands=command_pass2, debug=True, stderr_to_stdout=False
-        )
+    if any(output_results[output.name][0] == -2 for output in outputs):
+        return -2, "Cancelled"
 
-        # Cleanup the log file
-        if file_handler.file_exists(log_file_path):
-            file_handler.remove_file(log_file_path)
+    failed_outputs = [
+        f"{output.name}: {output_results[output.name][1]}"
+        for output in outputs
+        if output_results[output.name][0] != 1
+    ]
 
-        if result == -1:
-            return -1, f"Pass 2 failed: {message}"
+    if failed_outputs:
+        return -1, "\n".join(failed_outputs)
 
-    return 1, vob_file
+    return 1, ""
 
 
-def Transcode_DV(
-    input_file: str,
-    output_folder: str,
-    frame_rate: float,
-    width: int,
-    height: int,
-    interlaced: bool = True,
-    bottom_field_first: bool = True,
-    deinterlace: bool = False,
-    auto_bright: bool = False,
-    normalise: bool = False,
-    white_balance: bool = False,
-    denoise: bool = False,
-    sharpen: bool = False,
-    filters_off: bool = False,
-    black_border: bool = False,
-    task_def: Task_Def = None,
-) -> tuple[int, str]:
+def Plan_Encode_Chunks(input_file: str, duration: float) -> list[float]:
     """
-    Converts an input video file into a DV AVI file, adhering to standard PAL/NTSC DV specifications.
+    Splits a long video file into chunks that Transcode_Chunked can encode at the same time. Each chunk starts on a
+    closed GOP keyframe from the keyframe index, so decoding a chunk never needs a frame of the chunk before it.
 
     Args:
-        input_file (str): The path to the input video file.
-        output_folder (str): The path to the output folder.
-        frame_rate (float): The frame rate to use for the output video (will be adjusted to DV standard).
-        width (int): The target width of the output DV video (must be DV standard resolution).
-        height (int): The target height of the output DV video (must be DV standard resolution).
-        interlaced (bool, optional): True if the input video is interlaced, False if progressive. Defaults to True.
-        bottom_field_first (bool, optional): Whether to use bottom field first for interlaced output. Defaults to True.
-        deinterlace (bool, optional): If True, forces deinterlacing of the input video, making the output progressive. Defaults to False.
-        auto_bright (bool): Whether to use auto brightness. Defaults to False.
-        normalise (bool): Whether to use normalise. Defaults to False.
-        white_balance (bool): Whether to use white balance. Defaults to False.
-        denoise (bool): Whether to use denoise. Defaults to False.
-        sharpen (bool): Whether to use sharpen. Defaults to False.
-        filters_off (bool): Whether to disable all filters except scaling and black borders. Defaults to False.
-        black_border (bool, optional): Whether to add black borders to the video. Defaults to False.
-        task_def (Task_Def, optional): The task definition. If supplied, this becomes a background task. Defaults to None.
+        input_file (str): The video file
+        duration (float): Duration of the video file in seconds
 
     Returns:
-        tuple[int, str]:
-            - arg 1: 1 if ok, -1 if error, 0 if task_def supplied and this becomes a background task.
-            - arg 2: error message if error (-1) else output file path (1 or 0).
+        list[float]: The start time of each chunk, the first being the first keyframe. Empty if the video file is too
+        short to be worth chunking, has no keyframe index or is an ffconcat playlist
     """
-
     assert isinstance(input_file, str) and input_file.strip() != "", (
         f"{input_file=}. Must be a non-empty str"
     )
-    assert isinstance(output_folder, str) and output_folder.strip() != "", (
-        f"{output_folder=}. Must be a non-empty str"
-    )
-    assert isinstance(frame_rate, float) and frame_rate > 0, (
-        f"{frame_rate=}. Must be float > 0"
-    )
-    assert isinstance(width, int) and width > 0, f"{width=}. Must be int > 0"
-    assert isinstance(height, int) and height > 0, f"{height=}. Must be int > 0"
-    assert isinstance(interlaced, bool), f"{interlaced=}. Must be bool"
-    assert isinstance(bottom_field_first, bool), f"{bottom_field_first=}. Must be bool"
-    assert isinstance(deinterlace, bool), f"{deinterlace=}. Must be bool"
-    assert isinstance(auto_bright, bool), f"{auto_bright=}. Must be bool"
-    assert isinstance(normalise, bool), f"{normalise=}. Must be bool"
-    assert isinstance(white_balance, bool), f"{white_balance=}. Must be bool"
-    assert isinstance(denoise, bool), f"{denoise=}. Must be bool"
-    assert isinstance(sharpen, bool), f"{sharpen=}. Must be bool"
-    assert isinstance(filters_off, bool), f"{filters_off=}. Must be bool"
-    assert isinstance(black_border, bool), f"{black_border=}. Must be bool"
-    assert isinstance(task_def, Task_Def) or task_def is None, (
-        f"{task_def=}. Must be Task_Def or None"
+    assert isinstance(duration, (int, float)) and duration >= 0, (
+        f"{duration=}. Must be int | float >= 0"
     )
 
-    if deinterlace and not interlaced:
-        return (
-            -1,
-            "Cannot force deinterlace when input video is progressive. Input is already progressive.",
-        )
+    is_playlist = input_file.lower().endswith(f".{sys_consts.FFCONCAT_EXTN}")
 
-    file_handler = file_utils.File()
+    if duration < sys_consts.CHUNK_ENCODE_MIN_DURATION or is_playlist:
+        return []
 
-    if not file_handler.path_exists(output_folder):
-        return -1, f"{output_folder} Does not exist"
-    if not file_handler.path_writeable(output_folder):
-        return -1, f"{output_folder} Cannot Be Written To"
-    if not file_handler.file_exists(input_file):
-        return -1, f"File Does Not Exist {input_file}"
+    keyframe_index = Get_Keyframe_Index(input_file)
 
-    _, input_file_name, _ = file_handler.split_file_path(input_file)
-    output_file = file_handler.file_join(output_folder, f"{input_file_name}.avi")
+    if keyframe_index.error:
+        return []
 
-    # DV resolutions are fixed based on standard
-    if (
-        width == sys_consts.PAL_SPECS.width_43
-        and height == sys_consts.PAL_SPECS.height_43
-    ) or (
-        width == sys_consts.PAL_SPECS.width_169
-        and height == sys_consts.PAL_SPECS.height_43
-    ):  # Anamorphic PAL
-        adjusted_frame_rate = sys_consts.PAL_SPECS.frame_rate
-    elif (
-        width == sys_consts.NTSC_SPECS.width_43
-        and height == sys_consts.NTSC_SPECS.height_43
-    ) or (
-        width == sys_consts.NTSC_SPECS.width_169
-        and height == sys_consts.NTSC_SPECS.height_43
-    ):  # Anamorphic NTSC
-        adjusted_frame_rate = sys_consts.NTSC_SPECS.frame_rate
-    else:
-        return (
-            -1,
-            f"{width=}x{height=} Does Not Meet Standard PAL/NTSC DV specs (e.g., 720x576, 720x480)",
-        )
+    key_times = keyframe_index.key_times
+    chunk_count = math.ceil(duration / sys_consts.CHUNK_ENCODE_SECONDS)
+    # How far a boundary may move to find a closed GOP
+    search_window = sys_consts.CHUNK_ENCODE_SECONDS / 4
+    chunk_times = [key_times[0]]
 
-    # If the provided frame_rate is significantly different from the adjusted DV standard, warn or error
-    if (
-        abs(frame_rate - adjusted_frame_rate) > 0.01
-    ):  # Use a small tolerance for float comparison
-        print(
-            f"Warning: Input frame rate {frame_rate} does not match DV standard {adjusted_frame_rate}. Adjusting."
-        )
+    for chunk_index in range(1, chunk_count):
+        target_time = key_times[0] + chunk_index * duration / chunk_count
+        before_entry = keyframe_index.key_at_or_before(target_time)
+        after_entry = before_entry + 1
+        chunk_time = -1.0
 
-    video_filters_arg = Build_Video_Filters(
-        auto_bright=auto_bright,
-        normalise=normalise,
-        white_balance=white_balance,
-        denoise=denoise,
-        sharpen=sharpen,
-        filters_off=filters_off,
-        black_border=black_border,
-        target_width=width,
-        target_height=height,
-        deinterlace_video=deinterlace,
-        include_dvd_interlacing=False,
-    )
+        # Walks out from the target, nearest keyframe first, until a closed GOP is found or the window is passed
+        while True:
+            before_gap = (
+                target_time - key_times[before_entry] if before_entry >= 0 else math.inf
+            )
+            after_gap = (
+                key_times[after_entry] - target_time
+                if after_entry < len(key_times)
+                else math.inf
+            )
 
-    field_order_filter = f"fieldorder={'bff' if bottom_field_first else 'tff'}"
+            if min(before_gap, after_gap) > search_window:
+                break
 
-    # DV output is ALWAYS interlaced. So, these flags and field order filter should always be applied.
-    interlaced_flags = [
-        "-flags:v:0",
-        "+ilme+ildct",
-        "-alternate_scan:v:0",
-        "1",
-    ]
+            if before_gap <= after_gap:
+                if not keyframe_index.open_gops[before_entry]:
+                    chunk_time = key_times[before_entry]
+                    break
 
-    if video_filters_arg:
-        video_filters_arg[1] = f"{field_order_filter},{video_filters_arg[1]}"
-    else:
-        video_filters_arg = ["-vf", field_order_filter]
+                before_entry -= 1
+            else:
+                if not keyframe_index.open_gops[after_entry]:
+                    chunk_time = key_times[after_entry]
+                    break
 
-    command = [
-        sys_consts.FFMPG,
-        "-i",
-        input_file,
-        "-vsync",
-        "1",  # Preserve input timestamps (or 'cfr' for constant frame rate)
-        *video_filters_arg,
-        *interlaced_flags,
-        "-r",
-        str(adjusted_frame_rate),  # Use the adjusted DV standard frame rate
-        "-c:v",
-        "dvvideo",  # DV video codec
-        "-c:a",
-        "pcm_s16le",  # Uncompressed audio for DV
-        "-threads",
-        "0",
-        "-y",
-        output_file,
-    ]
+                after_entry += 1
 
-    if task_def:  # Run as a background task
-        background_task_qmanager = Task_QManager()
+        if (
+            chunk_time > chunk_times[-1] + search_window
+            and chunk_time < key_times[0] + duration - search_window
+        ):
+            chunk_times.append(chunk_time)
 
-        background_task_qmanager.submit_task(
-            worker_function=Execute_Check_Output,
-            commands=command,
-            debug=False,
-            stderr_to_stdout=False,
-            task_id=task_def.task_id,
-            started_callback=task_def.started_callback,
-            progress_callback=task_def.progress_callback,
-            finished_callback=task_def.finished_callback,
-            error_callback=task_def.error_callback,
-            aborted_callback=task_def.aborted_callback,
-        )
+    return chunk_times if len(chunk_times) > 1 else []
 
-        return 0, output_file
-    else:  # Run in the foreground
-        result, message = Execute_Check_Output(
-            commands=command, debug=False, stderr_to_stdout=False
+
+def _Plan_Chunk_Bitrates(
+    passlog_files: list[str], chunk_durations: list[float], video_bitrate: int
+) -> list[int]:
+    """
+    Shares the video bits of a two pass mpeg2 encode between its chunks. The analysis pass logs of the chunks give
+    the texture bits and quantiser of every frame, so the quantiser that spends the whole title's bits can be solved
+    for across the chunks, and each chunk gets the bitrate that quantiser needs. The chunks are then encoded at much
+    the same quality, as the title would be by a single two pass encode.
+
+    Args:
+        passlog_files (list[str]): The mpeg2video pass log file of each chunk
+        chunk_durations (list[float]): The duration of each chunk in seconds
+        video_bitrate (int): The average video bitrate of the title in kbps
+
+    Returns:
+        list[int]: The average video bitrate of each chunk in kbps. Every chunk gets video_bitrate if a pass log can
+        not be read
+    """
+    assert isinstance(passlog_files, list), f"{passlog_files=}. Must be a list"
+    assert isinstance(chunk_durations, list) and len(chunk_durations) == len(
+        passlog_files
+    ), f"{chunk_durations=}. Must be a list of one duration per pass log file"
+    assert isinstance(video_bitrate, int) and video_bitrate > 0, (
+        f"{video_bitrate=}. Must be int > 0"
+    )
+
+    lambda_scale = 118  # FF_QP2LAMBDA, the pass log q is the quantiser in lambda units
+    frame_stats = re.compile(r"q:([\d.]+) itex:(\d+) ptex:(\d+) mv:(\d+) misc:(\d+)")
+    uniform_bitrates = [video_bitrate] * len(passlog_files)
+    # Texture bits * quantiser, which is about constant whatever the quantiser
+    texture_complexities = []
+    # Motion vector and header bits, which barely change with the quantiser
+    overhead_bits = []
+
+    for passlog_file in passlog_files:
+        texture_complexity = 0.0
+        chunk_overhead_bits = 0
+
+        try:
+            with open(passlog_file, "r", encoding="utf-8") as passlog:
+                for line in passlog:
+                    stats_match = frame_stats.search(line)
+
+                    if stats_match:
+                        quantiser = float(stats_match.group(1)) / lambda_scale
+                        texture_complexity += quantiser * (
+                            int(stats_match.group(2)) + int(stats_match.group(3))
+                        )
+                        chunk_overhead_bits += int(stats_match.group(4)) + int(
+                            stats_match.group(5)
+                        )
+        except (OSError, ValueError):
+            return uniform_bitrates
+
+        if texture_complexity <= 0:
+            return uniform_bitrates
+
+        texture_complexities.append(texture_complexity)
+        overhead_bits.append(chunk_overhead_bits)
+
+    title_bits = video_bitrate * 1000 * sum(chunk_durations)
+    texture_bits = title_bits - sum(overhead_bits)
+
+    if texture_bits <= 0:
+        return uniform_bitrates
+
+    title_quantiser = sum(texture_complexities) / texture_bits
+
+    chunk_bitrates = [
+        min(
+            max(
+                (texture_complexity / title_quantiser + chunk_overhead_bits)
+                / chunk_duration
+                / 1000,
+                video_bitrate / 2,
+            ),
+            sys_consts.DVD_MAX_VIDEO_BITRATE,
+        )
+        for texture_complexity, chunk_overhead_bits, chunk_duration in zip(
+            texture_complexities, overhead_bits, chunk_durations
         )
+    ]
 
-        if result == -1:
-            return -1, message
+    # The clamps can push the chunks over the title's bits, which are what fit it on the disc
+    planned_bits = sum(
+        chunk_bitrate * chunk_duration
+        for chunk_bitrate, chunk_duration in zip(chunk_bitrates, chunk_durations)
+    )
+    fit_scale = min(1.0, video_bitrate * sum(chunk_durations) / planned_bits)
 
-    return 1, output_file
+    return [max(1, int(chunk_bitrate * fit_scale)) for chunk_bitrate in chunk_bitrates]
 
 
-def Transcode_ffv1_archival(
+def Transcode_Chunked(
     input_file: str,
-    output_folder: str,
+    output: Fan_Out_Output,
     frame_rate: float,
-    width: int,
-    height: int,
-    interlaced: bool = True,
-    bottom_field_first: bool = True,
-    deinterlace: bool = False,
-    auto_bright: bool = False,
-    normalise: bool = False,
-    white_balance: bool = False,
-    denoise: bool = False,
-    sharpen: bool = False,
-    filters_off: bool = False,
-    black_border: bool = False,
-    apply_spp: bool = False,
-    dehalo: bool = False,
-    task_def: Task_Def = None,
+    chunk_times: list[float],
+    duration: float = 0.0,
+    cancellation_callback: Optional[Callable[[], bool]] = None,
+    progress_callback: Optional[Callable[[float, str], None]] = None,
 ) -> tuple[int, str]:
     """
-    Converts an input video file into a lossless FFV1 compressed video suitable for permanent archival storage.
+    Encodes the video of a long input file as chunks, which run at the same time on the Async_Tool_Engine, each with
+    a share of the CPU threads, and then stitches the chunks together with the audio. A single encoder process does
+    not keep every core busy, several narrower ones do.
 
-    FFV1 is a permanent archival format widely accepted by archival institutions worldwide.
+    Each chunk starts on a closed GOP keyframe from Plan_Encode_Chunks and its encode starts a new GOP there, so the
+    chunks are joined GOP aligned by the concat demuxer with a stream copy. The audio is encoded whole while
+    stitching, from the first keyframe on.
+
+    An output with a -b:v bitrate and a pass log file is encoded in two passes. The analysis pass logs of the chunks,
+    which are kept in the Passlog_Cache, plan how the title's bits are shared between the chunks. An output without a
+    bitrate is encoded in a single pass per chunk, as two pass stats would give each chunk different codec headers.
+
+    If the audio options hold the dynamic Loudnorm_Filter, the loudness is measured while the chunks encode and the
+    audio is normalised with linear loudnorm.
 
     Args:
-        input_file (str): The path to the input video file.
-        output_folder (str): The path to the output folder.
-        frame_rate (float): The frame rate to use for the output video.
-        width (int): The target width of the output video.
-        height (int): The target height of the output video.
-        interlaced (bool, optional): True if the input video is interlaced, False if progressive. Defaults to True.
-        bottom_field_first (bool, optional): Whether to use bottom field first for interlaced output. Defaults to True.
-        deinterlace (bool, optional): If True, forces deinterlacing of the input video, making the output progressive. Defaults to False.
-        auto_bright (bool): Whether to use auto brightness. Defaults to False.
-        normalise (bool): Whether to use normalise. Defaults to False.
-        white_balance (bool): Whether to use white balance. Defaults to False.
-        denoise (bool): Whether to use denoise. Defaults to False.
-        sharpen (bool): Whether to use sharpen. Defaults to False.
-        filters_off (bool): Whether to disable all filters except scaling and black borders. Defaults to False.
-        black_border (bool, optional): Whether to add black borders to the video. Defaults to False.
-        apply_spp (bool): Whether to apply the spp deblocking/denoising filter. Defaults to False.
-        dehalo (bool): Whether to apply the dehalo filter to reduce halos/ringing. Defaults to False.
-        task_def (Task_Def): The task definition, if this is supplied, then this becomes a background task. Defaults to None.
+        input_file (str): The input video file
+        output (Fan_Out_Output): The output, as made for Transcode_Fan_Out
+        frame_rate (float): The frame rate of the output video
+        chunk_times (list[float]): The start time of each chunk, from Plan_Encode_Chunks
+        duration (float): Duration of the input video in seconds, used for progress percentages. Defaults to 0.0
+            (unknown)
+        cancellation_callback (Optional[Callable[[], bool]]): Returns True when the encode is to be cancelled.
+            Defaults to None (Cancel_All_Tasks)
+        progress_callback (Optional[Callable[[float, str], None]]): Receives the percentage complete and a message.
+            The chunks are 0-90% and the stitch 90-100%. Defaults to None
 
     Returns:
         tuple[int, str]:
-            - arg 1: 1 if ok, -1 if error, 0 if task_def supplied and this becomes a background task
-            - arg 2: error message if error (-1) else output file path (1 or 0)
+        - arg 1: 1 if ok, -1 if error, -2 if cancelled
+        - arg 2: Error message if error, otherwise the output file
     """
+    assert isinstance(input_file, str) and input_file.strip() != "", (
+        f"{input_file=}. Must be a non-empty str"
+    )
+    assert isinstance(output, Fan_Out_Output), f"{output=}. Must be Fan_Out_Output"
+    assert isinstance(frame_rate, (int, float)) and frame_rate > 0, (
+        f"{frame_rate=}. Must be int | float > 0"
+    )
+    assert (
+        isinstance(chunk_times, list)
+        and len(chunk_times) > 1
+        and all(
+            chunk_times[chunk_index] < chunk_times[chunk_index + 1]
+            for chunk_index in range(len(chunk_times) - 1)
+        )
+    ), f"{chunk_times=}. Must be a list of more than one increasing time"
+    assert isinstance(duration, (int, float)) and duration >= 0, (
+        f"{duration=}. Must be int | float >= 0"
+    )
+    assert callable(cancellation_callback) or cancellation_callback is None, (
+        f"{cancellation_callback=}. Must be a function or None"
+    )
+    assert callable(progress_callback) or progress_callback is None, (
+        f"{progress_callback=}. Must be a function or None"
+    )
 
-    # Helper functions for background task management
-    def _started_callback(task_id: str):
+    #### Helpers
+    def _video_options(video_bitrate: int) -> list[str]:
         """
-        Called when pass 1 or pass 2 starts in the background
+        Makes the video options of a chunk encode from those of the output
 
         Args:
-            task_id (str): Task ID
+            video_bitrate (int): The average video bitrate of the chunk in kbps, 0 keeps the output's
+
+        Returns:
+            list[str]: The video options
         """
-        assert isinstance(task_id, str), f"{task_id=}. Must be str"
+        video_options = list(output.video_options)
 
-        task_def.started_callback(task_def.task_id)
+        for option_index, option in enumerate(video_options[:-1]):
+            if option == "-threads":
+                video_options[option_index + 1] = chunk_threads
+            elif option == "-b:v" and video_bitrate > 0:
+                video_options[option_index + 1] = f"{video_bitrate}k"
 
-    def _progress_callback(task_id: str, percentage: float, message: str):
+        if "-threads" not in video_options:
+            video_options += ["-threads", chunk_threads]
+
+        return video_options
+
+    def _chunk_commands(
+        chunk_index: int, video_options: list[str], output_options: list[str]
+    ) -> list[str]:
         """
-        Called when pass 1 or pass 2 makes progress in the background
+        Makes the ffmpeg command that encodes the video of a chunk
 
         Args:
-            task_id (str): Task ID
-            percentage (float): Percentage complete
-            message (str): Message
+            chunk_index (int): The chunk
+            video_options (list[str]): The video options of the chunk encode
+            output_options (list[str]): The pass options and output file
+
+        Returns:
+            list[str]: The ffmpeg command
         """
-        assert isinstance(task_id, str), f"{task_id=}. Must be str"
-        assert isinstance(percentage, float), f"{percentage=}. Must be float"
-        assert isinstance(message, str), f"{message=}. Must be str"
+        chunk_time = chunk_times[chunk_index]
+        key_entry = keyframe_index.key_at_or_before(chunk_time)
+        seek_time = chunk_time
 
-        if task_def.progress_callback:
-            task_def.progress_callback(task_def.task_id, percentage, message)
+        if unreliable_seek:  # Lands a few keyframes early and decodes up to the chunk
+            seek_time = keyframe_index.key_times[max(key_entry - seek_margin_keys, 0)]
 
-    def _finished_callback(task_id: str, result: tuple[int, str]):
-        """
-        Called when pass 1 or pass 2 finishes in the background
+        # -seek_timestamp makes -ss the keyframe's own timestamp, not an offset from the start of the file
+        commands = [
+            sys_consts.FFMPG,
+            "-hide_banner",
+            "-nostdin",
+            "-y",
+            "-fflags",
+            "+genpts",
+            "-seek_timestamp",
+            "1",
+            "-ss",
+            f"{seek_time}",
+            *Input_Options(input_file),
+        ]
 
-        Args:
-            task_id (str): Task ID
-            result (tuple[int, str]): Result tuple
-        """
-        assert isinstance(task_id, str), f"{task_id=}. Must be str"
-        assert isinstance(result, tuple), f"{result=}. Must be tuple"
+        # Less a millisecond, so float error never drops the keyframe
+        if seek_time < chunk_time:
+            commands += ["-ss", f"{max(chunk_time - seek_time - 0.001, 0.0):.6f}"]
 
-        if task_id.endswith("_pass1"):
-            background_task_qmanager.submit_task(
-                worker_function=Execute_Check_Output,
-                commands=pass_2,
-                debug=False,
-                stderr_to_stdout=False,
-                task_id=f"{task_def.task_id}_pass2",
-                started_callback=_started_callback,
-                error_callback=_error_callback,
-                finished_callback=_finished_callback,
-                # progress_callback=_progress_callback,
-                aborted_callback=_aborted_callback,
-            )
+        if chunk_index < len(chunk_times) - 1:
+            commands += [
+                "-frames:v",
+                str(round((chunk_times[chunk_index + 1] - chunk_time) * frame_rate)),
+            ]
 
-        elif task_id.endswith("_pass2"):
-            if file_handler.remove_file(passlog_del_file) == -1:
-                task_def.finished_callback(
-                    task_def.task_id, (-1, f"Failed To Delete {passlog_del_file}")
-                )
-            else:
-                task_def.finished_callback(task_def.task_id, result)
+        commands += ["-map", "0:v:0", "-an", "-sn"]
 
-        return None
+        if output.video_filters:
+            commands += ["-vf", output.video_filters]
 
-    def _error_callback(task_id: str, message: str):
+        return [*commands, *video_options, *output_options]
+
+    def _chunks_encoded(
+        chunk_futures: list[concurrent.futures.Future],
+        progress_start: float,
+        progress_span: float,
+        progress_message: str,
+    ) -> tuple[int, str]:
         """
-        Called when an error occurs in pass 1 or pass 2
+        Waits for chunk encodes started on the Async_Tool_Engine, reporting progress as each one finishes
 
         Args:
-            task_id (str): Task ID
-            message (str): Error Message
+            chunk_futures (list[concurrent.futures.Future]): The chunk encodes
+            progress_start (float): The percentage complete before the chunk encodes
+            progress_span (float): The percentage of the whole encode the chunk encodes are
+            progress_message (str): The progress message
+
+        Returns:
+            tuple[int, str]:
+            - arg 1: 1 if every chunk was encoded, -1 if one failed, -2 if cancelled
+            - arg 2: Empty string if all good, otherwise error message
         """
-        assert isinstance(task_id, str), f"{task_id=}. Must be str"
-        assert isinstance(message, str), f"{message=}. Must be str"
+        for done_count, _ in enumerate(
+            concurrent.futures.as_completed(chunk_futures), start=1
+        ):
+            if progress_callback is not None:
+                progress_callback(
+                    progress_start + progress_span * done_count / len(chunk_futures),
+                    f"{progress_message} {done_count}/{len(chunk_futures)}",
+                )
 
-        path, name, ext = file_handler.split_file_path(passlog_del_file)
+        chunk_results = [chunk_future.result() for chunk_future in chunk_futures]
 
-        if (
-            file_handler.file_exists(path, name, ext)
-            and file_handler.remove_file(passlog_del_file) == -1
-        ):
-            task_def.finished_callback(
-                task_def.task_id,
-                (-1, f"Failed To Delete {passlog_del_file} \n {message}"),
-            )
-        else:
-            task_def.finished_callback(task_def.task_id, (-1, message))
+        if any(chunk_result == -2 for chunk_result, _ in chunk_results):
+            return -2, "Chunked Encode Cancelled"
 
-        task_def.error_callback(task_id, (-1, message))
+        for chunk_result, chunk_message in chunk_results:
+            if chunk_result != 1:
+                return -1, f"Chunk Encode Error: {chunk_message}"
 
-    def _aborted_callback(task_id: str, message: str):
-        """
-        Called when pass 1 or pass 2 is aborted
+        return 1, ""
 
-        Args:
-            task_id (str): Task ID
-            message (str): Error Message
-        """
-        assert isinstance(task_id, str), f"{task_id=}. Must be str"
-        assert isinstance(message, str), f"{message=}. Must be str"
+    #### Main
+    if not os.path.exists(input_file):
+        return -1, f"File Does Not Exist {input_file}"
 
-        path, name, ext = file_handler.split_file_path(passlog_del_file)
-        if (
-            file_handler.file_exists(path, name, ext)
-            and file_handler.remove_file(passlog_del_file) == -1
-        ):
-            task_def.aborted_callback(
-                task_def.task_id,
-                (-1, f"Failed To Delete {passlog_del_file} \n {message}"),
+    keyframe_index = Get_Keyframe_Index(input_file)
+
+    if keyframe_index.error:
+        return -1, keyframe_index.error
+
+    file_handler = file_utils.File()
+    engine = Async_Tool_Engine()
+
+    _, _, input_extension = file_handler.split_file_path(input_file)
+    output_folder, output_name, _ = file_handler.split_file_path(output.output_file)
+
+    seek_margin_keys = 2  # Keyframes to land before the chunk in unreliable containers
+    unreliable_seek = (
+        input_extension.strip(".").lower() in sys_consts.UNRELIABLE_SEEK_EXTNS
+    )
+
+    # The engine limits how many encoders run at once, together they use every core
+    worker_count = max(1, min(len(chunk_times), engine.tool_limit(TOOL_FFMPEG)))
+    chunk_threads = str(max(1, (os.cpu_count() or 2) // worker_count))
+
+    chunk_prefix = file_handler.file_join(output_folder, f"{output_name}_chunk")
+    chunk_passlogs = [
+        f"{chunk_prefix}{chunk_index:03d}" for chunk_index in range(len(chunk_times))
+    ]
+    chunk_files = [f"{chunk_passlog}.mkv" for chunk_passlog in chunk_passlogs]
+    chunk_durations = [
+        chunk_times[chunk_index + 1] - chunk_times[chunk_index]
+        for chunk_index in range(len(chunk_times) - 1)
+    ]
+    chunk_durations.append(max(duration - (chunk_times[-1] - chunk_times[0]), 1.0))
+    concat_file = file_handler.file_join(
+        output_folder, f"{output_name}_chunks.{sys_consts.FFCONCAT_EXTN}"
+    )
+
+    video_bitrate = 0
+
+    if output.two_pass and "-b:v" in output.video_options[:-1]:
+        try:
+            video_bitrate = int(
+                output.video_options[output.video_options.index("-b:v") + 1].rstrip(
+                    "kK"
+                )
             )
-        else:
-            task_def.aborted_callback(task_def.task_id, message)
+        except ValueError:
+            video_bitrate = 0
 
-    #### Main
+    buffer_options = []
+
+    for option_index, option in enumerate(output.video_options[:-1]):
+        if option in ("-bufsize", "-bufsize:v") and video_bitrate > 0:
+            try:
+                buffer_size = int(output.video_options[option_index + 1])
+            except ValueError:
+                continue
+
+            # A chunk can not know how full the buffer the chunk before left is, so it assumes half full
+            buffer_options = ["-rc_init_occupancy", str(buffer_size // 2)]
+
+    loudness_wanted = Loudnorm_Filter() in output.audio_options
+    measurement = None
+    chunk_bitrates = [0] * len(chunk_times)
+    chunk_futures = []
+    result, message = 1, ""
+
+    try:
+        # Analysis pass, which the bits of the title are shared on
+        if video_bitrate > 0:
+            passlog_cache = Passlog_Cache()
+            analysis_commands = [
+                _chunk_commands(
+                    chunk_index,
+                    [*_video_options(0), *buffer_options],
+                    [
+                        "-pass",
+                        "1",
+                        "-passlogfile",
+                        chunk_passlogs[chunk_index],
+                        "-f",
+                        "null",
+                        os.devnull,
+                    ],
+                )
+                for chunk_index in range(len(chunk_times))
+            ]
+            passlog_keys = [
+                passlog_cache.passlog_key(input_file, commands)
+                for commands in analysis_commands
+            ]
+            analysed_chunks = [
+                chunk_index
+                for chunk_index in range(len(chunk_times))
+                if not passlog_cache.get(
+                    passlog_keys[chunk_index], chunk_passlogs[chunk_index]
+                )
+            ]
+            chunk_futures = [
+                engine.submit(
+                    analysis_commands[chunk_index],
+                    stderr_to_stdout=True,
+                    cancellation_callback=cancellation_callback,
+                    debug=False,
+                    stdout_capture=Output_Capture(policy=CAPTURE_TAIL),
+                )
+                for chunk_index in analysed_chunks
+            ]
+
+            # Measured from its own audio decode while the chunks encode
+            if loudness_wanted:
+                loudness_result, loudness_message, measurement = Measure_Loudness(
+                    input_file=input_file, cancellation_callback=cancellation_callback
+                )
+
+                # A failed measurement only costs linear loudnorm
+                if loudness_result == -2:
+                    result, message = loudness_result, loudness_message
+
+                loudness_wanted = False
+
+            if chunk_futures:
+                analysis_result, analysis_message = _chunks_encoded(
+                    chunk_futures, 0.0, 45.0, "Pass 1: Chunk"
+                )
+
+                if result == 1:
+                    result, message = analysis_result, analysis_message
+
+            if result == 1:
+                for chunk_index in analysed_chunks:
+                    passlog_cache.put(
+                        passlog_keys[chunk_index], chunk_passlogs[chunk_index]
+                    )
+
+                chunk_bitrates = _Plan_Chunk_Bitrates(
+                    passlog_files=[
+                        (sorted(Pass_Log_Files(chunk_passlog)) or [""])[0]
+                        for chunk_passlog in chunk_passlogs
+                    ],
+                    chunk_durations=chunk_durations,
+                    video_bitrate=video_bitrate,
+                )
+
+        if result == 1:
+            encode_commands = [
+                _chunk_commands(
+                    chunk_index,
+                    [*_video_options(chunk_bitrates[chunk_index]), *buffer_options],
+                    [
+                        *(
+                            ["-pass", "2", "-passlogfile", chunk_passlogs[chunk_index]]
+                            if video_bitrate > 0
+                            else []
+                        ),
+                        chunk_files[chunk_index],
+                    ],
+                )
+                for chunk_index in range(len(chunk_times))
+            ]
+            chunk_futures = [
+                engine.submit(
+                    commands,
+                    stderr_to_stdout=True,
+                    cancellation_callback=cancellation_callback,
+                    debug=False,
+                    stdout_capture=Output_Capture(policy=CAPTURE_TAIL),
+                )
+                for commands in encode_commands
+            ]
+
+            if loudness_wanted:
+                loudness_result, loudness_message, measurement = Measure_Loudness(
+                    input_file=input_file, cancellation_callback=cancellation_callback
+                )
+
+                if loudness_result == -2:
+                    result, message = loudness_result, loudness_message
+
+            encode_result, encode_message = _chunks_encoded(
+                chunk_futures,
+                45.0 if video_bitrate > 0 else 0.0,
+                45.0 if video_bitrate > 0 else 90.0,
+                "Pass 2: Chunk" if video_bitrate > 0 else "Chunk",
+            )
+
+            if result == 1:
+                result, message = encode_result, encode_message
+
+        if result == 1:
+            # The chunks are in the concat file's folder, so the paths need no quoting beyond the file directive
+            concat_lines = ["ffconcat version 1.0"]
+
+            for chunk_file in chunk_files:
+                chunk_name = os.path.basename(chunk_file).replace("'", "'\\''")
+                concat_lines.append(f"file '{chunk_name}'")
+
+            with open(concat_file, "w", encoding="utf-8") as concat_handle:
+                concat_handle.write("\n".join(concat_lines) + "\n")
+
+            stitch_commands = [
+                sys_consts.FFMPG,
+                "-hide_banner",
+                "-nostdin",
+                "-y",
+                "-f",
+                "concat",
+                "-safe",
+                "0",
+                "-i",
+                concat_file,
+            ]
+
+            # From the first keyframe, where the first chunk starts
+            if output.audio_options:
+                stitch_commands += [
+                    "-seek_timestamp",
+                    "1",
+                    "-ss",
+                    f"{chunk_times[0]}",
+                    *Input_Options(input_file),
+                    "-map",
+                    "0:v:0",
+                    "-map",
+                    "1:a?",
+                ]
+            else:
+                stitch_commands += ["-map", "0:v:0"]
+
+            stitch_commands += [
+                "-c:v",
+                "copy",
+                *output.audio_options,
+                *output.muxer_options,
+                output.output_file,
+            ]
+
+            result, message = Execute_Check_Output(
+                commands=Loudnorm_Commands(stitch_commands, measurement),
+                debug=False,
+                cancellation_callback=cancellation_callback,
+                progress_callback=(
+                    None
+                    if progress_callback is None
+                    else lambda percentage, message: progress_callback(
+                        90.0 + percentage / 10, f"Stitching: {message}"
+                    )
+                ),
+                progress_duration=duration,
+            )
+    except OSError as e:
+        result, message = -1, f"Failed To Write {concat_file}: {e}"
+    finally:
+        concurrent.futures.wait(chunk_futures)
+
+        for chunk_file in [*chunk_files, concat_file]:
+            if os.path.exists(chunk_file):
+                os.remove(chunk_file)
+
+        for chunk_passlog in chunk_passlogs:
+            for passlog_file in Pass_Log_Files(chunk_passlog):
+                os.remove(passlog_file)
+
+    if result == 1 and (
+        not os.path.exists(output.output_file)
+        or os.path.getsize(output.output_file) == 0
+    ):
+        result, message = -1, f"{output.output_file} Was Not Written"
+
+    if result != 1:
+        if os.path.exists(output.output_file):  # Never leave a partial output
+            os.remove(output.output_file)
+
+        return result, message
+
+    return 1, output.output_file
+
+
+def Validate_DVD_VOB(vob_file: str, frame_rate: float) -> tuple[int, str]:
+    """
+    Checks the video of a DVD VOB file against the DVD limits a chunked encode could break where its chunks join. No
+    GOP may be longer than 15 frames (PAL) or 18 frames (NTSC), and the video buffer verifier, filled at
+    sys_consts.DVD_MAX_VIDEO_BITRATE, must never run dry
+
+    Args:
+        vob_file (str): The VOB file
+        frame_rate (float): The frame rate of the VOB video
+
+    Returns:
+        tuple[int, str]:
+        - arg 1: 1 if the VOB is within the DVD limits, -1 if not or it could not be checked
+        - arg 2: Empty string if all good, otherwise error message
+    """
+    assert isinstance(vob_file, str) and vob_file.strip() != "", (
+        f"{vob_file=}. Must be a non-empty str"
+    )
+    assert isinstance(frame_rate, (int, float)) and frame_rate > 0, (
+        f"{frame_rate=}. Must be int | float > 0"
+    )
+
+    max_gop_frames = 15 if round(frame_rate) == sys_consts.PAL_FRAME_RATE else 18
+    frame_fill_bits = sys_consts.DVD_MAX_VIDEO_BITRATE * 1000 / frame_rate
+
+    # Packets come out in decode order, which is the order the decoder takes pictures from its buffer
+    vob_state = {
+        "frame": 0,
+        "gop_frames": 0,
+        # A VBR decoder starts once it is full
+        "buffer_bits": float(sys_consts.DVD_VBV_BUFFER_SIZE),
+        "error": "",
+    }
+
+    def _check_packet(packet: tuple[str, ...]) -> bool:
+        """
+        Takes a picture out of the video buffer and counts it into its GOP
+
+        Args:
+            packet (tuple[str, ...]): The size and flags of the packet
+
+        Returns:
+            bool: False once a DVD limit is broken
+        """
+        try:
+            packet_bits = int(packet[0]) * 8
+        except ValueError:
+            return True
+
+        vob_state["frame"] += 1
+        vob_state["gop_frames"] = 1 if "K" in packet[1] else vob_state["gop_frames"] + 1
+
+        if vob_state["gop_frames"] > max_gop_frames:
+            vob_state["error"] = (
+                f"GOP Longer Than {max_gop_frames} Frames At Frame {vob_state['frame']}"
+            )
+            return False
+
+        # A VBR DVD buffer fills at the peak rate until it is full
+        vob_state["buffer_bits"] -= packet_bits
+
+        if vob_state["buffer_bits"] < 0:
+            vob_state["error"] = f"Video Buffer Underflow At Frame {vob_state['frame']}"
+            return False
+
+        vob_state["buffer_bits"] = min(
+            vob_state["buffer_bits"] + frame_fill_bits,
+            float(sys_consts.DVD_VBV_BUFFER_SIZE),
+        )
+
+        return True
+
+    result, message = Probe_Stream_Entries(
+        video_file=vob_file,
+        section="packet",
+        entries=("size", "flags"),
+        entry_callback=_check_packet,
+    )
+
+    if result != 1:
+        return -1, message
+
+    if vob_state["error"]:
+        return -1, f"{vob_file} Breaks The DVD Limits: {vob_state['error']}"
+
+    if vob_state["frame"] == 0:
+        return -1, f"No Video Found In {vob_file}"
+
+    return 1, ""
+
+
+def Transcode_DVD_VOB(
+    input_file: str,
+    output_folder: str,
+    input_video_width: int,
+    input_video_height: int,
+    input_video_ar: str,  # e.g., "4:3", "16:9"
+    input_video_scan_type: str,  # "interlaced" or "progressive"
+    input_video_frame_rate: float,  # Actual frame rate of the input video
+    auto_bright: bool,
+    normalise: bool,
+    white_balance: bool,
+    denoise: bool,
+    sharpen: bool,
+    filters_off: bool,
+    black_border: bool = False,
+    dvd_standard: str = "",
+    input_video_duration: float = 0.0,
+    progress_callback: Optional[Callable[[float, str], None]] = None,
+    task_def: Task_Def = None,
+    fan_out_outputs: Optional[list[Fan_Out_Output]] = None,
+    output_results: Optional[dict[str, tuple[int, str]]] = None,
+    draft: bool = False,
+    video_bitrate: int = 0,
+    chunked: bool = False,
+) -> tuple[int, str]:
+    """
+    Encodes the input video file as a DVD VOB (mpeg2) file.
+
+    The VOB is a two pass encode, and the analysis pass is skipped when its pass logs are in the Passlog_Cache. A
+    draft is a single pass encode at a fixed quantiser instead.
+
+    A chunked encode splits a long input with Plan_Encode_Chunks and encodes the chunks at the same time with
+    Transcode_Chunked. If the stitched VOB fails Validate_DVD_VOB, or the chunked encode fails, the VOB is encoded
+    again whole. Drafts, fan out encodes and inputs too short to split are never chunked.
+
+    The analysis pass also measures the loudness of the audio, which is kept in the Loudness_Cache, and the encoding
+    pass normalises the audio with linear loudnorm. A draft only uses a cached loudness, otherwise dynamic loudnorm.
+
+    If fan out outputs are supplied, they are encoded from the same decode as the VOB with Transcode_Fan_Out.
+
+    Args:
+        input_file (str): The path to the input video file.
+        output_folder (str): The path to the output folder.
+        input_video_width (int): Original width of the input video.
+        input_video_height (int): Original height of the input video.
+        input_video_ar (str): Original aspect ratio of the input video (e.g., "4:3", "16:9").
+        input_video_scan_type (str): Scan type of the input video ("interlaced" or "progressive").
+        input_video_frame_rate (float): Frame rate of the input video.
+        auto_bright (bool): Whether to apply auto-brightening filter.
+        normalise (bool): Whether to apply video normalization filter.
+        white_balance (bool): Whether to apply color correction filter.
+        denoise (bool): Whether to apply denoise filter.
+        sharpen (bool): Whether to apply a sharpen filter.
+        filters_off (bool): If True, skips all video processing filters except black borders.
+        black_border (bool, optional): Whether to add black borders to the video. Defaults to False.
+        dvd_standard (str): The target DVD standard (e.s., sys_consts.PAL, sys_consts.NTSC).
+        input_video_duration (float): Duration of the input video in seconds, used for progress percentages.
+            Defaults to 0.0 (unknown).
+        progress_callback (Optional[Callable[[float, str], None]]): Receives the percentage complete and a
+            frame/fps/speed/ETA message while encoding. Defaults to None.
+        task_def (Task_Def, optional): The task definition. If supplied, this becomes a background task. Defaults to None.
+        fan_out_outputs (Optional[list[Fan_Out_Output]]): Other outputs to encode along with the VOB, none may be
+            named "vob". Defaults to None
+        output_results (Optional[dict[str, tuple[int, str]]]): Pass by ref, filled with the result of the VOB and
+            of each fan out output as Transcode_Fan_Out reports them. Defaults to None
+        draft (bool): True for a quicker single pass encode at sys_consts.DRAFT_VIDEO_QSCALE, which fills the disc
+            less predictably. Defaults to False
+        video_bitrate (int): The average video bitrate in kbps of the two pass encode, as Plan_Title_Bitrates plans
+            it. Defaults to 0 (sys_consts.AVERAGE_BITRATE)
+        chunked (bool): True to encode a long input in chunks at the same time. Defaults to False
+
+    Returns:
+        tuple[int, str]:
+            - arg 1: 1 if ok, -1 if error, 0 if task_def supplied and this becomes a background task.
+            - arg 2: error message if error (-1) else output file path (1 or 0). A fan out output failing is only
+              reported in output_results
+    """
 
     assert isinstance(input_file, str) and input_file.strip() != "", (
         f"{input_file=}. Must be a non-empty str"
@@ -4100,14 +4750,21 @@ def Transcode_ffv1_archival(
     assert isinstance(output_folder, str) and output_folder.strip() != "", (
         f"{output_folder=}. Must be a non-empty str"
     )
-    assert isinstance(frame_rate, float) and frame_rate > 0, (
-        f"{frame_rate=}. Must be float > 0"
+    assert isinstance(input_video_width, int) and input_video_width > 0, (
+        f"{input_video_width=}. Must be int > 0"
     )
-    assert isinstance(width, int) and width > 0, f"{width=}. Must be int > 0"
-    assert isinstance(height, int) and height > 0, f"{height=}. Must be int > 0"
-    assert isinstance(interlaced, bool), f"{interlaced=}. Must be bool"
-    assert isinstance(bottom_field_first, bool), f"{bottom_field_first=}. Must be bool"
-    assert isinstance(deinterlace, bool), f"{deinterlace=}. Must be bool"
+    assert isinstance(input_video_height, int) and input_video_height > 0, (
+        f"{input_video_height=}. Must be int > 0"
+    )
+    assert isinstance(input_video_ar, str) and input_video_ar.strip() != "", (
+        f"{input_video_ar=}. Must be a non-empty str"
+    )
+    assert (
+        isinstance(input_video_scan_type, str) and input_video_scan_type.strip() != ""
+    ), f"{input_video_scan_type=}. Must be a non-empty str"
+    assert (
+        isinstance(input_video_frame_rate, (float, int)) and input_video_frame_rate > 0
+    ), f"{input_video_frame_rate=}. Must be float/int > 0"
     assert isinstance(auto_bright, bool), f"{auto_bright=}. Must be bool"
     assert isinstance(normalise, bool), f"{normalise=}. Must be bool"
     assert isinstance(white_balance, bool), f"{white_balance=}. Must be bool"
@@ -4115,339 +4772,242 @@ def Transcode_ffv1_archival(
     assert isinstance(sharpen, bool), f"{sharpen=}. Must be bool"
     assert isinstance(filters_off, bool), f"{filters_off=}. Must be bool"
     assert isinstance(black_border, bool), f"{black_border=}. Must be bool"
-    assert isinstance(apply_spp, bool), f"{apply_spp=}. Must be bool"  # NEW: Assertion
-    assert isinstance(dehalo, bool), f"{dehalo=}. Must be bool"  # NEW: Assertion
+    assert dvd_standard in [sys_consts.PAL, sys_consts.NTSC], (
+        f"{dvd_standard=}. Must be sys_consts.PAL or sys_consts.NTSC"
+    )
+    assert (
+        isinstance(input_video_duration, (int, float)) and input_video_duration >= 0
+    ), f"{input_video_duration=}. Must be int | float >= 0"
+    assert callable(progress_callback) or progress_callback is None, (
+        f"{progress_callback=}. Must be a function or None"
+    )
     assert isinstance(task_def, Task_Def) or task_def is None, (
         f"{task_def=}. Must be Task_Def or None"
     )
+    assert fan_out_outputs is None or (
+        isinstance(fan_out_outputs, list)
+        and all(isinstance(output, Fan_Out_Output) for output in fan_out_outputs)
+    ), f"{fan_out_outputs=}. Must be a list of Fan_Out_Output or None"
+    assert isinstance(output_results, dict) or output_results is None, (
+        f"{output_results=}. Must be a dict or None"
+    )
+    assert isinstance(draft, bool), f"{draft=}. Must be bool"
+    assert isinstance(video_bitrate, int) and (
+        video_bitrate == 0 or 0 < video_bitrate <= sys_consts.DVD_MAX_VIDEO_BITRATE
+    ), f"{video_bitrate=}. Must be 0 or an int > 0 and <= DVD_MAX_VIDEO_BITRATE"
+    assert isinstance(chunked, bool), f"{chunked=}. Must be bool"
 
-    if deinterlace and not interlaced:
-        return (
-            -1,
-            "Cannot force deinterlace when input video is progressive. Input is already progressive.",
+    #### Helper
+    def _fan_out_encoder_worker(
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+    ) -> tuple[int, str]:
+        """
+        Worker function to encode the VOB and the fan out outputs from one decode.
+        Note: This is designed to be submitted to Task_QManager.
+        """
+        fan_out_results = {} if output_results is None else output_results
+
+        result, message = Transcode_Fan_Out(
+            input_file=input_file,
+            outputs=[vob_output, *fan_out_outputs],
+            duration=input_video_duration,
+            output_results=fan_out_results,
+            progress_callback=progress_callback,
         )
 
-    file_handler = file_utils.File()
+        if result == -2:
+            return -2, message
 
-    if not file_handler.path_exists(output_folder):
-        return -1, f"{output_folder} Does not exist"
-    if not file_handler.path_writeable(output_folder):
-        return -1, f"{output_folder} Cannot Be Written To"
-    if not file_handler.file_exists(input_file):
-        return -1, f"File Does Not Exist {input_file}"
+        return fan_out_results[vob_output.name]
 
-    _, input_file_name, _ = file_handler.split_file_path(input_file)
+    def _chunked_encoder_worker(
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+    ) -> tuple[int, str]:
+        """
+        Worker function to encode the VOB in chunks, falling back to a whole encode if the chunked VOB is not usable.
+        Note: This is designed to be submitted to Task_QManager.
+        """
+        result, message = Transcode_Chunked(
+            input_file=input_file,
+            output=vob_output,
+            frame_rate=float(target_frame_rate),
+            chunk_times=chunk_times,
+            duration=input_video_duration,
+            progress_callback=progress_callback,
+        )
 
-    output_file = file_handler.file_join(output_folder, f"{input_file_name}.mkv")
-    passlog_file = file_handler.file_join(output_folder, f"{input_file_name}")
-    passlog_del_file = file_handler.file_join(output_folder, f"{input_file_name}-0.log")
+        if result == 1:
+            result, message = Validate_DVD_VOB(vob_file, float(target_frame_rate))
 
-    video_filters_arg = Build_Video_Filters(
-        auto_bright=auto_bright,
-        normalise=normalise,
-        white_balance=white_balance,
-        denoise=denoise,
-        sharpen=sharpen,
-        filters_off=filters_off,
-        black_border=black_border,
-        target_width=width,
-        target_height=height,
-        deinterlace_video=deinterlace,
-        include_dvd_interlacing=False,
-        apply_spp=apply_spp,
-        dehalo=dehalo,
-    )
+            if result == -1 and os.path.exists(vob_file):
+                os.remove(vob_file)
 
-    interlaced_output_flags = []
-    field_order_filter_str = ""
+        if result == -1:
+            return _two_pass_encoder_worker(
+                commands_1=command_pass1,
+                commands_2=command_pass2,
+                log_path=log_file_path,
+                passlog_key=passlog_key,
+                loudness_input=loudness_input,
+                debug=False,
+                stderr_to_stdout=False,
+                progress_duration=input_video_duration,
+                progress_callback=progress_callback,
+            )
 
-    if interlaced and not deinterlace:
-        field_order_filter_str = f"fieldorder={'bff' if bottom_field_first else 'tff'}"
-        interlaced_output_flags = [
-            "-flags:v",
-            "+ilme+ildct",
-            "-alternate_scan:v",
-            "1",
-        ]
-    all_filters = []
-    if field_order_filter_str:
-        if (
-            video_filters_arg and video_filters_arg[1]
-        ):  # Check if the filter string part exists
-            video_filters_arg[1] = f"{field_order_filter_str},{video_filters_arg[1]}"
-        else:
-            video_filters_arg = ["-vf", field_order_filter_str]
+        return result, message
 
-    # Command 1 (Pass 1)
-    pass_1 = [
-        sys_consts.FFMPG,
-        "-i",
-        input_file,
-        "-vsync",
-        "cfr",
-        "-max_muxing_queue_size",
-        "9999",
-        "-pass",
-        "1",
-        "-passlogfile",
-        passlog_file,
-        *video_filters_arg,
-        *interlaced_output_flags,
-        "-r",
-        str(frame_rate),
-        "-c:v",
-        "ffv1",
-        "-level",
-        "3",
-        "-coder",
-        "1",  # Golomb Rice
-        "-context",
-        "1",  # Small context
-        "-g",
-        "1",  # All I-frames
-        "-slices",
-        "16",  # More slices for parallel processing
-        "-slicecrc",
-        "1",  # CRC checks for slices
-        "-c:a",
-        "flac",  # Lossless audio
-        "-f",
-        "null",  # Output to null device for pass 1
-        "-threads",
-        "0",
-        str(os.devnull),
-    ]
+    def _two_pass_encoder_worker(
+        commands_1: list[str],
+        commands_2: list[str],
+        log_path: str,
+        *args,
+        passlog_key: str = "",
+        loudness_input: str = "",
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        **kwargs,
+    ) -> tuple[int, str]:
+        """
+        Worker function to execute both passes of FFmpeg and handle log cleanup.
+        Note: This is designed to be submitted to Task_QManager.
 
-    # Command 2 (Pass 2)
-    pass_2 = [
-        sys_consts.FFMPG,
-        "-i",
-        input_file,
-        "-vsync",
-        "cfr",
-        "-max_muxing_queue_size",
-        "9999",
-        "-pass",
-        "2",
-        "-passlogfile",
-        passlog_file,
-        *video_filters_arg,
-        *interlaced_output_flags,
-        "-r",
-        str(frame_rate),
-        "-c:v",
-        "ffv1",
-        "-level",
-        "3",
-        "-coder",
-        "1",
-        "-context",
-        "1",
-        "-g",
-        "1",
-        "-slices",
-        "16",
-        "-slicecrc",
-        "1",
-        "-c:a",
-        "flac",
-        "-threads",
-        "0",
-        "-y",
-        output_file,
-    ]
+        Progress is reported as 0-50% for the analysis pass and 50-100% for the encoding pass. If the pass logs
+        are cached under passlog_key the analysis pass is skipped and the encoding pass is 0-100%
 
-    if task_def:  # Run in the background
-        background_task_qmanager = Task_QManager()
+        If loudness_input is set, its loudness is measured in the analysis pass, unless it is cached, and the
+        encoding pass normalises the audio with linear loudnorm
+        """
+        file_handler = file_utils.File()
+        passlog_cache = Passlog_Cache()
+        loudness_cache = Loudness_Cache()
+
+        pass_1_progress = None
+        pass_2_progress = None
+        analysis_needed = not passlog_cache.get(passlog_key, log_path)
+        measurement = loudness_cache.get(loudness_input) if loudness_input else None
+        loudness_measured = loudness_input != "" and measurement is None
+
+        if progress_callback is not None:
+            pass_1_progress = lambda percentage, message: progress_callback(
+                percentage / 2, f"Pass 1: {message}"
+            )
+            pass_2_progress = lambda percentage, message: progress_callback(
+                (50.0 + percentage / 2) if analysis_needed else percentage,
+                f"Pass 2: {message}",
+            )
 
-        # Pass 1 submission
-        background_task_qmanager.submit_task(
-            worker_function=Execute_Check_Output,
-            commands=pass_1,
-            debug=False,
-            stderr_to_stdout=False,
-            task_id=f"{task_def.task_id}_pass1",
-            started_callback=_started_callback,
-            error_callback=_error_callback,
-            finished_callback=_finished_callback,
-            # progress_callback=_progress_callback,
-            aborted_callback=_aborted_callback,
-        )
+        if analysis_needed:
+            # Execute Pass 1 (Analysis), measuring the loudness from the same decode
+            loudness_capture = Output_Capture(policy=CAPTURE_TAIL)
 
-        return 0, output_file
+            try:
+                result_1, message_1 = Execute_Check_Output(
+                    commands=[
+                        *commands_1,
+                        *(_Loudness_Measure_Output() if loudness_measured else []),
+                    ],
+                    *args,
+                    progress_callback=pass_1_progress,
+                    stderr_capture=loudness_capture,
+                    **kwargs,
+                )
 
-    else:  # Run in the foreground
-        result, message = Execute_Check_Output(
-            commands=pass_1, debug=False, stderr_to_stdout=False
-        )
+                if result_1 == 1 and loudness_measured:
+                    measurement = Parse_Loudnorm_Output(loudness_capture.text())
+            finally:
+                loudness_capture.close()
 
-        if result == -1:
-            return -1, message
+            if result_1 != 1:
+                # Attempt to clean up log files on error or cancel, a cut short analysis must not be cached
+                for log_file in Pass_Log_Files(log_path):
+                    file_handler.remove_file(log_file)
 
-        result, message = Execute_Check_Output(
-            commands=pass_2, debug=False, stderr_to_stdout=False
-        )
+                if result_1 == -1:
+                    return result_1, f"Pass 1 Error: {message_1}"
 
-        if result == -1:
-            return -1, message
+                return result_1, message_1
 
-        # Delete passlog file only after successful completion of both passes
-        if file_handler.remove_file(passlog_del_file) == -1:
-            return -1, f"Failed To Delete {passlog_del_file}"
+            passlog_cache.put(passlog_key, log_path)
 
-    return 1, output_file
+            if measurement is not None and loudness_measured:
+                loudness_cache.put(loudness_input, measurement)
+        elif loudness_measured:  # The pass logs were cached but the loudness was not
+            result_1, message_1, measurement = Measure_Loudness(
+                input_file=loudness_input
+            )
 
+            if result_1 == -2:  # A failed measurement only costs linear loudnorm
+                return result_1, message_1
 
-def Transcode_Mezzanine(
-    input_file: str,
-    output_folder: str,
-    frame_rate: float,
-    width: int,
-    height: int,
-    interlaced: bool = True,
-    bottom_field_first: bool = True,
-    mjpeg: bool = False,
-    deinterlace: bool = False,
-    auto_bright: bool = False,
-    normalise: bool = False,
-    white_balance: bool = False,
-    denoise: bool = False,
-    sharpen: bool = False,
-    filters_off: bool = False,
-    black_border: bool = False,
-    encode_10bit: bool = False,
-    task_def: Task_Def = None,
-) -> tuple[int, str]:
-    """
-    Converts an input video to MJPEG or H264 at supplied resolution and frame rate to make an edit copy that minimises
-    generational losses. The video is transcoded to a file in the output folder.
+        # Execute Pass 2 (Encoding)
+        result_2, message_2 = Execute_Check_Output(
+            commands=Loudnorm_Commands(commands_2, measurement),
+            *args,
+            progress_callback=pass_2_progress,
+            **kwargs,
+        )
 
-       Args:
-           input_file (str): The path to the input video file.
-           output_folder (str): The path to the output folder.
-           frame_rate (float): The frame rate to use for the output video.
-           width (int): The target width of the output video
-           height (int): The target height of the output video
-           interlaced (bool, optional): True if the input video is interlaced, False if progressive. Defaults to True.
-           bottom_field_first (bool, optional): Whether to use bottom field first for interlaced output. Only relevant
-           if the output remains interlaced (i.e., `deinterlace` is False and `interlaced` is True). Defaults to True.
-           mjpeg (bool, optional): True use MJPEG video as a Mezzanine video, False use H264.
-           deinterlace (bool, optional): If True, forces deinterlacing of the input video, making the output progressive.
-           Defaults to False.
-           auto_bright (bool): Whether to use auto brightness. Defaults to False.
-           normalise (bool): Whether to use normalise. Defaults to False.
-           white_balance (bool): Whether to use white balance. Defaults to False.
-           denoise (bool): Whether to use denoise. Defaults to False.
-           sharpen (bool): Whether to use sharpen. Defaults to False.
-           filters_off (bool): Whether to disable all filters except scaling and black borders. Defaults to False.
-           black_border (bool, optional): Whether to add black borders to the video. Defaults to False.
-           encode_10bit (bool, optional): If True, encode video to 10-bit YUV 4:2:2 (yuv422p10le). Defaults to False.
-           task_def (Task_Def): The task definition, if this is supplied, then this becomes a background task. Defaults to None.
+        # Cleanup the log files
+        for log_file in Pass_Log_Files(log_path):
+            file_handler.remove_file(log_file)
 
-       Returns:
-           tuple[int, str]:
-               - arg 1: 1 if ok, -1 if error, 0 if task_def supplied and this becomes a background task
-               - arg 2: error message if error (-1) else output file path (1 or 0)
-    """
-    assert isinstance(input_file, str) and input_file.strip() != "", (
-        f"{input_file=}. Must be a non-empty str"
-    )
-    assert isinstance(output_folder, str) and output_folder.strip() != "", (
-        f"{output_folder=}. Must be a non-empty str"
-    )
-    assert isinstance(frame_rate, float) and frame_rate > 0, (
-        f"{frame_rate=}. Must be float > 0"
-    )
-    assert isinstance(width, int) and width > 0, f"{width=}. Must be int > 0"
-    assert isinstance(height, int) and height > 0, f"{height=}. Must be int > 0"
-    assert isinstance(interlaced, bool), f"{interlaced=}. Must be bool"
-    assert isinstance(bottom_field_first, bool), f"{bottom_field_first=}. Must be bool"
-    assert isinstance(mjpeg, bool), f"{mjpeg=}. Must be bool"
-    assert isinstance(deinterlace, bool), f"{deinterlace=}. Must be bool"
-    assert isinstance(auto_bright, bool), f"{auto_bright=}. Must be bool"
-    assert isinstance(normalise, bool), f"{normalise=}. Must be bool"
-    assert isinstance(white_balance, bool), f"{white_balance=}. Must be bool"
-    assert isinstance(denoise, bool), f"{denoise=}. Must be bool"
-    assert isinstance(sharpen, bool), f"{sharpen=}. Must be bool"
-    assert isinstance(filters_off, bool), f"{filters_off=}. Must be bool"
-    assert isinstance(black_border, bool), f"{black_border=}. Must be bool"
-    assert isinstance(encode_10bit, bool), f"{encode_10bit=}. Must be bool"
-    assert isinstance(task_def, Task_Def) or task_def is None, (
-        f"{task_def=}. Must be Task_Def or None"
-    )
+        if result_2 == -1:
+            return result_2, f"Pass 2 Error: {message_2}"
 
-    if deinterlace and not interlaced:
-        return (
-            -1,
-            "Cannot force deinterlace when input video is progressive. Input is already progressive.",
-        )
+        return result_2, message_2
+
+    #### Main
 
     file_handler = file_utils.File()
 
     if not file_handler.path_exists(output_folder):
         return -1, f"{output_folder} Does not exist"
+
     if not file_handler.path_writeable(output_folder):
         return -1, f"{output_folder} Cannot Be Written To"
+
     if not file_handler.file_exists(input_file):
         return -1, f"File Does Not Exist {input_file}"
 
-    _, input_file_name, _ = file_handler.split_file_path(input_file)
+    _, input_file_name_base, _ = file_handler.split_file_path(input_file)
 
-    if encode_10bit:
-        pixel_format = "yuv422p10le"  # 10-bit 4:2:2
-    else:
-        pixel_format = "yuv420p"  # Default to 8-bit 4:2:0
+    vob_file = file_handler.file_join(output_folder, f"{input_file_name_base}.vob")
 
-    if mjpeg:
-        output_file = file_handler.file_join(output_folder, f"{input_file_name}.avi")
+    log_file_path = file_handler.file_join(
+        output_folder, f"{input_file_name_base}_2pass.log"
+    )
 
-        if input_file == output_file:
-            output_file = file_handler.file_join(
-                output_folder, f"{input_file_name}_out.avi"
-            )
+    interlaced_video = input_video_scan_type.lower().startswith("interlaced")
 
-        video_codec = "mjpeg"
+    if input_video_width <= 0 or input_video_height <= 0:
+        return (
+            -1,
+            f"Input video {input_file=} does not specify valid height and/or width.",
+        )
 
-        # MJPEG specific quality/bitrate settings
-        q_v = "3"
-        crf = None  # CRF not used for MJPEG
-        preset = None  # Preset not used for MJPEG
-        gop_size = 1  # MJPEG is typically I-frame only
-        keyint_min = 1
-        sc_threshold = 0
+    if not input_video_ar:
+        return -1, f"Unrecognised Aspect Ratio : {input_video_ar} for {input_file=}"
 
-    else:  # H264 Mezzanine
-        output_file = file_handler.file_join(output_folder, f"{input_file_name}.mkv")
+    if dvd_standard == sys_consts.PAL:
+        target_frame_rate = f"{sys_consts.PAL_FRAME_RATE}"
+        target_width = sys_consts.PAL_SPECS.width_43
+        target_height = sys_consts.PAL_SPECS.height_43
+        target_video_size = f"{target_width}x{target_height}"
 
-        if input_file == output_file:
-            output_file = file_handler.file_join(
-                output_folder, f"{input_file_name}_out.mkv"
+        if input_video_ar not in ["4:3", "16:9"]:
+            return (
+                -1,
+                f"Video {input_video_width=}x{input_video_height=} with AR {input_video_ar} does not conform to PAL "
+                f"specifications for DVD.",
             )
 
-        video_codec = (
-            "libx264"  # Default for H264. If using H265, you'd change this here
-        )
-        q_v = None  # Q:v not used for H264
-        crf = "17"  # Good quality for mezzanine H264
-        preset = "medium"  # Medium preset for good balance
-        gop_size = 1  # Mezzanine is I-frame only
-        keyint_min = 1
-        sc_threshold = 0
-
-    # Set bit rate based on video height (common to both MJPEG and H264 Mezzanine)
-    if height <= 576:  # SD
-        bit_rate = 25
-    else:  # HD
-        bit_rate = 50
-
-    if (width, height) in Standard_Resolutions():
-        scale_width = -1
-        scale_height = -1
-    else:
-        scale_width = width
-        scale_height = height
+    else:  # NTSC
+        target_frame_rate = f"{sys_consts.NTSC_FRAME_RATE}"
+        target_width = sys_consts.NTSC_SPECS.width_43
+        target_height = sys_consts.NTSC_SPECS.height_43
+        target_video_size = f"{target_width}x{target_height}"
 
-    video_filters_arg = Build_Video_Filters(
+    video_filters = Build_Video_Filters(
         auto_bright=auto_bright,
         normalise=normalise,
         white_balance=white_balance,
@@ -4455,14 +5015,27 @@ def Transcode_Mezzanine(
         sharpen=sharpen,
         filters_off=filters_off,
         black_border=black_border,
-        target_width=scale_width,
-        target_height=scale_height,
-        deinterlace_video=deinterlace,
+        target_width=-1 if target_width == input_video_width else target_width,
+        target_height=-1 if target_height == input_video_height else target_height,
+        include_dvd_interlacing=True,
+        input_video_frame_rate=input_video_frame_rate,
+        video_interlaced=interlaced_video,
+        dvd_standard=dvd_standard,
     )
 
+    average_bit_rate = video_bitrate or sys_consts.AVERAGE_BITRATE
+    audio_bit_rate_bps = str(sys_consts.AUDIO_BITRATE * 1000)
+
+    if draft:  # Quality targeted, the VBV still holds it to the DVD peak rate
+        video_rate_options = ["-q:v", str(sys_consts.DRAFT_VIDEO_QSCALE)]
+        pass_options = []
+    else:
+        video_rate_options = ["-b:v", f"{average_bit_rate}k"]
+        pass_options = ["-pass", "2", "-passlogfile", log_file_path]
+
     interlaced_flags = []
 
-    if not deinterlace and interlaced:
+    if interlaced_video:
         interlaced_flags = [
             "-flags:v:0",
             "+ilme+ildct",
@@ -4470,70 +5043,236 @@ def Transcode_Mezzanine(
             "1",
         ]
 
-        field_order_filter = f"fieldorder={'bff' if bottom_field_first else 'tff'}"
-        if video_filters_arg:
-            video_filters_arg[1] = f"{field_order_filter},{video_filters_arg[1]}"
-        else:
-            video_filters_arg = ["-vf", field_order_filter]
-
-    command = [
+    # --- 💥 PASS 1: Analysis Command ---
+    command_pass1 = [
         sys_consts.FFMPG,
         "-fflags",
-        "+genpts",  # generate presentation timestamps
-        "-i",
-        input_file,
-        "-vsync",
-        "cfr",
-        "-max_muxing_queue_size",
-        "9999",
-        *video_filters_arg,
+        "+genpts",
+        *Input_Options(input_file),
         *interlaced_flags,
+        "-f",
+        "dvd",
+        "-c:v:0",
+        "mpeg2video",
+        "-aspect",
+        input_video_ar,
+        "-s",
+        target_video_size,
         "-r",
-        str(frame_rate),
-        "-c:v",
-        video_codec,
-        "-b:v",
-        f"{bit_rate}M",  # High bitrate for edit copy
-        "-maxrate",
-        f"{int(float(bit_rate) * 2)}M",
-        "-bufsize",
-        f"{int(float(bit_rate) * 5)}M",  # Adjusted bufsize for mezzanine
-        "-sn",  # Remove titles
+        target_frame_rate,
+        "-g",
+        "15",
         "-pix_fmt",
-        pixel_format,
+        "yuv420p",
+        "-b:v",
+        f"{average_bit_rate}k",
+        "-maxrate:v",
+        f"{sys_consts.DVD_MAX_VIDEO_BITRATE}k",
+        "-minrate:v",
+        "0",
+        "-bufsize:v",
+        str(sys_consts.DVD_VBV_BUFFER_SIZE),
+        # 2-Pass VBR Settings
+        "-pass",
+        "1",
+        "-passlogfile",
+        log_file_path,
+        "-an",  # Disable audio for Pass 1
+        "-map",
+        "0:V",
+        "-threads",
+        "0",
+        os.devnull,  # Outputs to the null device
+        "-y",
     ]
 
-    # Add codec-specific arguments
-    if q_v:  # For MJPEG
-        command.extend(["-q:v", q_v])
-    if crf:  # For H264
-        command.extend(["-crf", crf])
-    if preset:  # For H264
-        command.extend(["-preset", preset])
-
-    command.extend([
+    # --- 💥 PASS 2: Encoding Command, The Only Pass Of A Draft ---
+    command_pass2 = [
+        sys_consts.FFMPG,
+        "-fflags",
+        "+genpts",
+        *Input_Options(input_file),
+        *interlaced_flags,
+        "-f",
+        "dvd",
+        "-c:v:0",
+        "mpeg2video",
+        "-aspect",
+        input_video_ar,
+        "-s",
+        target_video_size,
+        "-r",
+        target_frame_rate,
         "-g",
-        f"{gop_size}",
-        "-keyint_min",
-        f"{keyint_min}",
-        "-sc_threshold",
-        f"{sc_threshold}",
-        "-c:a",
-        "pcm_s16le",  # Uncompressed audio for mezzanine
+        "15",
+        "-pix_fmt",
+        "yuv420p",
+        *video_rate_options,
+        "-maxrate:v",
+        f"{sys_consts.DVD_MAX_VIDEO_BITRATE}k",
+        "-minrate:v",
+        "0",
+        "-bufsize:v",
+        str(sys_consts.DVD_VBV_BUFFER_SIZE),
+        # 2-Pass VBR Settings
+        *pass_options,
+        # Audio, Muxing, and Output
+        "-packetsize",
+        "2048",
+        "-muxrate",
+        "10080000",
+        "-force_key_frames",
+        "expr:if(isnan(prev_forced_n),1,eq(n,prev_forced_n + 15))",
+        *video_filters,
+        "-b:a",
+        audio_bit_rate_bps,
+        "-ar",
+        "48000",
+        "-c:a:0",
+        "ac3",
+        "-filter:a:0",
+        Loudnorm_Filter(),  # Swapped for linear loudnorm once the loudness is measured
+        "-map",
+        "0:V",
+        "-map",
+        "0:a?",
+        "-map",
+        "-0:s",
         "-threads",
         "0",
+        vob_file,
         "-y",
-        output_file,
-    ])
+    ]
 
-    if task_def:  # Run in the background
+    # The same VOB encode, for the shared decode of a fan out encode or the chunks of a chunked encode
+    vob_output = Fan_Out_Output(
+        name="vob",
+        output_file=vob_file,
+        video_filters=",".join(
+            filterfalse(
+                lambda x: not x,
+                [
+                    video_filters[1] if video_filters else "",
+                    f"scale={target_width}:{target_height}",
+                ],
+            )
+        ),
+        video_options=[
+            *interlaced_flags,
+            "-c:v:0",
+            "mpeg2video",
+            "-aspect",
+            input_video_ar,
+            "-r",
+            target_frame_rate,
+            "-g",
+            "15",
+            "-pix_fmt",
+            "yuv420p",
+            *video_rate_options,
+            "-maxrate:v",
+            f"{sys_consts.DVD_MAX_VIDEO_BITRATE}k",
+            "-minrate:v",
+            "0",
+            "-bufsize:v",
+            str(sys_consts.DVD_VBV_BUFFER_SIZE),
+            "-force_key_frames",
+            "expr:if(isnan(prev_forced_n),1,eq(n,prev_forced_n + 15))",
+            "-threads",
+            "0",
+        ],
+        audio_options=[
+            "-b:a",
+            audio_bit_rate_bps,
+            "-ar",
+            "48000",
+            "-c:a:0",
+            "ac3",
+            "-filter:a:0",
+            Loudnorm_Filter(),
+        ],
+        muxer_options=[
+            "-f",
+            "dvd",
+            "-packetsize",
+            "2048",
+            "-muxrate",
+            "10080000",
+        ],
+        passlog_file="" if draft else log_file_path,
+    )
+
+    # The pass 2 filters are in the key, so a filter change is never encoded with stale pass logs
+    passlog_key = (
+        ""
+        if draft or fan_out_outputs
+        else Passlog_Cache().passlog_key(input_file, [*command_pass1, *video_filters])
+    )
+
+    encoding_info = Get_File_Encoding_Info(input_file)
+    loudness_input = (
+        input_file if not encoding_info.error and encoding_info.audio_tracks > 0 else ""
+    )
+
+    # Not worth an analysis pass, so linear loudnorm only if the loudness is cached
+    if draft:
+        command_pass2 = Loudnorm_Commands(
+            command_pass2,
+            Loudness_Cache().get(loudness_input) if loudness_input else None,
+        )
+
+    chunk_times = (
+        Plan_Encode_Chunks(input_file, input_video_duration)
+        if chunked and not draft and not fan_out_outputs
+        else []
+    )
+
+    if task_def:  # Run as a background task
         background_task_qmanager = Task_QManager()
 
+        if fan_out_outputs or chunk_times:
+            background_task_qmanager.submit_task(
+                worker_function=(
+                    _fan_out_encoder_worker
+                    if fan_out_outputs
+                    else _chunked_encoder_worker
+                ),
+                task_id=task_def.task_id,
+                started_callback=task_def.started_callback,
+                progress_callback=task_def.progress_callback,
+                finished_callback=task_def.finished_callback,
+                error_callback=task_def.error_callback,
+                aborted_callback=task_def.aborted_callback,
+            )
+            return 0, vob_file
+
+        if draft:
+            background_task_qmanager.submit_task(
+                worker_function=Execute_Check_Output,
+                commands=command_pass2,
+                debug=False,
+                stderr_to_stdout=False,
+                progress_duration=input_video_duration,
+                task_id=task_def.task_id,
+                started_callback=task_def.started_callback,
+                progress_callback=task_def.progress_callback,
+                finished_callback=task_def.finished_callback,
+                error_callback=task_def.error_callback,
+                aborted_callback=task_def.aborted_callback,
+            )
+            return 0, vob_file
+
+        # Submit the helper worker function to manage the sequential passes
         background_task_qmanager.submit_task(
-            worker_function=Execute_Check_Output,
-            commands=command,
+            worker_function=_two_pass_encoder_worker,
+            commands_1=command_pass1,
+            commands_2=command_pass2,
+            log_path=log_file_path,
+            passlog_key=passlog_key,
+            loudness_input=loudness_input,
             debug=False,
             stderr_to_stdout=False,
+            progress_duration=input_video_duration,
             task_id=task_def.task_id,
             started_callback=task_def.started_callback,
             progress_callback=task_def.progress_callback,
@@ -4541,21 +5280,45 @@ def Transcode_Mezzanine(
             error_callback=task_def.error_callback,
             aborted_callback=task_def.aborted_callback,
         )
-
-        return 0, output_file
+        return 0, vob_file
 
     else:  # Run in the foreground
-        result, message = Execute_Check_Output(
-            commands=command, debug=False, stderr_to_stdout=False
-        )
+        if fan_out_outputs:
+            result, message = _fan_out_encoder_worker(
+                progress_callback=progress_callback
+            )
+        elif chunk_times:
+            result, message = _chunked_encoder_worker(
+                progress_callback=progress_callback
+            )
+        elif draft:
+            result, message = Execute_Check_Output(
+                commands=command_pass2,
+                debug=True,
+                stderr_to_stdout=False,
+                progress_duration=input_video_duration,
+                progress_callback=progress_callback,
+            )
+        else:
+            result, message = _two_pass_encoder_worker(
+                commands_1=command_pass1,
+                commands_2=command_pass2,
+                log_path=log_file_path,
+                passlog_key=passlog_key,
+                loudness_input=loudness_input,
+                debug=True,
+                stderr_to_stdout=False,
+                progress_duration=input_video_duration,
+                progress_callback=progress_callback,
+            )
 
-        if result == -1:
-            return -1, message
+        if result != 1:
+            return result, message
 
-    return 1, output_file
+    return 1, vob_file
 
 
-def Transcode_MPEG2_High_Bitrate(
+def Transcode_DV(
     input_file: str,
     output_folder: str,
     frame_rate: float,
@@ -4563,7 +5326,6 @@ def Transcode_MPEG2_High_Bitrate(
     height: int,
     interlaced: bool = True,
     bottom_field_first: bool = True,
-    iframe_only: bool = False,
     deinterlace: bool = False,
     auto_bright: bool = False,
     normalise: bool = False,
@@ -4575,34 +5337,32 @@ def Transcode_MPEG2_High_Bitrate(
     task_def: Task_Def = None,
 ) -> tuple[int, str]:
     """
-    Converts an input video to MPEG2 at supplied resolution and frame rate at a high bit rate to make an edit
-    copy that minimises generational losses. The video is transcoded to a file in the output folder.
+    Converts an input video file into a DV AVI file, adhering to standard PAL/NTSC DV specifications.
 
-        Args:
-            input_file (str): The path to the input video file.
-            output_folder (str): The path to the output folder.
-            frame_rate (float): The frame rate to use for the output video.
-            width (int) : The target width of the output video
-            height (int) : The target height of the output video
-            interlaced (bool, optional): True if the input video is interlaced, False if progressive. Defaults to True.
-            bottom_field_first (bool, optional): Whether to use bottom field first for interlaced output. Only relevant
-            if the output remains interlaced (i.e., `deinterlace` is False and `input_video_is_interlaced` is True). Defaults to True.
-            iframe_only (bool, optional): Generate iframe only. Defaults to False.
-            deinterlace (bool, optional): If True, forces deinterlacing of the input video, making the output progressive. Defaults to False.
-            auto_bright (bool): Whether to use auto brightness. Defaults to False.
-            normalise (bool): Whether to use normalise. Defaults to False.
-            white_balance (bool): Whether to use white balance. Defaults to False.
-            denoise (bool): Whether to use denoise. Defaults to False.
-            sharpen (bool): Whether to use sharpen. Defaults to False.
-            filters_off (bool): Whether to disable all filters except scaling and black borders. Defaults to False.
-            black_border (bool, optional): Whether to add black borders to the video. Defaults to False.
-            task_def (Task_Def): The task definition, if this is supplied, then this becomes a background task. Defaults to None.
+    Args:
+        input_file (str): The path to the input video file.
+        output_folder (str): The path to the output folder.
+        frame_rate (float): The frame rate to use for the output video (will be adjusted to DV standard).
+        width (int): The target width of the output DV video (must be DV standard resolution).
+        height (int): The target height of the output DV video (must be DV standard resolution).
+        interlaced (bool, optional): True if the input video is interlaced, False if progressive. Defaults to True.
+        bottom_field_first (bool, optional): Whether to use bottom field first for interlaced output. Defaults to True.
+        deinterlace (bool, optional): If True, forces deinterlacing of the input video, making the output progressive. Defaults to False.
+        auto_bright (bool): Whether to use auto brightness. Defaults to False.
+        normalise (bool): Whether to use normalise. Defaults to False.
+        white_balance (bool): Whether to use white balance. Defaults to False.
+        denoise (bool): Whether to use denoise. Defaults to False.
+        sharpen (bool): Whether to use sharpen. Defaults to False.
+        filters_off (bool): Whether to disable all filters except scaling and black borders. Defaults to False.
+        black_border (bool, optional): Whether to add black borders to the video. Defaults to False.
+        task_def (Task_Def, optional): The task definition. If supplied, this becomes a background task. Defaults to None.
 
-        Returns:
-            tuple[int, str]:
-                - arg 1: 1 if ok, -1 if error, 0 if task_def supplied and this becomes a background task
-                - arg 2: error message if error (-1) else output file path (1 or 0)
+    Returns:
+        tuple[int, str]:
+            - arg 1: 1 if ok, -1 if error, 0 if task_def supplied and this becomes a background task.
+            - arg 2: error message if error (-1) else output file path (1 or 0).
     """
+
     assert isinstance(input_file, str) and input_file.strip() != "", (
         f"{input_file=}. Must be a non-empty str"
     )
@@ -4616,7 +5376,6 @@ def Transcode_MPEG2_High_Bitrate(
     assert isinstance(height, int) and height > 0, f"{height=}. Must be int > 0"
     assert isinstance(interlaced, bool), f"{interlaced=}. Must be bool"
     assert isinstance(bottom_field_first, bool), f"{bottom_field_first=}. Must be bool"
-    assert isinstance(iframe_only, bool), f"{iframe_only=}. Must be bool"
     assert isinstance(deinterlace, bool), f"{deinterlace=}. Must be bool"
     assert isinstance(auto_bright, bool), f"{auto_bright=}. Must be bool"
     assert isinstance(normalise, bool), f"{normalise=}. Must be bool"
@@ -4632,7 +5391,7 @@ def Transcode_MPEG2_High_Bitrate(
     if deinterlace and not interlaced:
         return (
             -1,
-            "Cannot force deinterlace when input_video_is_interlaced is False. Input is already progressive.",
+            "Cannot force deinterlace when input video is progressive. Input is already progressive.",
         )
 
     file_handler = file_utils.File()
@@ -4645,21 +5404,38 @@ def Transcode_MPEG2_High_Bitrate(
         return -1, f"File Does Not Exist {input_file}"
 
     _, input_file_name, _ = file_handler.split_file_path(input_file)
-    output_file = file_handler.file_join(output_folder, f"{input_file_name}.mpg")
-
-    gop_size = 1 if iframe_only else (15 if frame_rate == 25 else 18)
-
-    if height <= 576:  # SD
-        bit_rate = 9
-    else:  # HD
-        bit_rate = 50
+    output_file = file_handler.file_join(output_folder, f"{input_file_name}.avi")
 
-    if (width, height) in Standard_Resolutions():
-        scale_width = -1
-        scale_height = -1
+    # DV resolutions are fixed based on standard
+    if (
+        width == sys_consts.PAL_SPECS.width_43
+        and height == sys_consts.PAL_SPECS.height_43
+    ) or (
+        width == sys_consts.PAL_SPECS.width_169
+        and height == sys_consts.PAL_SPECS.height_43
+    ):  # Anamorphic PAL
+        adjusted_frame_rate = sys_consts.PAL_SPECS.frame_rate
+    elif (
+        width == sys_consts.NTSC_SPECS.width_43
+        and height == sys_consts.NTSC_SPECS.height_43
+    ) or (
+        width == sys_consts.NTSC_SPECS.width_169
+        and height == sys_consts.NTSC_SPECS.height_43
+    ):  # Anamorphic NTSC
+        adjusted_frame_rate = sys_consts.NTSC_SPECS.frame_rate
     else:
-        scale_width = width
-        scale_height = height
+        return (
+            -1,
+            f"{width=}x{height=} Does Not Meet Standard PAL/NTSC DV specs (e.g., 720x576, 720x480)",
+        )
+
+    # If the provided frame_rate is significantly different from the adjusted DV standard, warn or error
+    if (
+        abs(frame_rate - adjusted_frame_rate) > 0.01
+    ):  # Use a small tolerance for float comparison
+        print(
+            f"Warning: Input frame rate {frame_rate} does not match DV standard {adjusted_frame_rate}. Adjusting."
+        )
 
     video_filters_arg = Build_Video_Filters(
         auto_bright=auto_bright,
@@ -4669,71 +5445,47 @@ def Transcode_MPEG2_High_Bitrate(
         sharpen=sharpen,
         filters_off=filters_off,
         black_border=black_border,
-        target_width=scale_width,
-        target_height=scale_height,
+        target_width=width,
+        target_height=height,
         deinterlace_video=deinterlace,
         include_dvd_interlacing=False,
     )
 
-    interlaced_flags = []
-
-    if not deinterlace and interlaced:
-        interlaced_flags = [
-            "-flags:v:0",
-            "+ilme+ildct",
-            "-alternate_scan:v:0",
-            "1",
-        ]
+    field_order_filter = f"fieldorder={'bff' if bottom_field_first else 'tff'}"
 
-        field_order_filter = f"fieldorder={'bff' if bottom_field_first else 'tff'}"
+    # DV output is ALWAYS interlaced. So, these flags and field order filter should always be applied.
+    interlaced_flags = [
+        "-flags:v:0",
+        "+ilme+ildct",
+        "-alternate_scan:v:0",
+        "1",
+    ]
 
-        if video_filters_arg:
-            video_filters_arg[1] = f"{field_order_filter},{video_filters_arg[1]}"
-        else:
-            video_filters_arg = ["-vf", field_order_filter]
+    if video_filters_arg:
+        video_filters_arg[1] = f"{field_order_filter},{video_filters_arg[1]}"
+    else:
+        video_filters_arg = ["-vf", field_order_filter]
 
     command = [
         sys_consts.FFMPG,
-        "-fflags",
-        "+genpts",  # generate presentation timestamps
-        "-i",
-        input_file,
+        *Input_Options(input_file),
         "-vsync",
-        "cfr",
-        "-max_muxing_queue_size",
-        "9999",
+        "1",  # Preserve input timestamps (or 'cfr' for constant frame rate)
         *video_filters_arg,
         *interlaced_flags,
         "-r",
-        str(frame_rate),
+        str(adjusted_frame_rate),  # Use the adjusted DV standard frame rate
         "-c:v",
-        "mpeg2video",  # MPEG2 video codec
-        "-b:v",
-        f"{bit_rate}M",  # High bitrate for edit copy
-        "-maxrate",
-        f"{int(float(bit_rate) * 2)}M",
-        "-bufsize",
-        f"{int(float(bit_rate) * 10)}M",
-        "-sn",  # Remove titles
-        "-g",
-        f"{gop_size}",
-        "-force_key_frames",
-        f"expr:if(isnan(prev_forced_n),1,eq(n,prev_forced_n+{gop_size}))",
-        "-pix_fmt",
-        "yuv420p",  # Standard pixel format for MPEG2
-        "-bf",
-        "2",  # Max B-frames for MPEG2
+        "dvvideo",  # DV video codec
         "-c:a",
-        "ac3",  # Assuming AC3 audio for MPEG2 output
-        "-b:a",
-        "256k",
+        "pcm_s16le",  # Uncompressed audio for DV
         "-threads",
         "0",
         "-y",
         output_file,
     ]
 
-    if task_def:  # Run in the background
+    if task_def:  # Run as a background task
         background_task_qmanager = Task_QManager()
 
         background_task_qmanager.submit_task(
@@ -4754,42 +5506,14 @@ def Transcode_MPEG2_High_Bitrate(
         result, message = Execute_Check_Output(
             commands=command, debug=False, stderr_to_stdout=False
         )
+
         if result == -1:
             return -1, message
 
     return 1, output_file
 
 
-def Standard_Resolutions() -> set:
-    """
-    Returns a list of standard resolutions
-
-    Returns:
-        set: List of standard resolutions
-    """
-    return {
-        (
-            sys_consts.PAL_SPECS.width_43,
-            sys_consts.PAL_SPECS.height_43,
-        ),  # 720x576 (PAL 4:3)
-        (
-            sys_consts.PAL_SPECS.width_169,
-            sys_consts.PAL_SPECS.height_169,
-        ),  # 720x576 (PAL 16:9 anamorphic)
-        (
-            sys_consts.NTSC_SPECS.width_43,
-            sys_consts.NTSC_SPECS.height_43,
-        ),  # 720x480 (NTSC 4:3)
-        (
-            sys_consts.NTSC_SPECS.width_169,
-            sys_consts.NTSC_SPECS.height_169,
-        ),  # 720x480 (NTSC 16:9 anamorphic)
-        (1920, 1080),  # Full HD
-        (1280, 720),  # HD
-    }
-
-
-def Transcode_H26x(
+def Transcode_ffv1_archival(
     input_file: str,
     output_folder: str,
     frame_rate: float,
@@ -4797,9 +5521,6 @@ def Transcode_H26x(
     height: int,
     interlaced: bool = True,
     bottom_field_first: bool = True,
-    h265: bool = False,
-    high_quality: bool = True,
-    iframe_only: bool = False,
     deinterlace: bool = False,
     auto_bright: bool = False,
     normalise: bool = False,
@@ -4808,27 +5529,30 @@ def Transcode_H26x(
     sharpen: bool = False,
     filters_off: bool = False,
     black_border: bool = False,
-    encode_10bit: bool = False,
-    mkv_container: bool = False,
+    apply_spp: bool = False,
+    dehalo: bool = False,
+    duration: float = 0.0,
+    progress_callback: Optional[Callable[[float, str], None]] = None,
     task_def: Task_Def = None,
+    chunked: bool = False,
 ) -> tuple[int, str]:
     """
-    Converts an input video to H.264/5 at supplied resolution and frame rate.
-    The video is transcoded to a file in the output folder.
+    Converts an input video file into a lossless FFV1 compressed video suitable for permanent archival storage.
+
+    FFV1 is a permanent archival format widely accepted by archival institutions worldwide.
+
+    A chunked encode splits a long input with Plan_Encode_Chunks and encodes the FFV1_Fan_Out_Output of the same
+    settings with Transcode_Chunked. Each chunk is a single pass encode, so the chunks share the same FFV1 headers.
 
     Args:
         input_file (str): The path to the input video file.
         output_folder (str): The path to the output folder.
         frame_rate (float): The frame rate to use for the output video.
-        width (int) : The target width of the output video
-        height (int) : The target height of the output video
-        interlaced (bool): True if the input video is interlaced, False if progressive. Defaults to True.
-        bottom_field_first (bool): Whether to use bottom field first for interlaced output. Only relevant if the output
-        remains interlaced (i.e., `deinterlace` is False and `interlaced` is True). Defaults to True.
-        h265 (bool): Whether to use H.265. Defaults to False.
-        high_quality (bool): Use a high quality encode. Defaults to True.
-        iframe_only (bool): True if no GOP and all I-frames desired else False. Defaults to False.
-        deinterlace (bool): If True, forces deinterlacing of the input video, making the output progressive. Defaults to False.
+        width (int): The target width of the output video.
+        height (int): The target height of the output video.
+        interlaced (bool, optional): True if the input video is interlaced, False if progressive. Defaults to True.
+        bottom_field_first (bool, optional): Whether to use bottom field first for interlaced output. Defaults to True.
+        deinterlace (bool, optional): If True, forces deinterlacing of the input video, making the output progressive. Defaults to False.
         auto_bright (bool): Whether to use auto brightness. Defaults to False.
         normalise (bool): Whether to use normalise. Defaults to False.
         white_balance (bool): Whether to use white balance. Defaults to False.
@@ -4836,89 +5560,248 @@ def Transcode_H26x(
         sharpen (bool): Whether to use sharpen. Defaults to False.
         filters_off (bool): Whether to disable all filters except scaling and black borders. Defaults to False.
         black_border (bool, optional): Whether to add black borders to the video. Defaults to False.
-        encode_10bit (bool, optional): Encode videos as 10 bit. Defaults to False
-        mkv_container: (bool, optional): Place output file in a mkv container, Otherwise a mp4 container. Defaults to False,
+        apply_spp (bool): Whether to apply the spp deblocking/denoising filter. Defaults to False.
+        dehalo (bool): Whether to apply the dehalo filter to reduce halos/ringing. Defaults to False.
+        duration (float): Duration of the input video in seconds, used for progress percentages. Defaults to 0.0 (unknown).
+        progress_callback (Optional[Callable[[float, str], None]]): Receives the percentage complete and a
+            frame/fps/speed/ETA message while encoding. Defaults to None.
         task_def (Task_Def): The task definition, if this is supplied, then this becomes a background task. Defaults to None.
+        chunked (bool): True to encode a long input in chunks at the same time. Defaults to False
 
     Returns:
         tuple[int, str]:
             - arg 1: 1 if ok, -1 if error, 0 if task_def supplied and this becomes a background task
-            - arg 2: error message if error (-1) else output file path (1)
+            - arg 2: error message if error (-1) else output file path (1 or 0)
     """
-    assert isinstance(input_file, str) and input_file.strip() != "", (
-        f"{input_file=}. Must be a non-empty str"
-    )
-    assert isinstance(output_folder, str) and output_folder.strip() != "", (
-        f"{output_folder=}. Must be a non-empty str"
-    )
-    assert isinstance(frame_rate, float) and frame_rate > 0, (
-        f"{frame_rate=}. Must be float > 0"
-    )
-    assert isinstance(width, int) and width > 0, f"{width=}. Must be int > 0"
-    assert isinstance(height, int) and height > 0, f"{height=}. Must be int > 0"
-    assert isinstance(interlaced, bool), f"{interlaced=}. Must be bool"
-    assert isinstance(bottom_field_first, bool), f"{bottom_field_first=}. Must be bool"
-    assert isinstance(h265, bool), f"{h265=}. Must be bool"
-    assert isinstance(high_quality, bool), f"{high_quality=}. Must be bool"
-    assert isinstance(iframe_only, bool), f"{iframe_only=}. Must be bool"
-    assert isinstance(deinterlace, bool), f"{deinterlace=}. Must be bool"
-    assert isinstance(auto_bright, bool), f"{auto_bright=}. Must be bool"
-    assert isinstance(normalise, bool), f"{normalise=}. Must be bool"
-    assert isinstance(white_balance, bool), f"{white_balance=}. Must be bool"
-    assert isinstance(denoise, bool), f"{denoise=}. Must be bool"
-    assert isinstance(sharpen, bool), f"{sharpen=}. Must be bool"
-    assert isinstance(filters_off, bool), f"{filters_off=}. Must be bool"
-    assert isinstance(black_border, bool), f"{black_border=}. Must be bool"
-    assert isinstance(encode_10bit, bool), f"{encode_10bit=}, Must be bool"
-    assert isinstance(mkv_container, bool), f"{mkv_container=}. Must be bool"
-    assert isinstance(task_def, Task_Def) or task_def is None, (
-        f"{task_def=}. Must be Task_Def or None"
-    )
 
-    if deinterlace and not interlaced:
-        return (
-            -1,
-            "Cannot force deinterlace when input video is progressive. Input is already progressive.",
-        )
+    # Helper functions for background task management
+    def _started_callback(task_id: str):
+        """
+        Called when pass 1 or pass 2 starts in the background
 
-    file_handler = file_utils.File()
+        Args:
+            task_id (str): Task ID
+        """
+        assert isinstance(task_id, str), f"{task_id=}. Must be str"
 
-    if not file_handler.path_exists(output_folder):
-        return -1, f"{output_folder} Does not exist"
-    if not file_handler.path_writeable(output_folder):
-        return -1, f"{output_folder} Cannot Be Written To"
-    if not file_handler.file_exists(input_file):
-        return -1, f"File Does Not Exist {input_file}"
+        task_def.started_callback(task_def.task_id)
 
-    file_extension = "mkv" if mkv_container else "mp4"
-    _, input_file_name, _ = file_handler.split_file_path(input_file)
-    output_file = file_handler.file_join(
-        output_folder, f"{input_file_name}.{file_extension}"
+    def _progress_callback(task_id: str, percentage: float, message: str):
+        """
+        Called when pass 1 or pass 2 makes progress in the background. Pass 1 is reported as 0-50% and pass 2 as
+        50-100%
+
+        Args:
+            task_id (str): Task ID
+            percentage (float): Percentage complete
+            message (str): Message
+        """
+        assert isinstance(task_id, str), f"{task_id=}. Must be str"
+        assert isinstance(percentage, float), f"{percentage=}. Must be float"
+        assert isinstance(message, str), f"{message=}. Must be str"
+
+        if task_def.progress_callback:
+            if task_id.endswith("_pass1"):
+                task_def.progress_callback(
+                    task_def.task_id, percentage / 2, f"Pass 1: {message}"
+                )
+            else:
+                task_def.progress_callback(
+                    task_def.task_id, 50.0 + percentage / 2, f"Pass 2: {message}"
+                )
+
+    def _finished_callback(task_id: str, result: tuple[int, str]):
+        """
+        Called when pass 1 or pass 2 finishes in the background
+
+        Args:
+            task_id (str): Task ID
+            result (tuple[int, str]): Result tuple
+        """
+        assert isinstance(task_id, str), f"{task_id=}. Must be str"
+        assert isinstance(result, tuple), f"{result=}. Must be tuple"
+
+        if task_id.endswith("_pass1"):
+            background_task_qmanager.submit_task(
+                worker_function=Execute_Check_Output,
+                commands=pass_2,
+                debug=False,
+                stderr_to_stdout=False,
+                progress_duration=duration,
+                task_id=f"{task_def.task_id}_pass2",
+                started_callback=_started_callback,
+                error_callback=_error_callback,
+                finished_callback=_finished_callback,
+                progress_callback=_progress_callback,
+                aborted_callback=_aborted_callback,
+            )
+
+        elif task_id.endswith("_pass2"):
+            if file_handler.remove_file(passlog_del_file) == -1:
+                task_def.finished_callback(
+                    task_def.task_id, (-1, f"Failed To Delete {passlog_del_file}")
+                )
+            else:
+                task_def.finished_callback(task_def.task_id, result)
+
+        return None
+
+    def _error_callback(task_id: str, message: str):
+        """
+        Called when an error occurs in pass 1 or pass 2
+
+        Args:
+            task_id (str): Task ID
+            message (str): Error Message
+        """
+        assert isinstance(task_id, str), f"{task_id=}. Must be str"
+        assert isinstance(message, str), f"{message=}. Must be str"
+
+        path, name, ext = file_handler.split_file_path(passlog_del_file)
+
+        if (
+            file_handler.file_exists(path, name, ext)
+            and file_handler.remove_file(passlog_del_file) == -1
+        ):
+            task_def.finished_callback(
+                task_def.task_id,
+                (-1, f"Failed To Delete {passlog_del_file} \n {message}"),
+            )
+        else:
+            task_def.finished_callback(task_def.task_id, (-1, message))
+
+        task_def.error_callback(task_id, (-1, message))
+
+    def _aborted_callback(task_id: str, message: str):
+        """
+        Called when pass 1 or pass 2 is aborted
+
+        Args:
+            task_id (str): Task ID
+            message (str): Error Message
+        """
+        assert isinstance(task_id, str), f"{task_id=}. Must be str"
+        assert isinstance(message, str), f"{message=}. Must be str"
+
+        path, name, ext = file_handler.split_file_path(passlog_del_file)
+        if (
+            file_handler.file_exists(path, name, ext)
+            and file_handler.remove_file(passlog_del_file) == -1
+        ):
+            task_def.aborted_callback(
+                task_def.task_id,
+                (-1, f"Failed To Delete {passlog_del_file} \n {message}"),
+            )
+        else:
+            task_def.aborted_callback(task_def.task_id, message)
+
+    #### Main
+
+    assert isinstance(input_file, str) and input_file.strip() != "", (
+        f"{input_file=}. Must be a non-empty str"
+    )
+    assert isinstance(output_folder, str) and output_folder.strip() != "", (
+        f"{output_folder=}. Must be a non-empty str"
+    )
+    assert isinstance(frame_rate, float) and frame_rate > 0, (
+        f"{frame_rate=}. Must be float > 0"
+    )
+    assert isinstance(width, int) and width > 0, f"{width=}. Must be int > 0"
+    assert isinstance(height, int) and height > 0, f"{height=}. Must be int > 0"
+    assert isinstance(interlaced, bool), f"{interlaced=}. Must be bool"
+    assert isinstance(bottom_field_first, bool), f"{bottom_field_first=}. Must be bool"
+    assert isinstance(deinterlace, bool), f"{deinterlace=}. Must be bool"
+    assert isinstance(auto_bright, bool), f"{auto_bright=}. Must be bool"
+    assert isinstance(normalise, bool), f"{normalise=}. Must be bool"
+    assert isinstance(white_balance, bool), f"{white_balance=}. Must be bool"
+    assert isinstance(denoise, bool), f"{denoise=}. Must be bool"
+    assert isinstance(sharpen, bool), f"{sharpen=}. Must be bool"
+    assert isinstance(filters_off, bool), f"{filters_off=}. Must be bool"
+    assert isinstance(black_border, bool), f"{black_border=}. Must be bool"
+    assert isinstance(apply_spp, bool), f"{apply_spp=}. Must be bool"  # NEW: Assertion
+    assert isinstance(dehalo, bool), f"{dehalo=}. Must be bool"  # NEW: Assertion
+    assert isinstance(duration, (int, float)) and duration >= 0, (
+        f"{duration=}. Must be int | float >= 0"
+    )
+    assert callable(progress_callback) or progress_callback is None, (
+        f"{progress_callback=}. Must be a function or None"
+    )
+    assert isinstance(task_def, Task_Def) or task_def is None, (
+        f"{task_def=}. Must be Task_Def or None"
     )
+    assert isinstance(chunked, bool), f"{chunked=}. Must be bool"
 
-    if output_file == input_file:
-        output_file = file_handler.file_join(
-            output_folder, f"{input_file_name}_out.{file_extension}"
+    if deinterlace and not interlaced:
+        return (
+            -1,
+            "Cannot force deinterlace when input video is progressive. Input is already progressive.",
         )
 
-    if not utils.Is_Complied():
-        print(
-            "DBG Trans_H26x"
-            f" {input_file=} {frame_rate=} {width=} {height=} {interlaced=} {bottom_field_first=} ER"
-            f" {'5M' if height <= 576 else '35M'=}"
+    file_handler = file_utils.File()
+
+    if not file_handler.path_exists(output_folder):
+        return -1, f"{output_folder} Does not exist"
+    if not file_handler.path_writeable(output_folder):
+        return -1, f"{output_folder} Cannot Be Written To"
+    if not file_handler.file_exists(input_file):
+        return -1, f"File Does Not Exist {input_file}"
+
+    chunk_times = Plan_Encode_Chunks(input_file, duration) if chunked else []
+
+    if chunk_times:
+        chunked_output = FFV1_Fan_Out_Output(
+            name="ffv1",
+            input_file=input_file,
+            output_folder=output_folder,
+            frame_rate=frame_rate,
+            width=width,
+            height=height,
+            interlaced=interlaced,
+            bottom_field_first=bottom_field_first,
+            deinterlace=deinterlace,
+            auto_bright=auto_bright,
+            normalise=normalise,
+            white_balance=white_balance,
+            denoise=denoise,
+            sharpen=sharpen,
+            filters_off=filters_off,
+            black_border=black_border,
+            apply_spp=apply_spp,
+            dehalo=dehalo,
         )
 
-    gop_size = 1 if iframe_only else (15 if frame_rate == 25 else 18)
+        if task_def:  # Run in the background
+            Task_QManager().submit_task(
+                worker_function=Transcode_Chunked,
+                input_file=input_file,
+                output=chunked_output,
+                frame_rate=frame_rate,
+                chunk_times=chunk_times,
+                duration=duration,
+                task_id=task_def.task_id,
+                started_callback=task_def.started_callback,
+                progress_callback=task_def.progress_callback,
+                finished_callback=task_def.finished_callback,
+                error_callback=task_def.error_callback,
+                aborted_callback=task_def.aborted_callback,
+            )
 
-    encoder = "libx265" if h265 else "libx264"
-    quality_preset = "slow" if high_quality else "superfast"
+            return 0, chunked_output.output_file
 
-    if (width, height) in Standard_Resolutions():
-        scale_width = -1
-        scale_height = -1
-    else:
-        scale_width = width
-        scale_height = height
+        return Transcode_Chunked(
+            input_file=input_file,
+            output=chunked_output,
+            frame_rate=frame_rate,
+            chunk_times=chunk_times,
+            duration=duration,
+            progress_callback=progress_callback,
+        )
+
+    _, input_file_name, _ = file_handler.split_file_path(input_file)
+
+    output_file = file_handler.file_join(output_folder, f"{input_file_name}.mkv")
+    passlog_file = file_handler.file_join(output_folder, f"{input_file_name}")
+    passlog_del_file = file_handler.file_join(output_folder, f"{input_file_name}-0.log")
 
     video_filters_arg = Build_Video_Filters(
         auto_bright=auto_bright,
@@ -4928,1065 +5811,3351 @@ def Transcode_H26x(
         sharpen=sharpen,
         filters_off=filters_off,
         black_border=black_border,
-        target_width=scale_width,
-        target_height=scale_height,
+        target_width=width,
+        target_height=height,
         deinterlace_video=deinterlace,
         include_dvd_interlacing=False,
+        apply_spp=apply_spp,
+        dehalo=dehalo,
     )
 
-    interlaced_flags = []
+    interlaced_output_flags = []
+    field_order_filter_str = ""
 
-    if not deinterlace and interlaced:
-        interlaced_flags = [
-            "-flags:v:0",
+    if interlaced and not deinterlace:
+        field_order_filter_str = f"fieldorder={'bff' if bottom_field_first else 'tff'}"
+        interlaced_output_flags = [
+            "-flags:v",
             "+ilme+ildct",
-            "-alternate_scan:v:0",
+            "-alternate_scan:v",
             "1",
         ]
-
-        field_order_filter = f"fieldorder={'bff' if bottom_field_first else 'tff'}"
-
-        if video_filters_arg:
-            video_filters_arg[1] = f"{field_order_filter},{video_filters_arg[1]}"
+    all_filters = []
+    if field_order_filter_str:
+        if (
+            video_filters_arg and video_filters_arg[1]
+        ):  # Check if the filter string part exists
+            video_filters_arg[1] = f"{field_order_filter_str},{video_filters_arg[1]}"
         else:
-            video_filters_arg = ["-vf", field_order_filter]
-
-    pixel_format = "yuv422p10le" if encode_10bit else "yuv420p"
+            video_filters_arg = ["-vf", field_order_filter_str]
 
-    command = [
+    # Command 1 (Pass 1)
+    pass_1 = [
         sys_consts.FFMPG,
-        "-fflags",
-        "+genpts",
-        "-i",
-        input_file,
+        *Input_Options(input_file),
         "-vsync",
         "cfr",
         "-max_muxing_queue_size",
         "9999",
+        "-pass",
+        "1",
+        "-passlogfile",
+        passlog_file,
         *video_filters_arg,
-        *interlaced_flags,
+        *interlaced_output_flags,
         "-r",
         str(frame_rate),
         "-c:v",
-        encoder,
-        "-sn",  # Remove titles
-        "-pix_fmt",
-        pixel_format,
-        "-crf",
-        "19" if not h265 else "25",
-        "-preset",
-        quality_preset,
-        "-c:a",
-        "ac3",
-        "-b:a",
-        "256k",
-        "-muxrate",
-        "48M",
-        "-bufsize",
-        "48M",
+        "ffv1",
+        "-level",
+        "3",
+        "-coder",
+        "1",  # Golomb Rice
+        "-context",
+        "1",  # Small context
         "-g",
-        f"{gop_size}",
-        "-keyint_min",
-        f"{gop_size}",
-        "-sc_threshold",
-        "0",
-        "-threads",
-        "0",
-        output_file,
-        "-y",
-    ]
-
-    if task_def:  # Run in the background
-        background_task_qmanager = Task_QManager()
+        "1",  # All I-frames
+        "-slices",
+        "16",  # More slices for parallel processing
+        "-slicecrc",
+        "1",  # CRC checks for slices
+        "-c:a",
+        "flac",  # Lossless audio
+        "-f",
+        "null",  # Output to null device for pass 1
+        "-threads",
+        "0",
+        str(os.devnull),
+    ]
+
+    # Command 2 (Pass 2)
+    pass_2 = [
+        sys_consts.FFMPG,
+        *Input_Options(input_file),
+        "-vsync",
+        "cfr",
+        "-max_muxing_queue_size",
+        "9999",
+        "-pass",
+        "2",
+        "-passlogfile",
+        passlog_file,
+        *video_filters_arg,
+        *interlaced_output_flags,
+        "-r",
+        str(frame_rate),
+        "-c:v",
+        "ffv1",
+        "-level",
+        "3",
+        "-coder",
+        "1",
+        "-context",
+        "1",
+        "-g",
+        "1",
+        "-slices",
+        "16",
+        "-slicecrc",
+        "1",
+        "-c:a",
+        "flac",
+        "-threads",
+        "0",
+        "-y",
+        output_file,
+    ]
+
+    if task_def:  # Run in the background
+        background_task_qmanager = Task_QManager()
 
+        # Pass 1 submission
         background_task_qmanager.submit_task(
             worker_function=Execute_Check_Output,
-            commands=command,
+            commands=pass_1,
             debug=False,
             stderr_to_stdout=False,
-            task_id=task_def.task_id,
-            started_callback=task_def.started_callback,
-            progress_callback=task_def.progress_callback,
-            finished_callback=task_def.finished_callback,
-            error_callback=task_def.error_callback,
-            aborted_callback=task_def.aborted_callback,
+            progress_duration=duration,
+            task_id=f"{task_def.task_id}_pass1",
+            started_callback=_started_callback,
+            error_callback=_error_callback,
+            finished_callback=_finished_callback,
+            progress_callback=_progress_callback,
+            aborted_callback=_aborted_callback,
         )
 
         return 0, output_file
 
-    else:
+    else:  # Run in the foreground
+        result, message = Execute_Check_Output(
+            commands=pass_1,
+            debug=False,
+            stderr_to_stdout=False,
+            progress_callback=(
+                None
+                if progress_callback is None
+                else lambda percentage, message: progress_callback(
+                    percentage / 2, f"Pass 1: {message}"
+                )
+            ),
+            progress_duration=duration,
+        )
+
+        if result == -1:
+            return -1, message
+
         result, message = Execute_Check_Output(
-            commands=command, debug=True, stderr_to_stdout=False
+            commands=pass_2,
+            debug=False,
+            stderr_to_stdout=False,
+            progress_callback=(
+                None
+                if progress_callback is None
+                else lambda percentage, message: progress_callback(
+                    50.0 + percentage / 2, f"Pass 2: {message}"
+                )
+            ),
+            progress_duration=duration,
         )
+
         if result == -1:
             return -1, message
 
+        # Delete passlog file only after successful completion of both passes
+        if file_handler.remove_file(passlog_del_file) == -1:
+            return -1, f"Failed To Delete {passlog_del_file}"
+
     return 1, output_file
 
 
-def Convert_To_PNG_Stream(
-    image_filename: str, width: int, height: int, keep_aspect_ratio: bool = True
-) -> tuple[int, bytes]:
+def FFV1_Fan_Out_Output(
+    name: str,
+    input_file: str,
+    output_folder: str,
+    frame_rate: float,
+    width: int,
+    height: int,
+    interlaced: bool = True,
+    bottom_field_first: bool = True,
+    deinterlace: bool = False,
+    auto_bright: bool = False,
+    normalise: bool = False,
+    white_balance: bool = False,
+    denoise: bool = False,
+    sharpen: bool = False,
+    filters_off: bool = False,
+    black_border: bool = False,
+    apply_spp: bool = False,
+    dehalo: bool = False,
+) -> Fan_Out_Output:
     """
-    Converts an image file to PNG format, resizing it, and returns the PNG data as bytes.
+    Makes the Transcode_Fan_Out output of the two pass FFV1 archival encode Transcode_ffv1_archival does
 
     Args:
-        image_filename (str): The filename of the input image.
-        width (int): The width for resizing.
-        height (int): The height for resizing.
-        keep_aspect_ratio (bool): Whether to keep the aspect ratio.
+        name (str): The name of the output
+        input_file (str): The path to the input video file.
+        output_folder (str): The path to the output folder.
+        frame_rate (float): The frame rate to use for the output video.
+        width (int): The target width of the output video.
+        height (int): The target height of the output video.
+        interlaced (bool, optional): True if the input video is interlaced, False if progressive. Defaults to True.
+        bottom_field_first (bool, optional): Whether to use bottom field first for interlaced output. Defaults to True.
+        deinterlace (bool, optional): If True, forces deinterlacing of the input video, making the output progressive. Defaults to False.
+        auto_bright (bool): Whether to use auto brightness. Defaults to False.
+        normalise (bool): Whether to use normalise. Defaults to False.
+        white_balance (bool): Whether to use white balance. Defaults to False.
+        denoise (bool): Whether to use denoise. Defaults to False.
+        sharpen (bool): Whether to use sharpen. Defaults to False.
+        filters_off (bool): Whether to disable all filters except scaling and black borders. Defaults to False.
+        black_border (bool, optional): Whether to add black borders to the video. Defaults to False.
+        apply_spp (bool): Whether to apply the spp deblocking/denoising filter. Defaults to False.
+        dehalo (bool): Whether to apply the dehalo filter to reduce halos/ringing. Defaults to False.
 
     Returns:
-        tuple(int, bytes):
-            - arg1: 1 (ok) or -1 (error)
-            - arg2: The image data as a byte string (PNG format) on success, empty bytes on error
+        Fan_Out_Output: The output, its file is named after the input file
     """
-    assert isinstance(image_filename, str) and image_filename.strip() != "", (
-        f"{image_filename=}. Must be a non-empty str"
+    assert isinstance(name, str) and name.strip() != "", (
+        f"{name=}. Must be a non-empty str"
     )
-    assert isinstance(width, int) and width > 0, f"{width=} . Must be an int > 0"
-    assert isinstance(height, int) and height > 0, f"{height=} . Must be an int > 0"
-    assert isinstance(keep_aspect_ratio, bool), f"{keep_aspect_ratio=}. Must be a bool"
+    assert isinstance(input_file, str) and input_file.strip() != "", (
+        f"{input_file=}. Must be a non-empty str"
+    )
+    assert isinstance(output_folder, str) and output_folder.strip() != "", (
+        f"{output_folder=}. Must be a non-empty str"
+    )
+    assert isinstance(frame_rate, float) and frame_rate > 0, (
+        f"{frame_rate=}. Must be float > 0"
+    )
+    assert isinstance(width, int) and width > 0, f"{width=}. Must be int > 0"
+    assert isinstance(height, int) and height > 0, f"{height=}. Must be int > 0"
+    assert isinstance(interlaced, bool), f"{interlaced=}. Must be bool"
+    assert isinstance(bottom_field_first, bool), f"{bottom_field_first=}. Must be bool"
+    assert isinstance(deinterlace, bool), f"{deinterlace=}. Must be bool"
+
+    file_handler = file_utils.File()
+
+    _, input_file_name, _ = file_handler.split_file_path(input_file)
+
+    video_filters_arg = Build_Video_Filters(
+        auto_bright=auto_bright,
+        normalise=normalise,
+        white_balance=white_balance,
+        denoise=denoise,
+        sharpen=sharpen,
+        filters_off=filters_off,
+        black_border=black_border,
+        target_width=width,
+        target_height=height,
+        deinterlace_video=deinterlace,
+        include_dvd_interlacing=False,
+        apply_spp=apply_spp,
+        dehalo=dehalo,
+    )
+    video_filters = video_filters_arg[1] if video_filters_arg else ""
+
+    interlaced_output_flags = []
+
+    if interlaced and not deinterlace:
+        field_order_filter = f"fieldorder={'bff' if bottom_field_first else 'tff'}"
+        video_filters = (
+            f"{field_order_filter},{video_filters}"
+            if video_filters
+            else field_order_filter
+        )
+        interlaced_output_flags = [
+            "-flags:v",
+            "+ilme+ildct",
+            "-alternate_scan:v",
+            "1",
+        ]
+
+    return Fan_Out_Output(
+        name=name,
+        output_file=file_handler.file_join(output_folder, f"{input_file_name}.mkv"),
+        video_filters=video_filters,
+        video_options=[
+            "-vsync",
+            "cfr",
+            *interlaced_output_flags,
+            "-r",
+            str(frame_rate),
+            "-c:v",
+            "ffv1",
+            "-level",
+            "3",
+            "-coder",
+            "1",  # Golomb Rice
+            "-context",
+            "1",  # Small context
+            "-g",
+            "1",  # All I-frames
+            "-slices",
+            "16",
+            "-slicecrc",
+            "1",
+            "-threads",
+            "0",
+        ],
+        audio_options=[
+            "-c:a",
+            "flac",  # Lossless audio
+        ],
+        muxer_options=[
+            "-max_muxing_queue_size",
+            "9999",
+        ],
+        passlog_file=file_handler.file_join(output_folder, f"{input_file_name}"),
+    )
+
+
+def Transcode_Mezzanine(
+    input_file: str,
+    output_folder: str,
+    frame_rate: float,
+    width: int,
+    height: int,
+    interlaced: bool = True,
+    bottom_field_first: bool = True,
+    mjpeg: bool = False,
+    deinterlace: bool = False,
+    auto_bright: bool = False,
+    normalise: bool = False,
+    white_balance: bool = False,
+    denoise: bool = False,
+    sharpen: bool = False,
+    filters_off: bool = False,
+    black_border: bool = False,
+    encode_10bit: bool = False,
+    duration: float = 0.0,
+    progress_callback: Optional[Callable[[float, str], None]] = None,
+    task_def: Task_Def = None,
+) -> tuple[int, str]:
+    """
+    Converts an input video to MJPEG or H264 at supplied resolution and frame rate to make an edit copy that minimises
+    generational losses. The video is transcoded to a file in the output folder.
+
+       Args:
+           input_file (str): The path to the input video file.
+           output_folder (str): The path to the output folder.
+           frame_rate (float): The frame rate to use for the output video.
+           width (int): The target width of the output video
+           height (int): The target height of the output video
+           interlaced (bool, optional): True if the input video is interlaced, False if progressive. Defaults to True.
+           bottom_field_first (bool, optional): Whether to use bottom field first for interlaced output. Only relevant
+           if the output remains interlaced (i.e., `deinterlace` is False and `interlaced` is True). Defaults to True.
+           mjpeg (bool, optional): True use MJPEG video as a Mezzanine video, False use H264.
+           deinterlace (bool, optional): If True, forces deinterlacing of the input video, making the output progressive.
+           Defaults to False.
+           auto_bright (bool): Whether to use auto brightness. Defaults to False.
+           normalise (bool): Whether to use normalise. Defaults to False.
+           white_balance (bool): Whether to use white balance. Defaults to False.
+           denoise (bool): Whether to use denoise. Defaults to False.
+           sharpen (bool): Whether to use sharpen. Defaults to False.
+           filters_off (bool): Whether to disable all filters except scaling and black borders. Defaults to False.
+           black_border (bool, optional): Whether to add black borders to the video. Defaults to False.
+           encode_10bit (bool, optional): If True, encode video to 10-bit YUV 4:2:2 (yuv422p10le). Defaults to False.
+           duration (float): Duration of the input video in seconds, used for progress percentages. Defaults to 0.0 (unknown).
+           progress_callback (Optional[Callable[[float, str], None]]): Receives the percentage complete and a
+               frame/fps/speed/ETA message while encoding. Defaults to None.
+           task_def (Task_Def): The task definition, if this is supplied, then this becomes a background task. Defaults to None.
+
+       Returns:
+           tuple[int, str]:
+               - arg 1: 1 if ok, -1 if error, 0 if task_def supplied and this becomes a background task
+               - arg 2: error message if error (-1) else output file path (1 or 0)
+    """
+    assert isinstance(input_file, str) and input_file.strip() != "", (
+        f"{input_file=}. Must be a non-empty str"
+    )
+    assert isinstance(output_folder, str) and output_folder.strip() != "", (
+        f"{output_folder=}. Must be a non-empty str"
+    )
+    assert isinstance(frame_rate, float) and frame_rate > 0, (
+        f"{frame_rate=}. Must be float > 0"
+    )
+    assert isinstance(width, int) and width > 0, f"{width=}. Must be int > 0"
+    assert isinstance(height, int) and height > 0, f"{height=}. Must be int > 0"
+    assert isinstance(interlaced, bool), f"{interlaced=}. Must be bool"
+    assert isinstance(bottom_field_first, bool), f"{bottom_field_first=}. Must be bool"
+    assert isinstance(mjpeg, bool), f"{mjpeg=}. Must be bool"
+    assert isinstance(deinterlace, bool), f"{deinterlace=}. Must be bool"
+    assert isinstance(auto_bright, bool), f"{auto_bright=}. Must be bool"
+    assert isinstance(normalise, bool), f"{normalise=}. Must be bool"
+    assert isinstance(white_balance, bool), f"{white_balance=}. Must be bool"
+    assert isinstance(denoise, bool), f"{denoise=}. Must be bool"
+    assert isinstance(sharpen, bool), f"{sharpen=}. Must be bool"
+    assert isinstance(filters_off, bool), f"{filters_off=}. Must be bool"
+    assert isinstance(black_border, bool), f"{black_border=}. Must be bool"
+    assert isinstance(encode_10bit, bool), f"{encode_10bit=}. Must be bool"
+    assert isinstance(duration, (int, float)) and duration >= 0, (
+        f"{duration=}. Must be int | float >= 0"
+    )
+    assert callable(progress_callback) or progress_callback is None, (
+        f"{progress_callback=}. Must be a function or None"
+    )
+    assert isinstance(task_def, Task_Def) or task_def is None, (
+        f"{task_def=}. Must be Task_Def or None"
+    )
+
+    if deinterlace and not interlaced:
+        return (
+            -1,
+            "Cannot force deinterlace when input video is progressive. Input is already progressive.",
+        )
+
+    file_handler = file_utils.File()
+
+    if not file_handler.path_exists(output_folder):
+        return -1, f"{output_folder} Does not exist"
+    if not file_handler.path_writeable(output_folder):
+        return -1, f"{output_folder} Cannot Be Written To"
+    if not file_handler.file_exists(input_file):
+        return -1, f"File Does Not Exist {input_file}"
+
+    _, input_file_name, _ = file_handler.split_file_path(input_file)
+
+    if encode_10bit:
+        pixel_format = "yuv422p10le"  # 10-bit 4:2:2
+    else:
+        pixel_format = "yuv420p"  # Default to 8-bit 4:2:0
+
+    if mjpeg:
+        output_file = file_handler.file_join(output_folder, f"{input_file_name}.avi")
+
+        if input_file == output_file:
+            output_file = file_handler.file_join(
+                output_folder, f"{input_file_name}_out.avi"
+            )
+
+        video_codec = "mjpeg"
+
+        # MJPEG specific quality/bitrate settings
+        q_v = "3"
+        crf = None  # CRF not used for MJPEG
+        preset = None  # Preset not used for MJPEG
+        gop_size = 1  # MJPEG is typically I-frame only
+        keyint_min = 1
+        sc_threshold = 0
+
+    else:  # H264 Mezzanine
+        output_file = file_handler.file_join(output_folder, f"{input_file_name}.mkv")
+
+        if input_file == output_file:
+            output_file = file_handler.file_join(
+                output_folder, f"{input_file_name}_out.mkv"
+            )
+
+        video_codec = (
+            "libx264"  # Default for H264. If using H265, you'd change this here
+        )
+        q_v = None  # Q:v not used for H264
+        crf = "17"  # Good quality for mezzanine H264
+        preset = "medium"  # Medium preset for good balance
+        gop_size = 1  # Mezzanine is I-frame only
+        keyint_min = 1
+        sc_threshold = 0
+
+    # Set bit rate based on video height (common to both MJPEG and H264 Mezzanine)
+    if height <= 576:  # SD
+        bit_rate = 25
+    else:  # HD
+        bit_rate = 50
+
+    if (width, height) in Standard_Resolutions():
+        scale_width = -1
+        scale_height = -1
+    else:
+        scale_width = width
+        scale_height = height
+
+    video_filters_arg = Build_Video_Filters(
+        auto_bright=auto_bright,
+        normalise=normalise,
+        white_balance=white_balance,
+        denoise=denoise,
+        sharpen=sharpen,
+        filters_off=filters_off,
+        black_border=black_border,
+        target_width=scale_width,
+        target_height=scale_height,
+        deinterlace_video=deinterlace,
+    )
+
+    interlaced_flags = []
+
+    if not deinterlace and interlaced:
+        interlaced_flags = [
+            "-flags:v:0",
+            "+ilme+ildct",
+            "-alternate_scan:v:0",
+            "1",
+        ]
+
+        field_order_filter = f"fieldorder={'bff' if bottom_field_first else 'tff'}"
+        if video_filters_arg:
+            video_filters_arg[1] = f"{field_order_filter},{video_filters_arg[1]}"
+        else:
+            video_filters_arg = ["-vf", field_order_filter]
+
+    command = [
+        sys_consts.FFMPG,
+        "-fflags",
+        "+genpts",  # generate presentation timestamps
+        *Input_Options(input_file),
+        "-vsync",
+        "cfr",
+        "-max_muxing_queue_size",
+        "9999",
+        *video_filters_arg,
+        *interlaced_flags,
+        "-r",
+        str(frame_rate),
+        "-c:v",
+        video_codec,
+        "-b:v",
+        f"{bit_rate}M",  # High bitrate for edit copy
+        "-maxrate",
+        f"{int(float(bit_rate) * 2)}M",
+        "-bufsize",
+        f"{int(float(bit_rate) * 5)}M",  # Adjusted bufsize for mezzanine
+        "-sn",  # Remove titles
+        "-pix_fmt",
+        pixel_format,
+    ]
+
+    # Add codec-specific arguments
+    if q_v:  # For MJPEG
+        command.extend(["-q:v", q_v])
+    if crf:  # For H264
+        command.extend(["-crf", crf])
+    if preset:  # For H264
+        command.extend(["-preset", preset])
+
+    command.extend([
+        "-g",
+        f"{gop_size}",
+        "-keyint_min",
+        f"{keyint_min}",
+        "-sc_threshold",
+        f"{sc_threshold}",
+        "-c:a",
+        "pcm_s16le",  # Uncompressed audio for mezzanine
+        "-threads",
+        "0",
+        "-y",
+        output_file,
+    ])
+
+    if task_def:  # Run in the background
+        background_task_qmanager = Task_QManager()
+
+        background_task_qmanager.submit_task(
+            worker_function=Execute_Check_Output,
+            commands=command,
+            debug=False,
+            stderr_to_stdout=False,
+            progress_duration=duration,
+            task_id=task_def.task_id,
+            started_callback=task_def.started_callback,
+            progress_callback=task_def.progress_callback,
+            finished_callback=task_def.finished_callback,
+            error_callback=task_def.error_callback,
+            aborted_callback=task_def.aborted_callback,
+        )
+
+        return 0, output_file
+
+    else:  # Run in the foreground
+        result, message = Execute_Check_Output(
+            commands=command,
+            debug=False,
+            stderr_to_stdout=False,
+            progress_callback=progress_callback,
+            progress_duration=duration,
+        )
+
+        if result == -1:
+            return -1, message
+
+    return 1, output_file
+
+
+def Transcode_MPEG2_High_Bitrate(
+    input_file: str,
+    output_folder: str,
+    frame_rate: float,
+    width: int,
+    height: int,
+    interlaced: bool = True,
+    bottom_field_first: bool = True,
+    iframe_only: bool = False,
+    deinterlace: bool = False,
+    auto_bright: bool = False,
+    normalise: bool = False,
+    white_balance: bool = False,
+    denoise: bool = False,
+    sharpen: bool = False,
+    filters_off: bool = False,
+    black_border: bool = False,
+    task_def: Task_Def = None,
+) -> tuple[int, str]:
+    """
+    Converts an input video to MPEG2 at supplied resolution and frame rate at a high bit rate to make an edit
+    copy that minimises generational losses. The video is transcoded to a file in the output folder.
+
+        Args:
+            input_file (str): The path to the input video file.
+            output_folder (str): The path to the output folder.
+            frame_rate (float): The frame rate to use for the output video.
+            width (int) : The target width of the output video
+            height (int) : The target height of the output video
+            interlaced (bool, optional): True if the input video is interlaced, False if progressive. Defaults to True.
+            bottom_field_first (bool, optional): Whether to use bottom field first for interlaced output. Only relevant
+            if the output remains interlaced (i.e., `deinterlace` is False and `input_video_is_interlaced` is True). Defaults to True.
+            iframe_only (bool, optional): Generate iframe only. Defaults to False.
+            deinterlace (bool, optional): If True, forces deinterlacing of the input video, making the output progressive. Defaults to False.
+            auto_bright (bool): Whether to use auto brightness. Defaults to False.
+            normalise (bool): Whether to use normalise. Defaults to False.
+            white_balance (bool): Whether to use white balance. Defaults to False.
+            denoise (bool): Whether to use denoise. Defaults to False.
+            sharpen (bool): Whether to use sharpen. Defaults to False.
+            filters_off (bool): Whether to disable all filters except scaling and black borders. Defaults to False.
+            black_border (bool, optional): Whether to add black borders to the video. Defaults to False.
+            task_def (Task_Def): The task definition, if this is supplied, then this becomes a background task. Defaults to None.
+
+        Returns:
+            tuple[int, str]:
+                - arg 1: 1 if ok, -1 if error, 0 if task_def supplied and this becomes a background task
+                - arg 2: error message if error (-1) else output file path (1 or 0)
+    """
+    assert isinstance(input_file, str) and input_file.strip() != "", (
+        f"{input_file=}. Must be a non-empty str"
+    )
+    assert isinstance(output_folder, str) and output_folder.strip() != "", (
+        f"{output_folder=}. Must be a non-empty str"
+    )
+    assert isinstance(frame_rate, float) and frame_rate > 0, (
+        f"{frame_rate=}. Must be float > 0"
+    )
+    assert isinstance(width, int) and width > 0, f"{width=}. Must be int > 0"
+    assert isinstance(height, int) and height > 0, f"{height=}. Must be int > 0"
+    assert isinstance(interlaced, bool), f"{interlaced=}. Must be bool"
+    assert isinstance(bottom_field_first, bool), f"{bottom_field_first=}. Must be bool"
+    assert isinstance(iframe_only, bool), f"{iframe_only=}. Must be bool"
+    assert isinstance(deinterlace, bool), f"{deinterlace=}. Must be bool"
+    assert isinstance(auto_bright, bool), f"{auto_bright=}. Must be bool"
+    assert isinstance(normalise, bool), f"{normalise=}. Must be bool"
+    assert isinstance(white_balance, bool), f"{white_balance=}. Must be bool"
+    assert isinstance(denoise, bool), f"{denoise=}. Must be bool"
+    assert isinstance(sharpen, bool), f"{sharpen=}. Must be bool"
+    assert isinstance(filters_off, bool), f"{filters_off=}. Must be bool"
+    assert isinstance(black_border, bool), f"{black_border=}. Must be bool"
+    assert isinstance(task_def, Task_Def) or task_def is None, (
+        f"{task_def=}. Must be Task_Def or None"
+    )
+
+    if deinterlace and not interlaced:
+        return (
+            -1,
+            "Cannot force deinterlace when input_video_is_interlaced is False. Input is already progressive.",
+        )
+
+    file_handler = file_utils.File()
+
+    if not file_handler.path_exists(output_folder):
+        return -1, f"{output_folder} Does not exist"
+    if not file_handler.path_writeable(output_folder):
+        return -1, f"{output_folder} Cannot Be Written To"
+    if not file_handler.file_exists(input_file):
+        return -1, f"File Does Not Exist {input_file}"
+
+    _, input_file_name, _ = file_handler.split_file_path(input_file)
+    output_file = file_handler.file_join(output_folder, f"{input_file_name}.mpg")
+
+    gop_size = 1 if iframe_only else (15 if frame_rate == 25 else 18)
+
+    if height <= 576:  # SD
+        bit_rate = 9
+    else:  # HD
+        bit_rate = 50
+
+    if (width, height) in Standard_Resolutions():
+        scale_width = -1
+        scale_height = -1
+    else:
+        scale_width = width
+        scale_height = height
+
+    video_filters_arg = Build_Video_Filters(
+        auto_bright=auto_bright,
+        normalise=normalise,
+        white_balance=white_balance,
+        denoise=denoise,
+        sharpen=sharpen,
+        filters_off=filters_off,
+        black_border=black_border,
+        target_width=scale_width,
+        target_height=scale_height,
+        deinterlace_video=deinterlace,
+        include_dvd_interlacing=False,
+    )
+
+    interlaced_flags = []
+
+    if not deinterlace and interlaced:
+        interlaced_flags = [
+            "-flags:v:0",
+            "+ilme+ildct",
+            "-alternate_scan:v:0",
+            "1",
+        ]
+
+        field_order_filter = f"fieldorder={'bff' if bottom_field_first else 'tff'}"
+
+        if video_filters_arg:
+            video_filters_arg[1] = f"{field_order_filter},{video_filters_arg[1]}"
+        else:
+            video_filters_arg = ["-vf", field_order_filter]
+
+    command = [
+        sys_consts.FFMPG,
+        "-fflags",
+        "+genpts",  # generate presentation timestamps
+        *Input_Options(input_file),
+        "-vsync",
+        "cfr",
+        "-max_muxing_queue_size",
+        "9999",
+        *video_filters_arg,
+        *interlaced_flags,
+        "-r",
+        str(frame_rate),
+        "-c:v",
+        "mpeg2video",  # MPEG2 video codec
+        "-b:v",
+        f"{bit_rate}M",  # High bitrate for edit copy
+        "-maxrate",
+        f"{int(float(bit_rate) * 2)}M",
+        "-bufsize",
+        f"{int(float(bit_rate) * 10)}M",
+        "-sn",  # Remove titles
+        "-g",
+        f"{gop_size}",
+        "-force_key_frames",
+        f"expr:if(isnan(prev_forced_n),1,eq(n,prev_forced_n+{gop_size}))",
+        "-pix_fmt",
+        "yuv420p",  # Standard pixel format for MPEG2
+        "-bf",
+        "2",  # Max B-frames for MPEG2
+        "-c:a",
+        "ac3",  # Assuming AC3 audio for MPEG2 output
+        "-b:a",
+        "256k",
+        "-threads",
+        "0",
+        "-y",
+        output_file,
+    ]
+
+    if task_def:  # Run in the background
+        background_task_qmanager = Task_QManager()
+
+        background_task_qmanager.submit_task(
+            worker_function=Execute_Check_Output,
+            commands=command,
+            debug=False,
+            stderr_to_stdout=False,
+            task_id=task_def.task_id,
+            started_callback=task_def.started_callback,
+            progress_callback=task_def.progress_callback,
+            finished_callback=task_def.finished_callback,
+            error_callback=task_def.error_callback,
+            aborted_callback=task_def.aborted_callback,
+        )
+
+        return 0, output_file
+    else:  # Run in the foreground
+        result, message = Execute_Check_Output(
+            commands=command, debug=False, stderr_to_stdout=False
+        )
+        if result == -1:
+            return -1, message
+
+    return 1, output_file
+
+
+def Standard_Resolutions() -> set:
+    """
+    Returns a list of standard resolutions
+
+    Returns:
+        set: List of standard resolutions
+    """
+    return {
+        (
+            sys_consts.PAL_SPECS.width_43,
+            sys_consts.PAL_SPECS.height_43,
+        ),  # 720x576 (PAL 4:3)
+        (
+            sys_consts.PAL_SPECS.width_169,
+            sys_consts.PAL_SPECS.height_169,
+        ),  # 720x576 (PAL 16:9 anamorphic)
+        (
+            sys_consts.NTSC_SPECS.width_43,
+            sys_consts.NTSC_SPECS.height_43,
+        ),  # 720x480 (NTSC 4:3)
+        (
+            sys_consts.NTSC_SPECS.width_169,
+            sys_consts.NTSC_SPECS.height_169,
+        ),  # 720x480 (NTSC 16:9 anamorphic)
+        (1920, 1080),  # Full HD
+        (1280, 720),  # HD
+    }
+
+
+def Transcode_H26x(
+    input_file: str,
+    output_folder: str,
+    frame_rate: float,
+    width: int,
+    height: int,
+    interlaced: bool = True,
+    bottom_field_first: bool = True,
+    h265: bool = False,
+    high_quality: bool = True,
+    iframe_only: bool = False,
+    deinterlace: bool = False,
+    auto_bright: bool = False,
+    normalise: bool = False,
+    white_balance: bool = False,
+    denoise: bool = False,
+    sharpen: bool = False,
+    filters_off: bool = False,
+    black_border: bool = False,
+    encode_10bit: bool = False,
+    mkv_container: bool = False,
+    normalise_audio: bool = False,
+    duration: float = 0.0,
+    progress_callback: Optional[Callable[[float, str], None]] = None,
+    task_def: Task_Def = None,
+    chunked: bool = False,
+) -> tuple[int, str]:
+    """
+    Converts an input video to H.264/5 at supplied resolution and frame rate.
+    The video is transcoded to a file in the output folder.
+
+    A chunked encode splits a long input with Plan_Encode_Chunks and encodes the H26x_Fan_Out_Output of the same
+    settings with Transcode_Chunked. Its audio is normalised with the linear loudnorm of the measured loudness.
+
+    Args:
+        input_file (str): The path to the input video file.
+        output_folder (str): The path to the output folder.
+        frame_rate (float): The frame rate to use for the output video.
+        width (int) : The target width of the output video
+        height (int) : The target height of the output video
+        interlaced (bool): True if the input video is interlaced, False if progressive. Defaults to True.
+        bottom_field_first (bool): Whether to use bottom field first for interlaced output. Only relevant if the output
+        remains interlaced (i.e., `deinterlace` is False and `interlaced` is True). Defaults to True.
+        h265 (bool): Whether to use H.265. Defaults to False.
+        high_quality (bool): Use a high quality encode. Defaults to True.
+        iframe_only (bool): True if no GOP and all I-frames desired else False. Defaults to False.
+        deinterlace (bool): If True, forces deinterlacing of the input video, making the output progressive. Defaults to False.
+        auto_bright (bool): Whether to use auto brightness. Defaults to False.
+        normalise (bool): Whether to use normalise. Defaults to False.
+        white_balance (bool): Whether to use white balance. Defaults to False.
+        denoise (bool): Whether to use denoise. Defaults to False.
+        sharpen (bool): Whether to use sharpen. Defaults to False.
+        filters_off (bool): Whether to disable all filters except scaling and black borders. Defaults to False.
+        black_border (bool, optional): Whether to add black borders to the video. Defaults to False.
+        encode_10bit (bool, optional): Encode videos as 10 bit. Defaults to False
+        mkv_container: (bool, optional): Place output file in a mkv container, Otherwise a mp4 container. Defaults to False,
+        normalise_audio (bool, optional): Normalise the audio with the linear loudnorm of the cached loudness of the
+            input file, or dynamic loudnorm if it is not cached. Defaults to False
+        duration (float): Duration of the input video in seconds, used for progress percentages. Defaults to 0.0 (unknown).
+        progress_callback (Optional[Callable[[float, str], None]]): Receives the percentage complete and a
+            frame/fps/speed/ETA message while encoding. Defaults to None.
+        task_def (Task_Def): The task definition, if this is supplied, then this becomes a background task. Defaults to None.
+        chunked (bool): True to encode a long input in chunks at the same time. Defaults to False
+
+    Returns:
+        tuple[int, str]:
+            - arg 1: 1 if ok, -1 if error, 0 if task_def supplied and this becomes a background task
+            - arg 2: error message if error (-1) else output file path (1)
+    """
+    assert isinstance(input_file, str) and input_file.strip() != "", (
+        f"{input_file=}. Must be a non-empty str"
+    )
+    assert isinstance(output_folder, str) and output_folder.strip() != "", (
+        f"{output_folder=}. Must be a non-empty str"
+    )
+    assert isinstance(frame_rate, float) and frame_rate > 0, (
+        f"{frame_rate=}. Must be float > 0"
+    )
+    assert isinstance(width, int) and width > 0, f"{width=}. Must be int > 0"
+    assert isinstance(height, int) and height > 0, f"{height=}. Must be int > 0"
+    assert isinstance(interlaced, bool), f"{interlaced=}. Must be bool"
+    assert isinstance(bottom_field_first, bool), f"{bottom_field_first=}. Must be bool"
+    assert isinstance(h265, bool), f"{h265=}. Must be bool"
+    assert isinstance(high_quality, bool), f"{high_quality=}. Must be bool"
+    assert isinstance(iframe_only, bool), f"{iframe_only=}. Must be bool"
+    assert isinstance(deinterlace, bool), f"{deinterlace=}. Must be bool"
+    assert isinstance(auto_bright, bool), f"{auto_bright=}. Must be bool"
+    assert isinstance(normalise, bool), f"{normalise=}. Must be bool"
+    assert isinstance(white_balance, bool), f"{white_balance=}. Must be bool"
+    assert isinstance(denoise, bool), f"{denoise=}. Must be bool"
+    assert isinstance(sharpen, bool), f"{sharpen=}. Must be bool"
+    assert isinstance(filters_off, bool), f"{filters_off=}. Must be bool"
+    assert isinstance(black_border, bool), f"{black_border=}. Must be bool"
+    assert isinstance(encode_10bit, bool), f"{encode_10bit=}, Must be bool"
+    assert isinstance(mkv_container, bool), f"{mkv_container=}. Must be bool"
+    assert isinstance(normalise_audio, bool), f"{normalise_audio=}. Must be bool"
+    assert isinstance(duration, (int, float)) and duration >= 0, (
+        f"{duration=}. Must be int | float >= 0"
+    )
+    assert callable(progress_callback) or progress_callback is None, (
+        f"{progress_callback=}. Must be a function or None"
+    )
+    assert isinstance(task_def, Task_Def) or task_def is None, (
+        f"{task_def=}. Must be Task_Def or None"
+    )
+    assert isinstance(chunked, bool), f"{chunked=}. Must be bool"
+
+    if deinterlace and not interlaced:
+        return (
+            -1,
+            "Cannot force deinterlace when input video is progressive. Input is already progressive.",
+        )
+
+    file_handler = file_utils.File()
+
+    if not file_handler.path_exists(output_folder):
+        return -1, f"{output_folder} Does not exist"
+    if not file_handler.path_writeable(output_folder):
+        return -1, f"{output_folder} Cannot Be Written To"
+    if not file_handler.file_exists(input_file):
+        return -1, f"File Does Not Exist {input_file}"
+
+    file_extension = "mkv" if mkv_container else "mp4"
+    _, input_file_name, _ = file_handler.split_file_path(input_file)
+    output_file = file_handler.file_join(
+        output_folder, f"{input_file_name}.{file_extension}"
+    )
+
+    if output_file == input_file:
+        output_file = file_handler.file_join(
+            output_folder, f"{input_file_name}_out.{file_extension}"
+        )
+
+    if not utils.Is_Complied():
+        print(
+            "DBG Trans_H26x"
+            f" {input_file=} {frame_rate=} {width=} {height=} {interlaced=} {bottom_field_first=} ER"
+            f" {'5M' if height <= 576 else '35M'=}"
+        )
+
+    chunk_times = Plan_Encode_Chunks(input_file, duration) if chunked else []
+
+    if chunk_times:
+        chunked_output = H26x_Fan_Out_Output(
+            name="h26x",
+            input_file=input_file,
+            output_folder=output_folder,
+            frame_rate=frame_rate,
+            width=width,
+            height=height,
+            interlaced=interlaced,
+            bottom_field_first=bottom_field_first,
+            h265=h265,
+            high_quality=high_quality,
+            iframe_only=iframe_only,
+            deinterlace=deinterlace,
+            auto_bright=auto_bright,
+            normalise=normalise,
+            white_balance=white_balance,
+            denoise=denoise,
+            sharpen=sharpen,
+            filters_off=filters_off,
+            black_border=black_border,
+            encode_10bit=encode_10bit,
+            mkv_container=mkv_container,
+            normalise_audio=normalise_audio,
+        )
+
+        if task_def:  # Run in the background
+            Task_QManager().submit_task(
+                worker_function=Transcode_Chunked,
+                input_file=input_file,
+                output=chunked_output,
+                frame_rate=frame_rate,
+                chunk_times=chunk_times,
+                duration=duration,
+                task_id=task_def.task_id,
+                started_callback=task_def.started_callback,
+                progress_callback=task_def.progress_callback,
+                finished_callback=task_def.finished_callback,
+                error_callback=task_def.error_callback,
+                aborted_callback=task_def.aborted_callback,
+            )
+
+            return 0, chunked_output.output_file
+
+        return Transcode_Chunked(
+            input_file=input_file,
+            output=chunked_output,
+            frame_rate=frame_rate,
+            chunk_times=chunk_times,
+            duration=duration,
+            progress_callback=progress_callback,
+        )
+
+    gop_size = 1 if iframe_only else (15 if frame_rate == 25 else 18)
+
+    encoder = "libx265" if h265 else "libx264"
+    quality_preset = "slow" if high_quality else "superfast"
+
+    if (width, height) in Standard_Resolutions():
+        scale_width = -1
+        scale_height = -1
+    else:
+        scale_width = width
+        scale_height = height
+
+    video_filters_arg = Build_Video_Filters(
+        auto_bright=auto_bright,
+        normalise=normalise,
+        white_balance=white_balance,
+        denoise=denoise,
+        sharpen=sharpen,
+        filters_off=filters_off,
+        black_border=black_border,
+        target_width=scale_width,
+        target_height=scale_height,
+        deinterlace_video=deinterlace,
+        include_dvd_interlacing=False,
+    )
+
+    interlaced_flags = []
+
+    if not deinterlace and interlaced:
+        interlaced_flags = [
+            "-flags:v:0",
+            "+ilme+ildct",
+            "-alternate_scan:v:0",
+            "1",
+        ]
+
+        field_order_filter = f"fieldorder={'bff' if bottom_field_first else 'tff'}"
+
+        if video_filters_arg:
+            video_filters_arg[1] = f"{field_order_filter},{video_filters_arg[1]}"
+        else:
+            video_filters_arg = ["-vf", field_order_filter]
+
+    pixel_format = "yuv422p10le" if encode_10bit else "yuv420p"
+
+    audio_filters_arg = []
+
+    # The loudness is measured by the DVD encode, it is not worth measuring again here
+    if normalise_audio:
+        audio_filters_arg = [
+            "-filter:a:0",
+            Loudnorm_Filter(Loudness_Cache().get(input_file)),
+        ]
+
+    command = [
+        sys_consts.FFMPG,
+        "-fflags",
+        "+genpts",
+        *Input_Options(input_file),
+        "-vsync",
+        "cfr",
+        "-max_muxing_queue_size",
+        "9999",
+        *video_filters_arg,
+        *interlaced_flags,
+        "-r",
+        str(frame_rate),
+        "-c:v",
+        encoder,
+        "-sn",  # Remove titles
+        "-pix_fmt",
+        pixel_format,
+        "-crf",
+        "19" if not h265 else "25",
+        "-preset",
+        quality_preset,
+        "-c:a",
+        "ac3",
+        "-b:a",
+        "256k",
+        *audio_filters_arg,
+        "-muxrate",
+        "48M",
+        "-bufsize",
+        "48M",
+        "-g",
+        f"{gop_size}",
+        "-keyint_min",
+        f"{gop_size}",
+        "-sc_threshold",
+        "0",
+        "-threads",
+        "0",
+        output_file,
+        "-y",
+    ]
+
+    if task_def:  # Run in the background
+        background_task_qmanager = Task_QManager()
+
+        background_task_qmanager.submit_task(
+            worker_function=Execute_Check_Output,
+            commands=command,
+            debug=False,
+            stderr_to_stdout=False,
+            progress_duration=duration,
+            task_id=task_def.task_id,
+            started_callback=task_def.started_callback,
+            progress_callback=task_def.progress_callback,
+            finished_callback=task_def.finished_callback,
+            error_callback=task_def.error_callback,
+            aborted_callback=task_def.aborted_callback,
+        )
+
+        return 0, output_file
+
+    else:
+        result, message = Execute_Check_Output(
+            commands=command,
+            debug=True,
+            stderr_to_stdout=False,
+            progress_callback=progress_callback,
+            progress_duration=duration,
+        )
+        if result == -1:
+            return -1, message
+
+    return 1, output_file
+
+
+def H26x_Fan_Out_Output(
+    name: str,
+    input_file: str,
+    output_folder: str,
+    frame_rate: float,
+    width: int,
+    height: int,
+    interlaced: bool = True,
+    bottom_field_first: bool = True,
+    h265: bool = False,
+    high_quality: bool = True,
+    iframe_only: bool = False,
+    deinterlace: bool = False,
+    auto_bright: bool = False,
+    normalise: bool = False,
+    white_balance: bool = False,
+    denoise: bool = False,
+    sharpen: bool = False,
+    filters_off: bool = False,
+    black_border: bool = False,
+    encode_10bit: bool = False,
+    mkv_container: bool = False,
+    normalise_audio: bool = False,
+) -> Fan_Out_Output:
+    """
+    Makes the Transcode_Fan_Out output of the H.264/5 encode Transcode_H26x does
+
+    Args:
+        name (str): The name of the output
+        input_file (str): The path to the input video file.
+        output_folder (str): The path to the output folder.
+        frame_rate (float): The frame rate to use for the output video.
+        width (int) : The target width of the output video
+        height (int) : The target height of the output video
+        interlaced (bool): True if the input video is interlaced, False if progressive. Defaults to True.
+        bottom_field_first (bool): Whether to use bottom field first for interlaced output. Defaults to True.
+        h265 (bool): Whether to use H.265. Defaults to False.
+        high_quality (bool): Use a high quality encode. Defaults to True.
+        iframe_only (bool): True if no GOP and all I-frames desired else False. Defaults to False.
+        deinterlace (bool): If True, forces deinterlacing of the input video, making the output progressive. Defaults to False.
+        auto_bright (bool): Whether to use auto brightness. Defaults to False.
+        normalise (bool): Whether to use normalise. Defaults to False.
+        white_balance (bool): Whether to use white balance. Defaults to False.
+        denoise (bool): Whether to use denoise. Defaults to False.
+        sharpen (bool): Whether to use sharpen. Defaults to False.
+        filters_off (bool): Whether to disable all filters except scaling and black borders. Defaults to False.
+        black_border (bool, optional): Whether to add black borders to the video. Defaults to False.
+        encode_10bit (bool, optional): Encode videos as 10 bit. Defaults to False
+        mkv_container: (bool, optional): Place output file in a mkv container, Otherwise a mp4 container. Defaults to False,
+        normalise_audio (bool, optional): Normalise the audio with loudnorm, which Transcode_Fan_Out makes linear when
+            it has the loudness of the input file. Defaults to False
+
+    Returns:
+        Fan_Out_Output: The output, its file is named after the input file
+    """
+    assert isinstance(name, str) and name.strip() != "", (
+        f"{name=}. Must be a non-empty str"
+    )
+    assert isinstance(input_file, str) and input_file.strip() != "", (
+        f"{input_file=}. Must be a non-empty str"
+    )
+    assert isinstance(output_folder, str) and output_folder.strip() != "", (
+        f"{output_folder=}. Must be a non-empty str"
+    )
+    assert isinstance(frame_rate, float) and frame_rate > 0, (
+        f"{frame_rate=}. Must be float > 0"
+    )
+    assert isinstance(width, int) and width > 0, f"{width=}. Must be int > 0"
+    assert isinstance(height, int) and height > 0, f"{height=}. Must be int > 0"
+    assert isinstance(interlaced, bool), f"{interlaced=}. Must be bool"
+    assert isinstance(bottom_field_first, bool), f"{bottom_field_first=}. Must be bool"
+    assert isinstance(h265, bool), f"{h265=}. Must be bool"
+    assert isinstance(high_quality, bool), f"{high_quality=}. Must be bool"
+    assert isinstance(iframe_only, bool), f"{iframe_only=}. Must be bool"
+    assert isinstance(deinterlace, bool), f"{deinterlace=}. Must be bool"
+    assert isinstance(encode_10bit, bool), f"{encode_10bit=}, Must be bool"
+    assert isinstance(mkv_container, bool), f"{mkv_container=}. Must be bool"
+    assert isinstance(normalise_audio, bool), f"{normalise_audio=}. Must be bool"
+
+    file_handler = file_utils.File()
+
+    file_extension = "mkv" if mkv_container else "mp4"
+    _, input_file_name, _ = file_handler.split_file_path(input_file)
+    output_file = file_handler.file_join(
+        output_folder, f"{input_file_name}.{file_extension}"
+    )
+
+    if output_file == input_file:
+        output_file = file_handler.file_join(
+            output_folder, f"{input_file_name}_out.{file_extension}"
+        )
+
+    gop_size = 1 if iframe_only else (15 if frame_rate == 25 else 18)
+
+    if (width, height) in Standard_Resolutions():
+        scale_width = -1
+        scale_height = -1
+    else:
+        scale_width = width
+        scale_height = height
+
+    video_filters_arg = Build_Video_Filters(
+        auto_bright=auto_bright,
+        normalise=normalise,
+        white_balance=white_balance,
+        denoise=denoise,
+        sharpen=sharpen,
+        filters_off=filters_off,
+        black_border=black_border,
+        target_width=scale_width,
+        target_height=scale_height,
+        deinterlace_video=deinterlace,
+        include_dvd_interlacing=False,
+    )
+    video_filters = video_filters_arg[1] if video_filters_arg else ""
+
+    interlaced_flags = []
+
+    if interlaced and not deinterlace:
+        interlaced_flags = [
+            "-flags:v:0",
+            "+ilme+ildct",
+            "-alternate_scan:v:0",
+            "1",
+        ]
+
+        field_order_filter = f"fieldorder={'bff' if bottom_field_first else 'tff'}"
+        video_filters = (
+            f"{field_order_filter},{video_filters}"
+            if video_filters
+            else field_order_filter
+        )
+
+    return Fan_Out_Output(
+        name=name,
+        output_file=output_file,
+        video_filters=video_filters,
+        video_options=[
+            "-vsync",
+            "cfr",
+            *interlaced_flags,
+            "-r",
+            str(frame_rate),
+            "-c:v",
+            "libx265" if h265 else "libx264",
+            "-pix_fmt",
+            "yuv422p10le" if encode_10bit else "yuv420p",
+            "-crf",
+            "19" if not h265 else "25",
+            "-preset",
+            "slow" if high_quality else "superfast",
+            "-g",
+            f"{gop_size}",
+            "-keyint_min",
+            f"{gop_size}",
+            "-sc_threshold",
+            "0",
+            "-bufsize",
+            "48M",
+            "-threads",
+            "0",
+        ],
+        audio_options=[
+            "-c:a",
+            "ac3",
+            "-b:a",
+            "256k",
+            *(["-filter:a:0", Loudnorm_Filter()] if normalise_audio else []),
+        ],
+        muxer_options=[
+            "-max_muxing_queue_size",
+            "9999",
+            "-muxrate",
+            "48M",
+        ],
+    )
+
+
+def Convert_To_PNG_Stream(
+    image_filename: str, width: int, height: int, keep_aspect_ratio: bool = True
+) -> tuple[int, bytes]:
+    """
+    Converts an image file to PNG format, resizing it, and returns the PNG data as bytes.
+
+    Args:
+        image_filename (str): The filename of the input image.
+        width (int): The width for resizing.
+        height (int): The height for resizing.
+        keep_aspect_ratio (bool): Whether to keep the aspect ratio.
+
+    Returns:
+        tuple(int, bytes):
+            - arg1: 1 (ok) or -1 (error)
+            - arg2: The image data as a byte string (PNG format) on success, empty bytes on error
+    """
+    assert isinstance(image_filename, str) and image_filename.strip() != "", (
+        f"{image_filename=}. Must be a non-empty str"
+    )
+    assert isinstance(width, int) and width > 0, f"{width=} . Must be an int > 0"
+    assert isinstance(height, int) and height > 0, f"{height=} . Must be an int > 0"
+    assert isinstance(keep_aspect_ratio, bool), f"{keep_aspect_ratio=}. Must be a bool"
+
+    file_handler = file_utils.File()
+
+    if not file_handler.file_exists(image_filename):
+        return -1, f"File not found: {image_filename}".encode("utf-8")
+
+    command = [
+        sys_consts.CONVERT,
+        image_filename,
+        "-resize",
+        f"{width}x{height} {'>' if keep_aspect_ratio else ''}>",
+        "png:-",
+    ]
+
+    try:
+        with subprocess.Popen(
+            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        ) as process:
+            stdout, stderr = process.communicate()
+
+            if process.returncode == 0:
+                return 1, stdout
+            else:
+                print(f"Error converting image: {stderr.decode()}")
+                return -1, f"Error converting image: {stderr.decode()}".encode("utf-8")
+    except Exception as e:
+        return -1, f"Unexpected error: {e}".encode("utf-8")
+
+
+def Write_Image_On_Image(
+    base_image_data: bytes,
+    overlay_image_data: bytes,
+    x: int,
+    y: int,
+    gravity: str = Gravity.NORTHWEST.value,
+) -> tuple[int, bytes]:
+    """
+    Overlays an image (provided as bytes) onto another base image (provided as bytes)
+    using ImageMagick and returns the modified image as a byte string (PNG format).
+
+    Args:
+        base_image_data (bytes): The base image data in bytes format
+        overlay_image_data (bytes): The overlay image data in bytes format
+        x (int): The x-coordinate
+        y (int): The y-coordinate
+        gravity (str): The gravity positioning of the overlay image ('northwest', 'center', etc.)
+
+    Returns:
+        tuple(int, bytes):
+            - arg1: 1 (ok) or -1 (error)
+            - arg2: The modified image data as a byte string (PNG format) on success, empty bytes on error
+    """
+    assert isinstance(base_image_data, bytes) and base_image_data.strip() != "", (
+        f"{base_image_data=}. Must be a non-empty bytes"
+    )
+    assert isinstance(overlay_image_data, bytes) and base_image_data.strip() != "", (
+        f"{base_image_data=}. Must be a non-empty bytes"
+    )
+    assert isinstance(x, int) and x >= 0, f"{x=}. Must be a non-negative int"
+    assert isinstance(y, int) and y >= 0, f"{y=}. Must be a non-negative int"
+    assert isinstance(gravity, str) and gravity.strip().lower() in [
+        member.value for member in Gravity
+    ], (
+        f"{gravity=} must be a valid gravity string from {[member.value for member in Gravity]}"
+    )
+
+    try:
+        SEPARATOR: Final[bytes] = b"##ImageSeparator##"
+
+        stdin_data = base_image_data + SEPARATOR + overlay_image_data
+
+        command = [
+            sys_consts.CONVERT,
+            "-gravity",
+            gravity,
+            "-page",
+            f"+{x}+{y}",
+            "-",
+            "png:-",
+        ]
+
+        # Execute the command with input and output pipes
+        process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        stdout, stderr = process.communicate(input=stdin_data)
+
+        if process.returncode == 0:
+            return 1, stdout
+        else:
+            return -1, f"Failed To Overlay An Image (Err 1) {stderr.decode()}".encode(
+                "utf-8"
+            )
+    except Exception as e:
+        return -1, f"Failed To Overlay An Image (Err 2) {e}".encode("utf-8")
+
+
+def Write_Text_On_Image(
+    image_data: bytes,
+    text: str,
+    x: int,
+    y: int,
+    font: str,
+    pointsize: int,
+    color: str,
+    gravity: str = Gravity.NORTHWEST.value,
+) -> tuple[int, bytes]:
+    """
+    Writes text on an image (provided as bytes) and returns the modified image as a byte string (PNG format).
+
+    Args:
+        image_data (bytes): The image data in bytes format (e.g., from reading a file)
+        text (str): The text to be written
+        x (int): The x co-ordinate
+        y (int): The y co-ordinate
+        font (str): The font of the text
+        pointsize (int): The point size of the text
+        color (str): The color of the text
+        gravity: (str): The gravity positioning of the text
+
+    Returns:
+        tuple(int, bytes):
+            - arg1: 1, ok, -1, error.
+            - arg2: The modified image data as a byte string (PNG format) on success empty bytes on error.
+    """
+
+    assert isinstance(gravity, str) and gravity.strip().lower() in [
+        member.value for member in Gravity
+    ], (
+        f"{gravity=} must be a valid gravity string from {[member.value for member in Gravity]}"
+    )
+
+    assert isinstance(image_data, bytes) and image_data != b"", (
+        f"{image_data=}. Must be non-empty bytes"
+    )
+    assert isinstance(text, str), f"{text=}. Must be str"
+    assert isinstance(font, str) and font.strip() != "", (
+        f"{font=}. Must be non-empty str"
+    )
+    assert isinstance(x, int) and x > 0, f"{x=}. Must be int > 0"
+    assert isinstance(pointsize, int) and pointsize > 0, (
+        f"{pointsize=}. Must be int > 0"
+    )
+    assert isinstance(y, int) and y > 0, f"{y=}. Must be int > 0"
+
+    assert isinstance(color, str) and color.upper() in Color.__members__, (
+        f"{color=}. Must be one of {[member.name for member in Color]}"
+    )
+
+    try:
+        # Construct ImageMagick command (pipe image data as input)
+        command = [
+            sys_consts.CONVERT,
+            "-",  # Read input from standard input (pipe)
+            "-background",
+            "none",  # Transparent background
+            "-fill",
+            color,
+            "-gravity",
+            gravity,
+            "-font",
+            font,
+            "-pointsize",
+            f"{pointsize}",
+            "-annotate",
+            f"+{x}+{y}",
+            f"{text}",
+            "PNG:-",  # Output to standard output (pipe)
+        ]
+
+        process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+        # Send the image data directly
+        stdout, stderr = process.communicate(input=image_data)
+
+        if process.returncode != 0:
+            return -1, stderr
+
+        return 1, stdout
+
+    except Exception as e:
+        return -1, f"Error processing image: {str(e)}".encode("utf-8")
+
+
+def Write_Text_On_File(
+    input_file: str, text: str, x: int, y: int, font: str, pointsize: int, color: str
+) -> tuple[int, str]:
+    """
+    Writes text on a file
+
+    Args:
+        input_file (str): The file on which the text will be written
+        text (str): The text to be written
+        x (int): The x co-ordinate
+        y (int): The y co-ordinate
+        font (str): The font of the text
+        pointsize (int): The point size of the text
+        color (str): The color of the text
+
+    Returns:
+        tuple[int,str]:
+        - arg1: 1 OK, -1 Error,
+        - arg2: Error message or "" if ok
+    """
+    assert isinstance(input_file, str) and input_file.strip() != "", (
+        f"{input_file=}. Must be non-empty str"
+    )
+    assert isinstance(text, str), f"{text=}. Must be str"
+    assert isinstance(font, str) and font.strip() != "", (
+        f"{font=}. Must be non-empty str"
+    )
+    assert isinstance(x, int) and x > 0, f"{x=}. Must be int > 0"
+    assert isinstance(pointsize, int) and pointsize > 0, (
+        f"{pointsize=}. Must be int > 0"
+    )
+    assert isinstance(y, int) and y > 0, f"{y=}. Must be int > 0"
+
+    assert isinstance(color, str) and color.upper() in Color.__members__, (
+        f"{color=}. Must be one of {[member.name for member in Color]}"
+    )
+
+    if not os.path.exists(input_file):
+        return -1, f"{input_file} Does Not Exist!"
+
+    command = [
+        sys_consts.CONVERT,
+        input_file,
+        "-fill",
+        color,
+        "-gravity",
+        "NorthWest",
+        "-font",
+        font,
+        "-pointsize",
+        f"{pointsize}",
+        "-annotate",
+        f"+{x}+{y}",
+        text,
+        input_file,
+    ]
+
+    return Execute_Check_Output(commands=command)
+
+
+def Get_Text_Dims(text: str, font: str, pointsize: int) -> tuple[int, int]:
+    """
+    Gets the text dimensions in pixels
+
+    Args:
+        text (str): The text string to be measured
+        font (str): The font of the text
+        pointsize (int): The text point size
+
+    Returns:
+        tuple[int,int]: The width and height of the text. Both are -1 if there is an error
+    """
+    assert isinstance(text, str), f"{text=}. Must be str"
+    assert isinstance(font, str) and font.strip() != "", (
+        f"{font=}. Must be noon-empty str"
+    )
+    assert isinstance(pointsize, int) and pointsize > 0, (
+        f"{pointsize=}. Must be int > 0"
+    )
+
+    # Run the ImageMagick command to measure the text
+    result, message = Execute_Check_Output(
+        commands=[
+            sys_consts.CONVERT,
+            "-background",
+            "none",
+            "-fill",
+            "black",
+            "-font",
+            font,
+            "-pointsize",
+            str(pointsize),
+            "label:" + text,
+            "-format",
+            "%[fx:w]x%[fx:h]",
+            "info:",
+        ],
+        debug=False,
+    )
+
+    if result == -1:
+        return -1, -1
+
+    # Convert the message to width and height
+    dimensions = message.strip().split("x")
+
+    if (
+        not dimensions
+        or len(dimensions) != 2
+        or dimensions[0].strip() == ""
+        or dimensions[1].strip() == ""
+    ):  # Very rare error cases
+        return -1, -1
+
+    width = int(dimensions[0])
+    height = int(dimensions[1])
+
+    return width, height
+
+
+def Get_Codec(input_file: str) -> tuple[int, str]:
+    """
+    Get the codec name of the video file using FFprobe.
+
+    Args:
+        input_file (str): Path to the input video file.
+
+    Returns:
+        tuple[int, str]:
+        - arg 1: Status code. Returns 1 if the codec name was obtained successfully, -1 otherwise.
+        - arg 2: Codec name if obtained successfully, otherwise error message
+
+    """
+    assert isinstance(input_file, str) and input_file.strip() != "", (
+        "Input file must be a string."
+    )
+
+    encoding_info = Probe_File(input_file, (PROBE_IDENTITY,))
+
+    if encoding_info.error:
+        return -1, "Failed To Get Codec Name!"
+
+    return 1, encoding_info.video_codec
+
+
+def Probe_Stream_Entries(
+    video_file: str,
+    section: str,
+    entries: tuple[str, ...],
+    entry_callback: Callable[[tuple[str, ...]], bool],
+    select_streams: str = "v:0",
+    read_intervals: str = "",
+) -> tuple[int, str]:
+    """
+    Streams the packet or frame entries of a file from ffprobe's compact output, handing each one to the
+    entry_callback as it arrives. Nothing is accumulated, so memory use does not grow with the number of frames,
+    and ffprobe is stopped as soon as the entry_callback has what it needs.
+
+    Args:
+        video_file (str): The video file
+        section (str): The ffprobe section, "packet" or "frame"
+        entries (tuple[str, ...]): The section fields wanted, in the order they are passed to the entry_callback
+        entry_callback (Callable[[tuple[str, ...]], bool]): Called with the entry values, "" where ffprobe has no
+            value. Return False to stop probing
+        select_streams (str): The ffprobe stream specifier. Defaults to "v:0", the first video stream
+        read_intervals (str): The ffprobe read intervals. Defaults to "", the whole file
+
+    Returns:
+        tuple[int, str]:
+        - arg 1: 1 if the probe ran or was stopped by the entry_callback, -1 on error, -2 if cancelled
+        - arg 2: Empty string if all good, otherwise error message
+    """
+    assert isinstance(video_file, str) and video_file.strip() != "", (
+        f"{video_file=}. Must be a non-empty str"
+    )
+    assert section in ("packet", "frame"), f"{section=}. Must be packet or frame"
+    assert isinstance(entries, tuple) and len(entries) > 0, (
+        f"{entries=}. Must be a non-empty tuple of str"
+    )
+    assert callable(entry_callback), f"{entry_callback=}. Must be a function"
+    assert isinstance(select_streams, str), f"{select_streams=}. Must be str"
+    assert isinstance(read_intervals, str), f"{read_intervals=}. Must be str"
+
+    result, message = Execute_Check_Output(
+        commands=_Stream_Entries_Command(
+            video_file=video_file,
+            section=section,
+            entries=entries,
+            select_streams=select_streams,
+            read_intervals=read_intervals,
+        ),
+        debug=False,
+        line_callback=_Stream_Entries_Parser(
+            entries=entries, entry_callback=entry_callback
+        ),
+    )
+
+    return result, "" if result == 1 else message
+
+
+def _Stream_Entries_Command(
+    video_file: str,
+    section: str,
+    entries: tuple[str, ...],
+    select_streams: str,
+    read_intervals: str,
+) -> list[str]:
+    """
+    Builds the ffprobe command that outputs the packet or frame entries of a file for Probe_Stream_Entries
+
+    Args:
+        video_file (str): The video file
+        section (str): The ffprobe section, "packet" or "frame"
+        entries (tuple[str, ...]): The section fields wanted
+        select_streams (str): The ffprobe stream specifier, "" for all streams
+        read_intervals (str): The ffprobe read intervals, "" for the whole file
+
+    Returns:
+        list[str]: The ffprobe command
+    """
+    commands = [sys_consts.FFPROBE, "-v", "error"]
+
+    if select_streams:
+        commands += ["-select_streams", select_streams]
+
+    if read_intervals:
+        commands += ["-read_intervals", read_intervals]
+
+    # Compact output is one "key=value|key=value" line per entry. The keys make the parse independent of the
+    # order ffprobe writes the fields in
+    commands += [
+        "-show_entries",
+        f"{section}={','.join(entries)}",
+        "-of",
+        "compact=print_section=0",
+        *Input_Options(video_file),
+    ]
+
+    return commands
+
+
+def _Stream_Entries_Parser(
+    entries: tuple[str, ...], entry_callback: Callable[[tuple[str, ...]], bool]
+) -> Callable[[str], bool]:
+    """
+    Builds the line parser that hands each line of _Stream_Entries_Command output to the entry_callback
+
+    Args:
+        entries (tuple[str, ...]): The section fields wanted, in the order they are passed to the entry_callback
+        entry_callback (Callable[[tuple[str, ...]], bool]): Called with the entry values, "" where ffprobe has no
+            value. Return False to stop probing
+
+    Returns:
+        Callable[[str], bool]: Takes a compact output line and returns False to stop probing
+    """
+
+    def _parse_line(line: str) -> bool:
+        """
+        Converts a compact output line into the entry values tuple and passes it on
+
+        Args:
+            line (str): The compact output line
+
+        Returns:
+            bool: False to stop probing
+        """
+        if not line:
+            return True
+
+        fields = dict(field.partition("=")[::2] for field in line.split("|"))
+
+        return entry_callback(
+            tuple(
+                "" if fields.get(entry, "N/A") == "N/A" else fields[entry]
+                for entry in entries
+            )
+        )
+
+    return _parse_line
+
+
+def Get_Keyframe_Index(video_file: str) -> Keyframe_Index:
+    """
+    Returns the keyframe index of the first video stream of a file. The index is built once from the packet flags,
+    which needs no decoding, and is then held in the Probe_Cache until the file changes.
+
+    Args:
+        video_file (str): The video file
+
+    Returns:
+        Keyframe_Index: Check keyframe_index.error, if it is not an empty string an error occurred
+    """
+    assert isinstance(video_file, str) and video_file.strip() != "", (
+        f"{video_file=}. Must be a non-empty str"
+    )
+
+    keyframe_index = Keyframe_Index()
+
+    if not os.path.exists(video_file):
+        keyframe_index.error = f"{video_file=}. Does not exist"
+        return keyframe_index
+
+    probe_cache = Probe_Cache()
+    cached_keyframe_index = probe_cache.keyframe_index_get(video_file)
+
+    if cached_keyframe_index is not None:
+        return cached_keyframe_index
+
+    # Packets come out in decode order
+    keyframes: list[tuple[float, int, int]] = []  # pts_time, pos, open gop
+    key_state = {"pts_time": -1.0, "checking_leading_frames": False}
+
+    def _index_packet(packet: tuple[str, ...]) -> bool:
+        """
+        Adds a keyframe packet to the index, and flags its GOP as open if a following packet is shown before it
+
+        Args:
+            packet (tuple[str, ...]): The pts_time, pos and flags of the packet
+
+        Returns:
+            bool: Always True, every packet is needed
+        """
+        keyframe_index.packet_count += 1
+
+        try:
+            pts_time = float(packet[0])
+        except ValueError:  # N/A, no presentation time so it can not be a seek point
+            return True
+
+        if "K" in packet[2]:
+            try:
+                pos = int(packet[1])
+            except ValueError:
+                pos = -1
+
+            keyframes.append((pts_time, pos, 0))
+            key_state["pts_time"] = pts_time
+            key_state["checking_leading_frames"] = True
+        elif key_state["checking_leading_frames"]:
+            # Frames decoded after a keyframe but shown before it belong to an open GOP
+            if pts_time < key_state["pts_time"]:
+                keyframes[-1] = (keyframes[-1][0], keyframes[-1][1], 1)
+            else:
+                key_state["checking_leading_frames"] = False
+
+        return True
+
+    result, message = Probe_Stream_Entries(
+        video_file=video_file,
+        section="packet",
+        entries=("pts_time", "pos", "flags"),
+        entry_callback=_index_packet,
+    )
+
+    # A cancelled probe has only indexed part of the file, so it must not be cached
+    if result != 1:
+        keyframe_index.error = message or f"Keyframe Index Of {video_file} Cancelled"
+        return keyframe_index
+
+    if not keyframes:
+        keyframe_index.error = f"No Keyframes Found In {video_file}"
+        return keyframe_index
+
+    keyframes.sort()
+
+    for pts_time, pos, open_gop in keyframes:
+        keyframe_index.key_times.append(pts_time)
+        keyframe_index.key_positions.append(pos)
+        keyframe_index.open_gops.append(open_gop)
+
+    probe_cache.keyframe_index_put(video_file, keyframe_index)
+
+    return keyframe_index
+
+
+def Input_Options(input_file: str) -> list[str]:
+    """
+    Returns the ffmpeg and ffprobe options that open an input file. An ffconcat playlist from Assemble_Video_Playlist
+    is read through the concat demuxer, with safe mode off as its entries are absolute paths to the source files
+
+    Args:
+        input_file (str): The input video file or ffconcat playlist
+
+    Returns:
+        list[str]: The input options, ending with -i and the input file
+    """
+    assert isinstance(input_file, str) and input_file.strip() != "", (
+        f"{input_file=}. Must be a non-empty str"
+    )
+
+    if input_file.lower().endswith(f".{sys_consts.FFCONCAT_EXTN}"):
+        return ["-f", "concat", "-safe", "0", "-i", input_file]
+
+    return ["-i", input_file]
+
+
+def _Seek_Landing_Time(input_file: str, seek_time: float) -> float:
+    """
+    Returns the timestamp of the first video keyframe ffmpeg stream copies after an input side timestamp seek. This is
+    the seek ffmpeg does for Seek_Options, a backward seek to seek_time with -seek_timestamp set, so it shows where a
+    seek in that file really lands.
+
+    Args:
+        input_file (str): The input video file
+        seek_time (float): The timestamp sought, on the keyframe index timeline
+
+    Returns:
+        float: The timestamp landed on, or -1.0 if it could not be found
+    """
+    assert isinstance(input_file, str) and input_file.strip() != "", (
+        f"{input_file=}. Must be a non-empty str"
+    )
+    assert isinstance(seek_time, float) and seek_time >= 0.0, (
+        f"{seek_time=}. Must be float >= 0.0"
+    )
+
+    result, output = Execute_Check_Output(
+        commands=[
+            sys_consts.FFMPG,
+            "-v",
+            "error",
+            "-seek_timestamp",
+            "1",
+            "-ss",
+            f"{seek_time}",
+            "-i",
+            input_file,
+            "-map",
+            "0:v:0",
+            "-c",
+            "copy",
+            "-frames:v",
+            "1",
+            "-f",
+            "framecrc",
+            "-",
+        ],
+        debug=False,
+    )
+
+    if result != 1:
+        return -1.0
+
+    time_base = 0.0
+
+    # framecrc lines are "#tb 0: num/den" then "stream, dts, pts, duration, size, crc". The timestamps are offset by
+    # the seek, so a packet at seek_time has a pts of 0
+    for line in output.splitlines():
+        if line.startswith("#tb 0:"):
+            numerator, _, denominator = line.split(":", 1)[1].strip().partition("/")
+
+            try:
+                time_base = int(numerator) / int(denominator)
+            except (ValueError, ZeroDivisionError):
+                return -1.0
+        elif line and not line.startswith("#") and time_base > 0.0:
+            try:
+                return seek_time + int(line.split(",")[2]) * time_base
+            except (IndexError, ValueError):
+                return -1.0
+
+    return -1.0
+
+
+def Seek_Options(
+    input_file: str, start_time: float, stream_copy: bool
+) -> tuple[list[str], list[str], float]:
+    """
+    Works out the -ss options for a segment starting at start_time. An input side -ss, placed before -i, jumps straight
+    to a keyframe from the file's keyframe index, so extracting a segment costs the same wherever it is in the file.
+    An output side -ss, placed after -i, demuxes everything from the start of the file up to the seek point.
+
+    start_time is a timestamp on the keyframe index timeline, the raw pts_time of the file. -seek_timestamp is always
+    set so ffmpeg does not add the file's start time to either -ss, which matters in MPEG-TS and other files that do
+    not start at 0.
+
+    Timestamp seeks in MPEG-TS and camcorder MOD/TOD files can land after the keyframe asked for. In these the input
+    side seek goes a few keyframes early, is verified by making the same seek with ffmpeg and the output side -ss drops
+    the rest. If the landing is late the seek falls back to the output side only.
+
+    Args:
+        input_file (str): The input video file
+        start_time (float): The start time of the segment, on the keyframe index timeline
+        stream_copy (bool): True if the segment is stream copied, so it must start on a keyframe and start_time is
+            snapped to the nearest one. Otherwise decoding starts at the keyframe before start_time
+
+    Returns:
+        tuple[list[str], list[str], float]:
+        - arg 1: The options that go before -i
+        - arg 2: The options that go after -i
+        - arg 3: The time the segment will start at
+    """
+    assert isinstance(input_file, str) and input_file.strip() != "", (
+        f"{input_file=}. Must be a non-empty str"
+    )
+    assert isinstance(start_time, float) and start_time >= 0.0, (
+        f"{start_time=}. Must be float >= 0.0"
+    )
+    assert isinstance(stream_copy, bool), f"{stream_copy=}. Must be bool"
+
+    seek_margin_keys = 2  # Keyframes to land before the target in unreliable containers
+
+    keyframe_index = Get_Keyframe_Index(input_file)
+
+    # Without an input side -ss, -seek_timestamp leaves the timestamps as they are so the output side -ss is on the
+    # keyframe index timeline too
+    if keyframe_index.error or not keyframe_index.key_times:  # Slow, but always right
+        return ["-seek_timestamp", "1"], ["-ss", f"{start_time}"], start_time
+
+    if stream_copy:
+        key_entry = keyframe_index.nearest_key(start_time)
+        seek_time = keyframe_index.key_times[key_entry]
+    else:  # A decoding input side seek is frame accurate
+        key_entry = max(keyframe_index.key_at_or_before(start_time), 0)
+        seek_time = start_time
+
+    _, _, input_extension = file_utils.File().split_file_path(input_file)
+
+    if input_extension.strip(".").lower() not in sys_consts.UNRELIABLE_SEEK_EXTNS:
+        return ["-seek_timestamp", "1", "-ss", f"{seek_time}"], [], seek_time
+
+    coarse_time = keyframe_index.key_times[max(key_entry - seek_margin_keys, 0)]
+    landed_time = _Seek_Landing_Time(input_file=input_file, seek_time=coarse_time)
+
+    if landed_time < 0.0 or landed_time > seek_time:
+        return ["-seek_timestamp", "1"], ["-ss", f"{seek_time}"], seek_time
+
+    return (
+        ["-seek_timestamp", "1", "-ss", f"{coarse_time}"],
+        ["-ss", f"{seek_time - coarse_time}"],
+        seek_time,
+    )
+
+
+def _Boundary_Reencode_Command(
+    input_file: str,
+    output_file: str,
+    encoder_settings: Encoding_Details,
+    start_time: float,
+    end_time: float,
+    gop_size: int,
+) -> list[str]:
+    """
+    Builds the ffmpeg command that reencodes a boundary segment of a video file, matching the source encoding so the
+    segment can be joined to stream copied segments of the same file.
+
+    Args:
+        input_file (str): The input video file to extract the segment from.
+        output_file (str): The output file where the segment will be saved.
+        encoder_settings (Encoding_Details): The encoding settings of the input video file.
+        start_time (float): The start time of the segment.
+        end_time (float): The end time of the segment.
+        gop_size (int): The desired GOP (Group of Pictures) size.
+
+    Returns:
+        list[str]: The ffmpeg command
+    """
+    assert isinstance(input_file, str) and input_file.strip() != "", (
+        f"{input_file=}. Must be a non-empty  str"
+    )
+    assert isinstance(output_file, str) and output_file.strip() != "", (
+        f"{output_file=}. Must be a non-empty str"
+    )
+    assert isinstance(encoder_settings, Encoding_Details), (
+        f"{encoder_settings=}. Must be Encoding_Details"
+    )
+    assert isinstance(start_time, float) and start_time >= 0.0, (
+        f"{start_time=}. Must be float >= 0.0"
+    )
+    assert isinstance(end_time, float) and end_time > 0.0 and end_time > start_time, (
+        f"{end_time=}. Must be float > 0.0 and > {start_time=}"
+    )
+    assert isinstance(gop_size, int) and gop_size > 0, f"{gop_size=}. Must be int > 0"
+
+    if encoder_settings.video_scan_type == "interlaced":
+        field_order = f"fieldorder={encoder_settings.video_scan_order}"
+
+        video_filter = [
+            "-vf",
+            f"{field_order}",
+            "-flags:v:0",  # video flags for the first video stream
+            "+ilme+ildct",  # include interlaced motion estimation and interlaced DCT
+            "-alternate_scan:v:0",  # set alternate scan for first video stream (interlace)
+            "1",  # alternate scan value is 1,
+        ]
+    else:
+        video_filter = []
+
+    seek_input, seek_output, _ = Seek_Options(
+        input_file=input_file, start_time=start_time, stream_copy=False
+    )
+
+    return [
+        sys_consts.FFMPG,
+        *seek_input,
+        "-fflags",
+        "+genpts",
+        "-i",
+        input_file,
+        *seek_output,
+        "-vsync",
+        "cfr",
+        *video_filter,
+        "-tune",
+        "fastdecode",
+        "-t",
+        f"{end_time - start_time}",
+        "-r",
+        str(encoder_settings.video_frame_rate),
+        "-g",
+        str(gop_size),
+        "-keyint_min",
+        str(gop_size),
+        "-sc_threshold",
+        "0",
+        "-c:v",
+        encoder_settings.video_codec,
+        "-crf",
+        "18",
+        "-preset",
+        "slow",
+        "-b:v",
+        str(encoder_settings.video_bitrate),
+        "-pix_fmt",
+        encoder_settings.video_pix_fmt,
+        "-s",
+        f"{encoder_settings.video_width}x{encoder_settings.video_height}",
+        "-c:a",
+        "copy",
+        "-threads",
+        "0",
+        output_file,
+        "-y",
+    ]
+
+
+def Cut_Video(cut_video_def: Cut_Video_Def) -> tuple[int, str]:
+    """
+    Attempts a frame accurate cut and join of a video based on start and end cut frames.
+
+    Args:
+        cut_video_def(Cut_Video_Def): Cut video definition
+
+
+    Returns:
+        tuple[int, str]:
+        - arg 1: Status code. Returns 1 if cut_video was successful, -2 if cancelled, -1 otherwise.
+        - arg 2: Empty string if all good, otherwise error message
+    """
+
+    ##### Helper
+    def _get_GOP_info(
+        input_file: str,
+        start_time: float,
+    ) -> tuple[int, str, float, float]:
+        """Get the GOP Block I frame start and end times around the start time video file, from the file's
+        keyframe index
+
+        Args:
+            input_file (str): The input file
+            start_time (float): The start time, on the keyframe index timeline
+
+        Returns:
+            tuple[int, str, float, float]: The result (1 if ok, -1 if not),
+                                            the message ("" or "stream" if all iframes, if ok, error message if not )
+                                            the start time of the GOP
+                                            the end time of the GOP
+        """
+
+        assert isinstance(input_file, str) and input_file.strip() != "", (
+            f"{input_file=}. Must be non-empty str"
+        )
+        assert isinstance(start_time, float) and start_time >= 0.0, (
+            f"{start_time=}. Must be int >= 0"
+        )
+
+        keyframe_index = Get_Keyframe_Index(input_file)
+
+        if keyframe_index.error:
+            return -1, keyframe_index.error, -1.0, -1.0
+
+        start_key = keyframe_index.key_at_or_before(start_time)
+        end_key = keyframe_index.key_after(start_time)
+
+        for key_entry in (start_key, end_key):
+            if key_entry != -1 and keyframe_index.open_gops[key_entry]:
+                return -1, "Open GOP detected!", -1.0, -1.0
+
+        start_i_time = keyframe_index.key_times[start_key] if start_key != -1 else -1.0
+        end_i_time = keyframe_index.key_times[end_key] if end_key != -1 else -1.0
+
+        if end_i_time > 0 and start_i_time < 0:
+            start_i_time = keyframe_index.key_times[0]
+
+        return (
+            1,
+            "stream" if keyframe_index.all_intra else "",
+            start_i_time,
+            end_i_time,
+        )
+
+    def stream_copy_segment(
+        input_file: str,
+        output_file: str,
+        start_time: float,
+        end_time: float,
+        keyframe_seek: bool = True,
+    ) -> tuple[int, str]:
+        """
+        Extracts a segment from an input video file using stream copy.
+
+        Args:
+            input_file (str): The input video file to extract the segment from.
+            output_file (str): The output file where the segment will be saved.
+            start_time (float): The start time of the segment.
+            end_time (float): The end time of the segment.
+            keyframe_seek (bool): True, seek before -i to the keyframe nearest start_time. False, seek after -i to
+                start_time exactly, as is needed for files without a keyframe index
+
+        Returns:
+            tuple[int, Optional[float]]: tuple containing result code and
+
+            - arg 1: If the status code is 1, the operation was successful otherwise it failed.
+            - arg 2: If the status code is -1, an error occurred, and the message provides details.
+
+        """
+
+        assert isinstance(input_file, str) and input_file.strip() != "", (
+            f"{input_file=}. Must be a non-empty str"
+        )
+        assert isinstance(output_file, str) and output_file.strip() != "", (
+            f"{output_file=}. Must be a non-empty str"
+        )
+        assert isinstance(start_time, float) and start_time >= 0, (
+            f"{start_time=}. Must be float >= 0"
+        )
+        assert (
+            isinstance(end_time, float) and end_time >= 0.0 and end_time > start_time
+        ), f"{end_time=}. Must be float >= 0.0 and > {start_time=}"
+        assert isinstance(keyframe_seek, bool), f"{keyframe_seek=}. Must be bool"
+
+        if keyframe_seek:
+            seek_input, seek_output, start_time = Seek_Options(
+                input_file=input_file, start_time=start_time, stream_copy=True
+            )
+        else:
+            seek_input, seek_output = [], ["-ss", f"{start_time}"]
+
+        command = [
+            sys_consts.FFMPG,
+            *seek_input,
+            "-i",
+            input_file,
+            *seek_output,
+            "-t",
+            f"{end_time - start_time}",
+            "-c",
+            "copy",
+            "-threads",
+            "0",
+            output_file,
+            "-y",
+        ]
+
+        result, output = Execute_Check_Output(commands=command, debug=False)
+
+        if result == -1:
+            return -1, output  # Output has an error message
+
+        return 1, ""
+
+    def reencode_segment(
+        input_file: str,
+        output_file: str,
+        encoder_settings: Encoding_Details,
+        start_time: float,
+        end_time: float,
+        gop_size: int,
+    ) -> tuple[int, str]:
+        """
+        Reencodes a segment from an input video file with specific settings.
+
+        Args:
+            input_file (str): The input video file to extract the segment from.
+            output_file (str): The output file where the segment will be saved.
+            encoder_settings (Encoding_Details): The encoding settings used in the segment.
+            start_time (float): The start time of the segment.
+            end_time (float): The end time of the segment.
+            gop_size (int): The desired GOP (Group of Pictures) size.
+
+        Returns:
+            Tuple[int, str]: A tuple containing the status code and a message.
+
+            - If the status code is 1, the operation was successful.
+            - If the status code is -1, an error occurred, and the message provides details.
+            - If the status code is -2, the reencode was cancelled.
+        """
+
+        assert isinstance(input_file, str) and input_file.strip() != "", (
+            f"{input_file=}. Must be a non-empty  str"
+        )
+        assert isinstance(output_file, str) and output_file.strip() != "", (
+            f"{output_file=}. Must be a non-empty str"
+        )
+        assert isinstance(encoder_settings, Encoding_Details), (
+            f"{encoder_settings=}. Must be Encoding_Details"
+        )
+        assert isinstance(start_time, float) and start_time >= 0.0, (
+            f"{start_time=}. Must be float >= 0.0"
+        )
+        assert (
+            isinstance(end_time, float) and end_time > 0.0 and end_time > start_time
+        ), f"{end_time=}. Must be float > 0.0 and > {start_time=}"
+        assert isinstance(gop_size, int) and gop_size > 0, (
+            f"{gop_size=}. Must be int > 0"
+        )
+
+        command = _Boundary_Reencode_Command(
+            input_file=input_file,
+            output_file=output_file,
+            encoder_settings=encoder_settings,
+            start_time=start_time,
+            end_time=end_time,
+            gop_size=gop_size,
+        )
+
+        render_cache = Render_Cache()
+        segment_key = render_cache.segment_key(input_file, command)
+
+        if render_cache.get(segment_key, output_file):  # Unchanged since last rendered
+            return 1, ""
+
+        result, message = Execute_Check_Output(
+            commands=command, debug=False, stderr_to_stdout=True
+        )
+
+        if result == -1:
+            return -1, f"Failed to Transcode ({message=}): {input_file=}"
+
+        if result != 1:  # Cancelled, the partial segment must not be cached
+            return result, message
+
+        render_cache.put(segment_key, output_file)
+
+        return 1, ""
+
+    ##### Main
+    assert isinstance(cut_video_def, Cut_Video_Def), (
+        f"{cut_video_def=}. Must be an instance of Cut_Video_Def"
+    )
+
+    file_handler = file_utils.File()
+    encoder_settings = Get_File_Encoding_Info(cut_video_def.input_file)
+    if encoder_settings.error:
+        return -1, f"Failed to get encoder settings: {encoder_settings.error}"
+
+    if encoder_settings.video_frame_rate not in (
+        sys_consts.PAL_SPECS.frame_rate,
+        sys_consts.NTSC_SPECS.frame_rate,
+        sys_consts.PAL_SPECS.field_rate,
+        sys_consts.NTSC_SPECS.field_rate,
+        30,
+    ):
+        return -1, f"Frame Rate Error: {encoder_settings.video_frame_rate}"
+
+    keyframe_index = Get_Keyframe_Index(cut_video_def.input_file)
+
+    if keyframe_index.error:
+        return -1, keyframe_index.error
+
+    # Cut frames are numbered from the first frame, the keyframe index is on the file's timestamp timeline
+    origin = keyframe_index.key_times[0]
+    start_time = origin + cut_video_def.start_cut / cut_video_def.frame_rate
+    end_time = origin + cut_video_def.end_cut / cut_video_def.frame_rate
+    frame_time = 1 / cut_video_def.frame_rate
+    cut_duration = end_time - start_time
+
+    result, message, start_start_rencode_time, start_end_rencode_time = _get_GOP_info(
+        input_file=cut_video_def.input_file,
+        start_time=start_time,
+    )
+
+    if result == -1:
+        return result, message
+
+    result, message, end_start_rencode_time, end_end_rencode_time = _get_GOP_info(
+        input_file=cut_video_def.input_file,
+        start_time=end_time,
+    )
+
+    # The stream copy seek snaps to the keyframe nearest stream_start, so the GOP boundaries are used as they are
+    stream_start = max(start_end_rencode_time, origin)
+    stream_end = end_start_rencode_time
+
+    if result == -1:
+        return result, message
+
+    if message == "stream":  # All i frames like DV video make for a stream copy cut
+        result, message = stream_copy_segment(
+            input_file=cut_video_def.input_file,
+            output_file=cut_video_def.output_file,
+            start_time=start_time,
+            end_time=end_time,
+        )
+
+        if result == -1:
+            return -1, message
+    else:  # We have GOPS with I,P,B frames and need to reencode start and end GOP blocks to cut accurately
+        concat_files = []
+        _, _, input_extension = file_handler.split_file_path(cut_video_def.input_file)
+        output_dir, output_file_name, _ = file_handler.split_file_path(
+            cut_video_def.output_file
+        )
 
-    file_handler = file_utils.File()
+        start_offset = (start_time - start_start_rencode_time) + frame_time
 
-    if not file_handler.file_exists(image_filename):
-        return -1, f"File not found: {image_filename}".encode("utf-8")
+        if start_offset < 0:
+            return -1, f"Did not find start I frame  {start_offset} "
 
-    command = [
-        sys_consts.CONVERT,
-        image_filename,
-        "-resize",
-        f"{width}x{height} {'>' if keep_aspect_ratio else ''}>",
-        "png:-",
-    ]
+        ##### Reencode Start GOP Block
+        if start_end_rencode_time - start_start_rencode_time > 0:
+            reencode_start_seg_file = file_handler.file_join(
+                dir_path=output_dir,
+                file_name=f"reencode_start_segment_{cut_video_def.tag}",
+                ext=input_extension,
+            )
 
-    try:
-        with subprocess.Popen(
-            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-        ) as process:
-            stdout, stderr = process.communicate()
+            result, message = reencode_segment(
+                input_file=cut_video_def.input_file,
+                output_file=reencode_start_seg_file,
+                encoder_settings=encoder_settings,
+                start_time=start_start_rencode_time,
+                end_time=start_end_rencode_time,
+                gop_size=1,  # Force all frames to I frame in the GOP block, so we can cut in and out where we want,
+            )
 
-            if process.returncode == 0:
-                return 1, stdout
-            else:
-                print(f"Error converting image: {stderr.decode()}")
-                return -1, f"Error converting image: {stderr.decode()}".encode("utf-8")
-    except Exception as e:
-        return -1, f"Unexpected error: {e}".encode("utf-8")
+            if result != 1:
+                return result, message
 
+            concat_files.append(reencode_start_seg_file)
+        else:
+            print("Warning: Skipping zero-duration re-encode start segment.")
 
-def Write_Image_On_Image(
-    base_image_data: bytes,
-    overlay_image_data: bytes,
-    x: int,
-    y: int,
-    gravity: str = Gravity.NORTHWEST.value,
-) -> tuple[int, bytes]:
-    """
-    Overlays an image (provided as bytes) onto another base image (provided as bytes)
-    using ImageMagick and returns the modified image as a byte string (PNG format).
+        ##### Make a stream copy of the untouched oart of the file
+        if end_start_rencode_time - start_end_rencode_time > 0:
+            streamcopy_seg_file = file_handler.file_join(
+                dir_path=output_dir,
+                file_name=f"stream_copy_segment_{cut_video_def.tag}",
+                ext=input_extension,
+            )
 
-    Args:
-        base_image_data (bytes): The base image data in bytes format
-        overlay_image_data (bytes): The overlay image data in bytes format
-        x (int): The x-coordinate
-        y (int): The y-coordinate
-        gravity (str): The gravity positioning of the overlay image ('northwest', 'center', etc.)
+            result, message = stream_copy_segment(
+                input_file=cut_video_def.input_file,
+                output_file=streamcopy_seg_file,
+                start_time=stream_start,
+                end_time=stream_end,
+            )
 
-    Returns:
-        tuple(int, bytes):
-            - arg1: 1 (ok) or -1 (error)
-            - arg2: The modified image data as a byte string (PNG format) on success, empty bytes on error
-    """
-    assert isinstance(base_image_data, bytes) and base_image_data.strip() != "", (
-        f"{base_image_data=}. Must be a non-empty bytes"
-    )
-    assert isinstance(overlay_image_data, bytes) and base_image_data.strip() != "", (
-        f"{base_image_data=}. Must be a non-empty bytes"
-    )
-    assert isinstance(x, int) and x >= 0, f"{x=}. Must be a non-negative int"
-    assert isinstance(y, int) and y >= 0, f"{y=}. Must be a non-negative int"
-    assert isinstance(gravity, str) and gravity.strip().lower() in [
-        member.value for member in Gravity
-    ], (
-        f"{gravity=} must be a valid gravity string from {[member.value for member in Gravity]}"
-    )
+            if result == -1:
+                return -1, message
 
-    try:
-        SEPARATOR: Final[bytes] = b"##ImageSeparator##"
+            concat_files.append(streamcopy_seg_file)
+        else:
+            print("Warning: Skipping zero-duration stream copy segment.")
 
-        stdin_data = base_image_data + SEPARATOR + overlay_image_data
+        ##### Reencode End GOP Block
+        if end_end_rencode_time - end_start_rencode_time > 0:
+            reencode_end_seg_file = file_handler.file_join(
+                dir_path=output_dir,
+                file_name=f"reencode_end_segment_{cut_video_def.tag}",
+                ext=input_extension,
+            )
 
-        command = [
-            sys_consts.CONVERT,
-            "-gravity",
-            gravity,
-            "-page",
-            f"+{x}+{y}",
-            "-",
-            "png:-",
-        ]
+            result, message = reencode_segment(
+                input_file=cut_video_def.input_file,
+                output_file=reencode_end_seg_file,
+                encoder_settings=encoder_settings,
+                start_time=end_start_rencode_time,
+                end_time=end_end_rencode_time,
+                gop_size=1,  # Force all frames to I frame in the GOP block, so we can cut in and out where we want,
+            )
 
-        # Execute the command with input and output pipes
-        process = subprocess.Popen(
-            command,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-        stdout, stderr = process.communicate(input=stdin_data)
+            if result != 1:
+                return result, message
 
-        if process.returncode == 0:
-            return 1, stdout
+            concat_files.append(reencode_end_seg_file)
         else:
-            return -1, f"Failed To Overlay An Image (Err 1) {stderr.decode()}".encode(
-                "utf-8"
+            print("Warning: Skipping zero-duration re-encode end segment.")
+
+        if concat_files:
+            temp_output_file = file_handler.file_join(
+                dir_path=output_dir,
+                file_name=f"{output_file_name}_temp",
+                ext=input_extension,
             )
-    except Exception as e:
-        return -1, f"Failed To Overlay An Image (Err 2) {e}".encode("utf-8")
 
+            # Join re-encoded_start segment, stream_copy segment and re-encoded end segment to make the final frame
+            # accurate cut file with nearly no loss
+            result, message, _ = Concatenate_Videos(
+                video_files=concat_files,
+                output_file=temp_output_file,
+                delete_temp_files=True,
+                debug=False,
+            )
 
-def Write_Text_On_Image(
-    image_data: bytes,
-    text: str,
-    x: int,
-    y: int,
-    font: str,
-    pointsize: int,
-    color: str,
-    gravity: str = Gravity.NORTHWEST.value,
-) -> tuple[int, bytes]:
-    """
-    Writes text on an image (provided as bytes) and returns the modified image as a byte string (PNG format).
+            if result == -1:
+                return -1, message
 
-    Args:
-        image_data (bytes): The image data in bytes format (e.g., from reading a file)
-        text (str): The text to be written
-        x (int): The x co-ordinate
-        y (int): The y co-ordinate
-        font (str): The font of the text
-        pointsize (int): The point size of the text
-        color (str): The color of the text
-        gravity: (str): The gravity positioning of the text
+            result, message = stream_copy_segment(
+                input_file=temp_output_file,
+                output_file=cut_video_def.output_file,
+                start_time=start_offset,
+                end_time=start_offset + cut_duration + frame_time,
+                keyframe_seek=False,  # The temp file is not indexed and is only one cut long
+            )
 
-    Returns:
-        tuple(int, bytes):
-            - arg1: 1, ok, -1, error.
-            - arg2: The modified image data as a byte string (PNG format) on success empty bytes on error.
-    """
+            if result == -1:
+                return -1, message
 
-    assert isinstance(gravity, str) and gravity.strip().lower() in [
-        member.value for member in Gravity
-    ], (
-        f"{gravity=} must be a valid gravity string from {[member.value for member in Gravity]}"
-    )
+            if file_handler.remove_file(temp_output_file) == -1:
+                return -1, f"Failed to remove {temp_output_file}"
 
-    assert isinstance(image_data, bytes) and image_data != b"", (
-        f"{image_data=}. Must be non-empty bytes"
-    )
-    assert isinstance(text, str), f"{text=}. Must be str"
-    assert isinstance(font, str) and font.strip() != "", (
-        f"{font=}. Must be non-empty str"
-    )
-    assert isinstance(x, int) and x > 0, f"{x=}. Must be int > 0"
-    assert isinstance(pointsize, int) and pointsize > 0, (
-        f"{pointsize=}. Must be int > 0"
-    )
-    assert isinstance(y, int) and y > 0, f"{y=}. Must be int > 0"
+    return 1, ""
 
-    assert isinstance(color, str) and color.upper() in Color.__members__, (
-        f"{color=}. Must be one of {[member.name for member in Color]}"
-    )
 
-    try:
-        # Construct ImageMagick command (pipe image data as input)
-        command = [
-            sys_consts.CONVERT,
-            "-",  # Read input from standard input (pipe)
-            "-background",
-            "none",  # Transparent background
-            "-fill",
-            color,
-            "-gravity",
-            gravity,
-            "-font",
-            font,
-            "-pointsize",
-            f"{pointsize}",
-            "-annotate",
-            f"+{x}+{y}",
-            f"{text}",
-            "PNG:-",  # Output to standard output (pipe)
-        ]
+@dataclasses.dataclass(slots=True)
+class _Cut_Batch_Plan:
+    """How a batch of frame accurate cuts of one video file is made. Each cut is an optional reencoded head, a stream
+    copied body of whole GOPs and an optional reencoded tail
+    """
 
-        process = subprocess.Popen(
-            command,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
+    encoder_settings: Encoding_Details
+    keyframe_index: Keyframe_Index
+    # Cut_Video_Def, head file, body keyframe entries, tail file. An empty file or a None body is not needed
+    cuts: list[tuple[Cut_Video_Def, str, tuple[int, int] | None, str]] = (
+        dataclasses.field(default_factory=list)
+    )
+    reencode_commands: list[list[str]] = dataclasses.field(default_factory=list)
 
-        # Send the image data directly
-        stdout, stderr = process.communicate(input=image_data)
+    @property
+    def key_count(self) -> int:
+        """The number of keyframes, a body ending on this keyframe entry runs to the end of the file"""
+        return len(self.keyframe_index.key_times)
 
-        if process.returncode != 0:
-            return -1, stderr
+    def key_time(self, key_entry: int) -> float:
+        """
+        Returns the time of a keyframe entry
 
-        return 1, stdout
+        Args:
+            key_entry (int): The keyframe entry, key_count being the end of the file
 
-    except Exception as e:
-        return -1, f"Error processing image: {str(e)}".encode("utf-8")
+        Returns:
+            float: The time in seconds, on the file's timestamp timeline
+        """
+        if key_entry == self.key_count:
+            return (
+                self.keyframe_index.key_times[0] + self.encoder_settings.video_duration
+            )
 
+        return self.keyframe_index.key_times[key_entry]
 
-def Write_Text_On_File(
-    input_file: str, text: str, x: int, y: int, font: str, pointsize: int, color: str
-) -> tuple[int, str]:
+
+def _Plan_Cut_Batch(
+    cut_video_defs: list[Cut_Video_Def], segment_folder: str, segment_prefix: str
+) -> tuple[int, str, _Cut_Batch_Plan | None]:
     """
-    Writes text on a file
+    Plans frame accurate cuts of one video file from its keyframe index. The body of a cut runs from the first
+    keyframe at or after its start to the last keyframe at or before its end, the head and tail either side of the
+    body are reencoded. A cut without a whole GOP is reencoded in full as its head.
 
     Args:
-        input_file (str): The file on which the text will be written
-        text (str): The text to be written
-        x (int): The x co-ordinate
-        y (int): The y co-ordinate
-        font (str): The font of the text
-        pointsize (int): The point size of the text
-        color (str): The color of the text
+        cut_video_defs (list[Cut_Video_Def]): The cuts, all of the same input file at the same frame rate
+        segment_folder (str): The folder the reencoded heads and tails are written to
+        segment_prefix (str): Starts the file names of the reencoded heads and tails
 
     Returns:
-        tuple[int,str]:
-        - arg1: 1 OK, -1 Error,
-        - arg2: Error message or "" if ok
+        tuple[int, str, _Cut_Batch_Plan | None]:
+        - arg 1: 1 if the cuts were planned, -1 otherwise
+        - arg 2: Empty string if all good, otherwise error message
+        - arg 3: The plan, None if there was an error
     """
-    assert isinstance(input_file, str) and input_file.strip() != "", (
-        f"{input_file=}. Must be non-empty str"
+    assert isinstance(cut_video_defs, list) and cut_video_defs, (
+        f"{cut_video_defs=}. Must be a non-empty list of Cut_Video_Def"
     )
-    assert isinstance(text, str), f"{text=}. Must be str"
-    assert isinstance(font, str) and font.strip() != "", (
-        f"{font=}. Must be non-empty str"
+    assert (
+        len({
+            (cut_video_def.input_file, cut_video_def.frame_rate)
+            for cut_video_def in cut_video_defs
+        })
+        == 1
+    ), f"{cut_video_defs=}. Must all cut the same input file at the same frame rate"
+    assert isinstance(segment_folder, str) and segment_folder.strip() != "", (
+        f"{segment_folder=}. Must be a non-empty str"
     )
-    assert isinstance(x, int) and x > 0, f"{x=}. Must be int > 0"
-    assert isinstance(pointsize, int) and pointsize > 0, (
-        f"{pointsize=}. Must be int > 0"
+    assert isinstance(segment_prefix, str) and segment_prefix.strip() != "", (
+        f"{segment_prefix=}. Must be a non-empty str"
     )
-    assert isinstance(y, int) and y > 0, f"{y=}. Must be int > 0"
 
-    assert isinstance(color, str) and color.upper() in Color.__members__, (
-        f"{color=}. Must be one of {[member.name for member in Color]}"
+    input_file = cut_video_defs[0].input_file
+    frame_rate = cut_video_defs[0].frame_rate
+    half_frame = 0.5 / frame_rate
+
+    file_handler = file_utils.File()
+
+    encoder_settings = Get_File_Encoding_Info(input_file)
+    if encoder_settings.error:
+        return -1, f"Failed to get encoder settings: {encoder_settings.error}", None
+
+    if encoder_settings.video_frame_rate not in (
+        sys_consts.PAL_SPECS.frame_rate,
+        sys_consts.NTSC_SPECS.frame_rate,
+        sys_consts.PAL_SPECS.field_rate,
+        sys_consts.NTSC_SPECS.field_rate,
+        30,
+    ):
+        return -1, f"Frame Rate Error: {encoder_settings.video_frame_rate}", None
+
+    keyframe_index = Get_Keyframe_Index(input_file)
+
+    if keyframe_index.error:
+        return -1, keyframe_index.error, None
+
+    cut_plan = _Cut_Batch_Plan(
+        encoder_settings=encoder_settings, keyframe_index=keyframe_index
     )
+    _, _, input_extension = file_handler.split_file_path(input_file)
 
-    if not os.path.exists(input_file):
-        return -1, f"{input_file} Does Not Exist!"
+    # Cut frames are numbered from the first frame, the keyframe index is on the file's timestamp timeline
+    origin = keyframe_index.key_times[0]
 
-    command = [
-        sys_consts.CONVERT,
-        input_file,
-        "-fill",
-        color,
-        "-gravity",
-        "NorthWest",
-        "-font",
-        font,
-        "-pointsize",
-        f"{pointsize}",
-        "-annotate",
-        f"+{x}+{y}",
-        text,
-        input_file,
-    ]
+    for cut_index, cut_video_def in enumerate(cut_video_defs):
+        start_time = origin + cut_video_def.start_cut_secs
+        end_time = origin + cut_video_def.end_cut_secs
 
-    return Execute_Check_Output(commands=command)
+        # First keyframe at or after the start and last keyframe at or before the end, allowing for rounding
+        body_start = keyframe_index.key_at_or_before(start_time + half_frame)
 
+        if body_start == -1 or cut_plan.key_time(body_start) < start_time - half_frame:
+            body_start = keyframe_index.key_after(start_time + half_frame)
 
-def Get_Text_Dims(text: str, font: str, pointsize: int) -> tuple[int, int]:
+        if end_time >= cut_plan.key_time(cut_plan.key_count) - (2 * half_frame):
+            body_end = cut_plan.key_count
+        else:
+            body_end = keyframe_index.key_at_or_before(end_time + half_frame)
+
+        head_file = file_handler.file_join(
+            dir_path=segment_folder,
+            file_name=f"{segment_prefix}_start_{cut_index}",
+            ext=input_extension,
+        )
+        tail_file = file_handler.file_join(
+            dir_path=segment_folder,
+            file_name=f"{segment_prefix}_end_{cut_index}",
+            ext=input_extension,
+        )
+
+        if body_start == -1 or body_start >= body_end:  # No whole GOP, reencode it all
+            cut_plan.reencode_commands.append(
+                _Boundary_Reencode_Command(
+                    input_file=input_file,
+                    output_file=head_file,
+                    encoder_settings=encoder_settings,
+                    start_time=start_time,
+                    end_time=end_time,
+                    gop_size=max(1, cut_video_def.end_cut - cut_video_def.start_cut),
+                )
+            )
+            cut_plan.cuts.append((cut_video_def, head_file, None, ""))
+            continue
+
+        if keyframe_index.open_gops[body_start]:
+            return -1, "Open GOP detected!", None
+
+        if cut_plan.key_time(body_start) - start_time > half_frame:
+            cut_plan.reencode_commands.append(
+                _Boundary_Reencode_Command(
+                    input_file=input_file,
+                    output_file=head_file,
+                    encoder_settings=encoder_settings,
+                    start_time=start_time,
+                    end_time=cut_plan.key_time(body_start),
+                    gop_size=max(
+                        1,
+                        round(
+                            (cut_plan.key_time(body_start) - start_time) * frame_rate
+                        ),
+                    ),
+                )
+            )
+        else:
+            head_file = ""
+
+        if (
+            body_end < cut_plan.key_count
+            and end_time - cut_plan.key_time(body_end) > half_frame
+        ):
+            cut_plan.reencode_commands.append(
+                _Boundary_Reencode_Command(
+                    input_file=input_file,
+                    output_file=tail_file,
+                    encoder_settings=encoder_settings,
+                    start_time=cut_plan.key_time(body_end),
+                    end_time=end_time,
+                    gop_size=max(
+                        1, round((end_time - cut_plan.key_time(body_end)) * frame_rate)
+                    ),
+                )
+            )
+        else:
+            tail_file = ""
+
+        cut_plan.cuts.append((
+            cut_video_def,
+            head_file,
+            (body_start, body_end),
+            tail_file,
+        ))
+
+    return 1, "", cut_plan
+
+
+def _Render_Boundaries(
+    input_file: str,
+    reencode_commands: list[list[str]],
+    cancellation_callback: Optional[Callable[[], bool]] = None,
+) -> list[tuple[list[str], str, concurrent.futures.Future]]:
     """
-    Gets the text dimensions in pixels
+    Fetches boundary segments rendered by an earlier export from the render cache and starts reencoding the rest on
+    the Async_Tool_Engine, so the caller can get on with other work while they render
 
     Args:
-        text (str): The text string to be measured
-        font (str): The font of the text
-        pointsize (int): The text point size
+        input_file (str): The source video file
+        reencode_commands (list[list[str]]): The boundary reencode commands
+        cancellation_callback (Optional[Callable[[], bool]]): Returns True when the reencodes are to be cancelled.
+            Defaults to None (Cancel_All_Tasks)
 
     Returns:
-        tuple[int,int]: The width and height of the text. Both are -1 if there is an error
+        list[tuple[list[str], str, concurrent.futures.Future]]: The command, render cache segment key and future of
+            each reencode started, to be passed to _Boundaries_Rendered
     """
-    assert isinstance(text, str), f"{text=}. Must be str"
-    assert isinstance(font, str) and font.strip() != "", (
-        f"{font=}. Must be noon-empty str"
-    )
-    assert isinstance(pointsize, int) and pointsize > 0, (
-        f"{pointsize=}. Must be int > 0"
+    assert isinstance(input_file, str) and input_file.strip() != "", (
+        f"{input_file=}. Must be a non-empty str"
     )
-
-    # Run the ImageMagick command to measure the text
-    result, message = Execute_Check_Output(
-        commands=[
-            sys_consts.CONVERT,
-            "-background",
-            "none",
-            "-fill",
-            "black",
-            "-font",
-            font,
-            "-pointsize",
-            str(pointsize),
-            "label:" + text,
-            "-format",
-            "%[fx:w]x%[fx:h]",
-            "info:",
-        ],
-        debug=False,
+    assert isinstance(reencode_commands, list), f"{reencode_commands=}. Must be a list"
+    assert callable(cancellation_callback) or cancellation_callback is None, (
+        f"{cancellation_callback=}. Must be a function or None"
     )
 
-    if result == -1:
-        return -1, -1
-
-    # Convert the message to width and height
-    dimensions = message.strip().split("x")
+    render_cache = Render_Cache()
+    engine = Async_Tool_Engine()
+    renders = []
 
-    if (
-        not dimensions
-        or len(dimensions) != 2
-        or dimensions[0].strip() == ""
-        or dimensions[1].strip() == ""
-    ):  # Very rare error cases
-        return -1, -1
+    for commands in reencode_commands:
+        segment_key = render_cache.segment_key(input_file, commands)
 
-    width = int(dimensions[0])
-    height = int(dimensions[1])
+        if not render_cache.get(segment_key, commands[-2]):
+            renders.append((
+                commands,
+                segment_key,
+                engine.submit(
+                    commands,
+                    stderr_to_stdout=True,
+                    cancellation_callback=cancellation_callback,
+                    debug=False,
+                    # Only the end of ffmpeg's log is wanted, for the error message
+                    stdout_capture=Output_Capture(policy=CAPTURE_TAIL),
+                ),
+            ))
 
-    return width, height
+    return renders
 
 
-def Get_Codec(input_file: str) -> tuple[int, str]:
+def _Boundaries_Rendered(
+    input_file: str, renders: list[tuple[list[str], str, concurrent.futures.Future]]
+) -> tuple[int, str]:
     """
-    Get the codec name of the video file using FFprobe.
+    Waits for the boundary reencodes started by _Render_Boundaries and adds the segments to the render cache
 
     Args:
-        input_file (str): Path to the input video file.
+        input_file (str): The source video file
+        renders (list[tuple[list[str], str, concurrent.futures.Future]]): From _Render_Boundaries
 
     Returns:
         tuple[int, str]:
-        - arg 1: Status code. Returns 1 if the codec name was obtained successfully, -1 otherwise.
-        - arg 2: Codec name if obtained successfully, otherwise error message
-
+        - arg 1: 1 if all the boundaries were rendered, -2 if a render was cancelled, -1 otherwise
+        - arg 2: Empty string if all good, otherwise error message
     """
-    assert isinstance(input_file, str) and input_file.strip() != "", (
-        "Input file must be a string."
-    )
+    assert isinstance(renders, list), f"{renders=}. Must be a list"
 
-    commands = [
-        sys_consts.FFPROBE,
-        "-v",
-        "error",
-        "-select_streams",
-        "v:0",
-        "-show_entries",
-        "stream=codec_name",
-        "-of",
-        "default=nokey=1:noprint_wrappers=1",
-        input_file,
-    ]
+    render_cache = Render_Cache()
 
-    result, output = Execute_Check_Output(commands)
+    for commands, segment_key, render_future in renders:
+        result, message = render_future.result()
 
-    if result == -1:
-        return -1, "Failed To Get Codec Name!"
+        if result == -1:
+            return -1, f"Failed to Transcode ({message=}): {input_file=}"
+
+        if result != 1:  # Cancelled, the partial segment must not be cached
+            return result, message
+
+        render_cache.put(segment_key, commands[-2])
 
-    return 1, output.strip()
+    return 1, ""
 
 
-def Cut_Video(cut_video_def: Cut_Video_Def) -> tuple[int, str]:
+def Cut_Video_Batch(
+    cut_video_defs: list[Cut_Video_Def],
+    cancellation_callback: Optional[Callable[[], bool]] = None,
+    progress_callback: Optional[Callable[[float, str], None]] = None,
+) -> tuple[int, str]:
     """
-    Attempts a frame accurate cut and join of a video based on start and end cut frames.
+    Makes frame accurate cuts of one video file in a single pass over the source. The GOP aligned body of every cut
+    is stream copied by one segment muxer run over the span the bodies cover, split at the keyframes that bound them. The partial GOPs at the
+    cut boundaries are reencoded in parallel with it, and each cut is then joined from its boundary and body segments.
 
     Args:
-        cut_video_def(Cut_Video_Def): Cut video definition
-
+        cut_video_defs (list[Cut_Video_Def]): The cuts, all of the same input file. Cuts may overlap
+        cancellation_callback (Optional[Callable[[], bool]]): Returns True when the cuts are to be cancelled.
+            Defaults to None (Cancel_All_Tasks)
+        progress_callback (Optional[Callable[[float, str], None]]): Called with the percentage done and a message.
+            Defaults to None
 
     Returns:
         tuple[int, str]:
-        - arg 1: Status code. Returns 1 if cut_video was successful, -1 otherwise.
+        - arg 1: Status code. Returns 1 if all the cuts were made, -2 if cancelled, -1 otherwise.
         - arg 2: Empty string if all good, otherwise error message
     """
+    assert isinstance(cut_video_defs, list) and cut_video_defs, (
+        f"{cut_video_defs=}. Must be a non-empty list of Cut_Video_Def"
+    )
+    assert all(
+        isinstance(cut_video_def, Cut_Video_Def) for cut_video_def in cut_video_defs
+    ), f"{cut_video_defs=}. Must be a list of Cut_Video_Def"
+    assert (
+        len({
+            (cut_video_def.input_file, cut_video_def.frame_rate)
+            for cut_video_def in cut_video_defs
+        })
+        == 1
+    ), f"{cut_video_defs=}. Must all cut the same input file at the same frame rate"
+    assert callable(cancellation_callback) or cancellation_callback is None, (
+        f"{cancellation_callback=}. Must be a function or None"
+    )
+    assert callable(progress_callback) or progress_callback is None, (
+        f"{progress_callback=}. Must be a function or None"
+    )
 
-    ##### Helper
-    def _get_GOP_info(
-        input_file: str,
-        start_time: float,
-    ) -> tuple[int, str, float, float]:
-        """Get the GOP Block I frame start and end times around the start time video file
-
-        Args:
-            input_file (str): The input file
-            start_time (float): The start time
-
-        Returns:
-            tuple[int, str, float, float]: The result (1 if ok, -1 if not),
-                                            the message ("" or "stream" if all iframes, if ok, error message if not )
-                                            the start time of the GOP
-                                            the end time of the GOP
-        """
+    input_file = cut_video_defs[0].input_file
+    half_frame = 0.5 / cut_video_defs[0].frame_rate
 
-        assert isinstance(input_file, str) and input_file.strip() != "", (
-            f"{input_file=}. Must be non-empty str"
-        )
-        assert isinstance(start_time, float) and start_time >= 0.0, (
-            f"{start_time=}. Must be int >= 0"
-        )
+    file_handler = file_utils.File()
+    output_dir, _, _ = file_handler.split_file_path(cut_video_defs[0].output_file)
+    _, _, input_extension = file_handler.split_file_path(input_file)
+    batch_id = Get_Unique_Id()
 
-        search_window = 5  # Initial search window (seconds)
-        current_search_start = max(0.0, start_time - search_window)
-        found_iframe = False
-        start_i_time = -1.0
-        end_i_time = -1.0
-        stream_copy = False
-        max_searches = (
-            10  # Works out at 50 seconds if no I-frames found not likely to find any
-        )
-        search_count = 0
+    result, message, cut_plan = _Plan_Cut_Batch(
+        cut_video_defs=cut_video_defs,
+        segment_folder=output_dir,
+        segment_prefix=f"reencode_segment_{batch_id}",
+    )
 
-        # Find the nearest I-frame before start_time
-        while (
-            not found_iframe
-            and current_search_start >= 0.0
-            and search_count < max_searches
-        ):
-            commands = [
-                sys_consts.FFPROBE,
-                "-v",
-                "error",
-                "-select_streams",
-                "v:0",
-                "-show_frames",
-                "-of",
-                "json",
-                "-read_intervals",
-                f"{current_search_start}%+{search_window}",
-                input_file,
-            ]
+    if result != 1:
+        return result, message
 
-            result, message = Execute_Check_Output(
-                commands, debug=False, stderr_to_stdout=True
-            )
+    body_keys = {
+        body_key for _, _, body, _ in cut_plan.cuts if body for body_key in body
+    }
 
-            if result == -1:
-                return -1, message, -1.0, -1.0
+    # Only the span from the first body keyframe to the last is demuxed. The segment muxer starts a segment at the
+    # first keyframe at or after each split time, a split at the last body keyframe starts a segment that is not used
+    span_keys = (min(body_keys), max(body_keys)) if body_keys else (0, 0)
+    split_keys = sorted(
+        key_entry
+        for key_entry in body_keys
+        if span_keys[0] < key_entry < cut_plan.key_count
+    )
+    segment_list_file = file_handler.file_join(
+        dir_path=output_dir, file_name=f"cut_segments_{batch_id}", ext="csv"
+    )
+    segment_files: list[str] = []
+    reencode_files = [commands[-2] for commands in cut_plan.reencode_commands]
 
-            try:
-                iframe_data = json.loads(message)
-            except json.JSONDecodeError:
-                return -1, "JSON Decode Error!", -1.0, -1.0
+    # Boundary GOPs rendered by an earlier export come from the render cache, the rest are reencoded alongside the
+    # single demux pass that stream copies the bodies
+    renders = _Render_Boundaries(
+        input_file=input_file,
+        reencode_commands=cut_plan.reencode_commands,
+        cancellation_callback=cancellation_callback,
+    )
 
-            try:
-                i_frames = [
-                    frame
-                    for frame in iframe_data["frames"]
-                    if frame["pict_type"] == "I" and frame["key_frame"] == 1
+    try:
+        if body_keys:
+            seek_input, seek_output, span_start = Seek_Options(
+                input_file=input_file,
+                start_time=cut_plan.key_time(span_keys[0]),
+                stream_copy=True,
+            )
+            span_duration = cut_plan.key_time(span_keys[1]) - span_start
+
+            if span_keys[1] < cut_plan.key_count:
+                # A second past the last body keyframe, so it is demuxed and opens the unused segment
+                seek_output += ["-t", f"{span_duration + 1:.6f}"]
+
+            # Segment times are from the start of the span
+            if split_keys:
+                split_option = [
+                    "-segment_times",
+                    ",".join(
+                        f"{cut_plan.key_time(key_entry) - span_start - half_frame:.6f}"
+                        for key_entry in split_keys
+                    ),
                 ]
+            else:  # One body from its keyframe to the end of the file
+                split_option = ["-segment_time", f"{span_duration + 1:.6f}"]
 
-                if not i_frames:
-                    break
-
-                i_frame = i_frames[0]
-                I_Pos = float(i_frame["pkt_pos"])
-                I_Pts = float(i_frame["pts"])
-
-                for frame in reversed(iframe_data["frames"]):  # Search backwards
-                    if (
-                        frame["pict_type"] == "I"
-                        and frame["key_frame"] == 1
-                        and float(frame["pts_time"]) <= start_time
-                    ):
-                        start_i_time = float(frame["pts_time"])
-                        found_iframe = True
+            result, message = Execute_Check_Output(
+                commands=[
+                    sys_consts.FFMPG,
+                    *seek_input,
+                    "-i",
+                    input_file,
+                    *seek_output,
+                    "-c",
+                    "copy",
+                    "-f",
+                    "segment",
+                    *split_option,
+                    "-segment_list",
+                    segment_list_file,
+                    "-segment_list_type",
+                    "csv",
+                    "-reset_timestamps",
+                    "1",
+                    "-threads",
+                    "0",
+                    file_handler.file_join(
+                        dir_path=output_dir,
+                        file_name=f"stream_copy_segment_{batch_id}_%05d",
+                        ext=input_extension,
+                    ),
+                    "-y",
+                ],
+                debug=False,
+                cancellation_callback=cancellation_callback,
+                progress_callback=(
+                    None
+                    if progress_callback is None
+                    else lambda percentage, message: progress_callback(
+                        percentage * 0.8, message
+                    )
+                ),
+                progress_duration=span_duration,
+            )
 
-                        stream_copy = all(
-                            frame["pict_type"] == "I" and frame["key_frame"] == 1
-                            for frame in iframe_data["frames"]
+            if result != 1:
+                return result, message
+
+            # Each csv line is segment file, start time from the start of the span, end time
+            with open(segment_list_file, "r", encoding="utf-8") as segment_list:
+                for line in segment_list:
+                    if line.strip():
+                        segment_name, segment_start, _ = line.strip().rsplit(",", 2)
+                        segment_file = (
+                            segment_name
+                            if os.path.isabs(segment_name)
+                            else file_handler.file_join(output_dir, segment_name)
                         )
 
-                        break
-                    elif frame["pict_type"] == "B":
-                        B_pos = float(frame["pkt_pos"])
-                        B_pts = float(frame["pts"])
+                        segment_files.append(segment_file)
 
-                        if B_pos > I_Pos and B_pts < I_Pts:
+                        if len(segment_files) > 1 and abs(
+                            float(segment_start)
+                            + span_start
+                            - cut_plan.key_time(split_keys[len(segment_files) - 2])
+                        ) > (2 * half_frame):
                             return (
                                 -1,
-                                "Open GOP detected!",
-                                -1.0,
-                                -1.0,
-                            )  # Open GOP detected
+                                f"Segment {segment_file} Did Not Start On A Keyframe",
+                            )
 
-                    current_search_start = max(
-                        0.0, current_search_start - search_window
-                    )
-            except (KeyError, KeyError):
-                return -1, "Failed to get head I-frame!", -1.0, -1.0
+            if len(segment_files) != len(split_keys) + 1:
+                return (
+                    -1,
+                    f"Expected {len(split_keys) + 1} Segments, Got {len(segment_files)}",
+                )
 
-            search_count += 1
+        result, message = _Boundaries_Rendered(input_file=input_file, renders=renders)
 
-        # Get video duration
-        commands = [
-            sys_consts.FFPROBE,
-            "-v",
-            "error",
-            "-show_entries",
-            "format=duration",
-            "-of",
-            "json",
-            input_file,
-        ]
+        if result != 1:
+            return result, message
 
-        result, message = Execute_Check_Output(
-            commands, debug=False, stderr_to_stdout=True
-        )
+        ##### Join each cut from its head, body segments and tail
+        cut_parts: list[list[str]] = []
+        segment_uses: dict[str, int] = {}
 
-        if result == -1:
-            return -1, message, -1.0, -1.0
+        for _, head_file, body, tail_file in cut_plan.cuts:
+            body_segments = []
 
-        try:
-            video_duration = float(json.loads(message)["format"]["duration"])
-        except json.JSONDecodeError:
-            return -1, "JSON Decode Error!", -1.0, -1.0
-        except (ValueError, KeyError):
-            return -1, "Failed to get video duration!", -1.0, -1.0
-
-        found_iframe = False
-        current_search_start = start_i_time
-
-        # Find the nearest I-frame after the start_time
-        while not found_iframe and current_search_start < video_duration:
-            commands = [
-                sys_consts.FFPROBE,
-                "-v",
-                "error",
-                "-select_streams",
-                "v:0",
-                "-show_frames",
-                "-of",
-                "json",
-                "-read_intervals",
-                f"{current_search_start}%+{search_window}",
-                input_file,
-            ]
+            if body is not None:
+                # Segment 0 runs from the first body keyframe to the first split key
+                body_segments = segment_files[
+                    split_keys.index(body[0]) + 1 if body[0] in split_keys else 0 : (
+                        split_keys.index(body[1]) + 1
+                        if body[1] in split_keys
+                        else len(split_keys) + 1
+                    )
+                ]
 
-            result, message = Execute_Check_Output(
-                commands, debug=False, stderr_to_stdout=True
-            )
+                for segment_file in body_segments:
+                    segment_uses[segment_file] = segment_uses.get(segment_file, 0) + 1
 
-            if result == -1:
-                return -1, message, -1.0, -1.0
+            cut_parts.append([
+                part for part in (head_file, *body_segments, tail_file) if part
+            ])
+
+        for cut_index, ((cut_video_def, _, _, _), parts) in enumerate(
+            zip(cut_plan.cuts, cut_parts)
+        ):
+            if cancellation_callback is not None and cancellation_callback():
+                return -2, "Cut Cancelled"
 
-            try:
-                iframe_data = json.loads(message)
-            except json.JSONDecodeError:
-                return -1, "JSON Decode Error!", -1.0, -1.0
+            if len(parts) == 1 and segment_uses.get(parts[0], 0) <= 1:
+                shutil.move(parts[0], cut_video_def.output_file)  # Nothing to join
+            else:
+                result, message, _ = Concatenate_Videos(
+                    video_files=parts,
+                    output_file=cut_video_def.output_file,
+                    delete_temp_files=False,
+                    debug=False,
+                )
 
-            try:
-                i_frames = [
-                    frame
-                    for frame in iframe_data["frames"]
-                    if frame["pict_type"] == "I" and frame["key_frame"] == 1
-                ]
+                if result != 1:
+                    return result, message
 
-                if not i_frames:
-                    break
+            if progress_callback is not None:
+                progress_callback(
+                    80 + (20 * (cut_index + 1) / len(cut_plan.cuts)),
+                    cut_video_def.output_file,
+                )
+    finally:
+        concurrent.futures.wait([render_future for _, _, render_future in renders])
 
-                i_frame = i_frames[0]
-                I_Pos = float(i_frame["pkt_pos"])
-                I_Pts = float(i_frame["pts"])
+        for temp_file in (*segment_files, *reencode_files, segment_list_file):
+            if file_handler.file_exists(temp_file):
+                file_handler.remove_file(temp_file)
 
-                for frame in iframe_data["frames"]:  # Search forwards
-                    if (
-                        frame["pict_type"] == "I"
-                        and frame["key_frame"] == 1
-                        and float(frame["pts_time"]) > start_time
-                    ):
-                        end_i_time = float(frame["pts_time"])
-                        found_iframe = True
-                        stream_copy = all(
-                            frame["pict_type"] == "I" and frame["key_frame"] == 1
-                            for frame in iframe_data["frames"]
-                        )
+    return 1, ""
 
-                        break
 
-                    elif frame["pict_type"] == "B":
-                        B_pos = float(frame["pkt_pos"])
-                        B_pts = float(frame["pts"])
+def _Playlist_File_Directives(playlist_file: str) -> list[str]:
+    """
+    Returns the file directives of an ffconcat playlist from Assemble_Video_Playlist, in playlist order. The boundary
+    segment files are relative to the playlist, the source file entries are absolute paths
 
-                        if B_pos > I_Pos and B_pts < I_Pts:
-                            return (
-                                -1,
-                                "Open GOP detected!",
-                                -1.0,
-                                -1.0,
-                            )  # Open GOP detected
+    Args:
+        playlist_file (str): The ffconcat playlist file
 
-                if found_iframe:
-                    break
-            except (KeyError, ValueError):
-                return -1, "Failed to get tail I-frame!", -1.0, -1.0
+    Returns:
+        list[str]: The unquoted file directive paths, empty if the playlist cannot be read
+    """
+    assert isinstance(playlist_file, str) and playlist_file.strip() != "", (
+        f"{playlist_file=}. Must be a non-empty str"
+    )
 
-            current_search_start += search_window
+    file_paths = []
 
-        if end_i_time > 0 and start_i_time < 0:
-            start_i_time = 0.0
+    try:
+        with open(playlist_file, "r", encoding="utf-8") as playlist:
+            for line in playlist:
+                line = line.strip()
 
-        return (
-            1,
-            "stream" if stream_copy else "",
-            start_i_time,
-            end_i_time,
-        )
+                if not line.startswith("file "):
+                    continue
 
-    def stream_copy_segment(
-        input_file: str,
-        output_file: str,
-        start_time: float,
-        end_time: float,
-    ) -> tuple[int, str]:
-        """
-        Extracts a segment from an input video file using stream copy.
+                file_path = line[5:].strip()
 
-        Args:
-            input_file (str): The input video file to extract the segment from.
-            output_file (str): The output file where the segment will be saved.
-            start_time (float): The start time of the segment.
+                if len(file_path) > 1 and file_path[0] == file_path[-1] == "'":
+                    file_path = file_path[1:-1].replace("'\\''", "'")
 
-        Returns:
-            tuple[int, Optional[float]]: tuple containing result code and
+                if file_path:
+                    file_paths.append(file_path)
+    except OSError:
+        pass  # No earlier playlist
 
-            - arg 1: If the status code is 1, the operation was successful otherwise it failed.
-            - arg 2: If the status code is -1, an error occurred, and the message provides details.
+    return file_paths
 
-        """
 
-        assert isinstance(input_file, str) and input_file.strip() != "", (
-            f"{input_file=}. Must be a non-empty str"
-        )
-        assert isinstance(output_file, str) and output_file.strip() != "", (
-            f"{output_file=}. Must be a non-empty str"
-        )
-        assert isinstance(start_time, float) and start_time >= 0, (
-            f"{start_time=}. Must be float >= 0"
-        )
-        assert (
-            isinstance(end_time, float) and end_time >= 0.0 and end_time > start_time
-        ), f"{end_time=}. Must be float >= 0.0 and > {start_time=}"
+def _Playlist_Segment_Files(playlist_file: str) -> set[str]:
+    """
+    Returns the boundary segment files an ffconcat playlist from Assemble_Video_Playlist uses
 
-        command = [
-            sys_consts.FFMPG,
-            "-i",
-            input_file,
-            "-ss",
-            f"{start_time}",
-            "-t",
-            f"{end_time - start_time}",
-            "-c",
-            "copy",
-            "-threads",
-            "0",
-            output_file,
-            "-y",
-        ]
+    Args:
+        playlist_file (str): The ffconcat playlist file
 
-        result, output = Execute_Check_Output(commands=command, debug=False)
+    Returns:
+        set[str]: The absolute paths of the boundary segment files, empty if the playlist cannot be read
+    """
+    return {
+        os.path.abspath(os.path.join(os.path.dirname(playlist_file), file_path))
+        for file_path in _Playlist_File_Directives(playlist_file)
+        if not os.path.isabs(file_path)
+    }
 
-        if result == -1:
-            return -1, output  # Output has an error message
 
-        return 1, ""
+def Playlist_Source_File(playlist_file: str) -> str:
+    """
+    Returns the source file an ffconcat playlist from Assemble_Video_Playlist cuts, its boundary segments are
+    reencoded in the same container
 
-    def reencode_segment(
-        input_file: str,
-        output_file: str,
-        encoder_settings: Encoding_Details,
-        start_time: float,
-        end_time: float,
-        gop_size: int,
-    ) -> tuple[int, str]:
-        """
-        Reencodes a segment from an input video file with specific settings.
+    Args:
+        playlist_file (str): The ffconcat playlist file
 
-        Args:
-            input_file (str): The input video file to extract the segment from.
-            output_file (str): The output file where the segment will be saved.
-            encoder_settings (Encoding_Details): The encoding settings used in the segment.
-            start_time (float): The start time of the segment.
-            end_time (float): The end time of the segment.
-            gop_size (int): The desired GOP (Group of Pictures) size.
+    Returns:
+        str: The source file, empty if the playlist cannot be read or only holds boundary segments
+    """
+    for file_path in _Playlist_File_Directives(playlist_file):
+        if os.path.isabs(file_path):
+            return file_path
 
-        Returns:
-            Tuple[int, str]: A tuple containing the status code and a message.
+    return ""
 
-            - If the status code is 1, the operation was successful.
-            - If the status code is -1, an error occurred, and the message provides details.
-        """
 
-        assert isinstance(input_file, str) and input_file.strip() != "", (
-            f"{input_file=}. Must be a non-empty  str"
-        )
-        assert isinstance(output_file, str) and output_file.strip() != "", (
-            f"{output_file=}. Must be a non-empty str"
-        )
-        assert isinstance(encoder_settings, Encoding_Details), (
-            f"{encoder_settings=}. Must be Encoding_Details"
-        )
-        assert isinstance(start_time, float) and start_time >= 0.0, (
-            f"{start_time=}. Must be float >= 0.0"
-        )
-        assert (
-            isinstance(end_time, float) and end_time > 0.0 and end_time > start_time
-        ), f"{end_time=}. Must be float > 0.0 and > {start_time=}"
-        assert isinstance(gop_size, int) and gop_size > 0, (
-            f"{gop_size=}. Must be int > 0"
-        )
+def Remux_Video_Playlist(
+    playlist_file: str,
+    output_file: str,
+    cancellation_callback: Optional[Callable[[], bool]] = None,
+) -> tuple[int, str]:
+    """
+    Writes an ffconcat playlist from Assemble_Video_Playlist out as a video file. The playlist is only a text file
+    pointing into its source, so it cannot be copied, but its streams are stream copied without a reencode
 
-        if encoder_settings.video_scan_type == "interlaced":
-            field_order = f"fieldorder={encoder_settings.video_scan_order}"
+    Args:
+        playlist_file (str): The ffconcat playlist file. Must have the sys_consts.FFCONCAT_EXTN extension
+        output_file (str): The video file written, its extension picks the container. Usually that of the
+            Playlist_Source_File
+        cancellation_callback (Optional[Callable[[], bool]]): Returns True when the remux is to be cancelled.
+            Defaults to None (Cancel_All_Tasks)
 
-            video_filter = [
-                "-vf",
-                f"{field_order}",
-                "-flags:v:0",  # video flags for the first video stream
-                "+ilme+ildct",  # include interlaced motion estimation and interlaced DCT
-                "-alternate_scan:v:0",  # set alternate scan for first video stream (interlace)
-                "1",  # alternate scan value is 1,
-            ]
-        else:
-            video_filter = []
+    Returns:
+        tuple[int, str]:
+        - arg 1: Status code. Returns 1 if the video file was written, -2 if cancelled, -1 otherwise.
+        - arg 2: The output file if all good, otherwise error message
+    """
+    assert isinstance(playlist_file, str) and playlist_file.lower().endswith(
+        f".{sys_consts.FFCONCAT_EXTN}"
+    ), f"{playlist_file=}. Must be a .{sys_consts.FFCONCAT_EXTN} file"
+    assert isinstance(output_file, str) and output_file.strip() != "", (
+        f"{output_file=}. Must be a non-empty str"
+    )
+    assert callable(cancellation_callback) or cancellation_callback is None, (
+        f"{cancellation_callback=}. Must be a function or None"
+    )
 
-        command = [
+    result, message = Execute_Check_Output(
+        commands=[
             sys_consts.FFMPG,
-            "-ss",
-            f"{start_time}",
-            "-fflags",
-            "+genpts",
-            "-i",
-            input_file,
-            "-vsync",
-            "cfr",
-            *video_filter,
-            "-tune",
-            "fastdecode",
-            "-t",
-            f"{end_time - start_time}",
-            "-r",
-            str(encoder_settings.video_frame_rate),
-            "-g",
-            str(gop_size),
-            "-keyint_min",
-            str(gop_size),
-            "-sc_threshold",
+            "-hide_banner",
+            "-nostdin",
+            *Input_Options(playlist_file),
+            "-map",
             "0",
-            "-c:v",
-            encoder_settings.video_codec,
-            "-crf",
-            "18",
-            "-preset",
-            "slow",
-            "-b:v",
-            str(encoder_settings.video_bitrate),
-            "-pix_fmt",
-            encoder_settings.video_pix_fmt,
-            "-s",
-            f"{encoder_settings.video_width}x{encoder_settings.video_height}",
-            "-c:a",
+            "-c",
             "copy",
-            "-threads",
-            "0",
             output_file,
             "-y",
-        ]
+        ],
+        debug=False,
+        cancellation_callback=cancellation_callback,
+    )
 
-        result, message = Execute_Check_Output(
-            commands=command, debug=False, stderr_to_stdout=True
-        )
+    if result != 1:
+        file_handler = file_utils.File()
 
-        if result == -1:
-            return -1, f"Failed to Transcode ({message=}): {input_file=}"
+        if file_handler.file_exists(output_file):
+            file_handler.remove_file(output_file)
 
-        return 1, ""
+        return result, message
 
-    ##### Main
-    assert isinstance(cut_video_def, Cut_Video_Def), (
-        f"{cut_video_def=}. Must be an instance of Cut_Video_Def"
-    )
+    return 1, output_file
 
-    file_handler = file_utils.File()
-    encoder_settings = Get_File_Encoding_Info(cut_video_def.input_file)
-    if encoder_settings.error:
-        return -1, f"Failed to get encoder settings: {encoder_settings.error}"
 
-    if encoder_settings.video_frame_rate not in (
-        sys_consts.PAL_SPECS.frame_rate,
-        sys_consts.NTSC_SPECS.frame_rate,
-        sys_consts.PAL_SPECS.field_rate,
-        sys_consts.NTSC_SPECS.field_rate,
-        30,
-    ):
-        return -1, f"Frame Rate Error: {encoder_settings.video_frame_rate}"
+def Assemble_Video_Playlist(
+    cut_video_defs: list[Cut_Video_Def],
+    playlist_file: str,
+    cancellation_callback: Optional[Callable[[], bool]] = None,
+    progress_callback: Optional[Callable[[float, str], None]] = None,
+) -> tuple[int, str]:
+    """
+    Assembles frame accurate cuts of one video file as an ffconcat playlist, a virtual video file that the concat
+    demuxer reads straight from the source. Only the partial GOPs at the cut boundaries are reencoded, they are kept
+    beside the playlist, and those of an earlier version are only removed once the new playlist has replaced it. The GOP aligned body of every cut is an inpoint and outpoint into the source, so no
+    intermediate segments are written and the source must stay where it is for as long as the playlist is used.
 
-    start_time = cut_video_def.start_cut / cut_video_def.frame_rate
-    end_time = cut_video_def.end_cut / cut_video_def.frame_rate
-    frame_time = 1 / cut_video_def.frame_rate
-    cut_duration = end_time - start_time
+    Args:
+        cut_video_defs (list[Cut_Video_Def]): The cuts in playlist order, all of the same input file. Cuts may overlap
+        playlist_file (str): The ffconcat playlist file. Must have the sys_consts.FFCONCAT_EXTN extension
+        cancellation_callback (Optional[Callable[[], bool]]): Returns True when the assembly is to be cancelled.
+            Defaults to None (Cancel_All_Tasks)
+        progress_callback (Optional[Callable[[float, str], None]]): Called with the percentage done and a message.
+            Defaults to None
 
-    result, message, start_start_rencode_time, start_end_rencode_time = _get_GOP_info(
-        input_file=cut_video_def.input_file,
-        start_time=start_time,
+    Returns:
+        tuple[int, str]:
+        - arg 1: Status code. Returns 1 if the playlist was written, -2 if cancelled, -1 otherwise.
+        - arg 2: Empty string if all good, otherwise error message
+    """
+    assert isinstance(cut_video_defs, list) and cut_video_defs, (
+        f"{cut_video_defs=}. Must be a non-empty list of Cut_Video_Def"
     )
-
-    if result == -1:
-        return result, message
-
-    result, message, end_start_rencode_time, end_end_rencode_time = _get_GOP_info(
-        input_file=cut_video_def.input_file,
-        start_time=end_time,
+    assert all(
+        isinstance(cut_video_def, Cut_Video_Def) for cut_video_def in cut_video_defs
+    ), f"{cut_video_defs=}. Must be a list of Cut_Video_Def"
+    assert isinstance(playlist_file, str) and playlist_file.lower().endswith(
+        f".{sys_consts.FFCONCAT_EXTN}"
+    ), f"{playlist_file=}. Must be a .{sys_consts.FFCONCAT_EXTN} file"
+    assert callable(cancellation_callback) or cancellation_callback is None, (
+        f"{cancellation_callback=}. Must be a function or None"
     )
-
-    # Need to snap to the nearest I frames around the rencode start and end times - hence 2 frame offset
-    # Note: 2 frames may not always be enough, and this may need revisiting.
-    stream_start = (
-        0.0
-        if start_end_rencode_time - (2 * frame_time) < 0
-        else start_end_rencode_time - (2 * frame_time)
+    assert callable(progress_callback) or progress_callback is None, (
+        f"{progress_callback=}. Must be a function or None"
     )
 
-    stream_end = end_start_rencode_time - (2 * frame_time)
-
-    if result == -1:
-        return result, message
-
-    if message == "stream":  # All i frames like DV video make for a stream copy cut
-        result, message = stream_copy_segment(
-            input_file=cut_video_def.input_file,
-            output_file=cut_video_def.output_file,
-            start_time=start_time,
-            end_time=end_time,
-        )
-
-        if result == -1:
-            return -1, message
-    else:  # We have GOPS with I,P,B frames and need to reencode start and end GOP blocks to cut accurately
-        concat_files = []
-        _, _, input_extension = file_handler.split_file_path(cut_video_def.input_file)
-        output_dir, output_file_name, _ = file_handler.split_file_path(
-            cut_video_def.output_file
-        )
-
-        start_offset = (start_time - start_start_rencode_time) + frame_time
-
-        if start_offset < 0:
-            return -1, f"Did not find start I frame  {start_offset} "
+    input_file = os.path.abspath(cut_video_defs[0].input_file)
+    file_handler = file_utils.File()
+    playlist_dir, playlist_name, _ = file_handler.split_file_path(playlist_file)
 
-        ##### Reencode Start GOP Block
-        if start_end_rencode_time - start_start_rencode_time > 0:
-            reencode_start_seg_file = file_handler.file_join(
-                dir_path=output_dir,
-                file_name=f"reencode_start_segment_{cut_video_def.tag}",
-                ext=input_extension,
-            )
+    # Each assembly renders its boundaries under its own prefix, so the playlist in use keeps its segments until
+    # the new playlist replaces it
+    stale_files = _Playlist_Segment_Files(playlist_file)
 
-            result, message = reencode_segment(
-                input_file=cut_video_def.input_file,
-                output_file=reencode_start_seg_file,
-                encoder_settings=encoder_settings,
-                start_time=start_start_rencode_time,
-                end_time=start_end_rencode_time,
-                gop_size=1,  # Force all frames to I frame in the GOP block, so we can cut in and out where we want,
-            )
+    result, message, cut_plan = _Plan_Cut_Batch(
+        cut_video_defs=cut_video_defs,
+        segment_folder=playlist_dir,
+        segment_prefix=f"{playlist_name}_{Get_Unique_Id()}",
+    )
 
-            if result == -1:
-                return -1, message
+    if result == -1:
+        return -1, message
 
-            concat_files.append(reencode_start_seg_file)
-        else:
-            print("Warning: Skipping zero-duration re-encode start segment.")
+    renders = _Render_Boundaries(
+        input_file=input_file,
+        reencode_commands=cut_plan.reencode_commands,
+        cancellation_callback=cancellation_callback,
+    )
 
-        ##### Make a stream copy of the untouched oart of the file
-        if end_start_rencode_time - start_end_rencode_time > 0:
-            streamcopy_seg_file = file_handler.file_join(
-                dir_path=output_dir,
-                file_name=f"stream_copy_segment_{cut_video_def.tag}",
-                ext=input_extension,
+    try:
+        for render_index, _ in enumerate(
+            concurrent.futures.as_completed(
+                render_future for _, _, render_future in renders
             )
+        ):
+            if progress_callback is not None:
+                progress_callback(
+                    90 * (render_index + 1) / len(renders), "Rendering Cut Boundaries"
+                )
 
-            result, message = stream_copy_segment(
-                input_file=cut_video_def.input_file,
-                output_file=streamcopy_seg_file,
-                start_time=stream_start,
-                end_time=stream_end,
+        if cancellation_callback is not None and cancellation_callback():
+            result, message = -2, "Playlist Assembly Cancelled"
+        else:
+            result, message = _Boundaries_Rendered(
+                input_file=input_file, renders=renders
             )
 
-            if result == -1:
-                return -1, message
+        if result != 1:
+            return result, message
 
-            concat_files.append(streamcopy_seg_file)
-        else:
-            print("Warning: Skipping zero-duration stream copy segment.")
+        def _quote(file_path: str) -> str:
+            """Quotes a file path for an ffconcat file directive"""
+            return "'" + file_path.replace("'", "'\\''") + "'"
 
-        ##### Reencode End GOP Block
-        if end_end_rencode_time - end_start_rencode_time > 0:
-            reencode_end_seg_file = file_handler.file_join(
-                dir_path=output_dir,
-                file_name=f"reencode_end_segment_{cut_video_def.tag}",
-                ext=input_extension,
-            )
+        playlist_lines = ["ffconcat version 1.0"]
 
-            result, message = reencode_segment(
-                input_file=cut_video_def.input_file,
-                output_file=reencode_end_seg_file,
-                encoder_settings=encoder_settings,
-                start_time=end_start_rencode_time,
-                end_time=end_end_rencode_time,
-                gop_size=1,  # Force all frames to I frame in the GOP block, so we can cut in and out where we want,
-            )
+        for _, head_file, body, tail_file in cut_plan.cuts:
+            if head_file:
+                playlist_lines.append(f"file {_quote(os.path.basename(head_file))}")
 
-            if result == -1:
-                return -1, message
+            if body is not None:
+                playlist_lines.append(f"file {_quote(input_file)}")
+                playlist_lines.append(f"inpoint {cut_plan.key_time(body[0]):.6f}")
 
-            concat_files.append(reencode_end_seg_file)
-        else:
-            print("Warning: Skipping zero-duration re-encode end segment.")
+                if body[1] < cut_plan.key_count:  # Otherwise it runs to the end
+                    playlist_lines.append(f"outpoint {cut_plan.key_time(body[1]):.6f}")
 
-        if concat_files:
-            temp_output_file = file_handler.file_join(
-                dir_path=output_dir,
-                file_name=f"{output_file_name}_temp",
-                ext=input_extension,
-            )
+            if tail_file:
+                playlist_lines.append(f"file {_quote(os.path.basename(tail_file))}")
 
-            # Join re-encoded_start segment, stream_copy segment and re-encoded end segment to make the final frame
-            # accurate cut file with nearly no loss
-            result, message, _ = Concatenate_Videos(
-                video_files=concat_files,
-                output_file=temp_output_file,
-                delete_temp_files=True,
-                debug=False,
-            )
+        temp_playlist_file = f"{playlist_file}.{Get_Unique_Id()}.part"
 
-            if result == -1:
-                return -1, message
+        with open(temp_playlist_file, "w", encoding="utf-8") as playlist:
+            playlist.write("\n".join(playlist_lines) + "\n")
 
-            result, message = stream_copy_segment(
-                input_file=temp_output_file,
-                output_file=cut_video_def.output_file,
-                start_time=start_offset,
-                end_time=start_offset + cut_duration + frame_time,
-            )
+        # Readers never see a partial playlist
+        os.replace(temp_playlist_file, playlist_file)
 
-            if result == -1:
-                return -1, message
+        segment_files = {
+            os.path.abspath(commands[-2]) for commands in cut_plan.reencode_commands
+        }
 
-            if file_handler.remove_file(temp_output_file) == -1:
-                return -1, f"Failed to remove {temp_output_file}"
+        for stale_file in stale_files - segment_files:
+            if file_handler.file_exists(stale_file):
+                file_handler.remove_file(stale_file)
+    except OSError as e:
+        result, message = -1, f"Failed To Write Playlist {playlist_file}: {e}"
+    finally:
+        concurrent.futures.wait([render_future for _, _, render_future in renders])
 
-    return 1, ""
+        if result != 1:
+            for commands in cut_plan.reencode_commands:
+                if file_handler.file_exists(commands[-2]):
+                    file_handler.remove_file(commands[-2])
+
+    if progress_callback is not None and result == 1:
+        progress_callback(100, playlist_file)
+
+    return result, message
 
 
 def Frame_Num_To_FFMPEG_Time(frame_num: int, frame_rate: float) -> str:
@@ -6089,7 +9258,7 @@ def Split_Large_Video(
 
         _, source_name, source_extn = file_handler.split_file_path(source)
 
-        encoding_info = Get_File_Encoding_Info(source)
+        encoding_info = Probe_File(source, (PROBE_DURATION,))
 
         if encoding_info.error:
             return -1, encoding_info.error
@@ -6173,15 +9342,33 @@ def Split_Large_Video(
         # Recalculate exact chunk_frames for final iteration based on adjusted num_chunks
         chunk_frames = encoding_info.video_frame_count / num_chunks
 
-        for chunk_index in range(num_chunks):
-            start_frame = int(chunk_index * chunk_frames)
+        # Chunk boundaries, snapped to the nearest keyframe so each cut lands on a GOP start
+        boundary_frames = [int(index * chunk_frames) for index in range(num_chunks)]
+        boundary_frames.append(encoding_info.video_frame_count)
 
-            # Ensure end_frame does not exceed total frames for the last chunk
-            end_frame = int(
-                (chunk_index + 1) * chunk_frames
-                if chunk_index < num_chunks - 1
-                else encoding_info.video_frame_count
-            )
+        keyframe_index = Get_Keyframe_Index(source)
+
+        if not keyframe_index.error and not keyframe_index.all_intra:
+            # Frame numbers count from the first keyframe, the index is on the source timestamps
+            origin = keyframe_index.key_times[0]
+
+            for boundary in range(1, num_chunks):
+                key_entry = keyframe_index.nearest_key(
+                    origin + boundary_frames[boundary] / encoding_info.video_frame_rate
+                )
+
+                if key_entry != -1:
+                    boundary_frames[boundary] = min(
+                        encoding_info.video_frame_count,
+                        round(
+                            (keyframe_index.key_times[key_entry] - origin)
+                            * encoding_info.video_frame_rate
+                        ),
+                    )
+
+        for chunk_index in range(num_chunks):
+            start_frame = boundary_frames[chunk_index]
+            end_frame = boundary_frames[chunk_index + 1]
 
             if (
                 start_frame >= end_frame and chunk_index < num_chunks - 1
@@ -6205,12 +9392,15 @@ def Split_Large_Video(
                 )
             )
 
-            if result == -1:
-                # Clean up any already created chunks if one fails
+            if result != 1:
+                # Clean up any already created chunks if one fails or is cancelled
                 for created_chunk in chunk_file_list:
                     if os.path.exists(created_chunk):
                         os.remove(created_chunk)
-                return -1, f"Failed to cut video chunk {chunk_index + 1}: {message}"
+                return (
+                    result,
+                    f"Failed to cut video chunk {chunk_index + 1}: {message}",
+                )
 
         if not chunk_file_list:
             return -1, "No video chunks were created."
@@ -6441,46 +9631,432 @@ def Generate_Menu_Image_From_File(
     ):
         return -1, f"{video_file} or {out_folder} does not exist or is not writeable"
 
-    image_file = file_handler.file_join(out_folder, video_file_name, "jpg")
+    image_file = file_handler.file_join(out_folder, video_file_name, "jpg")
+
+    if file_handler.file_exists(out_folder, video_file_name, "jpg"):
+        os.remove(image_file)
+
+        if file_handler.file_exists(out_folder, video_file_name, "jpg"):
+            return -1, ""
+
+    commands = [
+        sys_consts.FFMPG,
+        *Input_Options(video_file),
+        "-vf",
+        f"select=eq(n\\,{frame_number}),scale=-1:{button_height}",
+        "-vframes",
+        "1",
+        "-update",
+        "1",
+        image_file,
+    ]
+
+    result, message = Execute_Check_Output(commands=commands)
+
+    if result == -1:
+        return result, message
+
+    return 1, image_file
+
+
+def Generate_Filmstrip(
+    video_file: str,
+    frame_rate: float,
+    duration: float,
+    thumb_height: int = FILMSTRIP_THUMB_HEIGHT,
+    cancellation_callback: Optional[Callable[[], bool]] = None,
+    progress_callback: Optional[Callable[[float, str], None]] = None,
+) -> tuple[int, str]:
+    """
+    Makes the filmstrip of a video file, if it is not already in the Filmstrip_Cache. Only keyframes are decoded, in
+    one pass, thinned out to at most FILMSTRIP_MAX_THUMBNAILS and packed into a single sprite of JPEG thumbnails.
+
+    Args:
+        video_file (str): The video file
+        frame_rate (float): The frame rate of the video file
+        duration (float): The duration of the video file in seconds
+        thumb_height (int): The thumbnail height. Defaults to FILMSTRIP_THUMB_HEIGHT
+        cancellation_callback (Optional[Callable[[], bool]]): Returns True when the filmstrip is to be cancelled.
+            Defaults to None (Cancel_All_Tasks)
+        progress_callback (Optional[Callable[[float, str], None]]): Called with the percentage done and a message.
+            Defaults to None
+
+    Returns:
+        tuple[int, str]:
+        - arg 1: 1 if ok, -1 on error, -2 if cancelled
+        - arg 2: Empty string if all good, otherwise error message
+    """
+    assert isinstance(video_file, str) and video_file.strip() != "", (
+        f"{video_file=}. Must be a non-empty str"
+    )
+    assert isinstance(frame_rate, float) and frame_rate > 0, (
+        f"{frame_rate=}. Must be a float > 0"
+    )
+    assert isinstance(duration, (int, float)) and duration >= 0, (
+        f"{duration=}. Must be int | float >= 0"
+    )
+    assert isinstance(thumb_height, int) and thumb_height > 0, (
+        f"{thumb_height=}. Must be an int > 0"
+    )
+
+    if not os.path.exists(video_file):
+        return -1, f"{video_file=}. Does not exist"
+
+    filmstrip_cache = Filmstrip_Cache()
+
+    if filmstrip_cache.get(video_file, thumb_height) is not None:
+        return 1, ""
+
+    thumb_spacing = max(FILMSTRIP_MIN_SPACING, duration / FILMSTRIP_MAX_THUMBNAILS)
+
+    # -skip_frame nokey stops the decoder at keyframes, showinfo reports the timestamp of each thumbnail kept
+    commands = [
+        sys_consts.FFMPG,
+        "-hide_banner",
+        "-nostats",
+        "-nostdin",
+        "-skip_frame",
+        "nokey",
+        *Input_Options(video_file),
+        "-map",
+        "0:v:0",
+        "-vf",
+        (
+            "select=isnan(prev_selected_t)"
+            f"+gte(t-prev_selected_t\\,{thumb_spacing:.3f}),"
+            f"scale=-2:{thumb_height},showinfo"
+        ),
+        "-vsync",
+        "passthrough",
+        "-c:v",
+        "mjpeg",
+        "-q:v",
+        "5",
+        "-f",
+        "image2pipe",
+        "pipe:1",
+    ]
+
+    sprite_capture = Output_Capture(policy=CAPTURE_SPILL)
+    info_capture = Output_Capture()
+
+    try:
+        result, message = Execute_Check_Output(
+            commands=commands,
+            cancellation_callback=cancellation_callback,
+            progress_callback=progress_callback,
+            progress_duration=duration,
+            stdout_capture=sprite_capture,
+            stderr_capture=info_capture,
+        )
+
+        if result != 1:
+            return result, message
+
+        sprite = sprite_capture.file().read()
+        pts_times = [
+            float(pts_time)
+            for pts_time in re.findall(
+                r"Parsed_showinfo.*?\spts_time:\s*(-?[\d.]+)", info_capture.text()
+            )
+        ]
+    finally:
+        sprite_capture.close()
+        info_capture.close()
+
+    # Entropy coded JPEG data stuffs every 0xFF byte, so an end of image marker only ends a thumbnail
+    offsets: list[tuple[int, int]] = []
+    offset = 0
+
+    while offset < len(sprite):
+        end_offset = sprite.find(b"\xff\xd9", offset)
+
+        if not sprite.startswith(b"\xff\xd8", offset) or end_offset == -1:
+            return -1, f"Filmstrip Of {video_file} Has A Damaged Thumbnail"
+
+        offsets.append((offset, end_offset + 2 - offset))
+        offset = end_offset + 2
+
+    if not offsets or len(offsets) != len(pts_times):
+        return -1, (
+            f"Filmstrip Of {video_file} Has {len(offsets)} Thumbnails For"
+            f" {len(pts_times)} Keyframes"
+        )
+
+    # Frames are numbered from the first keyframe, as the media player and Frame_Server number them
+    filmstrip_cache.put(
+        video_file,
+        Filmstrip(
+            thumb_height=thumb_height,
+            sprite=sprite,
+            frames=[
+                round((pts_time - pts_times[0]) * frame_rate) for pts_time in pts_times
+            ],
+            offsets=offsets,
+        ),
+    )
+
+    return 1, ""
+
+
+def Generate_Edit_Proxy(
+    video_file: str,
+    cancellation_callback: Optional[Callable[[], bool]] = None,
+    progress_callback: Optional[Callable[[float, str], None]] = None,
+) -> tuple[int, str]:
+    """
+    Makes the edit proxy of a video file, if it is not already in the Proxy_Cache. The proxy is PROXY_HEIGHT high,
+    deinterlaced and all I-frames, so the video editor seeks it as fast as it plays it. It keeps the frame rate and
+    timeline of the source, so the editor's frame numbers, and the cuts made from them, are those of the source
+
+    Args:
+        video_file (str): The video file
+        cancellation_callback (Optional[Callable[[], bool]]): Returns True when the proxy is to be cancelled.
+            Defaults to None (Cancel_All_Tasks)
+        progress_callback (Optional[Callable[[float, str], None]]): Called with the percentage done and a message.
+            Defaults to None
+
+    Returns:
+        tuple[int, str]:
+        - arg 1: 1 if ok, -1 on error, -2 if cancelled
+        - arg 2: The proxy file if all good, otherwise error message
+    """
+    assert isinstance(video_file, str) and video_file.strip() != "", (
+        f"{video_file=}. Must be a non-empty str"
+    )
+
+    if not os.path.exists(video_file):
+        return -1, f"{video_file=}. Does not exist"
+
+    proxy_cache = Proxy_Cache()
+    proxy_file = proxy_cache.get(video_file)
+
+    if proxy_file:
+        return 1, proxy_file
+
+    proxy_file = proxy_cache.proxy_file(video_file)
+
+    if not proxy_file:
+        return -1, "No Video Editor Folder For The Proxy"
+
+    encoding_info = Get_File_Encoding_Info(video_file)
+
+    if encoding_info.error:
+        return -1, encoding_info.error
+
+    rendered_file = f"{proxy_file}.{Get_Unique_Id()}.part"
+
+    # Only frames flagged as interlaced are deinterlaced, one frame out for each frame in
+    commands = [
+        sys_consts.FFMPG,
+        "-hide_banner",
+        "-nostdin",
+        *Input_Options(video_file),
+        "-map",
+        "0:v:0",
+        "-map",
+        "0:a:0?",
+        "-sn",
+        "-vf",
+        f"yadif=mode=send_frame:deint=interlaced,scale=-2:{PROXY_HEIGHT}",
+        "-vsync",
+        "cfr",
+        "-r",
+        str(encoding_info.video_frame_rate),
+        "-c:v",
+        "libx264",
+        "-preset",
+        "veryfast",
+        "-tune",
+        "fastdecode",
+        "-crf",
+        "23",
+        "-pix_fmt",
+        "yuv420p",
+        "-g",
+        "1",
+        "-c:a",
+        "aac",
+        "-b:a",
+        "128k",
+        "-ac",
+        "2",
+        "-movflags",
+        "+faststart",
+        "-f",
+        PROXY_EXTN,
+        rendered_file,
+        "-y",
+    ]
+
+    result, message = Execute_Check_Output(
+        commands=commands,
+        cancellation_callback=cancellation_callback,
+        progress_callback=progress_callback,
+        progress_duration=encoding_info.video_duration,
+    )
+
+    if result != 1:
+        if os.path.exists(rendered_file):
+            os.remove(rendered_file)
+
+        return result, message
+
+    proxy_file = proxy_cache.put(video_file, rendered_file)
+
+    if not proxy_file:
+        return -1, f"Failed To Cache The Proxy Of {video_file}"
+
+    return 1, proxy_file
+
+
+def _Probe_Frame_State(video_file: str) -> tuple[int, str, dict]:
+    """
+    Streams the frames of the first 2 seconds of the first video stream to find the representative I-frame and
+    whether the video is all I-frames. Probing stops once the representative I-frame is found and the video is
+    known not to be all I-frames
+
+    Args:
+        video_file (str): The video file
+
+    Returns:
+        tuple[int, str, dict]:
+        - arg 1: 1 if ok, -1 on error, -2 if cancelled
+        - arg 2: Empty string if all good, otherwise error message
+        - arg 3: The frame state, video_frames_read, all_I_frames, representative_frame and first_I_frame
+    """
+    assert isinstance(video_file, str) and video_file.strip() != "", (
+        f"{video_file=}. Must be a non-empty str"
+    )
+
+    commands, frame_state, parse_line = _Frame_State_Probe(video_file)
+
+    result, message = Execute_Check_Output(
+        commands=commands, debug=False, line_callback=parse_line
+    )
+
+    return result, "" if result == 1 else message, frame_state
+
+
+def _Frame_State_Probe(
+    video_file: str,
+) -> tuple[list[str], dict, Callable[[str], bool]]:
+    """
+    Sets up the frame state probe of _Probe_Frame_State, so it can be run streamed or by the Async_Tool_Engine
+
+    Args:
+        video_file (str): The video file
+
+    Returns:
+        tuple[list[str], dict, Callable[[str], bool]]:
+        - arg 1: The ffprobe command
+        - arg 2: The frame state, filled in as the output lines are parsed
+        - arg 3: The output line parser, returns False once no later frame can change the frame state
+    """
+    frame_state = {
+        "video_frames_read": 0,
+        "all_I_frames": True,
+        "representative_frame": None,
+        "first_I_frame": None,
+    }
+
+    def _check_frame(frame: tuple[str, ...]) -> bool:
+        """
+        Tallies a video frame and keeps it if it is a candidate representative I-frame
 
-    if file_handler.file_exists(out_folder, video_file_name, "jpg"):
-        os.remove(image_file)
+        Args:
+            frame (tuple[str, ...]): The frame entries, in the entries order
 
-        if file_handler.file_exists(out_folder, video_file_name, "jpg"):
-            return -1, ""
+        Returns:
+            bool: False once no later frame can change the result
+        """
+        (
+            key_frame,
+            pict_type,
+            width,
+            height,
+            sample_aspect_ratio,
+            interlaced_frame,
+            top_field_first,
+        ) = frame
+
+        frame_state["video_frames_read"] += 1
+
+        width = int(width) if width.isdigit() else 0
+        height = int(height) if height.isdigit() else 0
+
+        if not (pict_type == "I" and key_frame == "1" and width > 0 and height > 0):
+            frame_state["all_I_frames"] = False
+        elif frame_state["representative_frame"] is None:
+            i_frame = {
+                "width": width,
+                "height": height,
+                "sample_aspect_ratio": sample_aspect_ratio,
+                "interlaced_frame": 1 if interlaced_frame == "1" else 0,
+                "top_field_first": 1 if top_field_first == "1" else 0,
+            }
 
-    commands = [
-        sys_consts.FFMPG,
-        "-i",
-        video_file,
-        "-vf",
-        f"select=eq(n\\,{frame_number}),scale=-1:{button_height}",
-        "-vframes",
-        "1",
-        "-update",
-        "1",
-        image_file,
-    ]
+            if frame_state["first_I_frame"] is None:
+                frame_state["first_I_frame"] = i_frame
 
-    result, message = Execute_Check_Output(commands=commands)
+            if sample_aspect_ratio != "":
+                frame_state["representative_frame"] = i_frame
 
-    if result == -1:
-        return result, message
+        return not (
+            frame_state["representative_frame"] is not None
+            and not frame_state["all_I_frames"]
+        )
 
-    return 1, image_file
+    entries = (
+        "key_frame",
+        "pict_type",
+        "width",
+        "height",
+        "sample_aspect_ratio",
+        "interlaced_frame",
+        "top_field_first",
+    )
+    commands = _Stream_Entries_Command(
+        video_file=video_file,
+        section="frame",
+        entries=entries,
+        select_streams="v:0",
+        read_intervals="%+2",  # Read first 2 seconds for frame analysis
+    )
+
+    return (
+        commands,
+        frame_state,
+        _Stream_Entries_Parser(entries=entries, entry_callback=_check_frame),
+    )
 
 
-def Get_File_Encoding_Info(video_file: str) -> Encoding_Details:
+def _Derive_Encoding_Details(
+    json_data: dict,
+    frame_state: dict,
+    validate_fields: Optional[frozenset[str]] = None,
+    debug: bool = False,
+) -> Encoding_Details:
     """
-    Returns the pertinent file encoding information
+    Derives the Encoding_Details of a video from its ffprobe format and stream data and its frame state
 
     Args:
-        video_file (str): The video file being checked
+        json_data (dict): The ffprobe "format" and "streams" data, it may hold only some of the entries
+        frame_state (dict): The frame state from _Probe_Frame_State, or an empty frame state if frames were not
+            probed
+        validate_fields (Optional[frozenset[str]]): The Encoding_Details fields checked for a value. Defaults to
+            None, all fields
+        debug (bool): If True, debug information will be printed. Defaults to False
 
     Returns:
-        Video_Details: Check video_details.error if it is not an empty string an error occurred
-
+        Encoding_Details: Check encoding_details.error if it is not an empty string an error occurred
     """
+    assert isinstance(json_data, dict), f"{json_data=}. Must be a dict"
+    assert isinstance(frame_state, dict), f"{frame_state=}. Must be a dict"
+    assert validate_fields is None or isinstance(validate_fields, frozenset), (
+        f"{validate_fields=}. Must be a frozenset or None"
+    )
+    assert isinstance(debug, bool), f"{debug=}. Must be bool"
 
     #### Helper functions
     def _calculate_frame_rate(stream: dict, video_scan_type: str = "") -> float:
@@ -6692,46 +10268,10 @@ def Get_File_Encoding_Info(video_file: str) -> Encoding_Details:
         return f"{round(calculated_float_ar, 2)}:1" if calculated_float_ar > 0 else ""
 
     #### Main
-    debug = False  # Set to False for production
-
     video_file_details = Encoding_Details()
-
-    assert isinstance(video_file, str) and video_file.strip() != "", (
-        f"{video_file=}. Must be a path to a file"
-    )
-    if not os.path.exists(video_file):
-        video_file_details.error = f"{video_file=}. Does not exist"
-        return video_file_details
-
-    commands = [
-        sys_consts.FFPROBE,
-        "-v",
-        "quiet",
-        "-print_format",
-        "json",
-        "-show_format",
-        "-show_streams",
-        "-show_frames",
-        "-read_intervals",
-        "%+2",  # Read first 2 seconds for frame analysis
-        video_file,
-    ]
-
-    result, message = Execute_Check_Output(
-        commands=commands, debug=False, stderr_to_stdout=True
-    )
-
-    if result == -1:
-        video_file_details.error = message
-        return video_file_details
-
-    json_string = message
     representative_frame = None
-    all_video_i_frames = []
 
     try:
-        json_data = json.loads(json_string)
-
         audio_track_count = 0
         video_track_count = 0
 
@@ -6739,38 +10279,14 @@ def Get_File_Encoding_Info(video_file: str) -> Encoding_Details:
         format_data = json_data.get("format", {})
         video_file_details.video_duration = float(format_data.get("duration", 0.0))
 
-        # Frame Analysis and Representative Frame Selection
-        all_video_i_frames = [
-            frame
-            for frame in json_data.get("frames", [])
-            if frame.get("media_type") == "video"
-            and frame.get("pict_type") == "I"
-            and frame.get("key_frame") == 1
-            and frame.get("width") is not None
-            and frame.get("height") is not None
-            and frame.get("width") > 0
-            and frame.get("height") > 0
-        ]
-
-        total_video_frames_read = len([
-            frame
-            for frame in json_data.get("frames", [])
-            if frame.get("media_type") == "video"
-        ])
-
-        video_file_details.all_I_frames = (
-            total_video_frames_read > 0
-            and total_video_frames_read == len(all_video_i_frames)
-        )
-
-        for frame in all_video_i_frames:
-            if frame.get("sample_aspect_ratio", "") != "":
-                representative_frame = frame
-                break  # Found a good one, use it!
+        frames_read = frame_state.get("video_frames_read", 0)
+        all_I_frames = frame_state.get("all_I_frames", False)
+        video_file_details.all_I_frames = frames_read > 0 and all_I_frames
 
         # Fallback if no frame with sample_aspect_ratio was found, but we have other I-frames
-        if representative_frame is None and all_video_i_frames:
-            representative_frame = all_video_i_frames[0]
+        representative_frame = frame_state.get(
+            "representative_frame"
+        ) or frame_state.get("first_I_frame")
 
         video_file_details.video_scan_type = "progressive"
 
@@ -6778,9 +10294,7 @@ def Get_File_Encoding_Info(video_file: str) -> Encoding_Details:
             if representative_frame.get("interlaced_frame") == 1:
                 video_file_details.video_scan_type = "interlaced"
                 video_file_details.video_scan_order = (
-                    "tff"
-                    if representative_frame.get("top_field_first") == "1"
-                    else "bff"
+                    "tff" if representative_frame.get("top_field_first") == 1 else "bff"
                 )
 
         video_streams = [
@@ -6798,7 +10312,7 @@ def Get_File_Encoding_Info(video_file: str) -> Encoding_Details:
         if not video_streams:
             video_file_details.error = "No Video Stream found"
             if debug:
-                print(f"==== File Encoding Details {video_file=} ")
+                print("==== File Encoding Details")
                 print("==== JSON DATA")
                 pprint.pprint(json_data)
             return video_file_details
@@ -7006,7 +10520,7 @@ def Get_File_Encoding_Info(video_file: str) -> Encoding_Details:
                 (24.0 < video_file_details.video_frame_rate < 30.0)
                 or (48.0 < video_file_details.video_frame_rate < 60.0)
             ):
-                video_file_details.video_frame_rate = sys_consts.PAL_FRAME_RATE
+                video_file_details.video_frame_rate = float(sys_consts.PAL_FRAME_RATE)
 
                 if video_file_details.video_duration > 0:
                     video_file_details.video_frame_count = math.floor(
@@ -7031,53 +10545,180 @@ def Get_File_Encoding_Info(video_file: str) -> Encoding_Details:
                         * video_file_details.video_frame_rate
                     )
 
-        if video_file_details.video_standard == "":
+        # A profile probe that does not own the standard leaves it unset rather than Unknown
+        if video_file_details.video_standard == "" and (
+            validate_fields is None or "video_standard" in validate_fields
+        ):
             video_file_details.video_standard = "Unknown"
 
-        # Final validation checks
+        # Final validation checks, limited to validate_fields when only some fields were probed
         errors = []
+
+        def _add_error(field: str, message: str) -> None:
+            """Adds the error message of a failed field check, if the field is being validated"""
+            if validate_fields is None or field in validate_fields:
+                errors.append(message)
+
         if video_file_details.video_duration == 0:
-            errors.append("Failed To Determine Duration")
+            _add_error("video_duration", "Failed To Determine Duration")
         if video_file_details.video_dar == 0:
-            errors.append("Failed To Determine Display Aspect Ratio")
+            _add_error("video_dar", "Failed To Determine Display Aspect Ratio")
         if video_file_details.video_par == 0:
-            errors.append("Failed To Determine Pixel Aspect Ratio")
+            _add_error("video_par", "Failed To Determine Pixel Aspect Ratio")
         if video_file_details.video_ar == "":
-            errors.append("Failed To Determine Aspect Ratio String")
+            _add_error("video_ar", "Failed To Determine Aspect Ratio String")
         if video_file_details.video_width == 0 or video_file_details.video_height == 0:
-            errors.append("Failed To Determine Video Dimensions")
+            _add_error("video_width", "Failed To Determine Video Dimensions")
         if video_file_details.video_frame_rate == 0:
-            errors.append("Failed To Determine Video Frame Rate")
+            _add_error("video_frame_rate", "Failed To Determine Video Frame Rate")
         if video_file_details.video_bitrate == 0:
-            errors.append("Failed To Determine Video Bitrate")
+            _add_error("video_bitrate", "Failed To Determine Video Bitrate")
         if video_file_details.video_codec == "":
-            errors.append(
-                "Failed To Determine Video Codec"
-            )  # This one is often "unknown" rather than an error for missing codecs
+            # This one is often "unknown" rather than an error for missing codecs
+            _add_error("video_codec", "Failed To Determine Video Codec")
         if video_file_details.video_frame_count == 0:
-            errors.append("Failed To Determine The Number Of Frames In The Video")
+            _add_error(
+                "video_frame_count",
+                "Failed To Determine The Number Of Frames In The Video",
+            )
         if video_file_details.video_standard == "Unknown":
-            errors.append("Failed To Determine The Video Standard")
+            _add_error("video_standard", "Failed To Determine The Video Standard")
 
         # Audio specific checks
         if video_file_details.audio_tracks > 0:
             if video_file_details.audio_format == "":
-                errors.append("Failed To Determine The Audio Format")
+                _add_error("audio_format", "Failed To Determine The Audio Format")
             if video_file_details.audio_channels == 0:
-                errors.append("Failed To Determine The Number Of Audio Channels")
+                _add_error(
+                    "audio_channels", "Failed To Determine The Number Of Audio Channels"
+                )
 
         if errors:
             video_file_details.error = "; ".join(errors)
 
-    except (json.JSONDecodeError, KeyError, ValueError, TypeError) as e:
+    except (KeyError, ValueError, TypeError) as e:
         video_file_details.error = (
             f"Error parsing ffprobe output or processing data: {e}. "
-            f"Raw message start: {json_string[:500]}..."
+            f"Raw data start: {str(json_data)[:500]}..."
         )
 
         if debug:
             print(f"Error: {e}")
-            print(f"JSON String start: {json_string[:500]}...")
+            print(f"JSON Data start: {str(json_data)[:500]}...")
+
+    return video_file_details
+
+
+def Get_File_Encoding_Info(video_file: str) -> Encoding_Details:
+    """
+    Returns the pertinent file encoding information. Results are held in the Probe_Cache, so ffprobe only runs
+    when the file is new or has changed
+
+    Args:
+        video_file (str): The video file being checked
+
+    Returns:
+        Video_Details: Check video_details.error if it is not an empty string an error occurred
+
+    """
+    debug = False  # Set to False for production
+
+    video_file_details = Encoding_Details()
+
+    assert isinstance(video_file, str) and video_file.strip() != "", (
+        f"{video_file=}. Must be a path to a file"
+    )
+    if not os.path.exists(video_file):
+        video_file_details.error = f"{video_file=}. Does not exist"
+        return video_file_details
+
+    probe_cache = Probe_Cache()
+    cached_file_details = probe_cache.get(video_file)
+
+    if cached_file_details is not None:
+        return cached_file_details
+
+    result, message = Execute_Check_Output(
+        commands=_Encoding_Info_Command(video_file),
+        debug=False,
+        stderr_to_stdout=True,
+    )
+
+    if result != 1:  # Failed or cancelled, the message says which
+        video_file_details.error = message
+        return video_file_details
+
+    probe_output = message
+    result, message, frame_state = _Probe_Frame_State(video_file)
+
+    if result != 1:
+        video_file_details.error = message
+        return video_file_details
+
+    return _Encoding_Info_Details(
+        video_file=video_file,
+        probe_output=probe_output,
+        frame_state=frame_state,
+        debug=debug,
+    )
+
+
+def _Encoding_Info_Command(video_file: str) -> list[str]:
+    """
+    Builds the ffprobe command whose format and stream output Get_File_Encoding_Info works from
+
+    Args:
+        video_file (str): The video file being checked
+
+    Returns:
+        list[str]: The ffprobe command
+    """
+    return [
+        sys_consts.FFPROBE,
+        "-v",
+        "quiet",
+        "-print_format",
+        "json",
+        "-show_format",
+        "-show_streams",
+        *Input_Options(video_file),
+    ]
+
+
+def _Encoding_Info_Details(
+    video_file: str, probe_output: str, frame_state: dict, debug: bool = False
+) -> Encoding_Details:
+    """
+    Works out the Encoding_Details of a video file from the output of its _Encoding_Info_Command and its frame
+    state, and puts them in the Probe_Cache
+
+    Args:
+        video_file (str): The video file being checked
+        probe_output (str): The JSON output of the _Encoding_Info_Command
+        frame_state (dict): The frame state from _Probe_Frame_State
+        debug (bool): If True, the details are printed. Defaults to False
+
+    Returns:
+        Encoding_Details: Check encoding_details.error if it is not an empty string an error occurred
+    """
+    video_file_details = Encoding_Details()
+    probe_cache = Probe_Cache()
+
+    try:
+        json_data = json.loads(probe_output)
+    except json.JSONDecodeError as e:
+        video_file_details.error = (
+            f"Error parsing ffprobe output or processing data: {e}. "
+            f"Raw message start: {probe_output[:500]}..."
+        )
+        return video_file_details
+
+    video_file_details = _Derive_Encoding_Details(
+        json_data=json_data, frame_state=frame_state, debug=debug
+    )
+    representative_frame = (
+        frame_state["representative_frame"] or frame_state["first_I_frame"]
+    )
 
     if debug and video_file_details.error:
         print(f"Error processing {video_file}: {video_file_details.error}")
@@ -7119,8 +10760,7 @@ def Get_File_Encoding_Info(video_file: str) -> Encoding_Details:
         print(f"DBG = {video_file_details.audio_codec=}")
         print(f"DBG = {video_file_details.audio_sample_rate=}")
         # pprint.pprint(video_file_details.__dir__)  # Access dict for easier viewing
-        print("==== All Video I-Frames (first 2) ====")
-        pprint.pprint(all_video_i_frames[:2])  # Print only a few for brevity
+        print(f"==== Video Frames Read {frame_state['video_frames_read']} ====")
         if representative_frame:
             print("==== Representative Frame ====")
             pprint.pprint(representative_frame)
@@ -7128,9 +10768,253 @@ def Get_File_Encoding_Info(video_file: str) -> Encoding_Details:
             print("==== No Representative Frame found ====")
         print("==== File Encoding Details End ====")
 
+    probe_cache.put(video_file, video_file_details)  # Only cached if there is no error
+
+    return video_file_details
+
+
+def Probe_File(video_file: str, profiles: tuple[str, ...]) -> Encoding_Details:
+    """
+    Returns only the Encoding_Details fields owned by the named probe profiles (PROBE_IDENTITY, PROBE_DURATION,
+    PROBE_STREAM_LAYOUT, PROBE_SCAN_TYPE and PROBE_GOP), probing with the minimal ffprobe entries those profiles
+    need. Profile results accumulate in the Probe_Cache, and a file already fully probed by Get_File_Encoding_Info
+    is answered from that.
+
+    Args:
+        video_file (str): The video file being checked
+        profiles (tuple[str, ...]): The probe profiles wanted
+
+    Returns:
+        Encoding_Details: Fields not owned by a requested profile may be unset. Check encoding_details.error if it
+        is not an empty string an error occurred
+    """
+    assert isinstance(video_file, str) and video_file.strip() != "", (
+        f"{video_file=}. Must be a path to a file"
+    )
+    assert (
+        isinstance(profiles, tuple)
+        and len(profiles) > 0
+        and all(profile in PROBE_PROFILES for profile in profiles)
+    ), f"{profiles=}. Must be a non-empty tuple of PROBE_PROFILES keys"
+
+    video_file_details = Encoding_Details()
+
+    if not os.path.exists(video_file):
+        video_file_details.error = f"{video_file=}. Does not exist"
+        return video_file_details
+
+    probe_cache = Probe_Cache()
+    cached_file_details = probe_cache.get(video_file)
+
+    if cached_file_details is not None:
+        return cached_file_details
+
+    profiles_done: frozenset[str] = frozenset()
+    cached_profile = probe_cache.profile_get(video_file)
+
+    if cached_profile is not None:
+        profiles_done, video_file_details = cached_profile
+
+    missing_profiles = [
+        profile for profile in dict.fromkeys(profiles) if profile not in profiles_done
+    ]
+
+    if not missing_profiles:
+        return video_file_details
+
+    stream_entries = {"codec_type"}
+    format_entries = set()
+    owned_fields = set()
+
+    for profile in missing_profiles:
+        stream_entries.update(PROBE_PROFILES[profile].stream_entries)
+        format_entries.update(PROBE_PROFILES[profile].format_entries)
+        owned_fields.update(PROBE_PROFILES[profile].fields)
+
+    show_entries = f"stream={','.join(sorted(stream_entries))}"
+
+    if format_entries:
+        show_entries += f":format={','.join(sorted(format_entries))}"
+
+    commands = [
+        sys_consts.FFPROBE,
+        "-v",
+        "quiet",
+        "-print_format",
+        "json",
+        "-show_entries",
+        show_entries,
+        *Input_Options(video_file),
+    ]
+
+    result, message = Execute_Check_Output(
+        commands=commands, debug=False, stderr_to_stdout=True
+    )
+
+    if result != 1:  # Failed or cancelled, the message says which
+        return Encoding_Details(_error=message)
+
+    try:
+        json_data = json.loads(message)
+    except json.JSONDecodeError as e:
+        return Encoding_Details(
+            _error=f"Error parsing ffprobe output: {e}. Raw message start: {message[:500]}..."
+        )
+
+    frame_state = {}
+
+    if any(PROBE_PROFILES[profile].frames for profile in missing_profiles):
+        result, message, frame_state = _Probe_Frame_State(video_file)
+
+        if result != 1:
+            return Encoding_Details(_error=message)
+
+    probed_file_details = _Derive_Encoding_Details(
+        json_data=json_data,
+        frame_state=frame_state,
+        validate_fields=frozenset(owned_fields),
+    )
+
+    if probed_file_details.error:
+        return probed_file_details
+
+    if any(PROBE_PROFILES[profile].keyframe_index for profile in missing_profiles):
+        keyframe_index = Get_Keyframe_Index(video_file)
+
+        if keyframe_index.error:
+            return Encoding_Details(_error=keyframe_index.error)
+
+        probed_file_details.all_I_frames = keyframe_index.all_intra
+
+    # Copy the underlying fields, the property setters reject the unset values of fields no profile filled yet
+    video_file_details = dataclasses.replace(
+        video_file_details,
+        **{
+            f"_{field}": getattr(probed_file_details, f"_{field}")
+            for field in owned_fields
+        },
+    )
+
+    probe_cache.profile_put(
+        video_file, profiles_done | frozenset(missing_profiles), video_file_details
+    )
+
     return video_file_details
 
 
+def Probe_Files_Batch(
+    video_files: list[str],
+    encoding_infos: dict[str, Encoding_Details],
+    cancellation_callback: Optional[Callable[[], bool]] = None,
+    progress_callback: Optional[Callable[[float, str], None]] = None,
+) -> tuple[int, str]:
+    """
+    Gets the Encoding_Details of many video files concurrently. The probes of every file not in the Probe_Cache are
+    queued on the Async_Tool_Engine, so they share its ffprobe limit with every other caller. Intended to be run as
+    a background task.
+
+    Args:
+        video_files (list[str]): The video files to probe
+        encoding_infos (dict[str, Encoding_Details]): Passed by reference, each video file is added with its
+            Encoding_Details as soon as it has been probed
+        cancellation_callback (Optional[Callable[[], bool]]): Returns True when the batch is to be cancelled. The
+            probes still queued or running are cancelled. Defaults to None (Cancel_All_Tasks)
+        progress_callback (Optional[Callable[[float, str], None]]): Called with the percentage done and the video
+            file just added to encoding_infos. Defaults to None
+
+    Returns:
+        tuple[int, str]:
+        - arg 1: 1 if all the files were probed, -2 if cancelled
+        - arg 2: Empty string if all good, otherwise a message
+    """
+    assert isinstance(video_files, list) and all(
+        isinstance(video_file, str) and video_file.strip() != ""
+        for video_file in video_files
+    ), f"{video_files=}. Must be a list of non-empty str"
+    assert isinstance(encoding_infos, dict), f"{encoding_infos=}. Must be a dict"
+    assert callable(cancellation_callback) or cancellation_callback is None, (
+        f"{cancellation_callback=}. Must be a function or None"
+    )
+    assert callable(progress_callback) or progress_callback is None, (
+        f"{progress_callback=}. Must be a function or None"
+    )
+
+    video_files = list(dict.fromkeys(video_files))  # Each file is only probed once
+
+    if not video_files:
+        return 1, ""
+
+    engine = Async_Tool_Engine()
+    probe_cache = Probe_Cache()
+    # The stream probe and the frame state probe of each file, the frame state being filled in from the output
+    probes: dict[str, tuple] = {}
+
+    for video_file in video_files:
+        if not os.path.exists(video_file) or probe_cache.get(video_file) is not None:
+            continue  # Get_File_Encoding_Info answers these without a probe
+
+        frame_commands, frame_state, parse_frame_line = _Frame_State_Probe(video_file)
+        probes[video_file] = (
+            engine.submit(
+                _Encoding_Info_Command(video_file),
+                stderr_to_stdout=True,
+                cancellation_callback=cancellation_callback,
+                debug=False,
+            ),
+            engine.submit(
+                frame_commands,
+                cancellation_callback=cancellation_callback,
+                debug=False,
+            ),
+            frame_state,
+            parse_frame_line,
+        )
+
+    try:
+        for files_done, video_file in enumerate(video_files, start=1):
+            if video_file not in probes:
+                encoding_infos[video_file] = Get_File_Encoding_Info(video_file)
+            else:
+                probe_future, frame_future, frame_state, parse_frame_line = probes[
+                    video_file
+                ]
+                result, message = probe_future.result()
+                frame_result, frame_message = frame_future.result()
+
+                if -2 in (result, frame_result):
+                    return (
+                        -2,
+                        f"Cancelled After {files_done - 1} Of {len(video_files)} Files",
+                    )
+
+                if result != 1:
+                    encoding_infos[video_file] = Encoding_Details(_error=message)
+                elif frame_result != 1:
+                    encoding_infos[video_file] = Encoding_Details(_error=frame_message)
+                else:
+                    for line in frame_message.splitlines():
+                        if parse_frame_line(line.strip()) is False:
+                            break
+
+                    encoding_infos[video_file] = _Encoding_Info_Details(
+                        video_file=video_file,
+                        probe_output=message,
+                        frame_state=frame_state,
+                    )
+
+            if progress_callback is not None:
+                progress_callback(files_done * 100 / len(video_files), video_file)
+
+            if cancellation_callback is not None and cancellation_callback():
+                return -2, f"Cancelled After {files_done} Of {len(video_files)} Files"
+    finally:
+        for probe_future, frame_future, _, _ in probes.values():
+            probe_future.cancel()
+            frame_future.cancel()
+
+    return 1, ""
+
+
 def Resize_Image(
     width: int,
     height: int,
@@ -388,6 +388,12 @@ class DVD_Archiver(DVD_Archiver_Base):
                     _delete_dvd_layout(event)
                 case "delete_project":
                     _delete_project(event)
+                case "dvd_encode_chunked":
+                    _handle_dvd_encode_chunked_clicked(event)
+                case "dvd_encode_draft":
+                    _handle_dvd_encode_clicked(draft=True)
+                case "dvd_encode_final":
+                    _handle_dvd_encode_clicked(draft=False)
                 case "dvd_folder_select":
                     _dvd_folder_select(event)
                 case "exit_app":
@@ -440,6 +446,34 @@ class DVD_Archiver(DVD_Archiver_Base):
 
             return None
 
+        def _handle_dvd_encode_clicked(draft: bool) -> None:
+            """Handles the dvd_encode_draft and dvd_encode_final CLICKED events.
+
+            Sets the DVD draft encode setting.
+
+            Args:
+                draft (bool): True for single pass draft VOB encodes, False for two pass encodes
+            """
+            self._db_settings.setting_set(sys_consts.DVD_DRAFT_ENCODE_DBK, draft)
+
+            return None
+
+        def _handle_dvd_encode_chunked_clicked(event: qtg.Action) -> None:
+            """Handles the dvd_encode_chunked CLICKED event.
+
+            Sets the DVD chunked encode setting.
+
+            Args:
+                event (qtg.Action): The event triggering the click, its value is the checkbox state
+            """
+            assert isinstance(event, qtg.Action), f"{event=}. Must be qtg.Action"
+
+            self._db_settings.setting_set(
+                sys_consts.DVD_CHUNKED_ENCODE_DBK, bool(event.value)
+            )
+
+            return None
+
         def _handle_exit_app_clicked() -> None:
             """Handles the exit_app CLICKED event.
 
@@ -1329,6 +1363,16 @@ class DVD_Archiver(DVD_Archiver_Base):
                 else:
                     dvd_config.transcode_type = sys_consts.TRANSCODE_NONE
 
+                if self._db_settings.setting_exist(sys_consts.DVD_DRAFT_ENCODE_DBK):
+                    dvd_config.draft_encode = self._db_settings.setting_get(
+                        sys_consts.DVD_DRAFT_ENCODE_DBK
+                    )
+
+                if self._db_settings.setting_exist(sys_consts.DVD_CHUNKED_ENCODE_DBK):
+                    dvd_config.chunked_encode = self._db_settings.setting_get(
+                        sys_consts.DVD_CHUNKED_ENCODE_DBK
+                    )
+
                 # TODO: Remove this code, and associated variables, in the future if it proves unnecessary
                 # 17/01/2024 DAW On consideration this seems unnecessary and complicates things
                 # sql_result = self._app_db.sql_select(
@@ -1592,6 +1636,24 @@ class DVD_Archiver(DVD_Archiver_Base):
                 sys_consts.ARCHIVE_DISK_TRANSCODE_DBK, transcode_type
             )
 
+        if self._db_settings.setting_exist(sys_consts.DVD_DRAFT_ENCODE_DBK):
+            draft_encode = self._db_settings.setting_get(
+                sys_consts.DVD_DRAFT_ENCODE_DBK
+            )
+        else:
+            draft_encode = False
+            self._db_settings.setting_set(sys_consts.DVD_DRAFT_ENCODE_DBK, draft_encode)
+
+        if self._db_settings.setting_exist(sys_consts.DVD_CHUNKED_ENCODE_DBK):
+            chunked_encode = self._db_settings.setting_get(
+                sys_consts.DVD_CHUNKED_ENCODE_DBK
+            )
+        else:
+            chunked_encode = False
+            self._db_settings.setting_set(
+                sys_consts.DVD_CHUNKED_ENCODE_DBK, chunked_encode
+            )
+
         archive_folder = self._db_settings.setting_get(sys_consts.ARCHIVE_FOLDER_DBK)
         streaming_folder = self._db_settings.setting_get(
             sys_consts.STREAMING_FOLDER_DBK
@@ -1929,6 +1991,40 @@ class DVD_Archiver(DVD_Archiver_Base):
             ),
         )
 
+        dvd_encode_container = qtg.VBoxContainer(text="DVD Encode", width=20).add_row(
+            qtg.RadioButton(
+                text="Final (Two Pass)",
+                tag="dvd_encode_final",
+                tooltip=(
+                    "Best Quality And Predictable DVD Size. Rebuilds Reuse The"
+                    " Analysis Pass Of Unchanged Videos"
+                ),
+                callback=self.event_handler,
+                checked=not draft_encode,
+            ),
+            qtg.RadioButton(
+                text="Draft (One Pass)",
+                tag="dvd_encode_draft",
+                tooltip=(
+                    "Quicker Single Pass Encode For Checking Menus And Layouts."
+                    " The DVD Size Is Less Predictable"
+                ),
+                callback=self.event_handler,
+                checked=draft_encode,
+            ),
+            qtg.Checkbox(
+                text="Chunked (Long Videos)",
+                tag="dvd_encode_chunked",
+                tooltip=(
+                    "Encodes Long Videos In Chunks On Every Core At Once."
+                    " Not Used For Drafts Or With An Archive Folder"
+                ),
+                callback=self.event_handler,
+                checked=chunked_encode,
+            ),
+            qtg.Spacer(),
+        )
+
         self._control_tab.page_add(
             tag="about_tab",
             title="About/System",
@@ -1948,7 +2044,11 @@ class DVD_Archiver(DVD_Archiver_Base):
                     margin_right=10,
                     margin_bottom=5,
                 ).add_row(
-                    backup_disk_size_container, qtg.Spacer(width=2), app_lang_container
+                    backup_disk_size_container,
+                    qtg.Spacer(width=2),
+                    dvd_encode_container,
+                    qtg.Spacer(width=2),
+                    app_lang_container,
                 ),
             ),
             enabled=True,
@@ -0,0 +1,216 @@
+"""
+Caches the filmstrip of a video file, the keyframe thumbnails the video editor draws along its slider and shows while
+scrubbing. A filmstrip is one packed sprite of JPEG thumbnails plus an index of the frame, offset and length of each,
+stored under the hash of the source file identity and thumbnail height.
+
+Copyright (C) 2025  David Worboys (-:alumnus Moyhu Primary School et al.:-)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import bisect
+import dataclasses
+import json
+import os
+from typing import Final
+
+from QTPYGUI.utils import Singleton
+
+import sys_consts
+from folder_cache import Folder_Cache
+
+# Bump when the filmstrip layout or the way thumbnails are extracted changes, so older filmstrips are not reused
+FILMSTRIP_CACHE_VERSION: Final[int] = 1
+FILMSTRIP_CACHE_MAX_SIZE: Final[int] = 512 * 1024**2  # Bytes, LRU evicted past this
+FILMSTRIP_THUMB_HEIGHT: Final[int] = 144  # Pixels, keeping the frame aspect ratio
+FILMSTRIP_MAX_THUMBNAILS: Final[int] = 2000  # Keyframes are thinned out to this
+FILMSTRIP_MIN_SPACING: Final[float] = 1.0  # Seconds, the closest thumbnails get
+FILMSTRIP_SPRITE_EXTN: Final[str] = "jpgs"
+FILMSTRIP_INDEX_EXTN: Final[str] = "json"
+
+
+@dataclasses.dataclass(slots=True)
+class Filmstrip:
+    """The keyframe thumbnails of a video file, held in memory as one packed sprite of JPEGs"""
+
+    thumb_height: int = 0
+    sprite: bytes = b""
+    frames: list[int] = dataclasses.field(default_factory=list)  # Ascending
+    # Offset and length in the sprite
+    offsets: list[tuple[int, int]] = dataclasses.field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        assert isinstance(self.thumb_height, int) and self.thumb_height >= 0, (
+            f"{self.thumb_height=}. Must be an int >= 0"
+        )
+        assert isinstance(self.sprite, bytes), f"{self.sprite=}. Must be bytes"
+        assert isinstance(self.frames, list), f"{self.frames=}. Must be a list"
+        assert isinstance(self.offsets, list), f"{self.offsets=}. Must be a list"
+        assert len(self.frames) == len(self.offsets), (
+            f"{len(self.frames)=} {len(self.offsets)=}. Must be the same length"
+        )
+
+    @property
+    def thumbnail_count(self) -> int:
+        """The number of thumbnails in the filmstrip"""
+        return len(self.frames)
+
+    def thumbnail_get(self, frame_num: int) -> bytes:
+        """Gets the thumbnail of the keyframe at or before a frame, the first thumbnail if the frame is before it
+
+        Args:
+            frame_num (int): The frame number
+
+        Returns:
+            bytes: The JPEG thumbnail, empty if the filmstrip has no thumbnails
+        """
+        assert isinstance(frame_num, int), f"{frame_num=}. Must be int"
+
+        if not self.frames:
+            return b""
+
+        offset, length = self.offsets[
+            max(0, bisect.bisect_right(self.frames, frame_num) - 1)
+        ]
+
+        return self.sprite[offset : offset + length]
+
+
+class Filmstrip_Cache(Folder_Cache, metaclass=Singleton):
+    """Holds filmstrips in the filmstrip cache folder of the video editor folder. A filmstrip is a sprite file and an
+    index file, each evicted on its own
+    """
+
+    def __init__(self):
+        super().__init__(
+            folder_name=sys_consts.FILMSTRIP_CACHE_FOLDER_NAME,
+            max_size=FILMSTRIP_CACHE_MAX_SIZE,
+            version=FILMSTRIP_CACHE_VERSION,
+        )
+
+    def _filmstrip_files(self, video_file: str, thumb_height: int) -> tuple[str, str]:
+        """Works out the sprite and index files of a filmstrip
+
+        Args:
+            video_file (str): The source video file
+            thumb_height (int): The thumbnail height
+
+        Returns:
+            tuple[str, str]: The sprite and index files, both empty strings if there is no cache folder or the
+            source file cannot be read
+        """
+        filmstrip_key = self._cache_key(video_file, [str(thumb_height)])
+
+        return (
+            self._cache_file(filmstrip_key, f".{FILMSTRIP_SPRITE_EXTN}"),
+            self._cache_file(filmstrip_key, f".{FILMSTRIP_INDEX_EXTN}"),
+        )
+
+    def get(self, video_file: str, thumb_height: int) -> Filmstrip | None:
+        """Loads the cached filmstrip of a video file
+
+        Args:
+            video_file (str): The source video file
+            thumb_height (int): The thumbnail height
+
+        Returns:
+            Filmstrip | None: The filmstrip, or None if it is not cached
+        """
+        assert isinstance(video_file, str) and video_file.strip() != "", (
+            f"{video_file=}. Must be a non-empty str"
+        )
+        assert isinstance(thumb_height, int) and thumb_height > 0, (
+            f"{thumb_height=}. Must be an int > 0"
+        )
+
+        sprite_file, index_file = self._filmstrip_files(video_file, thumb_height)
+
+        if not sprite_file:
+            return None
+
+        try:
+            with open(index_file, "r", encoding="utf-8") as index_handle:
+                filmstrip_index = json.load(index_handle)
+
+            with open(sprite_file, "rb") as sprite_handle:
+                sprite = sprite_handle.read()
+
+            frames = [int(frame_num) for frame_num in filmstrip_index["frames"]]
+            offsets = [
+                (int(offset), int(length))
+                for offset, length in filmstrip_index["offsets"]
+            ]
+
+            if len(frames) != len(offsets):
+                return None
+
+            filmstrip = Filmstrip(
+                thumb_height=thumb_height,
+                sprite=sprite,
+                frames=frames,
+                offsets=offsets,
+            )
+
+            # Marks them as the most recently used
+            os.utime(sprite_file)
+            os.utime(index_file)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None  # Missing, partly evicted or damaged, it is just made again
+
+        if filmstrip.offsets and sum(filmstrip.offsets[-1]) > len(sprite):
+            return None
+
+        return filmstrip
+
+    def put(self, video_file: str, filmstrip: Filmstrip) -> None:
+        """Caches a filmstrip, then evicts the least recently used filmstrips while the cache is too big
+
+        Args:
+            video_file (str): The source video file
+            filmstrip (Filmstrip): The filmstrip
+        """
+        assert isinstance(video_file, str) and video_file.strip() != "", (
+            f"{video_file=}. Must be a non-empty str"
+        )
+        assert isinstance(filmstrip, Filmstrip) and filmstrip.thumb_height > 0, (
+            f"{filmstrip=}. Must be a Filmstrip with a thumb_height > 0"
+        )
+
+        sprite_file, index_file = self._filmstrip_files(
+            video_file, filmstrip.thumb_height
+        )
+
+        if not sprite_file:
+            return None
+
+        def _write_sprite(temp_file: str) -> None:
+            """Writes the sprite to the temporary file"""
+            with open(temp_file, "wb") as sprite_handle:
+                sprite_handle.write(filmstrip.sprite)
+
+        def _write_index(temp_file: str) -> None:
+            """Writes the index to the temporary file"""
+            with open(temp_file, "w", encoding="utf-8") as index_handle:
+                json.dump(
+                    {"frames": filmstrip.frames, "offsets": filmstrip.offsets},
+                    index_handle,
+                )
+
+        # The index goes last, a reader never finds an index without its sprite
+        if self._write(sprite_file, _write_sprite) and self._write(
+            index_file, _write_index
+        ):
+            self._evict()
+
+        return None
@@ -0,0 +1,202 @@
+"""
+The base of the caches that keep their entries in a folder of the video editor folder. Each entry is a file, or a
+folder of files, named by the hash of the source file identity and whatever else the entry depends on.
+
+Copyright (C) 2025  David Worboys (-:alumnus Moyhu Primary School et al.:-)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import hashlib
+import os
+import shutil
+import threading
+from typing import Callable, Final
+
+from probe_cache import Get_File_Identity
+from sys_config import Get_Video_Editor_Folder
+
+PART_EXTN: Final[str] = ".part"  # Entries being written, never read or evicted
+
+
+class Folder_Cache:
+    """Holds entries in a cache folder of the video editor folder. The modification time of an entry is its last use,
+    so the folder itself is the LRU and survives between sessions. Subclasses supply the payload specific get and put.
+    """
+
+    def __init__(self, folder_name: str, max_size: int, version: int):
+        """
+        Sets up the cache, the cache folder is only made when it is first used
+
+        Args:
+            folder_name (str): The cache folder name in the video editor folder
+            max_size (int): Bytes, the least recently used entries are evicted past this
+            version (int): Part of every key, bumped so older entries are not reused
+        """
+        assert isinstance(folder_name, str) and folder_name.strip() != "", (
+            f"{folder_name=}. Must be a non-empty str"
+        )
+        assert isinstance(max_size, int) and max_size > 0, (
+            f"{max_size=}. Must be int > 0"
+        )
+        assert isinstance(version, int), f"{version=}. Must be int"
+
+        self._folder_name = folder_name
+        self._max_size = max_size
+        self._version = version
+        self._lock = threading.Lock()
+
+    def _cache_folder(self) -> str:
+        """Gets the cache folder, making it if needed
+
+        Returns:
+            str: The cache folder or an empty string if there is no video editor folder
+        """
+        video_editor_folder = Get_Video_Editor_Folder(suppress_error=True)
+
+        if video_editor_folder.strip() == "":
+            return ""
+
+        cache_folder = os.path.join(video_editor_folder, self._folder_name)
+
+        try:
+            os.makedirs(cache_folder, exist_ok=True)
+        except OSError:
+            return ""
+
+        return cache_folder
+
+    def _cache_key(self, source_file: str, key_parts: list[str]) -> str:
+        """Works out the key of an entry made from a source file
+
+        Args:
+            source_file (str): The source file, its path and identity are part of the key
+            key_parts (list[str]): Anything else the entry depends on
+
+        Returns:
+            str: The key or an empty string if the source file cannot be read
+        """
+        file_path = os.path.realpath(source_file)
+        file_identity = Get_File_Identity(file_path)
+
+        if file_identity is None:
+            return ""
+
+        return hashlib.sha256(
+            "\0".join([
+                str(self._version),
+                file_path,
+                str(file_identity.file_size),
+                str(file_identity.mtime_ns),
+                str(file_identity.inode),
+                *key_parts,
+            ]).encode("utf-8")
+        ).hexdigest()
+
+    def _cache_file(self, cache_key: str, file_extn: str = "") -> str:
+        """Works out the file or folder an entry is kept in
+
+        Args:
+            cache_key (str): The key from _cache_key
+            file_extn (str): The entry extension, with its leading dot. Defaults to "" (none)
+
+        Returns:
+            str: The entry file or an empty string if there is no key or cache folder
+        """
+        cache_folder = self._cache_folder() if cache_key else ""
+
+        if not cache_folder:
+            return ""
+
+        return os.path.join(cache_folder, f"{cache_key}{file_extn}")
+
+    def _write(self, cache_file: str, write: Callable[[str], None]) -> bool:
+        """Writes an entry under a temporary name and then renames it, so readers never see a partial entry
+
+        Args:
+            cache_file (str): The entry file from _cache_file
+            write (Callable[[str], None]): Writes the entry to the temporary file or folder it is passed
+
+        Returns:
+            bool: True if the entry was written. A cache write failure only costs making the entry again
+        """
+        temp_file = f"{cache_file}.{threading.get_ident()}{PART_EXTN}"
+
+        try:
+            write(temp_file)
+            os.replace(temp_file, cache_file)
+        except OSError:
+            if os.path.isdir(temp_file):
+                shutil.rmtree(temp_file, ignore_errors=True)
+            elif os.path.exists(temp_file):
+                os.remove(temp_file)
+
+            return False
+
+        return True
+
+    def _evict(self, keep_file: str = "") -> None:
+        """Deletes the least recently used entries until the cache is within its maximum size
+
+        Args:
+            keep_file (str): An entry that is never evicted, though its size counts. Defaults to "" (none)
+        """
+        cache_folder = self._cache_folder()
+
+        if not cache_folder:
+            return None
+
+        with self._lock:
+            entries = []
+            cache_size = 0
+
+            with os.scandir(cache_folder) as folder_entries:
+                for folder_entry in folder_entries:
+                    if folder_entry.name.endswith(PART_EXTN):
+                        continue
+
+                    try:
+                        if folder_entry.is_dir():
+                            with os.scandir(folder_entry.path) as entry_files:
+                                entry_size = sum(
+                                    entry_file.stat().st_size
+                                    for entry_file in entry_files
+                                )
+                        else:
+                            entry_size = folder_entry.stat().st_size
+
+                        entry_mtime_ns = folder_entry.stat().st_mtime_ns
+                    except OSError:  # Evicted by another process
+                        continue
+
+                    cache_size += entry_size
+
+                    if folder_entry.path != keep_file:
+                        entries.append((entry_mtime_ns, entry_size, folder_entry.path))
+
+            for _, entry_size, entry_path in sorted(entries):
+                if cache_size <= self._max_size:
+                    break
+
+                try:
+                    if os.path.isdir(entry_path):
+                        shutil.rmtree(entry_path)
+                    else:
+                        os.remove(entry_path)
+
+                    cache_size -= entry_size
+                except OSError:
+                    pass
+
+        return None
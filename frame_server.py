@@ -0,0 +1,478 @@
+"""
+Serves decoded video frames to the video editor for frame accurate stepping. A persistent ffmpeg decoder, started at
+a keyframe from the file's keyframe index, pipes raw downscaled frames into a bounded LRU around the playhead. While
+the editor is idle the frames ahead of the playhead, in the direction it is moving, are prefetched. A GUI asks for
+frames with frame_request, which never waits on the decoder, and frame_get is for callers that can block.
+
+Copyright (C) 2025  David Worboys (-:alumnus Moyhu Primary School et al.:-)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import subprocess
+import threading
+from collections import OrderedDict
+from typing import Callable, Final
+
+import sys_consts
+from dvdarch_utils import Get_Keyframe_Index, Input_Options, Seek_Options
+from probe_cache import Keyframe_Index
+
+FRAME_CACHE_MAX_SIZE: Final[int] = 256 * 1024**2  # Bytes of decoded frames
+FRAME_PREFETCH_SECONDS: Final[float] = 1.0  # Prefetched ahead of the playhead
+FRAME_TIMEOUT: Final[float] = 10.0  # Seconds frame_get waits for a frame to be decoded
+
+
+class Frame_Server:
+    """Decodes the frames of one video file on a worker thread and holds them in an LRU. Frames are RGB24 bytes of
+    output_width x output_height, numbered from the first keyframe of the file as the media player numbers them.
+    """
+
+    def __init__(
+        self,
+        video_file: str,
+        frame_rate: float,
+        output_width: int,
+        output_height: int,
+        cache_size: int = FRAME_CACHE_MAX_SIZE,
+    ):
+        """
+        Starts the decoder worker thread. The decoder itself is only started when a frame is asked for
+
+        Args:
+            video_file (str): The video file
+            frame_rate (float): The frame rate of the video file
+            output_width (int): The width the frames are scaled to
+            output_height (int): The height the frames are scaled to
+            cache_size (int): The most bytes of decoded frames held. Defaults to FRAME_CACHE_MAX_SIZE
+        """
+        assert isinstance(video_file, str) and video_file.strip() != "", (
+            f"{video_file=}. Must be a non-empty str"
+        )
+        assert isinstance(frame_rate, float) and frame_rate > 0, (
+            f"{frame_rate=}. Must be a float > 0"
+        )
+        assert isinstance(output_width, int) and output_width > 0, (
+            f"{output_width=}. Must be an int > 0"
+        )
+        assert isinstance(output_height, int) and output_height > 0, (
+            f"{output_height=}. Must be an int > 0"
+        )
+        assert isinstance(cache_size, int) and cache_size > 0, (
+            f"{cache_size=}. Must be an int > 0"
+        )
+
+        self._video_file = video_file
+        self._frame_rate = frame_rate
+        self._output_width = output_width
+        self._output_height = output_height
+        self._frame_size = output_width * output_height * 3
+        self._prefetch_frames = max(1, round(frame_rate * FRAME_PREFETCH_SECONDS))
+        # Always room for a prefetch either side of the playhead, however small cache_size is
+        self._cache_frames = max(
+            2 * self._prefetch_frames + 1, cache_size // self._frame_size
+        )
+
+        self._condition = threading.Condition()
+        self._frames: OrderedDict[int, bytes] = OrderedDict()
+        self._demand_frame = -1  # The frame frame_get or frame_request is waiting on
+        # The frame asked for by frame_request and the callback it goes to, only the latest request is answered
+        self._request: tuple[int, Callable[[int, int, str, bytes], None]] | None = None
+        self._done_frame = -1  # The last demanded frame the worker finished with
+        self._prefetch_range: tuple[int, int] | None = None
+        self._last_frame = -1
+        self._error = ""
+        self._stopped = False
+        self._hits = 0
+        self._misses = 0
+
+        # Only touched by the worker thread
+        self._keyframe_index: Keyframe_Index | None = None
+        self._process: subprocess.Popen | None = None
+        self._next_frame = -1  # The number of the next frame the decoder outputs
+        # One past the last frame, once the decoder has reached the end of the file
+        self._end_frame = -1
+
+        self._worker = threading.Thread(
+            target=self._decode_loop, name="frame_server", daemon=True
+        )
+        self._worker.start()
+
+    @property
+    def output_width(self) -> int:
+        """The width of the served frames"""
+        return self._output_width
+
+    @property
+    def output_height(self) -> int:
+        """The height of the served frames"""
+        return self._output_height
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """The cache counters, hits, misses and cached_frames"""
+        with self._condition:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "cached_frames": len(self._frames),
+            }
+
+    def frame_get(
+        self, frame_num: int, timeout: float = FRAME_TIMEOUT
+    ) -> tuple[int, str, bytes]:
+        """
+        Gets a decoded frame, waiting for it to be decoded if it is not cached. Then prefetches the frames beyond it
+        in the direction the playhead moved
+
+        Args:
+            frame_num (int): The frame number
+            timeout (float): The seconds to wait for the frame to be decoded. Defaults to FRAME_TIMEOUT
+
+        Returns:
+            tuple[int, str, bytes]:
+            - arg 1: 1 if ok, -1 if the frame could not be decoded
+            - arg 2: Empty string if all good, otherwise error message
+            - arg 3: The RGB24 frame, empty if there was an error
+        """
+        assert isinstance(frame_num, int) and frame_num >= 0, (
+            f"{frame_num=}. Must be an int >= 0"
+        )
+        assert isinstance(timeout, (int, float)) and timeout > 0, (
+            f"{timeout=}. Must be a number > 0"
+        )
+
+        with self._condition:
+            if self._stopped:
+                return -1, "Frame Server Stopped", b""
+
+            frame = self._frames.get(frame_num)
+
+            if frame is not None:
+                self._frames.move_to_end(frame_num)
+                self._hits += 1
+            else:
+                self._misses += 1
+                self._error = ""
+                self._demand_frame = frame_num
+                self._done_frame = -1
+                self._condition.notify_all()
+
+                self._condition.wait_for(
+                    lambda: self._done_frame == frame_num or self._stopped,
+                    timeout=timeout,
+                )
+
+                self._demand_frame = -1
+                frame = self._frames.get(frame_num)
+
+                if frame is None:
+                    if self._error:
+                        return -1, self._error, b""
+
+                    if self._done_frame == frame_num:
+                        return -1, f"Frame {frame_num} Is Not In The Video", b""
+
+                    return -1, f"Timed Out Decoding Frame {frame_num}", b""
+
+            self._prefetch_set(frame_num)
+
+        return 1, "", frame
+
+    def frame_request(
+        self,
+        frame_num: int,
+        frame_callback: Callable[[int, int, str, bytes], None],
+    ) -> bytes:
+        """
+        Gets a decoded frame without waiting for the decoder. A cached frame is returned straight away, otherwise
+        the frame is decoded and passed to frame_callback from the worker thread. A request replaces any request
+        still waiting, so only the latest frame asked for is answered. Then prefetches the frames beyond it in the
+        direction the playhead moved
+
+        Args:
+            frame_num (int): The frame number
+            frame_callback (Callable[[int, int, str, bytes], None]): Called from the worker thread with the frame
+                number, the result (1 if ok, -1 if the frame could not be decoded), an error message and the RGB24
+                frame. A GUI must hand the frame over to its own thread
+
+        Returns:
+            bytes: The RGB24 frame if it is cached, otherwise empty and the frame goes to frame_callback
+        """
+        assert isinstance(frame_num, int) and frame_num >= 0, (
+            f"{frame_num=}. Must be an int >= 0"
+        )
+        assert callable(frame_callback), f"{frame_callback=}. Must be a function"
+
+        with self._condition:
+            if self._stopped:
+                return b""
+
+            frame = self._frames.get(frame_num)
+
+            if frame is not None:
+                self._frames.move_to_end(frame_num)
+                self._hits += 1
+                self._request = None
+                self._prefetch_set(frame_num)
+
+                return frame
+
+            self._misses += 1
+            self._error = ""
+            self._request = (frame_num, frame_callback)
+            self._demand_frame = frame_num
+            self._done_frame = -1
+            self._condition.notify_all()
+
+        return b""
+
+    def stop(self) -> None:
+        """Stops the decoder and the worker thread and drops the cached frames and any waiting request"""
+        with self._condition:
+            self._stopped = True
+            self._request = None
+            self._condition.notify_all()
+
+        self._worker.join()
+
+        with self._condition:
+            self._frames.clear()
+
+        return None
+
+    def _decode_loop(self) -> None:
+        """The worker thread. Decodes the demanded frame first and prefetches when there is no demand"""
+        try:
+            while True:
+                with self._condition:
+                    self._condition.wait_for(
+                        lambda: (
+                            self._stopped
+                            or self._demand_frame != -1
+                            or self._prefetch_range is not None
+                        )
+                    )
+
+                    if self._stopped:
+                        break
+
+                    if self._demand_frame != -1:
+                        demand = True
+                        first_frame = last_frame = self._demand_frame
+                    else:
+                        demand = False
+                        first_frame, last_frame = self._prefetch_range
+                        self._prefetch_range = None
+
+                error = self._decode_frames(first_frame, last_frame, demand)
+
+                if demand:
+                    frame_callback = None
+                    frame = b""
+
+                    with self._condition:
+                        self._error = error
+                        self._done_frame = first_frame
+
+                        if self._demand_frame == first_frame:
+                            self._demand_frame = -1
+
+                        if self._request and self._request[0] == first_frame:
+                            _, frame_callback = self._request
+                            self._request = None
+                            frame = self._frames.get(first_frame, b"")
+
+                            if frame:
+                                self._prefetch_set(first_frame)
+
+                        self._condition.notify_all()
+
+                    # Outside the lock, the callback may ask for another frame
+                    if frame_callback is not None:
+                        if frame:
+                            frame_callback(first_frame, 1, "", frame)
+                        else:
+                            frame_callback(
+                                first_frame,
+                                -1,
+                                error or f"Frame {first_frame} Is Not In The Video",
+                                b"",
+                            )
+        finally:
+            self._decoder_stop()
+
+        return None
+
+    def _prefetch_set(self, frame_num: int) -> None:
+        """
+        Sets the frames to prefetch beyond a frame that has been served, in the direction the playhead moved. The
+        caller holds self._condition
+
+        Args:
+            frame_num (int): The frame served
+        """
+        if frame_num >= self._last_frame:
+            self._prefetch_range = (frame_num + 1, frame_num + self._prefetch_frames)
+        else:
+            self._prefetch_range = (
+                max(0, frame_num - self._prefetch_frames),
+                frame_num - 1,
+            )
+
+        self._last_frame = frame_num
+        self._condition.notify_all()
+
+        return None
+
+    def _decode_frames(self, first_frame: int, last_frame: int, demand: bool) -> str:
+        """
+        Decodes frames into the cache until first_frame to last_frame are all cached. The running decoder is
+        carried on with if it is already in the GOP of the first frame needed, otherwise it is restarted at the
+        keyframe at or before that frame. A prefetch gives way as soon as there is a demand or a newer prefetch
+
+        Args:
+            first_frame (int): The first frame wanted
+            last_frame (int): The last frame wanted
+            demand (bool): True if frame_get or frame_request is waiting on these frames, False for a prefetch
+
+        Returns:
+            str: Empty string if all good, otherwise error message
+        """
+        with self._condition:
+            wanted_frames = [
+                frame_num
+                for frame_num in range(first_frame, last_frame + 1)
+                if frame_num not in self._frames
+            ]
+
+        if not wanted_frames or (0 <= self._end_frame <= wanted_frames[0]):
+            return ""
+
+        if self._keyframe_index is None:
+            self._keyframe_index = Get_Keyframe_Index(self._video_file)
+
+        if self._keyframe_index.error:
+            return self._keyframe_index.error
+
+        key_times = self._keyframe_index.key_times
+        origin = key_times[0]
+        key_entry = self._keyframe_index.key_at_or_before(
+            origin + (wanted_frames[0] + 0.5) / self._frame_rate
+        )
+        key_frame = round((key_times[max(0, key_entry)] - origin) * self._frame_rate)
+
+        if (
+            self._process is None
+            or self._next_frame > wanted_frames[0]
+            # Restarting at the keyframe skips decoding frames
+            or key_frame > self._next_frame
+        ):
+            result = self._decoder_start(key_times[max(0, key_entry)], key_frame)
+
+            if result:
+                return result
+
+        while self._next_frame <= wanted_frames[-1]:
+            with self._condition:
+                if self._stopped or (
+                    not demand
+                    and (self._demand_frame != -1 or self._prefetch_range is not None)
+                ):
+                    return ""
+
+            frame = self._process.stdout.read(self._frame_size)
+
+            if len(frame) < self._frame_size:  # End of the video
+                self._end_frame = self._next_frame
+                self._decoder_stop()
+                break
+
+            with self._condition:
+                self._frames[self._next_frame] = frame
+                self._frames.move_to_end(self._next_frame)
+
+                while len(self._frames) > self._cache_frames:
+                    self._frames.popitem(last=False)
+
+            self._next_frame += 1
+
+        return ""
+
+    def _decoder_start(self, key_time: float, key_frame: int) -> str:
+        """
+        Starts the decoder at a keyframe, stopping any running decoder first
+
+        Args:
+            key_time (float): The keyframe timestamp
+            key_frame (int): The keyframe's frame number
+
+        Returns:
+            str: Empty string if all good, otherwise error message
+        """
+        self._decoder_stop()
+
+        # The decoded output must start exactly on the keyframe or every frame served is misnumbered. Seek_Options
+        # verifies seeks in containers where they can land late, and drops any frames before key_time on the output
+        # side
+        seek_input, seek_output, _ = Seek_Options(
+            input_file=self._video_file, start_time=key_time, stream_copy=False
+        )
+
+        commands = [
+            sys_consts.FFMPG,
+            "-v",
+            "error",
+            "-nostdin",
+            *seek_input,
+            *Input_Options(self._video_file),
+            *seek_output,
+            "-map",
+            "0:v:0",
+            "-vf",
+            f"scale={self._output_width}:{self._output_height}",
+            "-vsync",
+            "passthrough",
+            "-pix_fmt",
+            "rgb24",
+            "-f",
+            "rawvideo",
+            "pipe:1",
+        ]
+
+        try:
+            self._process = subprocess.Popen(
+                commands,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=self._frame_size,
+            )
+        except OSError as e:
+            self._process = None
+            return f"Failed To Start The Frame Decoder: {e}"
+
+        self._next_frame = key_frame
+
+        return ""
+
+    def _decoder_stop(self) -> None:
+        """Stops the running decoder, if there is one"""
+        if self._process is not None:
+            self._process.kill()
+            self._process.stdout.close()
+            self._process.wait()
+            self._process = None
+
+        return None
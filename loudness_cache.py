@@ -0,0 +1,273 @@
+"""
+Caches the loudness of the audio of a video file, as measured by the first pass of the ffmpeg loudnorm filter, so the
+audio can be normalised with linear loudnorm rather than the single pass dynamic loudnorm, which pumps the audio of
+tape captures. A measurement is stored under the hash of the source file identity and the loudness target.
+
+Copyright (C) 2025  David Worboys (-:alumnus Moyhu Primary School et al.:-)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import dataclasses
+import json
+import math
+import os
+import re
+from typing import Final
+
+from QTPYGUI.utils import Singleton
+
+import sys_consts
+from folder_cache import Folder_Cache
+
+# Bump when the loudness measurement changes, so older measurements are not reused
+LOUDNESS_CACHE_VERSION: Final[int] = 1
+LOUDNESS_CACHE_MAX_SIZE: Final[int] = 4 * 1024**2  # Bytes, LRU evicted past this
+LOUDNORM_TARGET: Final[str] = "I=-16:LRA=11:TP=-1.5"  # Integrated, range and true peak
+
+# The ranges loudnorm accepts for each measured value, by Loudness_Measurement field
+LOUDNORM_MEASURED_RANGES: Final[dict[str, tuple[float, float]]] = {
+    "input_i": (-99.0, 0.0),
+    "input_tp": (-99.0, 99.0),
+    "input_lra": (0.0, 99.0),
+    "input_thresh": (-99.0, 0.0),
+    "target_offset": (-99.0, 99.0),
+}
+
+
+@dataclasses.dataclass(slots=True)
+class Loudness_Measurement:
+    """The loudness of the first audio stream of a video file, as the measuring pass of loudnorm reports it"""
+
+    input_i: float = 0.0  # LUFS
+    input_tp: float = 0.0  # dBTP
+    input_lra: float = 0.0  # LU
+    input_thresh: float = 0.0  # LUFS
+    target_offset: float = 0.0  # LU
+
+    def __post_init__(self) -> None:
+        for field_name, (low_value, high_value) in LOUDNORM_MEASURED_RANGES.items():
+            field_value = getattr(self, field_name)
+
+            in_range = isinstance(field_value, float) and (
+                low_value <= field_value <= high_value
+            )
+
+            assert in_range, (
+                f"{field_name}={field_value}. Must be a float >= {low_value} and"
+                f" <= {high_value}"
+            )
+
+
+def _Loudness_Measurement(loudnorm_stats: dict) -> Loudness_Measurement | None:
+    """
+    Makes a loudness measurement from the values loudnorm logged or the cache holds
+
+    Args:
+        loudnorm_stats (dict): The measured values by Loudness_Measurement field, as numbers or number strings
+
+    Returns:
+        Loudness_Measurement | None: The measurement, or None if a value is missing or outside the range loudnorm
+        accepts. Silent audio measures as -inf
+    """
+    measured_values = {}
+
+    for field_name, (low_value, high_value) in LOUDNORM_MEASURED_RANGES.items():
+        try:
+            field_value = float(loudnorm_stats[field_name])
+        except (ValueError, KeyError, TypeError):
+            return None
+
+        if not math.isfinite(field_value) or not (
+            low_value <= field_value <= high_value
+        ):
+            return None
+
+        measured_values[field_name] = field_value
+
+    return Loudness_Measurement(**measured_values)
+
+
+def Loudnorm_Filter(measurement: Loudness_Measurement | None = None) -> str:
+    """
+    Makes the loudnorm audio filter that normalises audio to LOUDNORM_TARGET
+
+    Args:
+        measurement (Loudness_Measurement | None): The loudness of the audio. Defaults to None (not measured)
+
+    Returns:
+        str: The linear loudnorm filter of the measurement, or the single pass dynamic loudnorm filter if there is no
+        measurement
+    """
+    assert isinstance(measurement, Loudness_Measurement) or measurement is None, (
+        f"{measurement=}. Must be Loudness_Measurement or None"
+    )
+
+    if measurement is None:
+        return f"loudnorm={LOUDNORM_TARGET}"
+
+    return (
+        f"loudnorm={LOUDNORM_TARGET}"
+        f":measured_I={measurement.input_i:.2f}"
+        f":measured_TP={measurement.input_tp:.2f}"
+        f":measured_LRA={measurement.input_lra:.2f}"
+        f":measured_thresh={measurement.input_thresh:.2f}"
+        f":offset={measurement.target_offset:.2f}"
+        ":linear=true"
+    )
+
+
+def Loudnorm_Measure_Filter() -> str:
+    """
+    Makes the loudnorm audio filter that measures audio against LOUDNORM_TARGET and logs the measurement as JSON when
+    the audio ends
+
+    Returns:
+        str: The measuring loudnorm filter, its output is read with Parse_Loudnorm_Output
+    """
+    return f"loudnorm={LOUDNORM_TARGET}:print_format=json"
+
+
+def Loudnorm_Commands(
+    commands: list[str], measurement: Loudness_Measurement | None
+) -> list[str]:
+    """
+    Swaps the dynamic loudnorm filter in an ffmpeg command for the linear loudnorm filter of a measurement
+
+    Args:
+        commands (list[str]): The ffmpeg command
+        measurement (Loudness_Measurement | None): The loudness of the audio, None leaves the dynamic loudnorm filter
+
+    Returns:
+        list[str]: The ffmpeg command
+    """
+    assert isinstance(commands, list), f"{commands=}. Must be a list"
+    assert isinstance(measurement, Loudness_Measurement) or measurement is None, (
+        f"{measurement=}. Must be Loudness_Measurement or None"
+    )
+
+    dynamic_filter = Loudnorm_Filter()
+    linear_filter = Loudnorm_Filter(measurement)
+
+    return [
+        linear_filter if command == dynamic_filter else command for command in commands
+    ]
+
+
+def Parse_Loudnorm_Output(output: str) -> Loudness_Measurement | None:
+    """
+    Gets the measurement the measuring loudnorm filter logged
+
+    Args:
+        output (str): The ffmpeg log (stderr) of a command using Loudnorm_Measure_Filter
+
+    Returns:
+        Loudness_Measurement | None: The measurement, or None if there is none or it cannot drive linear loudnorm
+    """
+    assert isinstance(output, str), f"{output=}. Must be str"
+
+    json_blocks = re.findall(r"\{[^{}]*\"input_i\"[^{}]*\}", output)
+
+    if not json_blocks:
+        return None
+
+    try:
+        loudnorm_stats = json.loads(json_blocks[-1])
+    except ValueError:
+        return None
+
+    if not isinstance(loudnorm_stats, dict):
+        return None
+
+    return _Loudness_Measurement(loudnorm_stats)
+
+
+class Loudness_Cache(Folder_Cache, metaclass=Singleton):
+    """Holds loudness measurements in the loudness cache folder of the video editor folder"""
+
+    def __init__(self):
+        super().__init__(
+            folder_name=sys_consts.LOUDNESS_CACHE_FOLDER_NAME,
+            max_size=LOUDNESS_CACHE_MAX_SIZE,
+            version=LOUDNESS_CACHE_VERSION,
+        )
+
+    def _loudness_file(self, video_file: str) -> str:
+        """Works out the file the loudness of a video file is kept in
+
+        Args:
+            video_file (str): The source video file
+
+        Returns:
+            str: The loudness file or an empty string if there is no cache folder or the source file cannot be read
+        """
+        return self._cache_file(self._cache_key(video_file, [LOUDNORM_TARGET]), ".json")
+
+    def get(self, video_file: str) -> Loudness_Measurement | None:
+        """Gets the cached loudness of a video file
+
+        Args:
+            video_file (str): The source video file
+
+        Returns:
+            Loudness_Measurement | None: The loudness, or None if it is not cached
+        """
+        assert isinstance(video_file, str) and video_file.strip() != "", (
+            f"{video_file=}. Must be a non-empty str"
+        )
+
+        loudness_file = self._loudness_file(video_file)
+
+        if not loudness_file:
+            return None
+
+        try:
+            with open(loudness_file, "r", encoding="utf-8") as loudness_handle:
+                loudnorm_stats = json.load(loudness_handle)
+
+            os.utime(loudness_file)  # Marks it as the most recently used
+        except (OSError, ValueError):
+            return None  # Missing or damaged, it is just measured again
+
+        if not isinstance(loudnorm_stats, dict):
+            return None
+
+        return _Loudness_Measurement(loudnorm_stats)
+
+    def put(self, video_file: str, measurement: Loudness_Measurement) -> None:
+        """Caches the loudness of a video file, then evicts the least recently used measurements while the cache is
+        too big
+
+        Args:
+            video_file (str): The source video file
+            measurement (Loudness_Measurement): The loudness
+        """
+        assert isinstance(video_file, str) and video_file.strip() != "", (
+            f"{video_file=}. Must be a non-empty str"
+        )
+        assert isinstance(measurement, Loudness_Measurement), (
+            f"{measurement=}. Must be Loudness_Measurement"
+        )
+
+        loudness_file = self._loudness_file(video_file)
+
+        def _write_measurement(temp_file: str) -> None:
+            """Writes the measurement to the temporary file"""
+            with open(temp_file, "w", encoding="utf-8") as loudness_handle:
+                json.dump(dataclasses.asdict(measurement), loudness_handle)
+
+        if loudness_file and self._write(loudness_file, _write_measurement):
+            self._evict()
+
+        return None
@@ -0,0 +1,184 @@
+"""
+Caches the pass logs of two pass encodes, so a rebuild with the same source and encoder settings skips the analysis
+pass. The logs of a pass are stored under the hash of the source file identity and the analysis pass ffmpeg command,
+which holds the filters, target bitrate and other encoder settings.
+
+Copyright (C) 2025  David Worboys (-:alumnus Moyhu Primary School et al.:-)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import glob
+import os
+import shutil
+from typing import Final
+
+from QTPYGUI.utils import Singleton
+
+import sys_consts
+from folder_cache import Folder_Cache
+
+# Bump when the analysis pass changes in a way its command does not show, so older pass logs are not reused
+PASSLOG_CACHE_VERSION: Final[int] = 1
+PASSLOG_CACHE_MAX_SIZE: Final[int] = 1024**3  # Bytes, LRU evicted past this
+
+
+def Pass_Log_Files(passlog_file: str) -> list[str]:
+    """
+    Gets the pass log files ffmpeg wrote for a -passlogfile prefix, one or more per encoded stream
+
+    Args:
+        passlog_file (str): The -passlogfile prefix
+
+    Returns:
+        list[str]: The pass log files
+    """
+    assert isinstance(passlog_file, str) and passlog_file.strip() != "", (
+        f"{passlog_file=}. Must be a non-empty str"
+    )
+
+    return glob.glob(f"{glob.escape(passlog_file)}-*.log*")
+
+
+class Passlog_Cache(Folder_Cache, metaclass=Singleton):
+    """Holds pass logs in the pass log cache folder of the video editor folder. Each entry is a folder of the logs of
+    one analysis pass
+    """
+
+    def __init__(self):
+        super().__init__(
+            folder_name=sys_consts.PASSLOG_CACHE_FOLDER_NAME,
+            max_size=PASSLOG_CACHE_MAX_SIZE,
+            version=PASSLOG_CACHE_VERSION,
+        )
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """The number of analysis passes served from the cache"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of analysis passes that had to be run"""
+        return self._misses
+
+    def passlog_key(self, input_file: str, commands: list[str]) -> str:
+        """Works out the content address of the pass logs an analysis pass command makes
+
+        Args:
+            input_file (str): The source video file
+            commands (list[str]): The analysis pass ffmpeg command, with anything else the logs depend on appended
+
+        Returns:
+            str: The pass log key or an empty string if the source file cannot be read
+        """
+        assert isinstance(input_file, str) and input_file.strip() != "", (
+            f"{input_file=}. Must be a non-empty str"
+        )
+        assert isinstance(commands, list) and len(commands) > 1, (
+            f"{commands=}. Must be a list of ffmpeg commands and options"
+        )
+
+        # The tool path, input file and pass log file do not change what is analysed
+        key_parts = []
+
+        for command_index, command in enumerate(commands[1:], start=1):
+            if command == input_file:
+                key_parts.append("<input>")
+            elif commands[command_index - 1] == "-passlogfile":
+                key_parts.append("<passlog>")
+            else:
+                key_parts.append(command)
+
+        return self._cache_key(input_file, key_parts)
+
+    def get(self, passlog_key: str, passlog_file: str) -> bool:
+        """Copies cached pass logs to the -passlogfile prefix of the encoding pass
+
+        Args:
+            passlog_key (str): The pass log key from passlog_key
+            passlog_file (str): The -passlogfile prefix the logs are wanted under
+
+        Returns:
+            bool: True if the pass logs were cached and copied, otherwise False
+        """
+        assert isinstance(passlog_key, str), f"{passlog_key=}. Must be str"
+        assert isinstance(passlog_file, str) and passlog_file.strip() != "", (
+            f"{passlog_file=}. Must be a non-empty str"
+        )
+
+        entry_folder = self._cache_file(passlog_key)
+
+        if entry_folder:
+            try:
+                with os.scandir(entry_folder) as folder_entries:
+                    log_names = [folder_entry.name for folder_entry in folder_entries]
+
+                if log_names:
+                    # Each name is the suffix ffmpeg gave the log
+                    for log_name in log_names:
+                        shutil.copyfile(
+                            os.path.join(entry_folder, log_name),
+                            f"{passlog_file}{log_name}",
+                        )
+
+                    os.utime(entry_folder)  # Marks it as the most recently used
+
+                    with self._lock:
+                        self._hits += 1
+
+                    return True
+            except OSError:
+                pass
+
+        with self._lock:
+            self._misses += 1
+
+        return False
+
+    def put(self, passlog_key: str, passlog_file: str) -> None:
+        """Caches the pass logs of an analysis pass, then evicts the least recently used pass logs while the cache is
+        too big
+
+        Args:
+            passlog_key (str): The pass log key from passlog_key
+            passlog_file (str): The -passlogfile prefix of the analysis pass
+        """
+        assert isinstance(passlog_key, str), f"{passlog_key=}. Must be str"
+        assert isinstance(passlog_file, str) and passlog_file.strip() != "", (
+            f"{passlog_file=}. Must be a non-empty str"
+        )
+
+        entry_folder = self._cache_file(passlog_key)
+        log_files = Pass_Log_Files(passlog_file) if entry_folder else []
+
+        if not log_files:
+            return None
+
+        def _write_logs(temp_folder: str) -> None:
+            """Copies the pass logs into the temporary entry folder"""
+            os.makedirs(temp_folder, exist_ok=True)
+
+            for log_file in log_files:
+                shutil.copyfile(
+                    log_file, os.path.join(temp_folder, log_file[len(passlog_file) :])
+                )
+
+        # Fails if already cached, which like a cache write failure only costs a later analysis pass
+        if self._write(entry_folder, _write_logs):
+            self._evict()
+
+        return None
@@ -0,0 +1,953 @@
+"""
+Caches the ffprobe derived Encoding_Details and keyframe indexes of video files so a file is only probed again when
+it changes. Also defines the probe profiles, the minimal ffprobe requests that fill part of an Encoding_Details.
+
+Copyright (C) 2025  David Worboys (-:alumnus Moyhu Primary School et al.:-)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import array
+import bisect
+import dataclasses
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Final
+
+import platformdirs
+import QTPYGUI.sqldb as sqldb
+from QTPYGUI.utils import Singleton
+
+import sys_consts
+from sys_config import Encoding_Details
+
+# Bump when Get_File_Encoding_Info changes what it derives, so older cached results are re-probed
+PROBE_CACHE_VERSION: Final[int] = 2
+PROBE_CACHE_LRU_SIZE: Final[int] = 1024
+KEYFRAME_INDEX_VERSION: Final[int] = 1
+KEYFRAME_INDEX_LRU_SIZE: Final[int] = 16  # A 3 hour capture index is a few hundred KB
+
+# Probe profiles
+PROBE_IDENTITY: Final[str] = "identity"
+PROBE_DURATION: Final[str] = "duration"
+PROBE_STREAM_LAYOUT: Final[str] = "stream_layout"
+PROBE_SCAN_TYPE: Final[str] = "scan_type"
+PROBE_GOP: Final[str] = "gop"
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class Probe_Profile:
+    """The ffprobe entries a probe profile requests and the Encoding_Details fields it fills. Every profile also
+    gets the stream codec_type, so video and audio streams can be told apart
+    """
+
+    fields: tuple[str, ...]  # Encoding_Details property names owned by the profile
+    stream_entries: tuple[str, ...] = ()
+    format_entries: tuple[str, ...] = ()
+    frames: bool = False  # Needs the representative I-frame of the first 2 seconds
+    keyframe_index: bool = False  # Needs the keyframe index of the whole file
+
+
+PROBE_PROFILES: Final[dict[str, Probe_Profile]] = {
+    PROBE_IDENTITY: Probe_Profile(
+        fields=(
+            "video_codec",
+            "video_format",
+            "video_tracks",
+            "audio_codec",
+            "audio_format",
+            "audio_tracks",
+        ),
+        stream_entries=("codec_name",),
+    ),
+    PROBE_DURATION: Probe_Profile(
+        fields=(
+            "video_duration",
+            "video_frame_rate",
+            "video_frame_count",
+            "video_standard",
+        ),
+        stream_entries=(
+            "avg_frame_rate",
+            "r_frame_rate",
+            "nb_frames",
+            "width",
+            "height",
+        ),
+        format_entries=("duration",),
+        frames=True,  # Interlaced field rates and counts are halved
+    ),
+    PROBE_STREAM_LAYOUT: Probe_Profile(
+        fields=(
+            "video_width",
+            "video_height",
+            "video_par",
+            "video_dar",
+            "video_ar",
+            "video_pix_fmt",
+            "video_profile",
+            "video_level",
+            "video_bitrate",
+            "audio_sample_rate",
+            "audio_channels",
+            "audio_bitrate",
+        ),
+        stream_entries=(
+            "width",
+            "height",
+            "sample_aspect_ratio",
+            "display_aspect_ratio",
+            "pix_fmt",
+            "profile",
+            "level",
+            "bit_rate",
+            "sample_rate",
+            "channels",
+        ),
+        format_entries=("bit_rate",),
+        frames=True,  # The representative I-frame size and aspect ratio win over the stream's
+    ),
+    PROBE_SCAN_TYPE: Probe_Profile(
+        fields=("video_scan_type", "video_scan_order"),
+        frames=True,
+    ),
+    PROBE_GOP: Probe_Profile(fields=("all_I_frames",), keyframe_index=True),
+}
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class File_Identity:
+    """Identifies a version of a file, any change to the file changes at least one of these"""
+
+    file_size: int
+    mtime_ns: int
+    inode: int
+
+
+def Get_File_Identity(file_path: str) -> File_Identity | None:
+    """
+    Gets the identity of a file
+
+    Args:
+        file_path (str): The file path
+
+    Returns:
+        File_Identity | None: The file identity or None if the file cannot be read
+    """
+    assert isinstance(file_path, str) and file_path.strip() != "", (
+        f"{file_path=}. Must be a non-empty str"
+    )
+
+    try:
+        file_stat = os.stat(file_path)
+    except OSError:
+        return None
+
+    return File_Identity(
+        file_size=file_stat.st_size,
+        mtime_ns=file_stat.st_mtime_ns,
+        inode=file_stat.st_ino,
+    )
+
+
+@dataclasses.dataclass(slots=True)
+class Keyframe_Index:
+    """The keyframes of the first video stream of a file, in presentation order, built from the packet flags.
+
+    The arrays are parallel, entry n of each describes the n'th keyframe. Lookups are binary searches on key_times.
+    """
+
+    key_times: array.array = dataclasses.field(
+        default_factory=lambda: array.array("d")
+    )  # pts_time, seconds
+    key_positions: array.array = dataclasses.field(
+        default_factory=lambda: array.array("q")
+    )  # Byte offset of the keyframe packet, -1 if unknown
+    open_gops: array.array = dataclasses.field(
+        default_factory=lambda: array.array("B")
+    )  # 1 if the GOP at the keyframe is open, its leading frames use the previous GOP
+    packet_count: int = 0
+    error: str = ""
+
+    @property
+    def all_intra(self) -> bool:
+        """True if every packet is a keyframe (e.g. DV), so any frame can be cut with a stream copy"""
+        return self.packet_count > 0 and len(self.key_times) == self.packet_count
+
+    def key_at_or_before(self, time: float) -> int:
+        """
+        Finds the last keyframe at or before a time
+
+        Args:
+            time (float): The time in seconds
+
+        Returns:
+            int: The keyframe entry or -1 if there is none
+        """
+        assert isinstance(time, (int, float)), f"{time=}. Must be int | float"
+
+        return bisect.bisect_right(self.key_times, time) - 1
+
+    def key_after(self, time: float) -> int:
+        """
+        Finds the first keyframe after a time
+
+        Args:
+            time (float): The time in seconds
+
+        Returns:
+            int: The keyframe entry or -1 if there is none
+        """
+        assert isinstance(time, (int, float)), f"{time=}. Must be int | float"
+
+        key_entry = bisect.bisect_right(self.key_times, time)
+
+        return key_entry if key_entry < len(self.key_times) else -1
+
+    def nearest_key(self, time: float) -> int:
+        """
+        Finds the keyframe closest to a time
+
+        Args:
+            time (float): The time in seconds
+
+        Returns:
+            int: The keyframe entry or -1 if the index is empty
+        """
+        assert isinstance(time, (int, float)), f"{time=}. Must be int | float"
+
+        before = self.key_at_or_before(time)
+        after = self.key_after(time)
+
+        if before == -1:
+            return after
+
+        if after == -1 or time - self.key_times[before] <= self.key_times[after] - time:
+            return before
+
+        return after
+
+
+class Probe_Cache(metaclass=Singleton):
+    """Holds the Encoding_Details, probe profile results and keyframe indexes of probed files in in-memory LRUs
+    backed by the probe_cache, probe_profiles and keyframe_index tables of the application database. An entry is
+    only returned while the file size, mtime_ns and inode are unchanged.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # sqlite connections can not be shared between threads
+        self._local = threading.local()
+        self._lru: OrderedDict[str, tuple[File_Identity, Encoding_Details]] = (
+            OrderedDict()
+        )
+        self._keyframe_lru: OrderedDict[str, tuple[File_Identity, Keyframe_Index]] = (
+            OrderedDict()
+        )
+        self._profile_lru: OrderedDict[
+            str, tuple[File_Identity, frozenset[str], Encoding_Details]
+        ] = OrderedDict()
+        self._memory_hits = 0
+        self._db_hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """The number of lookups answered from the cache"""
+        return self._memory_hits + self._db_hits
+
+    @property
+    def misses(self) -> int:
+        """The number of lookups that needed a probe"""
+        return self._misses
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """The cache counters, memory_hits, db_hits, misses and lru_size"""
+        with self._lock:
+            return {
+                "memory_hits": self._memory_hits,
+                "db_hits": self._db_hits,
+                "misses": self._misses,
+                "lru_size": len(self._lru),
+            }
+
+    def _db_get(self) -> sqldb.SQLDB | None:
+        """Gets the calling thread's connection to the application database, creating the cache tables if needed
+
+        Returns:
+            sqldb.SQLDB | None: The database or None if it could not be opened
+        """
+        app_database = getattr(self._local, "app_database", None)
+
+        if app_database is not None:
+            return app_database
+
+        data_path = platformdirs.user_data_dir(sys_consts.PROGRAM_NAME)
+
+        if not os.path.exists(data_path):
+            return None
+
+        app_database = sqldb.SQLDB(
+            appname=sys_consts.PROGRAM_NAME,
+            dbpath=data_path,
+            dbfile=sys_consts.PROGRAM_NAME,
+            suffix=".db",
+            dbpassword="666evil",
+        )
+
+        if app_database.get_error_status().code == -1:
+            return None
+
+        if not app_database.table_exists(sys_consts.PROBE_CACHE):
+            probe_cache_def = (
+                sqldb.ColDef(
+                    name="file_path",
+                    description="Real Path Of The Video File",
+                    data_type=sqldb.SQL.TEXT,
+                    primary_key=True,
+                ),
+                sqldb.ColDef(
+                    name="file_size",
+                    description="File Size In Bytes",
+                    data_type=sqldb.SQL.INTEGER,
+                ),
+                sqldb.ColDef(
+                    name="mtime_ns",
+                    description="File Modification Time In Nanoseconds",
+                    data_type=sqldb.SQL.INTEGER,
+                ),
+                sqldb.ColDef(
+                    name="inode",
+                    description="File Inode",
+                    data_type=sqldb.SQL.INTEGER,
+                ),
+                sqldb.ColDef(
+                    name="cache_version",
+                    description="PROBE_CACHE_VERSION Of The Entry",
+                    data_type=sqldb.SQL.INTEGER,
+                ),
+                sqldb.ColDef(
+                    name="encoding_details",
+                    description="Encoding_Details As JSON",
+                    data_type=sqldb.SQL.TEXT,
+                ),
+            )
+
+            if (
+                app_database.table_create(
+                    table_name=sys_consts.PROBE_CACHE, col_defs=probe_cache_def
+                )
+                == -1
+            ):
+                app_database.disconnect()
+                return None
+
+        if not app_database.table_exists(sys_consts.KEYFRAME_INDEX):
+            keyframe_index_def = (
+                sqldb.ColDef(
+                    name="file_path",
+                    description="Real Path Of The Video File",
+                    data_type=sqldb.SQL.TEXT,
+                    primary_key=True,
+                ),
+                sqldb.ColDef(
+                    name="file_size",
+                    description="File Size In Bytes",
+                    data_type=sqldb.SQL.INTEGER,
+                ),
+                sqldb.ColDef(
+                    name="mtime_ns",
+                    description="File Modification Time In Nanoseconds",
+                    data_type=sqldb.SQL.INTEGER,
+                ),
+                sqldb.ColDef(
+                    name="inode",
+                    description="File Inode",
+                    data_type=sqldb.SQL.INTEGER,
+                ),
+                sqldb.ColDef(
+                    name="cache_version",
+                    description="KEYFRAME_INDEX_VERSION Of The Entry",
+                    data_type=sqldb.SQL.INTEGER,
+                ),
+                sqldb.ColDef(
+                    name="packet_count",
+                    description="Video Packets In The File",
+                    data_type=sqldb.SQL.INTEGER,
+                ),
+                sqldb.ColDef(
+                    name="key_times",
+                    description="Keyframe Times, array('d') Bytes",
+                    data_type=sqldb.SQL.BLOB,
+                ),
+                sqldb.ColDef(
+                    name="key_positions",
+                    description="Keyframe Byte Offsets, array('q') Bytes",
+                    data_type=sqldb.SQL.BLOB,
+                ),
+                sqldb.ColDef(
+                    name="open_gops",
+                    description="Open GOP Flags, array('B') Bytes",
+                    data_type=sqldb.SQL.BLOB,
+                ),
+            )
+
+            if (
+                app_database.table_create(
+                    table_name=sys_consts.KEYFRAME_INDEX, col_defs=keyframe_index_def
+                )
+                == -1
+            ):
+                app_database.disconnect()
+                return None
+
+        if not app_database.table_exists(sys_consts.PROBE_PROFILES):
+            probe_profiles_def = (
+                sqldb.ColDef(
+                    name="file_path",
+                    description="Real Path Of The Video File",
+                    data_type=sqldb.SQL.TEXT,
+                    primary_key=True,
+                ),
+                sqldb.ColDef(
+                    name="file_size",
+                    description="File Size In Bytes",
+                    data_type=sqldb.SQL.INTEGER,
+                ),
+                sqldb.ColDef(
+                    name="mtime_ns",
+                    description="File Modification Time In Nanoseconds",
+                    data_type=sqldb.SQL.INTEGER,
+                ),
+                sqldb.ColDef(
+                    name="inode",
+                    description="File Inode",
+                    data_type=sqldb.SQL.INTEGER,
+                ),
+                sqldb.ColDef(
+                    name="cache_version",
+                    description="PROBE_CACHE_VERSION Of The Entry",
+                    data_type=sqldb.SQL.INTEGER,
+                ),
+                sqldb.ColDef(
+                    name="profiles",
+                    description="Comma Separated Probe Profiles Filled",
+                    data_type=sqldb.SQL.TEXT,
+                ),
+                sqldb.ColDef(
+                    name="encoding_details",
+                    description="Partial Encoding_Details As JSON",
+                    data_type=sqldb.SQL.TEXT,
+                ),
+            )
+
+            if (
+                app_database.table_create(
+                    table_name=sys_consts.PROBE_PROFILES, col_defs=probe_profiles_def
+                )
+                == -1
+            ):
+                app_database.disconnect()
+                return None
+
+        self._local.app_database = app_database
+
+        return app_database
+
+    def get(self, video_file: str) -> Encoding_Details | None:
+        """Gets the cached Encoding_Details of a video file
+
+        Args:
+            video_file (str): The video file path
+
+        Returns:
+            Encoding_Details | None: A copy of the cached details or None if the file is not cached or has changed
+        """
+        assert isinstance(video_file, str) and video_file.strip() != "", (
+            f"{video_file=}. Must be a non-empty str"
+        )
+
+        file_path = os.path.realpath(video_file)
+        file_identity = Get_File_Identity(file_path)
+
+        if file_identity is None:
+            return None
+
+        with self._lock:
+            cached = self._lru.get(file_path)
+
+            if cached is not None and cached[0] == file_identity:
+                self._lru.move_to_end(file_path)
+                self._memory_hits += 1
+
+                return dataclasses.replace(cached[1])
+
+        encoding_details = self._db_lookup(file_path, file_identity)
+
+        with self._lock:
+            if encoding_details is None:
+                self._misses += 1
+                return None
+
+            self._db_hits += 1
+            self._lru_put(file_path, file_identity, encoding_details)
+
+        return dataclasses.replace(encoding_details)
+
+    def put(self, video_file: str, encoding_details: Encoding_Details) -> None:
+        """Caches the Encoding_Details of a video file. Details with an error are not cached
+
+        Args:
+            video_file (str): The video file path
+            encoding_details (Encoding_Details): The details from probing the file
+        """
+        assert isinstance(video_file, str) and video_file.strip() != "", (
+            f"{video_file=}. Must be a non-empty str"
+        )
+        assert isinstance(encoding_details, Encoding_Details), (
+            f"{encoding_details=}. Must be an Encoding_Details instance"
+        )
+
+        if encoding_details.error:
+            return None
+
+        file_path = os.path.realpath(video_file)
+        file_identity = Get_File_Identity(file_path)
+
+        if file_identity is None:
+            return None
+
+        encoding_details = dataclasses.replace(encoding_details)
+
+        with self._lock:
+            self._lru_put(file_path, file_identity, encoding_details)
+
+        app_database = self._db_get()
+
+        if app_database is None:
+            return None
+
+        try:
+            connection = app_database.get_connection
+            connection.execute(
+                f"INSERT OR REPLACE INTO {sys_consts.PROBE_CACHE}"
+                " (file_path, file_size, mtime_ns, inode, cache_version, encoding_details)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    file_path,
+                    file_identity.file_size,
+                    file_identity.mtime_ns,
+                    file_identity.inode,
+                    PROBE_CACHE_VERSION,
+                    json.dumps(dataclasses.asdict(encoding_details)),
+                ),
+            )
+            connection.commit()
+        except Exception:  # A cache write failure only costs a later probe
+            pass
+
+        return None
+
+    def invalidate(self, video_file: str) -> None:
+        """Drops a video file from the cache
+
+        Args:
+            video_file (str): The video file path
+        """
+        assert isinstance(video_file, str) and video_file.strip() != "", (
+            f"{video_file=}. Must be a non-empty str"
+        )
+
+        file_path = os.path.realpath(video_file)
+
+        with self._lock:
+            self._lru.pop(file_path, None)
+            self._keyframe_lru.pop(file_path, None)
+            self._profile_lru.pop(file_path, None)
+
+        app_database = self._db_get()
+
+        if app_database is None:
+            return None
+
+        try:
+            connection = app_database.get_connection
+
+            for table_name in (
+                sys_consts.PROBE_CACHE,
+                sys_consts.KEYFRAME_INDEX,
+                sys_consts.PROBE_PROFILES,
+            ):
+                connection.execute(
+                    f"DELETE FROM {table_name} WHERE file_path = ?", (file_path,)
+                )
+
+            connection.commit()
+        except Exception:
+            pass
+
+        return None
+
+    def profile_get(
+        self, video_file: str
+    ) -> tuple[frozenset[str], Encoding_Details] | None:
+        """Gets the partial Encoding_Details built up by probe profiles for a video file
+
+        Args:
+            video_file (str): The video file path
+
+        Returns:
+            tuple[frozenset[str], Encoding_Details] | None: The profiles filled and a copy of the details, or None if
+            the file has no profile entry or has changed
+        """
+        assert isinstance(video_file, str) and video_file.strip() != "", (
+            f"{video_file=}. Must be a non-empty str"
+        )
+
+        file_path = os.path.realpath(video_file)
+        file_identity = Get_File_Identity(file_path)
+
+        if file_identity is None:
+            return None
+
+        with self._lock:
+            cached = self._profile_lru.get(file_path)
+
+            if cached is not None and cached[0] == file_identity:
+                self._profile_lru.move_to_end(file_path)
+                return cached[1], dataclasses.replace(cached[2])
+
+        app_database = self._db_get()
+
+        if app_database is None:
+            return None
+
+        try:
+            row = (
+                app_database.get_connection.execute(
+                    f"SELECT file_size, mtime_ns, inode, cache_version, profiles, encoding_details"
+                    f" FROM {sys_consts.PROBE_PROFILES} WHERE file_path = ?",
+                    (file_path,),
+                )
+            ).fetchone()
+        except Exception:
+            return None
+
+        if row is None:
+            return None
+
+        file_size, mtime_ns, inode, cache_version, profiles, encoding_details_json = row
+
+        if (
+            File_Identity(file_size=file_size, mtime_ns=mtime_ns, inode=inode)
+            != file_identity
+            or cache_version != PROBE_CACHE_VERSION
+        ):
+            return None
+
+        try:
+            encoding_details = Encoding_Details(**json.loads(encoding_details_json))
+        except (json.JSONDecodeError, TypeError):  # Encoding_Details fields changed
+            return None
+
+        profiles = frozenset(profile for profile in profiles.split(",") if profile)
+
+        with self._lock:
+            self._profile_lru_put(file_path, file_identity, profiles, encoding_details)
+
+        return profiles, dataclasses.replace(encoding_details)
+
+    def profile_put(
+        self,
+        video_file: str,
+        profiles: frozenset[str],
+        encoding_details: Encoding_Details,
+    ) -> None:
+        """Caches the partial Encoding_Details filled by probe profiles, replacing any earlier profile entry.
+        Details with an error are not cached
+
+        Args:
+            video_file (str): The video file path
+            profiles (frozenset[str]): All the profiles filled in encoding_details
+            encoding_details (Encoding_Details): The partial details
+        """
+        assert isinstance(video_file, str) and video_file.strip() != "", (
+            f"{video_file=}. Must be a non-empty str"
+        )
+        assert isinstance(profiles, frozenset) and all(
+            profile in PROBE_PROFILES for profile in profiles
+        ), f"{profiles=}. Must be a frozenset of PROBE_PROFILES keys"
+        assert isinstance(encoding_details, Encoding_Details), (
+            f"{encoding_details=}. Must be an Encoding_Details instance"
+        )
+
+        if encoding_details.error:
+            return None
+
+        file_path = os.path.realpath(video_file)
+        file_identity = Get_File_Identity(file_path)
+
+        if file_identity is None:
+            return None
+
+        encoding_details = dataclasses.replace(encoding_details)
+
+        with self._lock:
+            self._profile_lru_put(file_path, file_identity, profiles, encoding_details)
+
+        app_database = self._db_get()
+
+        if app_database is None:
+            return None
+
+        try:
+            connection = app_database.get_connection
+            connection.execute(
+                f"INSERT OR REPLACE INTO {sys_consts.PROBE_PROFILES}"
+                " (file_path, file_size, mtime_ns, inode, cache_version, profiles, encoding_details)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    file_path,
+                    file_identity.file_size,
+                    file_identity.mtime_ns,
+                    file_identity.inode,
+                    PROBE_CACHE_VERSION,
+                    ",".join(sorted(profiles)),
+                    json.dumps(dataclasses.asdict(encoding_details)),
+                ),
+            )
+            connection.commit()
+        except Exception:  # A cache write failure only costs a later probe
+            pass
+
+        return None
+
+    def keyframe_index_get(self, video_file: str) -> Keyframe_Index | None:
+        """Gets the cached keyframe index of a video file
+
+        Args:
+            video_file (str): The video file path
+
+        Returns:
+            Keyframe_Index | None: The index or None if the file is not indexed or has changed. Shared, do not modify
+        """
+        assert isinstance(video_file, str) and video_file.strip() != "", (
+            f"{video_file=}. Must be a non-empty str"
+        )
+
+        file_path = os.path.realpath(video_file)
+        file_identity = Get_File_Identity(file_path)
+
+        if file_identity is None:
+            return None
+
+        with self._lock:
+            cached = self._keyframe_lru.get(file_path)
+
+            if cached is not None and cached[0] == file_identity:
+                self._keyframe_lru.move_to_end(file_path)
+                return cached[1]
+
+        app_database = self._db_get()
+
+        if app_database is None:
+            return None
+
+        try:
+            row = (
+                app_database.get_connection.execute(
+                    f"SELECT file_size, mtime_ns, inode, cache_version, packet_count, key_times,"
+                    f" key_positions, open_gops FROM {sys_consts.KEYFRAME_INDEX} WHERE file_path = ?",
+                    (file_path,),
+                )
+            ).fetchone()
+        except Exception:
+            return None
+
+        if row is None:
+            return None
+
+        (
+            file_size,
+            mtime_ns,
+            inode,
+            cache_version,
+            packet_count,
+            key_times,
+            key_positions,
+            open_gops,
+        ) = row
+
+        if (
+            File_Identity(file_size=file_size, mtime_ns=mtime_ns, inode=inode)
+            != file_identity
+            or cache_version != KEYFRAME_INDEX_VERSION
+        ):
+            return None
+
+        keyframe_index = Keyframe_Index(packet_count=packet_count)
+        keyframe_index.key_times.frombytes(key_times)
+        keyframe_index.key_positions.frombytes(key_positions)
+        keyframe_index.open_gops.frombytes(open_gops)
+
+        with self._lock:
+            self._keyframe_lru_put(file_path, file_identity, keyframe_index)
+
+        return keyframe_index
+
+    def keyframe_index_put(
+        self, video_file: str, keyframe_index: Keyframe_Index
+    ) -> None:
+        """Caches the keyframe index of a video file. An index with an error is not cached
+
+        Args:
+            video_file (str): The video file path
+            keyframe_index (Keyframe_Index): The index built from the file
+        """
+        assert isinstance(video_file, str) and video_file.strip() != "", (
+            f"{video_file=}. Must be a non-empty str"
+        )
+        assert isinstance(keyframe_index, Keyframe_Index), (
+            f"{keyframe_index=}. Must be a Keyframe_Index instance"
+        )
+
+        if keyframe_index.error:
+            return None
+
+        file_path = os.path.realpath(video_file)
+        file_identity = Get_File_Identity(file_path)
+
+        if file_identity is None:
+            return None
+
+        with self._lock:
+            self._keyframe_lru_put(file_path, file_identity, keyframe_index)
+
+        app_database = self._db_get()
+
+        if app_database is None:
+            return None
+
+        try:
+            connection = app_database.get_connection
+            connection.execute(
+                f"INSERT OR REPLACE INTO {sys_consts.KEYFRAME_INDEX}"
+                " (file_path, file_size, mtime_ns, inode, cache_version, packet_count, key_times, key_positions,"
+                " open_gops) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    file_path,
+                    file_identity.file_size,
+                    file_identity.mtime_ns,
+                    file_identity.inode,
+                    KEYFRAME_INDEX_VERSION,
+                    keyframe_index.packet_count,
+                    keyframe_index.key_times.tobytes(),
+                    keyframe_index.key_positions.tobytes(),
+                    keyframe_index.open_gops.tobytes(),
+                ),
+            )
+            connection.commit()
+        except Exception:  # A cache write failure only costs a later re-index
+            pass
+
+        return None
+
+    def _keyframe_lru_put(
+        self,
+        file_path: str,
+        file_identity: File_Identity,
+        keyframe_index: Keyframe_Index,
+    ) -> None:
+        """Adds an index to the in-memory keyframe LRU, evicting the least recently used. Caller holds the lock"""
+        self._keyframe_lru[file_path] = (file_identity, keyframe_index)
+        self._keyframe_lru.move_to_end(file_path)
+
+        while len(self._keyframe_lru) > KEYFRAME_INDEX_LRU_SIZE:
+            self._keyframe_lru.popitem(last=False)
+
+    def _profile_lru_put(
+        self,
+        file_path: str,
+        file_identity: File_Identity,
+        profiles: frozenset[str],
+        encoding_details: Encoding_Details,
+    ) -> None:
+        """Adds a profile entry to the in-memory profile LRU, evicting the least recently used. Caller holds the
+        lock"""
+        self._profile_lru[file_path] = (file_identity, profiles, encoding_details)
+        self._profile_lru.move_to_end(file_path)
+
+        while len(self._profile_lru) > PROBE_CACHE_LRU_SIZE:
+            self._profile_lru.popitem(last=False)
+
+    def _lru_put(
+        self,
+        file_path: str,
+        file_identity: File_Identity,
+        encoding_details: Encoding_Details,
+    ) -> None:
+        """Adds an entry to the in-memory LRU, evicting the least recently used. Caller holds the lock"""
+        self._lru[file_path] = (file_identity, encoding_details)
+        self._lru.move_to_end(file_path)
+
+        while len(self._lru) > PROBE_CACHE_LRU_SIZE:
+            self._lru.popitem(last=False)
+
+    def _db_lookup(
+        self, file_path: str, file_identity: File_Identity
+    ) -> Encoding_Details | None:
+        """Reads an entry from the probe_cache table
+
+        Args:
+            file_path (str): The real path of the file
+            file_identity (File_Identity): The current identity of the file
+
+        Returns:
+            Encoding_Details | None: The cached details or None if missing, stale or unreadable
+        """
+        app_database = self._db_get()
+
+        if app_database is None:
+            return None
+
+        try:
+            row = (
+                app_database.get_connection.execute(
+                    f"SELECT file_size, mtime_ns, inode, cache_version, encoding_details"
+                    f" FROM {sys_consts.PROBE_CACHE} WHERE file_path = ?",
+                    (file_path,),
+                )
+            ).fetchone()
+        except Exception:
+            return None
+
+        if row is None:
+            return None
+
+        file_size, mtime_ns, inode, cache_version, encoding_details_json = row
+
+        if (
+            File_Identity(file_size=file_size, mtime_ns=mtime_ns, inode=inode)
+            != file_identity
+            or cache_version != PROBE_CACHE_VERSION
+        ):
+            return None
+
+        try:
+            return Encoding_Details(**json.loads(encoding_details_json))
+        except (json.JSONDecodeError, TypeError):  # Encoding_Details fields changed
+            return None
@@ -0,0 +1,145 @@
+"""
+Caches the low resolution, all I-frame, edit proxies of large HD video files, which the video editor plays and
+scrubs in place of the source. A proxy keeps the frame rate and timeline of its source, so a frame number in the
+editor is the same frame of the source, and is stored under the hash of the source file identity.
+
+Copyright (C) 2025  David Worboys (-:alumnus Moyhu Primary School et al.:-)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import os
+from typing import Final
+
+from QTPYGUI.utils import Singleton
+
+import sys_consts
+from folder_cache import Folder_Cache
+from sys_config import Encoding_Details
+
+# Bump when the proxy encode changes, so older proxies are not reused
+PROXY_CACHE_VERSION: Final[int] = 1
+PROXY_CACHE_MAX_SIZE: Final[int] = 16 * 1024**3  # Bytes, LRU evicted past this
+PROXY_HEIGHT: Final[int] = 360  # Pixels, proxies keep the aspect ratio of their source
+PROXY_MIN_SOURCE_HEIGHT: Final[int] = 577  # Taller than standard definition
+PROXY_MIN_SOURCE_BITRATE: Final[int] = 15_000_000  # Or a video bitrate above this
+PROXY_EXTN: Final[str] = "mp4"
+
+
+def Proxy_Wanted(encoding_info: Encoding_Details) -> bool:
+    """
+    Works out if a video file is heavy enough to decode that the video editor should use a proxy of it
+
+    Args:
+        encoding_info (Encoding_Details): The encoding details of the video file
+
+    Returns:
+        bool: True if the video file should have a proxy
+    """
+    assert isinstance(encoding_info, Encoding_Details), (
+        f"{encoding_info=}. Must be Encoding_Details"
+    )
+
+    if encoding_info.error or encoding_info.video_tracks <= 0:
+        return False
+
+    return (
+        encoding_info.video_height >= PROXY_MIN_SOURCE_HEIGHT
+        or encoding_info.video_bitrate > PROXY_MIN_SOURCE_BITRATE
+    )
+
+
+class Proxy_Cache(Folder_Cache, metaclass=Singleton):
+    """Holds edit proxies in the proxy cache folder of the video editor folder"""
+
+    def __init__(self):
+        super().__init__(
+            folder_name=sys_consts.PROXY_CACHE_FOLDER_NAME,
+            max_size=PROXY_CACHE_MAX_SIZE,
+            version=PROXY_CACHE_VERSION,
+        )
+
+    def proxy_file(self, video_file: str) -> str:
+        """Works out the file the proxy of a video file is kept in, making the proxy cache folder if needed
+
+        Args:
+            video_file (str): The source video file
+
+        Returns:
+            str: The proxy file or an empty string if there is no cache folder or the source file cannot be read
+        """
+        assert isinstance(video_file, str) and video_file.strip() != "", (
+            f"{video_file=}. Must be a non-empty str"
+        )
+
+        return self._cache_file(self._cache_key(video_file, []), f".{PROXY_EXTN}")
+
+    def get(self, video_file: str) -> str:
+        """Gets the proxy of a video file
+
+        Args:
+            video_file (str): The source video file
+
+        Returns:
+            str: The proxy file or an empty string if the video file has no proxy
+        """
+        assert isinstance(video_file, str) and video_file.strip() != "", (
+            f"{video_file=}. Must be a non-empty str"
+        )
+
+        proxy_file = self.proxy_file(video_file)
+
+        if not proxy_file:
+            return ""
+
+        try:
+            os.utime(proxy_file)  # Marks it as the most recently used
+        except OSError:
+            return ""
+
+        return proxy_file
+
+    def put(self, video_file: str, rendered_file: str) -> str:
+        """Moves a rendered proxy into the cache, then evicts the least recently used proxies while the cache is too
+        big
+
+        Args:
+            video_file (str): The source video file
+            rendered_file (str): The rendered proxy, it must be on the same file system as the cache
+
+        Returns:
+            str: The proxy file or an empty string if it could not be cached, the rendered proxy is then removed
+        """
+        assert isinstance(video_file, str) and video_file.strip() != "", (
+            f"{video_file=}. Must be a non-empty str"
+        )
+        assert isinstance(rendered_file, str) and rendered_file.strip() != "", (
+            f"{rendered_file=}. Must be a non-empty str"
+        )
+
+        proxy_file = self.proxy_file(video_file)
+
+        # The rendered proxy is moved in, so readers never see a partial proxy
+        if not proxy_file or not self._write(
+            proxy_file, lambda temp_file: os.replace(rendered_file, temp_file)
+        ):
+            # A cache failure only costs playing the source
+            if os.path.exists(rendered_file):
+                os.remove(rendered_file)
+
+            return ""
+
+        self._evict(keep_file=proxy_file)
+
+        return proxy_file
@@ -0,0 +1,141 @@
+"""
+Caches the reencoded boundary GOP segments of frame accurate cuts, so a re-export only renders the cuts that changed.
+A segment is stored under the hash of its source file identity and the ffmpeg command that made it, which holds the
+GOP start and end times and the encoder settings from the source Encoding_Details.
+
+Copyright (C) 2025  David Worboys (-:alumnus Moyhu Primary School et al.:-)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import os
+import shutil
+from typing import Final
+
+from QTPYGUI.utils import Singleton
+
+import sys_consts
+from folder_cache import Folder_Cache
+
+# Bump when the boundary reencode changes in a way its command does not show, so older segments are not reused
+RENDER_CACHE_VERSION: Final[int] = 1
+# Bytes, the least recently used segments are evicted past this
+RENDER_CACHE_MAX_SIZE: Final[int] = 4 * 1024**3
+
+
+class Render_Cache(Folder_Cache, metaclass=Singleton):
+    """Holds reencoded boundary segments in the render cache folder of the video editor folder"""
+
+    def __init__(self):
+        super().__init__(
+            folder_name=sys_consts.RENDER_CACHE_FOLDER_NAME,
+            max_size=RENDER_CACHE_MAX_SIZE,
+            version=RENDER_CACHE_VERSION,
+        )
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """The number of segments served from the cache"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of segments that had to be rendered"""
+        return self._misses
+
+    def segment_key(self, input_file: str, commands: list[str]) -> str:
+        """Works out the content address of the segment a reencode command makes
+
+        Args:
+            input_file (str): The source video file
+            commands (list[str]): The ffmpeg command, its last two items being the output file and "-y"
+
+        Returns:
+            str: The segment key or an empty string if the source file cannot be read
+        """
+        assert isinstance(input_file, str) and input_file.strip() != "", (
+            f"{input_file=}. Must be a non-empty str"
+        )
+        assert isinstance(commands, list) and len(commands) > 2, (
+            f"{commands=}. Must be a list of ffmpeg commands and options"
+        )
+
+        # The tool path, input file and output file do not change what is rendered, only the output extension does
+        return self._cache_key(
+            input_file,
+            [
+                *(
+                    "<input>" if command == input_file else command
+                    for command in commands[1:-2]
+                ),
+                os.path.splitext(commands[-2])[1].lower(),
+            ],
+        )
+
+    def get(self, segment_key: str, output_file: str) -> bool:
+        """Copies a cached segment to the output file
+
+        Args:
+            segment_key (str): The segment key from segment_key
+            output_file (str): The file the segment is wanted in
+
+        Returns:
+            bool: True if the segment was cached and copied, otherwise False
+        """
+        assert isinstance(segment_key, str), f"{segment_key=}. Must be str"
+        assert isinstance(output_file, str) and output_file.strip() != "", (
+            f"{output_file=}. Must be a non-empty str"
+        )
+
+        segment_file = self._cache_file(segment_key, os.path.splitext(output_file)[1])
+
+        if segment_file:
+            try:
+                shutil.copyfile(segment_file, output_file)
+                os.utime(segment_file)  # Marks it as the most recently used
+
+                with self._lock:
+                    self._hits += 1
+
+                return True
+            except OSError:
+                pass
+
+        with self._lock:
+            self._misses += 1
+
+        return False
+
+    def put(self, segment_key: str, segment_file: str) -> None:
+        """Caches a rendered segment, then evicts the least recently used segments while the cache is too big
+
+        Args:
+            segment_key (str): The segment key from segment_key
+            segment_file (str): The rendered segment
+        """
+        assert isinstance(segment_key, str), f"{segment_key=}. Must be str"
+        assert isinstance(segment_file, str) and segment_file.strip() != "", (
+            f"{segment_file=}. Must be a non-empty str"
+        )
+
+        cache_file = self._cache_file(segment_key, os.path.splitext(segment_file)[1])
+
+        if cache_file and self._write(
+            cache_file, lambda temp_file: shutil.copyfile(segment_file, temp_file)
+        ):
+            self._evict()
+
+        return None
@@ -0,0 +1,597 @@
+"""
+Analyses a video file for the video editor so it can propose edit points, the junk between recordings on a tape
+capture. ffmpeg pipes a tiny grey luma stream, and a low rate mono audio stream, into NumPy where the frame
+difference, mean luma, luma spread and audio RMS of each frame are worked out a batch at a time. The time series are
+cached per file, so proposing edit points again costs nothing.
+
+Copyright (C) 2025  David Worboys (-:alumnus Moyhu Primary School et al.:-)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import dataclasses
+import os
+import threading
+from typing import Callable, Final, Optional
+
+import numpy as np
+from QTPYGUI.utils import Singleton
+
+import sys_consts
+from break_circular import Cancel_All_Tasks, Execute_Check_Output
+from dvdarch_utils import Get_File_Encoding_Info, Input_Options
+from folder_cache import Folder_Cache
+
+# Bump when the analysis changes in a way that makes older time series wrong, so they are not reused
+ANALYSIS_CACHE_VERSION: Final[int] = 1
+ANALYSIS_CACHE_MAX_SIZE: Final[int] = 256 * 1024**2  # Bytes, LRU evicted past this
+ANALYSIS_WIDTH: Final[int] = 64  # Pixels, area averaging also smooths tape noise
+ANALYSIS_HEIGHT: Final[int] = 48
+ANALYSIS_BATCH_FRAMES: Final[int] = 250  # Frames at a time, bounds the memory used
+AUDIO_SAMPLE_RATE: Final[int] = 8000  # Hz, plenty for loudness
+AUDIO_READ_SIZE: Final[int] = 64 * 1024  # Bytes of audio analysed at a time
+
+# Edit point proposal thresholds, luma is 0 - 255 and audio RMS is 0.0 - 1.0 of full scale
+BLACK_LUMA_MAX: Final[float] = 32.0  # Studio black is 16
+FLAT_LUMA_STD_MAX: Final[float] = 6.0  # A black, blue or snow screen is this even
+SILENCE_RMS_MAX: Final[float] = 0.003  # About -50 dBFS
+BLANK_MIN_SECONDS: Final[float] = 1.0
+SILENCE_MIN_SECONDS: Final[float] = 2.0
+SCENE_CHANGE_MIN: Final[float] = 12.0  # Mean absolute luma change from the last frame
+SCENE_CHANGE_RATIO: Final[float] = 3.0  # Times the mean change of the frames around it
+SCENE_WINDOW_SECONDS: Final[float] = 1.0
+SCENE_SNAP_SECONDS: Final[float] = 0.5  # Edit points move to a scene change this close
+
+
+@dataclasses.dataclass(slots=True)
+class Analysis_Series:
+    """The per frame time series of a video file. audio_rms is NaN where there is no audio"""
+
+    frame_rate: float = 0.0
+    frame_diff: np.ndarray = dataclasses.field(
+        default_factory=lambda: np.zeros(0, dtype=np.float32)
+    )
+    mean_luma: np.ndarray = dataclasses.field(
+        default_factory=lambda: np.zeros(0, dtype=np.float32)
+    )
+    luma_std: np.ndarray = dataclasses.field(
+        default_factory=lambda: np.zeros(0, dtype=np.float32)
+    )
+    audio_rms: np.ndarray = dataclasses.field(
+        default_factory=lambda: np.zeros(0, dtype=np.float32)
+    )
+
+    def __post_init__(self) -> None:
+        assert isinstance(self.frame_rate, float) and self.frame_rate >= 0, (
+            f"{self.frame_rate=}. Must be a float >= 0"
+        )
+        assert (
+            len(self.frame_diff)
+            == len(self.mean_luma)
+            == len(self.luma_std)
+            == len(self.audio_rms)
+        ), "The time series must all be the same length"
+
+    @property
+    def frame_count(self) -> int:
+        """The number of frames analysed"""
+        return len(self.frame_diff)
+
+
+class _Audio_RMS:
+    """Works out the RMS of the audio samples of each video frame period, as s16le mono audio is fed in"""
+
+    def __init__(self, samples_per_frame: float):
+        """
+        Args:
+            samples_per_frame (float): The audio samples in a video frame period
+        """
+        assert isinstance(samples_per_frame, float) and samples_per_frame >= 1, (
+            f"{samples_per_frame=}. Must be a float >= 1"
+        )
+
+        self._samples_per_frame = samples_per_frame
+        # Of the samples not yet in a whole frame period
+        self._squares = np.zeros(0, dtype=np.float32)
+        self._squares_start = 0  # The sample number of the first square
+        self._next_frame = 0
+        self._odd_byte = b""
+        self._frame_rms: list[np.ndarray] = []
+
+    def feed(self, data: bytes) -> None:
+        """
+        Feeds raw audio into the RMS, every frame period it completes is worked out
+
+        Args:
+            data (bytes): s16le mono audio, not necessarily sample aligned
+        """
+        data = self._odd_byte + data
+        sample_bytes = len(data) // 2 * 2
+        self._odd_byte = data[sample_bytes:]
+
+        samples = np.frombuffer(data[:sample_bytes], dtype="<i2") / np.float32(32768)
+        self._squares = np.concatenate((self._squares, samples * samples))
+        sample_end = self._squares_start + len(self._squares)
+
+        # Frame period boundaries are rounded so they never drift, whatever the frame rate
+        boundaries = np.round(
+            np.arange(self._next_frame, sample_end / self._samples_per_frame + 1)
+            * self._samples_per_frame
+        ).astype(np.int64)
+        boundaries = boundaries[boundaries <= sample_end] - self._squares_start
+
+        if len(boundaries) < 2:
+            return None
+
+        square_sums = np.add.reduceat(self._squares[: boundaries[-1]], boundaries[:-1])
+        self._frame_rms.append(
+            np.sqrt(square_sums / np.diff(boundaries)).astype(np.float32)
+        )
+        self._next_frame += len(boundaries) - 1
+        self._squares = self._squares[boundaries[-1] :]
+        self._squares_start += int(boundaries[-1])
+
+        return None
+
+    def finish(self, frame_count: int) -> np.ndarray:
+        """
+        Finishes the RMS, the audio of any last part frame period is a frame of its own
+
+        Args:
+            frame_count (int): The number of video frames, the RMS is cut or NaN padded to this
+
+        Returns:
+            np.ndarray: The RMS of each video frame
+        """
+        assert isinstance(frame_count, int) and frame_count >= 0, (
+            f"{frame_count=}. Must be an int >= 0"
+        )
+
+        if len(self._squares) > 0:
+            self._frame_rms.append(
+                np.sqrt(self._squares.mean(keepdims=True)).astype(np.float32)
+            )
+            self._squares = np.zeros(0, dtype=np.float32)
+
+        frame_rms = np.full(frame_count, np.nan, dtype=np.float32)
+
+        if self._frame_rms:
+            audio_rms = np.concatenate(self._frame_rms)[:frame_count]
+            frame_rms[: len(audio_rms)] = audio_rms
+
+        return frame_rms
+
+
+class Analysis_Cache(Folder_Cache, metaclass=Singleton):
+    """Holds the time series of analysed video files in the analysis cache folder of the video editor folder"""
+
+    def __init__(self):
+        super().__init__(
+            folder_name=sys_consts.ANALYSIS_CACHE_FOLDER_NAME,
+            max_size=ANALYSIS_CACHE_MAX_SIZE,
+            version=ANALYSIS_CACHE_VERSION,
+        )
+
+    def _series_file(self, video_file: str) -> str:
+        """Works out the file the time series of a video file are kept in
+
+        Args:
+            video_file (str): The source video file
+
+        Returns:
+            str: The time series file or an empty string if there is no cache folder or the source file cannot be read
+        """
+        return self._cache_file(self._cache_key(video_file, []), ".npz")
+
+    def get(self, video_file: str) -> Analysis_Series | None:
+        """Loads the cached time series of a video file
+
+        Args:
+            video_file (str): The source video file
+
+        Returns:
+            Analysis_Series | None: The time series, or None if they are not cached
+        """
+        assert isinstance(video_file, str) and video_file.strip() != "", (
+            f"{video_file=}. Must be a non-empty str"
+        )
+
+        series_file = self._series_file(video_file)
+
+        if not series_file:
+            return None
+
+        try:
+            with np.load(series_file) as series_data:
+                series = Analysis_Series(
+                    frame_rate=float(series_data["frame_rate"]),
+                    frame_diff=series_data["frame_diff"],
+                    mean_luma=series_data["mean_luma"],
+                    luma_std=series_data["luma_std"],
+                    audio_rms=series_data["audio_rms"],
+                )
+
+            os.utime(series_file)  # Marks it as the most recently used
+        except (OSError, ValueError, KeyError):
+            return None  # Missing, evicted or damaged, the file is just analysed again
+
+        return series
+
+    def put(self, video_file: str, series: Analysis_Series) -> None:
+        """Caches the time series of a video file, then evicts the least recently used while the cache is too big
+
+        Args:
+            video_file (str): The source video file
+            series (Analysis_Series): The time series
+        """
+        assert isinstance(video_file, str) and video_file.strip() != "", (
+            f"{video_file=}. Must be a non-empty str"
+        )
+        assert isinstance(series, Analysis_Series), (
+            f"{series=}. Must be an Analysis_Series"
+        )
+
+        series_file = self._series_file(video_file)
+
+        if not series_file:
+            return None
+
+        def _write_series(temp_file: str) -> None:
+            """Writes the time series to the temporary file"""
+            with open(temp_file, "wb") as series_handle:  # A file name would gain .npz
+                np.savez(
+                    series_handle,
+                    frame_rate=np.float64(series.frame_rate),
+                    frame_diff=series.frame_diff,
+                    mean_luma=series.mean_luma,
+                    luma_std=series.luma_std,
+                    audio_rms=series.audio_rms,
+                )
+
+        if self._write(series_file, _write_series):
+            self._evict()
+
+        return None
+
+
+def Analyse_Video(
+    video_file: str,
+    cancellation_callback: Optional[Callable[[], bool]] = None,
+    progress_callback: Optional[Callable[[float, str], None]] = None,
+) -> tuple[int, str]:
+    """
+    Works out the time series of a video file, if they are not already in the Analysis_Cache. The file is decoded
+    once and only ANALYSIS_BATCH_FRAMES frames, and a little audio, are held at a time however long the file is.
+
+    Args:
+        video_file (str): The video file
+        cancellation_callback (Optional[Callable[[], bool]]): Returns True when the analysis is to be cancelled.
+            Defaults to None (Cancel_All_Tasks)
+        progress_callback (Optional[Callable[[float, str], None]]): Called with the percentage done and a message.
+            Defaults to None
+
+    Returns:
+        tuple[int, str]:
+        - arg 1: 1 if ok, -1 on error, -2 if cancelled
+        - arg 2: Empty string if all good, otherwise error message
+    """
+    assert isinstance(video_file, str) and video_file.strip() != "", (
+        f"{video_file=}. Must be a non-empty str"
+    )
+    assert callable(cancellation_callback) or cancellation_callback is None, (
+        f"{cancellation_callback=}. Must be a function or None"
+    )
+    assert callable(progress_callback) or progress_callback is None, (
+        f"{progress_callback=}. Must be a function or None"
+    )
+
+    if not os.path.exists(video_file):
+        return -1, f"{video_file=}. Does not exist"
+
+    analysis_cache = Analysis_Cache()
+
+    if analysis_cache.get(video_file) is not None:
+        return 1, ""
+
+    if cancellation_callback is None:
+        cancellation_callback = Cancel_All_Tasks().is_cancellation_requested
+
+    encoding_info = Get_File_Encoding_Info(video_file)
+
+    if encoding_info.error:
+        return -1, encoding_info.error
+
+    frame_rate = float(encoding_info.video_frame_rate)
+
+    if frame_rate <= 0:
+        return -1, f"{video_file} Has No Frame Rate"
+
+    expected_frames = max(1, round(encoding_info.video_duration * frame_rate))
+
+    # -lowres decodes DV and MPEG-2 at a quarter size, decoders without it ignore it
+    commands = [
+        sys_consts.FFMPG,
+        "-hide_banner",
+        "-nostats",
+        "-nostdin",
+        "-v",
+        "error",
+        "-lowres",
+        "2",
+        *Input_Options(video_file),
+        "-map",
+        "0:v:0",
+        "-vf",
+        f"scale={ANALYSIS_WIDTH}:{ANALYSIS_HEIGHT}:flags=area,format=gray",
+        "-vsync",
+        "passthrough",
+        "-f",
+        "rawvideo",
+        "pipe:1",
+    ]
+
+    audio_read_fd = audio_write_fd = None
+    audio_rms = _Audio_RMS(AUDIO_SAMPLE_RATE / frame_rate)
+
+    if encoding_info.audio_tracks > 0:
+        audio_read_fd, audio_write_fd = os.pipe()
+        commands += [
+            "-map",
+            "0:a:0",
+            "-ac",
+            "1",
+            "-ar",
+            str(AUDIO_SAMPLE_RATE),
+            "-f",
+            "s16le",
+            f"pipe:{audio_write_fd}",
+        ]
+
+    def _read_audio() -> None:
+        """Feeds the audio pipe into the audio RMS until ffmpeg closes it"""
+        with open(audio_read_fd, "rb", buffering=0) as audio_pipe:
+            while audio_data := audio_pipe.read(AUDIO_READ_SIZE):
+                audio_rms.feed(audio_data)
+
+        return None
+
+    frame_size = ANALYSIS_WIDTH * ANALYSIS_HEIGHT
+    batch_size = frame_size * ANALYSIS_BATCH_FRAMES
+    batch_data = bytearray()
+    frame_diffs: list[np.ndarray] = []
+    mean_lumas: list[np.ndarray] = []
+    luma_stds: list[np.ndarray] = []
+    frame_state = {"previous_frame": None, "frame_count": 0}
+
+    def _analyse_frames(frames_data: bytes) -> None:
+        """
+        Adds a batch of whole frames to the time series
+
+        Args:
+            frames_data (bytes): The gray frames, a whole number of frames
+        """
+        batch_frames = len(frames_data) // frame_size
+        frames = np.frombuffer(
+            frames_data, dtype=np.uint8, count=batch_frames * frame_size
+        ).reshape(batch_frames, frame_size)
+
+        mean_lumas.append(frames.mean(axis=1, dtype=np.float32))
+        luma_stds.append(frames.std(axis=1, dtype=np.float32))
+
+        # The last frame of the previous batch is carried over, so differences run across batches
+        signed_frames = frames.astype(np.int16)
+
+        if frame_state["previous_frame"] is None:
+            frame_state["previous_frame"] = signed_frames[:1]
+
+        frame_diffs.append(
+            np.abs(
+                np.diff(
+                    np.concatenate((frame_state["previous_frame"], signed_frames)),
+                    axis=0,
+                )
+            ).mean(axis=1, dtype=np.float32)
+        )
+        frame_state["previous_frame"] = signed_frames[-1:]
+        frame_state["frame_count"] += batch_frames
+
+        if progress_callback is not None:
+            progress_callback(
+                min(100.0, frame_state["frame_count"] * 100 / expected_frames),
+                f"Analysed {frame_state['frame_count']} Of {expected_frames} Frames",
+            )
+
+        return None
+
+    def _read_video(video_data: bytes) -> bool:
+        """
+        Gathers the video pipe into batches of ANALYSIS_BATCH_FRAMES frames and analyses each batch
+
+        Args:
+            video_data (bytes): The video bytes just read
+
+        Returns:
+            bool: Always True, every frame is needed
+        """
+        batch_data.extend(video_data)
+
+        while len(batch_data) >= batch_size:
+            _analyse_frames(bytes(batch_data[:batch_size]))
+            del batch_data[:batch_size]
+
+        return True
+
+    audio_reader = None
+
+    if audio_read_fd is not None:
+        audio_reader = threading.Thread(
+            target=_read_audio, name="analysis_audio", daemon=True
+        )
+        audio_reader.start()
+
+    # Execute_Check_Output closes the write end of the audio pipe once ffmpeg has it, so the reader sees it end
+    try:
+        result, message = Execute_Check_Output(
+            commands=commands,
+            debug=False,
+            cancellation_callback=cancellation_callback,
+            stdout_callback=_read_video,
+            pass_fds=(audio_write_fd,) if audio_write_fd is not None else (),
+        )
+    finally:
+        if audio_reader is not None:
+            audio_reader.join()
+
+    if result == -2:
+        return -2, ""
+
+    if result == -1:
+        return -1, f"Video Analysis Of {video_file} Failed: {message}"
+
+    if len(batch_data) >= frame_size:  # The last, part filled, batch
+        _analyse_frames(bytes(batch_data[: len(batch_data) // frame_size * frame_size]))
+
+    frame_count = frame_state["frame_count"]
+
+    if frame_count == 0:
+        return -1, f"No Video Frames Found In {video_file}"
+
+    analysis_cache.put(
+        video_file,
+        Analysis_Series(
+            frame_rate=frame_rate,
+            frame_diff=np.concatenate(frame_diffs),
+            mean_luma=np.concatenate(mean_lumas),
+            luma_std=np.concatenate(luma_stds),
+            audio_rms=audio_rms.finish(frame_count),
+        ),
+    )
+
+    return 1, ""
+
+
+def _Runs(mask: np.ndarray, min_frames: int) -> list[tuple[int, int]]:
+    """
+    Finds the runs of True in a mask
+
+    Args:
+        mask (np.ndarray): The boolean mask
+        min_frames (int): The shortest run wanted
+
+    Returns:
+        list[tuple[int, int]]: The first and last index of each run
+    """
+    edges = np.flatnonzero(np.diff(np.concatenate(([False], mask, [False]))))
+
+    return [
+        (int(run_start), int(run_end) - 1)
+        for run_start, run_end in zip(edges[0::2], edges[1::2])
+        if run_end - run_start >= min_frames
+    ]
+
+
+def Scene_Cuts(series: Analysis_Series) -> np.ndarray:
+    """
+    Finds the scene changes, frames much more different from the frame before than the frames around them are
+
+    Args:
+        series (Analysis_Series): The time series of the video file
+
+    Returns:
+        np.ndarray: The frame numbers of the first frame of each new scene, ascending
+    """
+    assert isinstance(series, Analysis_Series), f"{series=}. Must be an Analysis_Series"
+
+    if series.frame_count < 2:
+        return np.zeros(0, dtype=np.int64)
+
+    window = max(1, round(SCENE_WINDOW_SECONDS * series.frame_rate))
+    kernel = np.ones(2 * window + 1, dtype=np.float32)
+    kernel[window] = 0  # The frame itself is not part of its surroundings
+    local_mean = np.convolve(series.frame_diff, kernel, mode="same") / (2 * window)
+
+    return np.flatnonzero(
+        (series.frame_diff >= SCENE_CHANGE_MIN)
+        & (series.frame_diff >= SCENE_CHANGE_RATIO * local_mean)
+    )
+
+
+def Propose_Edit_Points(series: Analysis_Series) -> list[tuple[int, int, str]]:
+    """
+    Proposes the edit points of the junk in a video file, black, blank (blue or snow) and silent stretches. Each edit
+    point is moved onto a scene change if there is one close by, as tape junk starts and ends abruptly
+
+    Args:
+        series (Analysis_Series): The time series of the video file
+
+    Returns:
+        list[tuple[int, int, str]]: The mark in frame, mark out frame and clip name of each edit point, ascending
+    """
+    assert isinstance(series, Analysis_Series), f"{series=}. Must be an Analysis_Series"
+
+    if series.frame_count == 0:
+        return []
+
+    flat = series.luma_std <= FLAT_LUMA_STD_MAX
+    black = flat & (series.mean_luma <= BLACK_LUMA_MAX)
+    silent = series.audio_rms <= SILENCE_RMS_MAX  # NaN, no audio, is never silent
+
+    junk_runs = []
+
+    for clip_name, junk_mask, min_seconds in (
+        ("Black", black, BLANK_MIN_SECONDS),
+        ("Blank", flat & ~black, BLANK_MIN_SECONDS),
+        ("Silence", silent & ~flat, SILENCE_MIN_SECONDS),
+    ):
+        for run_start, run_end in _Runs(
+            junk_mask, max(1, round(min_seconds * series.frame_rate))
+        ):
+            junk_runs.append((run_start, run_end, clip_name))
+
+    scene_cuts = Scene_Cuts(series)
+    snap_frames = round(SCENE_SNAP_SECONDS * series.frame_rate)
+
+    def _snap(frame_num: int) -> int:
+        """Moves a frame onto the closest scene change within snap_frames of it"""
+        if len(scene_cuts) == 0:
+            return frame_num
+
+        cut_index = int(np.searchsorted(scene_cuts, frame_num))
+        closest = min(
+            scene_cuts[max(0, cut_index - 1) : cut_index + 1],
+            key=lambda scene_cut: abs(int(scene_cut) - frame_num),
+        )
+
+        if abs(int(closest) - frame_num) > snap_frames:
+            return frame_num
+
+        return int(closest)
+
+    # Junk that touches or overlaps, black fading to blue say, is one edit point
+    edit_points: list[tuple[int, int, str]] = []
+
+    for run_start, run_end, clip_name in sorted(junk_runs):
+        mark_in = _snap(run_start)
+        mark_out = max(mark_in, _snap(run_end + 1) - 1)
+
+        if edit_points and mark_in <= edit_points[-1][1] + 1:
+            edit_points[-1] = (
+                edit_points[-1][0],
+                max(edit_points[-1][1], mark_out),
+                edit_points[-1][2],
+            )
+        else:
+            edit_points.append((mark_in, mark_out, clip_name))
+
+    return edit_points
@@ -64,6 +64,12 @@ NTSC_FRAME_RATE: Final[float] = 30000 / 1001
 NTSC_FIELD_RATE: Final[float] = 60000 / 1001
 AUDIO_BITRATE: Final[int] = 192  # kbps
 AVERAGE_BITRATE: Final[int] = 5000  # 5500  # kilobits/sec
+DVD_MAX_BITRATE: Final[int] = 9800  # kbps, the DVD peak for video and audio together
+DVD_MAX_VIDEO_BITRATE: Final[int] = 9000  # kbps, the VOB encoder video peak
+DRAFT_VIDEO_QSCALE: Final[int] = 4  # Draft encode mpeg2 quantiser, 2 best - 31 worst
+DVD_VBV_BUFFER_SIZE: Final[int] = 1835008  # bits, the DVD video buffer verifier size
+CHUNK_ENCODE_MIN_DURATION: Final[int] = 1200  # seconds, shorter titles are not chunked
+CHUNK_ENCODE_SECONDS: Final[int] = 300  # seconds, the length each chunk aims for
 SINGLE_SIDED_DVD_SIZE: Final[int] = 40258730  # kb ~ 4.7GB DVD5
 DOUBLE_SIDED_DVD_SIZE: Final[int] = 72453177  # kb ~ 8.5GB DVD9
 BLUERAY_ARCHIVE_SIZE: Final[str] = "25GB"
@@ -114,8 +120,12 @@ SHELVE_FILE_EXTNS = ("dir", "dat", "bak", "project_files", "dvdmenu")
 VIDEO_FILE_EXTNS = ("mp4", "avi", "mkv", "vob",'mod','mov','webm',"m4v","3gp",
                         "3g2", "mj2","mkv","mpg","mpeg","ts", "m2ts", "mts","qt",
                         "wmv", "asf","flv","f4v","ogg","ogv","rm", "rmvb","divx","mxf",
-                        "dv","mts")
+                        "dv","mts","ffconcat")
 # fmt: on
+# Virtual video files, cuts assembled as a concat demuxer playlist that reads the source in place
+FFCONCAT_EXTN: Final[str] = "ffconcat"
+# Containers whose timestamp seeks can land off target, so an input side -ss is verified before it is trusted
+UNRELIABLE_SEEK_EXTNS: Final[tuple[str, ...]] = ("m2ts", "mod", "mts", "tod", "ts")
 tool_app_folder: Final[str] = (
     f"{executable_folder}{file_sep}tool_apps{file_sep}usr{file_sep}bin{file_sep}"
 )
@@ -135,6 +145,11 @@ GENISOIMAGE: Final[str] = f"{tool_app_folder}genisoimage"
 ICON_PATH: Final[str] = f"{executable_folder}{file_sep}icons"
 
 # Database tables
+COMMAND_METRICS: Final[str] = "command_metrics"
+EDIT_CUTS: Final[str] = "edit_cuts"
+KEYFRAME_INDEX: Final[str] = "keyframe_index"
+PROBE_CACHE: Final[str] = "probe_cache"
+PROBE_PROFILES: Final[str] = "probe_profiles"
 PRODUCT_LINE: Final[str] = "product_line"
 
 # Database Setting Keys
@@ -153,11 +168,17 @@ BUTTON_FONT_POINT_SIZE_DBK: Final[str] = "button_font_point_size"
 BUTTONS_ACROSS_DBK: Final[str] = "buttons_across"
 BUTTONS_PER_PAGE_DBK: Final[str] = "buttons_per_page"
 
+COMMAND_METRICS_DBK: Final[str] = "command_metrics"
+
 DISPLAY_FILE_NAMES_DBK: Final[str] = "display_file_names"
 
 DEFAULT_PROJECT_NAME_DBK: Final[str] = "Default"
 DEFAULT_DVD_LAYOUT_NAME_DBK: Final[str] = "DVD 1"
 DVD_BUILD_FOLDER_DBK: Final[str] = "dvd_build_folder"
+DVD_DRAFT_ENCODE_DBK: Final[str] = "dvd_draft_encode"
+DVD_CHUNKED_ENCODE_DBK: Final[str] = "dvd_chunked_encode"
+
+EDIT_PROXIES_DBK: Final[str] = "edit_proxies"
 
 DVD_INSERT_TITLE_BACKGROUND_COLOUR_DBK: Final[str] = "dvd_insert_title_background_color"
 DVD_INSERT_TITLE_BACKGROUND_TRANSPARENCY_DBK: Final[str] = (
@@ -220,6 +241,14 @@ EDIT_FOLDER_NAME: Final[str] = "edits"
 TRANSCODE_FOLDER_NAME: Final[str] = "transcodes"
 DVD_BUILD_FOLDER_NAME: Final[str] = f"{PROGRAM_NAME} DVD Builder"
 VIDEO_EDITOR_FOLDER_NAME: Final[str] = f"{PROGRAM_NAME} Video Editor"
+# The cache folders are in the video editor folder
+RENDER_CACHE_FOLDER_NAME: Final[str] = "render_cache"
+FILMSTRIP_CACHE_FOLDER_NAME: Final[str] = "filmstrip_cache"
+ANALYSIS_CACHE_FOLDER_NAME: Final[str] = "analysis_cache"
+PROXY_CACHE_FOLDER_NAME: Final[str] = "proxy_cache"
+PASSLOG_CACHE_FOLDER_NAME: Final[str] = "passlog_cache"
+COMPLEXITY_CACHE_FOLDER_NAME: Final[str] = "complexity_cache"
+LOUDNESS_CACHE_FOLDER_NAME: Final[str] = "loudness_cache"
 PEOPLE_TRAILER_FOLDER_NAME: Final[str] = "people_trailer"
 
 # SQL Shelf keys
@@ -20,8 +20,10 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import dataclasses
 import functools
 import json
-from typing import Callable, cast, Literal, Final
+import sqlite3
+from typing import Callable, cast, Iterable, Literal, Final
 
+import platformdirs
 import PySide6.QtCore as qtC
 import PySide6.QtGui as qtG
 
@@ -33,10 +35,14 @@ import QTPYGUI.sqldb as sqldb
 import sys_consts
 import QTPYGUI.utils as utils
 from background_task_manager import Task_QManager, Task_Dispatcher, Unpack_Result_Tuple
-from break_circular import Task_Def
+from break_circular import PRIORITY_BACKGROUND, Cancel_Task, Task_Def
 from dvdarch_utils import Get_File_Encoding_Info
 from file_renamer_popup import File_Renamer_Popup
+from filmstrip_cache import FILMSTRIP_THUMB_HEIGHT, Filmstrip, Filmstrip_Cache
+from frame_server import Frame_Server
 from person_trailer_popup import Person_Trailer_Popup
+from proxy_cache import Proxy_Cache
+from scene_analysis import Analyse_Video, Analysis_Cache, Propose_Edit_Points
 from sys_config import (
     DVD_Archiver_Base,
     Video_Data,
@@ -46,26 +52,42 @@ from video_file_picker import Video_File_Picker_Popup
 
 DEBUG: bool = False
 CUT_PREFIX: Final[str] = "VE_CT"
+FILMSTRIP_PREFIX: Final[str] = "VE_FS"
+ANALYSIS_PREFIX: Final[str] = "VE_AN"
+FILMSTRIP_DISPLAY_HEIGHT: Final[int] = 40  # Pixels, the filmstrip under the slider
 EDIT_LIST_EXTENSION: Final[str] = "edit_list_txt"
 
 # Cut Oprion Constants.
 DELETE_SEGMENTS = "Delete_Segments"
 AS_A_SINGLE_FILE = "As_A_Single_File"
+AS_A_PLAYLIST = "As_A_Playlist"
 AS_INDIVIDUAL_FILES = "As_Individual_Files"
 
 
+class Frame_Ready_Signals(qtC.QObject):
+    """Hands the frames the frame server decodes on its worker thread over to the GUI thread"""
+
+    # Frame_Server, frame number, result, RGB24 frame
+    frame_ready = qtC.Signal(object, int, int, object)
+
+
 @dataclasses.dataclass(slots=True)
 class Edit_List:
     """
     Stores, updates, and deletes the edit list.
 
+    Edit cuts are rows of the edit_cuts table, keyed by file path, project, layout and cut index. The global edit
+    cuts of a file have an empty project and layout. Only the rows of the file being edited are read or written,
+    each change being a single transaction.
+
     Attributes:
         _error_message (str):  Stores the last error message.
         _error_code (int): Stores the last error code (0 for success, non-zero for error).
         _archive_folder (str):  The folder where archived videos are stored.
         _db_settings (sqldb.App_Settings):  An instance of the application settings database class.
         _json_edit_cuts_file (str):  The name of the JSON file used to store edit cuts (currently unused & will ve removed in future).
-        _video_shelf_name (Final[str]): The name of the SQL Shelf used to store video cut data.
+        _video_shelf_name (Final[str]): The name of the SQL Shelf that held video cut data before the edit_cuts table.
+        _app_database (sqldb.SQLDB | None): The application database holding the edit_cuts table, once opened.
     """
 
     _error_message: str = ""
@@ -75,6 +97,7 @@ class Edit_List:
     _db_settings: sqldb.App_Settings = sqldb.App_Settings(sys_consts.PROGRAM_NAME)
     _json_edit_cuts_file: str = "edit_cuts"
     _video_shelf_name: Final[str] = sys_consts.VIDEO_CUTTER_SHELF
+    _app_database: sqldb.SQLDB | None = None
 
     def __post_init__(self):
         if self._db_settings.setting_exist(sys_consts.ARCHIVE_FOLDER_DBK):
@@ -84,6 +107,274 @@ class Edit_List:
 
         return None
 
+    def _db_get(self) -> tuple[int, str, sqldb.SQLDB | None]:
+        """
+        Gets the application database, creating the edit_cuts table and migrating the video cutter shelf into it
+        the first time
+
+        Returns:
+            tuple[int, str, sqldb.SQLDB | None]:
+                - arg 1: If the status code is 1, the operation was successful otherwise it failed.
+                - arg 2: If the status code is -1, an error occurred, and the message provides details.
+                - arg 3: The database or None if it could not be opened
+        """
+        if self._app_database is not None:
+            return 1, "", self._app_database
+
+        file_handler = file_utils.File()
+        data_path = platformdirs.user_data_dir(sys_consts.PROGRAM_NAME)
+
+        if not file_handler.path_exists(data_path):
+            file_handler.make_dir(data_path)
+
+            if not file_handler.path_exists(data_path):
+                self._error_message = (
+                    f"Failed To Create {sys_consts.PROGRAM_NAME} Data Folder"
+                )
+                self._error_code = -1
+                return -1, self._error_message, None
+
+        app_database = sqldb.SQLDB(
+            appname=sys_consts.PROGRAM_NAME,
+            dbpath=data_path,
+            dbfile=sys_consts.PROGRAM_NAME,
+            suffix=".db",
+            dbpassword="666evil",
+        )
+
+        if app_database.get_error_status().code == -1:
+            self._error_message = app_database.get_error_status().message
+            self._error_code = -1
+            return -1, self._error_message, None
+
+        if not app_database.table_exists(sys_consts.EDIT_CUTS):
+            # The primary key index serves every lookup, all of which are by file path, project and layout
+            edit_cuts_def = (
+                sqldb.ColDef(
+                    name="file_path",
+                    description="Path Of The Video File",
+                    data_type=sqldb.SQL.TEXT,
+                    primary_key=True,
+                ),
+                sqldb.ColDef(
+                    name="project",
+                    description="Project Name, Empty For The Global Edit Cuts",
+                    data_type=sqldb.SQL.TEXT,
+                    primary_key=True,
+                ),
+                sqldb.ColDef(
+                    name="layout",
+                    description="DVD Layout Name",
+                    data_type=sqldb.SQL.TEXT,
+                    primary_key=True,
+                ),
+                sqldb.ColDef(
+                    name="cut_index",
+                    description="Position Of The Cut In The Edit List",
+                    data_type=sqldb.SQL.INTEGER,
+                    primary_key=True,
+                ),
+                sqldb.ColDef(
+                    name="mark_in",
+                    description="Mark In Frame",
+                    data_type=sqldb.SQL.INTEGER,
+                ),
+                sqldb.ColDef(
+                    name="mark_out",
+                    description="Mark Out Frame",
+                    data_type=sqldb.SQL.INTEGER,
+                ),
+                sqldb.ColDef(
+                    name="clip_name",
+                    description="Clip Name",
+                    data_type=sqldb.SQL.TEXT,
+                ),
+            )
+
+            if (
+                app_database.table_create(
+                    table_name=sys_consts.EDIT_CUTS, col_defs=edit_cuts_def
+                )
+                == -1
+            ):
+                self._error_message = app_database.get_error_status().message
+                self._error_code = -1
+                app_database.disconnect()
+                return -1, self._error_message, None
+
+        result, message = self._migrate_edit_cuts_shelf(app_database)
+
+        if result == -1:
+            app_database.disconnect()
+            return -1, message, None
+
+        self._app_database = app_database
+
+        return 1, "", app_database
+
+    def _migrate_edit_cuts_shelf(self, app_database: sqldb.SQLDB) -> tuple[int, str]:
+        """
+        Moves the edit cuts held in the video cutter SQL shelf into the edit_cuts table and empties the shelf.
+        Existing rows are kept, so a migration interrupted before the shelf is emptied can safely run again.
+        TODO Remove in some future version
+
+        Args:
+            app_database (sqldb.SQLDB): The application database holding the edit_cuts table
+
+        Returns:
+            tuple[int,str]:
+                - arg 1: error_code
+                - arg 2: error message
+        """
+        assert isinstance(app_database, sqldb.SQLDB), (
+            f"{app_database=}. Must be an instance of sqldb.SQLDB"
+        )
+
+        sql_shelf = sqldb.SQL_Shelf(db_name=sys_consts.PROGRAM_NAME)
+
+        if sql_shelf.error.code == -1:
+            return -1, sql_shelf.error.message
+
+        shelf_dict = sql_shelf.open(shelf_name=self._video_shelf_name)
+
+        if sql_shelf.error.code == -1:
+            return -1, sql_shelf.error.message
+
+        if not shelf_dict:
+            return 1, ""
+
+        edit_cut_rows = []
+
+        for file_path, edit_dict in shelf_dict.items():
+            edit_lists = [("", edit_dict.get("edit_cuts", ()))]
+            edit_lists.extend(
+                edit_dict.get("user_data", {}).get("project_edit_cuts", {}).items()
+            )
+
+            for project, edit_cuts in edit_lists:
+                edit_cut_rows.extend(
+                    (file_path, project, "", cut_index, mark_in, mark_out, clip_name)
+                    for cut_index, (mark_in, mark_out, clip_name) in enumerate(
+                        edit_cuts
+                    )
+                )
+
+        if not utils.Is_Complied():
+            print(
+                f" Migrating {len(shelf_dict)} Files Edit Points In [{self._video_shelf_name}] To The"
+                f" {sys_consts.EDIT_CUTS} Table"
+            )
+
+        try:
+            with app_database.get_connection as connection:
+                connection.executemany(
+                    f"INSERT OR IGNORE INTO {sys_consts.EDIT_CUTS}"
+                    " (file_path, project, layout, cut_index, mark_in, mark_out, clip_name)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    edit_cut_rows,
+                )
+        except sqlite3.Error as e:
+            return -1, f"Failed To Migrate Edit Cuts: {e}"
+
+        return sql_shelf.update(shelf_name=self._video_shelf_name, shelf_data={})
+
+    @staticmethod
+    def _select_edit_cuts(
+        connection: sqlite3.Connection, file_path: str, project: str, layout: str
+    ) -> tuple[tuple[int, int, str], ...]:
+        """
+        Selects the edit cuts of a video file for a project and layout, in edit list order
+
+        Args:
+            connection (sqlite3.Connection): The application database connection
+            file_path (str): The path of the video file.
+            project (str): The project name, empty for the global edit cuts
+            layout (str): The DVD layout name
+
+        Returns:
+            tuple[tuple[int, int, str], ...]: The edit cut tuples (mark_in,mark_out,clip_name)
+        """
+        return tuple(
+            connection.execute(
+                f"SELECT mark_in, mark_out, clip_name FROM {sys_consts.EDIT_CUTS}"
+                " WHERE file_path = ? AND project = ? AND layout = ? ORDER BY cut_index",
+                (file_path, project, layout),
+            ).fetchall()
+        )
+
+    @staticmethod
+    def _upsert_edit_cuts(
+        connection: sqlite3.Connection,
+        file_path: str,
+        project: str,
+        layout: str,
+        file_cuts: Iterable[tuple[int, int, str]],
+    ) -> None:
+        """
+        Makes the edit cuts of a video file for a project and layout the given cuts. Only the rows that change are
+        written and those past the end of the new edit list are deleted. The caller owns the transaction
+
+        Args:
+            connection (sqlite3.Connection): The application database connection
+            file_path (str): The path of the video file.
+            project (str): The project name, empty for the global edit cuts
+            layout (str): The DVD layout name
+            file_cuts (Iterable[tuple[int, int, str]]): The edit cut tuples (mark_in,mark_out,clip_name)
+        """
+        file_cuts = tuple(file_cuts)
+
+        connection.executemany(
+            f"INSERT INTO {sys_consts.EDIT_CUTS}"
+            " (file_path, project, layout, cut_index, mark_in, mark_out, clip_name)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT (file_path, project, layout, cut_index) DO UPDATE SET"
+            " mark_in = excluded.mark_in, mark_out = excluded.mark_out, clip_name = excluded.clip_name"
+            " WHERE (mark_in, mark_out, clip_name)"
+            " IS NOT (excluded.mark_in, excluded.mark_out, excluded.clip_name)",
+            [
+                (file_path, project, layout, cut_index, mark_in, mark_out, clip_name)
+                for cut_index, (mark_in, mark_out, clip_name) in enumerate(file_cuts)
+            ],
+        )
+        connection.execute(
+            f"DELETE FROM {sys_consts.EDIT_CUTS}"
+            " WHERE file_path = ? AND project = ? AND layout = ? AND cut_index >= ?",
+            (file_path, project, layout, len(file_cuts)),
+        )
+
+        return None
+
+    @staticmethod
+    def _project_cuts_exist(
+        connection: sqlite3.Connection, file_path: str, project: str, layout: str = ""
+    ) -> bool:
+        """
+        Checks if a video file has edit cuts of its own for a project
+
+        Args:
+            connection (sqlite3.Connection): The application database connection
+            file_path (str): The path of the video file.
+            project (str): The project name, empty checks for any project
+            layout (str): The DVD layout name, only checked with a project
+
+        Returns:
+            bool: True if the project edit cuts exist, otherwise False
+        """
+        if project:
+            sql_statement = (
+                f"SELECT 1 FROM {sys_consts.EDIT_CUTS}"
+                " WHERE file_path = ? AND project = ? AND layout = ? LIMIT 1"
+            )
+            sql_args = (file_path, project, layout)
+        else:
+            sql_statement = (
+                f"SELECT 1 FROM {sys_consts.EDIT_CUTS}"
+                " WHERE file_path = ? AND project != '' LIMIT 1"
+            )
+            sql_args = (file_path,)
+
+        return connection.execute(sql_statement, sql_args).fetchone() is not None
+
     def delete_edit_cuts(
         self,
         file_path: str,
@@ -91,7 +382,8 @@ class Edit_List:
         layout: str,
     ) -> tuple[int, str]:
         """
-        Deletes all edit cuts associated with the given file that are stored in the edit cuts SQL Shelve
+        Deletes the project edit cuts of the given file. If the project has none, or it was the file's last project
+        with edit cuts, all the file's edit cuts are deleted
 
         Args:
             file_path (str): The path of the video file.
@@ -111,45 +403,32 @@ class Edit_List:
         self._error_message = ""
         self._error_code = 1
 
-        sql_shelf = sqldb.SQL_Shelf(db_name=sys_consts.PROGRAM_NAME)
-        self._error_message = sql_shelf.error.message
-        self._error_code = sql_shelf.error.code
-
-        if sql_shelf.error.code == -1:
-            return -1, sql_shelf.error.message
+        result, message, app_database = self._db_get()
 
-        shelf_dict = sql_shelf.open(shelf_name=sys_consts.VIDEO_CUTTER_SHELF)
-        self._error_message = sql_shelf.error.message
-        self._error_code = sql_shelf.error.code
-
-        if sql_shelf.error.code == -1:
-            return -1, sql_shelf.error.message
-
-        if file_path in shelf_dict:
-            edit_cuts = shelf_dict[file_path]
-            if (
-                "user_data" in edit_cuts
-                and "project_edit_cuts" in edit_cuts["user_data"]
-                and project in edit_cuts["user_data"]["project_edit_cuts"]
-            ):
-                edit_cuts["user_data"]["project_edit_cuts"].pop(project)
-
-                if edit_cuts["user_data"]["project_edit_cuts"]:
-                    shelf_dict[file_path] = edit_cuts
-                else:
-                    shelf_dict.pop(file_path)
-            else:
-                shelf_dict.pop(file_path)
+        if result == -1:
+            return -1, message
 
-            result, message = sql_shelf.update(
-                shelf_name=sys_consts.VIDEO_CUTTER_SHELF, shelf_data=shelf_dict
-            )
+        try:
+            with app_database.get_connection as connection:
+                if project and self._project_cuts_exist(
+                    connection, file_path, project, layout
+                ):
+                    connection.execute(
+                        f"DELETE FROM {sys_consts.EDIT_CUTS}"
+                        " WHERE file_path = ? AND project = ? AND layout = ?",
+                        (file_path, project, layout),
+                    )
 
-            self._error_message = message
-            self._error_code = result
+                    if self._project_cuts_exist(connection, file_path, ""):
+                        return 1, ""
 
-            if sql_shelf.error.code == -1:
-                return -1, sql_shelf.error.message
+                connection.execute(
+                    f"DELETE FROM {sys_consts.EDIT_CUTS} WHERE file_path = ?",
+                    (file_path,),
+                )
+        except sqlite3.Error as e:
+            self._error_message = f"Failed To Delete Edit Cuts: {e}"
+            self._error_code = -1
 
         return self._error_code, self._error_message
 
@@ -179,32 +458,20 @@ class Edit_List:
             f"{project=}. Must not be empty if {layout=} is provided"
         )
 
-        sql_shelf = sqldb.SQL_Shelf(db_name=sys_consts.PROGRAM_NAME)
-        self._error_message = sql_shelf.error.message
-        self._error_code = sql_shelf.error.code
-
-        if sql_shelf.error.code == -1:
-            return -1, sql_shelf.error.message, ""
-
-        shelf_dict = sql_shelf.open(shelf_name=sys_consts.VIDEO_CUTTER_SHELF)
-        self._error_message = sql_shelf.error.message
-        self._error_code = sql_shelf.error.code
-
-        if sql_shelf.error.code == -1:
-            return -1, sql_shelf.error.message, ""
+        result, message, app_database = self._db_get()
 
-        if file_path in shelf_dict:
-            edit_cuts = shelf_dict[file_path]
+        if result == -1:
+            return -1, message, ""
 
-            if (
-                project
-                and "user_data" in edit_cuts
-                and "project_edit_cuts" in edit_cuts["user_data"]
+        try:
+            if project and self._project_cuts_exist(
+                app_database.get_connection, file_path, project, layout
             ):
-                project_edit_cuts = edit_cuts["user_data"]["project_edit_cuts"]
-
-                if project in project_edit_cuts:
-                    return 1, "", "project"
+                return 1, "", "project"
+        except sqlite3.Error as e:
+            self._error_message = f"Failed To Read Edit Cuts: {e}"
+            self._error_code = -1
+            return -1, self._error_message, ""
 
         return 1, "", "global"
 
@@ -235,54 +502,42 @@ class Edit_List:
         )
         assert isinstance(combine, bool), f"{combine=}. Must be bool"
 
-        sql_shelf = sqldb.SQL_Shelf(db_name=sys_consts.PROGRAM_NAME)
-        self._error_message = sql_shelf.error.message
-        self._error_code = sql_shelf.error.code
-
-        if sql_shelf.error.code == -1:
-            return -1, sql_shelf.error.message, ()
-
-        shelf_dict = sql_shelf.open(shelf_name=sys_consts.VIDEO_CUTTER_SHELF)
-        self._error_message = sql_shelf.error.message
-        self._error_code = sql_shelf.error.code
+        result, message, app_database = self._db_get()
 
-        if sql_shelf.error.code == -1:
-            return -1, sql_shelf.error.message, ()
+        if result == -1:
+            return -1, message, ()
 
-        if file_path in shelf_dict:
-            edit_dict = shelf_dict[file_path]
+        try:
+            with app_database.get_connection as connection:
+                project_edit_list = self._select_edit_cuts(
+                    connection, file_path, project, layout
+                )
 
-            if (
-                "user_data" in edit_dict
-                and "project_edit_cuts" in edit_dict["user_data"]
-            ):
-                project_edit_cuts = edit_dict["user_data"]["project_edit_cuts"]
-                if project in project_edit_cuts:
-                    project_edit_list = project_edit_cuts.pop(project)
+                if not project or not project_edit_list:
+                    return 1, "", ()
 
-                    if combine:  # Combine Project and Global edit cut lists
-                        edit_dict["edit_cuts"] = tuple(
-                            set(edit_dict["edit_cuts"]) | set(project_edit_list)
+                if combine:  # Combine Project and Global edit cut lists
+                    edit_cuts = tuple(
+                        sorted(
+                            set(self._select_edit_cuts(connection, file_path, "", ""))
+                            | set(project_edit_list)
                         )
-                    else:  # Make the project edit cuts the global edit cuts
-                        edit_dict["edit_cuts"] = project_edit_list
-
-                    shelf_dict[file_path] = edit_dict
-
-                    result, message = sql_shelf.update(
-                        shelf_name=sys_consts.VIDEO_CUTTER_SHELF, shelf_data=shelf_dict
                     )
+                else:  # Make the project edit cuts the global edit cuts
+                    edit_cuts = project_edit_list
+
+                self._upsert_edit_cuts(connection, file_path, "", "", edit_cuts)
+                connection.execute(
+                    f"DELETE FROM {sys_consts.EDIT_CUTS}"
+                    " WHERE file_path = ? AND project = ? AND layout = ?",
+                    (file_path, project, layout),
+                )
+        except sqlite3.Error as e:
+            self._error_message = f"Failed To Update Edit Cuts: {e}"
+            self._error_code = -1
+            return -1, self._error_message, ()
 
-                    self._error_message = message
-                    self._error_code = result
-
-                    if sql_shelf.error.code == -1:
-                        return -1, message, ()
-
-                    return self.read_edit_cuts(
-                        file_path=file_path, project="", layout=layout
-                    )
-        return 1, "", ()
+        return self.read_edit_cuts(file_path=file_path, project="", layout=layout)
 
     def read_edit_cuts(
         self,
@@ -291,7 +546,8 @@ class Edit_List:
         layout: str,
     ) -> tuple[int, str, tuple[tuple[int, int, str], ...]]:
         """
-        Read edit cuts for a video file from a JSON file.
+        Read edit cuts for a video file. The project edit cuts are returned if there are any, otherwise the global
+        edit cuts
 
         Args:
             file_path (str): The path of the video file.
@@ -312,50 +568,32 @@ class Edit_List:
             f"{project=}. Must not be empty if {layout=} is provided"
         )
 
-        sql_shelf = sqldb.SQL_Shelf(db_name=sys_consts.PROGRAM_NAME)
-        self._error_message = sql_shelf.error.message
-        self._error_code = sql_shelf.error.code
-
-        if sql_shelf.error.code == -1:
-            return -1, sql_shelf.error.message, ()
-
-        shelf_dict = sql_shelf.open(shelf_name=sys_consts.VIDEO_CUTTER_SHELF)
-        self._error_message = sql_shelf.error.message
-        self._error_code = sql_shelf.error.code
-
-        if sql_shelf.error.code == -1:
-            return -1, sql_shelf.error.message, ()
+        result, message, app_database = self._db_get()
 
-        if file_path in shelf_dict:
-            edit_dict = shelf_dict[file_path]
+        if result == -1:
+            return -1, message, ()
 
-            # Design oversight fix
-            if "user_data" not in edit_dict:
-                edit_dict["user_data"] = {}
-            if "project_edit_cuts" not in edit_dict["user_data"]:
-                edit_dict["user_data"] = {"project_edit_cuts": {}}
-                shelf_dict[file_path] = edit_dict
+        try:
+            connection = app_database.get_connection
 
-                result, message = sql_shelf.update(
-                    shelf_name=sys_consts.VIDEO_CUTTER_SHELF, shelf_data=shelf_dict
+            if project:
+                edit_cuts = self._select_edit_cuts(
+                    connection, file_path, project, layout
                 )
 
-                self._error_message = message
-                self._error_code = result
-
-                if sql_shelf.error.code == -1:
-                    return -1, message, ()
-
-            # Back to the regular programme
-            if project:
-                project_edit_cuts = edit_dict["user_data"]["project_edit_cuts"]
+                if edit_cuts:
+                    return 1, "", edit_cuts
 
-                if project in project_edit_cuts:
-                    return 1, "", project_edit_cuts[project]
+            edit_cuts = self._select_edit_cuts(connection, file_path, "", "")
 
-            return 1, "", edit_dict["edit_cuts"]
+            if edit_cuts or self._project_cuts_exist(connection, file_path, ""):
+                return 1, "", edit_cuts
+        except sqlite3.Error as e:
+            self._error_message = f"Failed To Read Edit Cuts: {e}"
+            self._error_code = -1
+            return -1, self._error_message, ()
 
-        # Code below migrates existing JSON file edit cuts  to a SQL shelf. TODO Remove in some future version
+        # Code below migrates existing JSON file edit cuts  to the edit cuts table. TODO Remove in some future version
         if self._archive_folder:
             self._error_message = ""
             self._error_code = 1
@@ -449,24 +687,19 @@ class Edit_List:
                 if edit_cuts:
                     if not utils.Is_Complied():
                         print(
-                            f" Migrating [{file_path=}] Edit Points In [{json_cuts_file}]  To A SQL SHELF"
+                            f" Migrating [{file_path=}] Edit Points In [{json_cuts_file}]  To The"
+                            f" {sys_consts.EDIT_CUTS} Table"
                         )
-                    # Add edit_cuts to the SQL shelf
-                    shelf_dict[file_path] = {
-                        "project": project,
-                        "layout": layout,
-                        "edit_cuts": edit_cuts,
-                    }
-
-                    result, message = sql_shelf.update(
-                        shelf_name=sys_consts.VIDEO_CUTTER_SHELF, shelf_data=shelf_dict
-                    )
-
-                    self._error_message = message
-                    self._error_code = result
-
-                    if sql_shelf.error.code == -1:
-                        return -1, sql_shelf.error.message, ()
+                    # Add edit_cuts to the global edit cuts
+                    try:
+                        with app_database.get_connection as connection:
+                            self._upsert_edit_cuts(
+                                connection, file_path, "", "", edit_cuts
+                            )
+                    except sqlite3.Error as e:
+                        self._error_message = f"Failed To Migrate Edit Cuts: {e}"
+                        self._error_code = -1
+                        return -1, self._error_message, ()
 
                     return 1, "", tuple(edit_cuts)
         return 1, "", ()
@@ -478,7 +711,7 @@ class Edit_List:
         layout: str,
         file_cuts: list[tuple[int, int, str]],
     ) -> tuple[int, str]:
-        """Store files and cuts in the archive json_file.
+        """Store a file's cuts in the edit cuts table. A file's first cuts are also its global edit cuts.
 
         Args:
             file_path (str): The path of the video file that owns the cuts.
@@ -511,56 +744,32 @@ class Edit_List:
             f"{project=}. Must not be empty if {layout=} is provided"
         )
 
-        sql_shelf = sqldb.SQL_Shelf(db_name=sys_consts.PROGRAM_NAME)
-        self._error_message = sql_shelf.error.message
-        self._error_code = sql_shelf.error.code
-
-        if sql_shelf.error.code == -1:
-            return -1, sql_shelf.error.message
-
-        shelf_dict = sql_shelf.open(shelf_name=sys_consts.VIDEO_CUTTER_SHELF)
-        self._error_message = sql_shelf.error.message
-        self._error_code = sql_shelf.error.code
-
-        if sql_shelf.error.code == -1:
-            return -1, sql_shelf.error.message
+        result, message, app_database = self._db_get()
 
-        if file_path in shelf_dict:
-            edit_dict = shelf_dict[file_path]
-            edit_dict["project"] = project
-            edit_dict["layout"] = layout
-
-            if "user_data" not in edit_dict:
-                edit_dict["user_data"] = {}
-            if "project_edit_cuts" not in edit_dict["user_data"]:
-                edit_dict["user_data"] = {"project_edit_cuts": {}}
-
-        else:
-            edit_dict = {
-                "project": project,
-                "layout": layout,
-                "edit_cuts": tuple(file_cuts),
-                "user_data": {"project_edit_cuts": {}},
-            }
-
-        if project:  # Project edit cuts
-            project_edit_cuts = edit_dict["user_data"]["project_edit_cuts"]
-            project_edit_cuts[project] = tuple(file_cuts)
-            edit_dict["user_data"]["project_edit_cuts"] = project_edit_cuts
-        else:  # Global edit cuts
-            edit_dict["edit_cuts"] = tuple(file_cuts)
-
-        shelf_dict[file_path] = edit_dict
-
-        result, message = sql_shelf.update(
-            shelf_name=sys_consts.VIDEO_CUTTER_SHELF, shelf_data=shelf_dict
-        )
+        if result == -1:
+            return -1, message
 
-        self._error_message = message
-        self._error_code = result
+        try:
+            with app_database.get_connection as connection:
+                if project and (
+                    connection.execute(
+                        f"SELECT 1 FROM {sys_consts.EDIT_CUTS} WHERE file_path = ? LIMIT 1",
+                        (file_path,),
+                    ).fetchone()
+                    is None
+                ):  # New file, so these are the global edit cuts as well
+                    self._upsert_edit_cuts(connection, file_path, "", "", file_cuts)
+
+                self._upsert_edit_cuts(
+                    connection, file_path, project, layout, file_cuts
+                )
+        except sqlite3.Error as e:
+            self._error_message = f"Failed To Write Edit Cuts: {e}"
+            self._error_code = -1
+            return -1, self._error_message
 
-        if sql_shelf.error.code == -1:
-            return -1, message
+        self._error_message = ""
+        self._error_code = 1
 
         return 1, ""
 
@@ -575,6 +784,7 @@ class Video_Editor(DVD_Archiver_Base):
     display_width: int = sys_consts.PAL_SPECS.width_43
 
     # Private instance variables
+    _analysis_cancel: Cancel_Task | None = None
     _aspect_ratio: str = sys_consts.AR43
     _background_task_qmanager: Task_QManager = Task_QManager()
     _current_frame: int = -1
@@ -585,11 +795,18 @@ class Video_Editor(DVD_Archiver_Base):
     _error_message: str = ""
     _file_handler = file_utils.File()
     _file_system_init: bool = False
+    _filmstrip: Filmstrip | None = None
+    _filmstrip_cancel: Cancel_Task | None = None
+    _filmstrip_display: qtg.Label = None
     _db_settings: sqldb.App_Settings = sqldb.App_Settings(sys_consts.PROGRAM_NAME)
     _frame_rate: float = sys_consts.PAL_SPECS.frame_rate
     _frame_width: int = sys_consts.PAL_SPECS.width_43
     _frame_height: int = sys_consts.PAL_SPECS.height_43
     _frame_count: int = -1
+    _frame_server: Frame_Server | None = None
+    _frame_ready_signals: Frame_Ready_Signals | None = None
+    # The frame shown from the frame server, -1 when the media player is showing frames
+    _served_frame: int = -1
     _output_folder: str = ""
     _edit_list_scope_container: qtg.HBoxContainer = None
     _video_cutter_container: qtg.HBoxContainer = None
@@ -607,6 +824,7 @@ class Video_Editor(DVD_Archiver_Base):
     _sliding: bool = False
     _source_state = "no_media"
     _step_value: int = 1
+    _step_key_frame: bool = False
     _video_handler: qtg.Video_Player = None
     _edit_folder: str = sys_consts.EDIT_FOLDER_NAME
     _transcode_folder: str = sys_consts.TRANSCODE_FOLDER_NAME
@@ -667,6 +885,12 @@ class Video_Editor(DVD_Archiver_Base):
                 functools.partial(self._position_changed)
             )
 
+        # Made on the GUI thread, so frames emitted from the frame server's worker thread are queued to it
+        self._frame_ready_signals = Frame_Ready_Signals()
+        self._frame_ready_signals.frame_ready.connect(
+            functools.partial(self._frame_served)
+        )
+
         return None
 
     def event_handler(self, event: qtg.Action) -> None:
@@ -799,10 +1023,13 @@ class Video_Editor(DVD_Archiver_Base):
                         self._move_edit_point(up=False)
                     case "move_edit_point_up":
                         self._move_edit_point(up=True)
+                    case "propose_edit_points":
+                        self._propose_edit_points()
                     case "forward":
                         self._step_forward()
                     case "play":
                         self._sliding = True
+                        self._served_frame = -1
                         self._video_handler.play()
                     case "pause":
                         self._video_handler.pause()
@@ -832,7 +1059,7 @@ class Video_Editor(DVD_Archiver_Base):
                         ).show()
 
                     case "set_menu_image":
-                        current_frame = str(self._video_handler.current_frame())
+                        current_frame = str(self._playhead_frame())
                         if current_frame:
                             event.value_set(
                                 container_tag=event.container_tag,
@@ -874,9 +1101,11 @@ class Video_Editor(DVD_Archiver_Base):
             case qtg.Sys_Events.MOVED:
                 match event.tag:
                     case "video_slider":
-                        self._video_handler.blockSignals(True)
-                        self._seek(event.value)
-                        self._video_handler.blockSignals(False)
+                        # Scrubbing shows filmstrip thumbnails, the exact frame is shown on release
+                        if not self._filmstrip_scrub(event.value):
+                            self._video_handler.blockSignals(True)
+                            self._seek(event.value)
+                            self._video_handler.blockSignals(False)
             case qtg.Sys_Events.PRESSED:
                 match event.tag:
                     case "video_slider":
@@ -980,16 +1209,50 @@ class Video_Editor(DVD_Archiver_Base):
 
         self._set_dvd_settings()
 
-        if self._frame_count > 0:
-            self._video_handler.set_source(
-                self._video_file_input[0].video_path, self._frame_rate
+        if self._frame_server is not None:
+            self._frame_server.stop()
+            self._frame_server = None
+
+        if self._analysis_cancel is not None:
+            self._analysis_cancel.request_cancellation()
+            self._analysis_cancel = None
+
+        self._served_frame = -1
+
+        # An edit proxy keeps the frame rate and timeline of its source, so its frame numbers are the source's and
+        # the edit cuts made while playing it apply to the source unchanged
+        playback_file = (
+            Proxy_Cache().get(self._video_file_input[0].video_path)
+            or self._video_file_input[0].video_path
+        )
+
+        if self._frame_count > 0 and self._frame_width > 0 and self._frame_height > 0:
+            self._video_handler.set_source(playback_file, self._frame_rate)
+
+            # Frames are served at the size they are displayed
+            display_scale = min(
+                self.display_width / self._frame_width,
+                self.display_height / self._frame_height,
             )
+            self._frame_server = Frame_Server(
+                video_file=playback_file,
+                frame_rate=float(self._frame_rate),
+                output_width=max(2, round(self._frame_width * display_scale / 2) * 2),
+                output_height=max(2, round(self._frame_height * display_scale / 2) * 2),
+            )
+
+        self._filmstrip_load()
 
         self._source_file_label.value_set(
             f"{self._video_file_input[0].video_file}{self._video_file_input[0].video_extension}"
         )
         self._source_file_label.tooltip_set(
             f"{sys_consts.SDELIM}{self._video_file_input[0].video_path}{sys_consts.SDELIM}"
+            + (
+                " (Editing A Proxy)"
+                if playback_file != self._video_file_input[0].video_path
+                else ""
+            )
         )
 
         return None
@@ -1307,32 +1570,70 @@ class Video_Editor(DVD_Archiver_Base):
 
                 return None
 
-            (
-                assembled_path,
-                assembled_filename,
-                assembled_extension,
-            ) = self._file_handler.split_file_path(assembled_file)
+            self._add_assembled_file(assembled_file)
 
-            encoding_info = Get_File_Encoding_Info(assembled_file)
+        return None
 
-            if encoding_info.error:
-                popups.PopError(
-                    title="Error Getting Encoder Info...",
-                    message=f"{sys_consts.SDELIM}{assembled_file}{sys_consts.SDELIM}\n<{encoding_info.error}>",
-                ).show()
-                return None
+    def _playlist_file_handler(
+        self, result: int, message: str, playlist_file: str
+    ) -> None:
+        """
+        Adds the virtual video file made by dvdarch_utils.Assemble_Video_Playlist to the processed files
 
-            self._video_file_input.append(
-                Video_Data(
-                    video_folder=assembled_path,
-                    video_file=assembled_filename,
-                    video_extension=assembled_extension,
-                    encoding_info=encoding_info,
-                    video_file_settings=self._video_file_input[0].video_file_settings,
-                )
+        Args:
+            result (int): The worker result, -1 if the playlist failed
+            message (str): The worker error message
+            playlist_file (str): The ffconcat playlist file
+        """
+        assert isinstance(result, int), f"{result=}. Must be type int"
+        assert isinstance(message, str), f"{message=}. Must be type str"
+        assert isinstance(playlist_file, str), f"{playlist_file=}. Must be type str"
+
+        if result == -1:
+            popups.PopError(
+                title="Error Assembling Playlist...",
+                message=f"<{message}>",
+            ).show()
+        else:
+            self._add_assembled_file(playlist_file)
+
+        return None
+
+    def _add_assembled_file(self, assembled_file: str) -> None:
+        """
+        Appends an assembled video file to the processed files and hands them back
+
+        Args:
+            assembled_file (str): The assembled video file
+        """
+        assert isinstance(assembled_file, str), f"{assembled_file=}. Must be type str"
+
+        (
+            assembled_path,
+            assembled_filename,
+            assembled_extension,
+        ) = self._file_handler.split_file_path(assembled_file)
+
+        encoding_info = Get_File_Encoding_Info(assembled_file)
+
+        if encoding_info.error:
+            popups.PopError(
+                title="Error Getting Encoder Info...",
+                message=f"{sys_consts.SDELIM}{assembled_file}{sys_consts.SDELIM}\n<{encoding_info.error}>",
+            ).show()
+            return None
+
+        self._video_file_input.append(
+            Video_Data(
+                video_folder=assembled_path,
+                video_file=assembled_filename,
+                video_extension=assembled_extension,
+                encoding_info=encoding_info,
+                video_file_settings=self._video_file_input[0].video_file_settings,
             )
+        )
 
-            self.processed_files_callback(self._video_file_input)
+        self.processed_files_callback(self._video_file_input)
 
         return None
 
@@ -1354,6 +1655,7 @@ class Video_Editor(DVD_Archiver_Base):
                 message="Please Choose How To Assemble Clips",
                 options={
                     "As A Single File": AS_A_SINGLE_FILE,
+                    "As A Virtual File": AS_A_PLAYLIST,
                     "As Individual Files": AS_INDIVIDUAL_FILES,
                 },
             ).show()
@@ -1392,6 +1694,23 @@ class Video_Editor(DVD_Archiver_Base):
                     cut_out=False,
                 )
 
+            elif result == AS_A_PLAYLIST:
+                # Only the cut boundaries are rendered, the rest is read from the source in place
+                _, filename, _ = self._file_handler.split_file_path(
+                    self._video_file_input[0].video_path
+                )
+
+                playlist_file = self._file_handler.file_join(
+                    self._edit_folder, f"{filename}_assembled", sys_consts.FFCONCAT_EXTN
+                )
+
+                self._cut_video_with_editlist(
+                    input_file=self._video_file_input[0].video_path,
+                    output_file=playlist_file,
+                    operation=result,
+                    cut_out=False,
+                )
+
             else:
                 popups.PopMessage(
                     title="No Entries In The Edit List...",
@@ -1568,6 +1887,26 @@ class Video_Editor(DVD_Archiver_Base):
             self._progress_bar.range_set(0, len(edit_list))
             self._progress_bar.value_set(len(edit_list))
 
+        def _progress_task(
+            task_def: Task_Def, edit_list: list[tuple[int, int, str]]
+        ) -> None:
+            """
+            Counts the progress bar down as the cuts are made.
+
+            Args:
+                task_def (Task_Def): The task definition.
+                edit_list (list[tuple[int, int, str]]): The list of tuples representing the cut in/out points and cut
+                name of the video.
+            """
+            assert isinstance(task_def, Task_Def), f"{task_def=}. Must be Task_Def"
+            assert isinstance(edit_list, list), f"{edit_list=}. Must be a list"
+
+            self._progress_bar.value_set(
+                round(len(edit_list) * (1 - task_def.cargo["percentage"] / 100))
+            )
+
+            return None
+
         def _finish_task(task_def: Task_Def, temp_files: list[str]) -> None:
             """
             Finishes a task to cut a video file based on a given edit list of start and end frames.
@@ -1651,6 +1990,12 @@ class Video_Editor(DVD_Archiver_Base):
 
                     return None
 
+                elif task_def.cargo["operation"] == AS_A_PLAYLIST:
+                    self._playlist_file_handler(
+                        worker_error_no, worker_message, output_file
+                    )
+
+                    return None
                 elif task_def.cargo["operation"] == AS_INDIVIDUAL_FILES:
                     # We keep the temp files, as they are the new videos
                     self._individual_files_handler(
@@ -1701,9 +2046,11 @@ class Video_Editor(DVD_Archiver_Base):
         assert isinstance(operation, str) and operation in (
             DELETE_SEGMENTS,
             AS_A_SINGLE_FILE,
+            AS_A_PLAYLIST,
             AS_INDIVIDUAL_FILES,
         ), (
-            f"{operation=}. Must be {DELETE_SEGMENTS} | {AS_A_SINGLE_FILE} | {AS_INDIVIDUAL_FILES}"
+            f"{operation=}. Must be {DELETE_SEGMENTS} | {AS_A_SINGLE_FILE} | {AS_A_PLAYLIST} |"
+            f" {AS_INDIVIDUAL_FILES}"
         )
         assert isinstance(cut_out, bool), f"{cut_out=}. Must be a bool"
 
@@ -1735,7 +2082,8 @@ class Video_Editor(DVD_Archiver_Base):
 
         self._progress_bar.range_set(0, len(edit_list))
         self._progress_bar.value_set(len(edit_list))
-        task_list = []
+        cut_defs = []
+        task_id = "VE_VC_cuts"
 
         for cut_index, (start_frame, end_frame, clip_name) in enumerate(edit_list):
             if end_frame - start_frame <= 0:  # Probably should not happen
@@ -1763,7 +2111,8 @@ class Video_Editor(DVD_Archiver_Base):
 
             temp_files.append(temp_file)
 
-            if self._file_handler.file_exists(temp_file):
+            # A playlist never writes its cuts out, so an existing file of the same name is left alone
+            if operation != AS_A_PLAYLIST and self._file_handler.file_exists(temp_file):
                 result = self._file_handler.remove_file(temp_file)
 
                 if result == -1:
@@ -1776,81 +2125,95 @@ class Video_Editor(DVD_Archiver_Base):
                         [],
                     )
 
-            task_id = f"VE_VC_{cut_index}"
-            cut_def = dvdarch_utils.Cut_Video_Def(
-                input_file=input_file,
-                output_file=temp_file,
-                start_cut=start_frame,
-                end_cut=end_frame,
-                frame_rate=self._frame_rate,
-                tag=task_id,
+            cut_defs.append(
+                dvdarch_utils.Cut_Video_Def(
+                    input_file=input_file,
+                    output_file=temp_file,
+                    start_cut=start_frame,
+                    end_cut=end_frame,
+                    frame_rate=self._frame_rate,
+                    tag=f"{task_id}_{cut_index}",
+                )
             )
 
-            task_list.append({
-                "task_id": task_id,
-                "cut_index": cut_index,
-                "file_operation": operation,
-                "task_def": dvdarch_utils.Task_Def(
-                    task_id=task_id,
-                    task_prefix=CUT_PREFIX,
-                    worker_function=dvdarch_utils.Cut_Video,
-                    kwargs={"cut_video_def": cut_def},
-                    cargo={
-                        "operation": operation,
-                        "input_file": input_file,
-                        "temp_files": temp_files,
+        if not cut_defs:
+            return 1, "", []
+
+        # One batch task reads the source once for every cut, rather than a task per cut
+        if operation == AS_A_PLAYLIST:
+            worker_function = dvdarch_utils.Assemble_Video_Playlist
+            worker_kwargs = {"cut_video_defs": cut_defs, "playlist_file": output_file}
+        else:
+            worker_function = dvdarch_utils.Cut_Video_Batch
+            worker_kwargs = {"cut_video_defs": cut_defs}
+
+        task_def = dvdarch_utils.Task_Def(
+            task_id=task_id,
+            task_prefix=CUT_PREFIX,
+            worker_function=worker_function,
+            kwargs=worker_kwargs,
+            cargo={
+                "operation": operation,
+                "input_file": input_file,
+                "temp_files": temp_files,
+            },
+        )
+
+        Task_Dispatcher().submit_task(
+            task_def=task_def,
+            task_dispatch_methods=[
+                {
+                    "task_dispatch_name": CUT_PREFIX,
+                    "callback": "start",
+                    "operation": operation,
+                    "method": _start_task,
+                    "kwargs": {
+                        "task_def": task_def,
+                        "edit_list": edit_list,
                     },
-                ),
-            })
-
-        task_dispatcher = Task_Dispatcher()
-
-        for task_index, task_dict in enumerate(task_list):
-            task_dispatcher.submit_task(
-                task_def=task_dict["task_def"],
-                task_dispatch_methods=[
-                    {
-                        "task_dispatch_name": f"{CUT_PREFIX}_{task_index}",
-                        "callback": "start",
-                        "operation": task_dict["file_operation"],
-                        "method": _start_task,
-                        "kwargs": {
-                            "task_def": task_dict["task_def"],
-                            "edit_list": edit_list,
-                        },
+                },
+                {
+                    "task_dispatch_name": CUT_PREFIX,
+                    "callback": "progress",
+                    "operation": operation,
+                    "method": _progress_task,
+                    "kwargs": {
+                        "task_def": task_def,
+                        "edit_list": edit_list,
                     },
-                    {
-                        "task_dispatch_name": f"{CUT_PREFIX}_{task_index}",
-                        "callback": "finish",
-                        "operation": task_dict["file_operation"],
-                        "method": _finish_task,
-                        "kwargs": {
-                            "task_def": task_dict["task_def"],
-                            "temp_files": temp_files,
-                        },
+                },
+                {
+                    "task_dispatch_name": CUT_PREFIX,
+                    "callback": "finish",
+                    "operation": operation,
+                    "method": _finish_task,
+                    "kwargs": {
+                        "task_def": task_def,
+                        "temp_files": temp_files,
                     },
-                    {
-                        "task_dispatch_name": f"{CUT_PREFIX}_{task_index}",
-                        "callback": "error",
-                        "operation": task_dict["file_operation"],
-                        "method": _error_task,
-                        "kwargs": {
-                            "task_def": task_dict["task_def"],
-                        },
+                },
+                {
+                    "task_dispatch_name": CUT_PREFIX,
+                    "callback": "error",
+                    "operation": operation,
+                    "method": _error_task,
+                    "kwargs": {
+                        "task_def": task_def,
                     },
-                    {
-                        "task_dispatch_name": f"{CUT_PREFIX}_{task_index}",
-                        "callback": "abort",
-                        "operation": task_dict["file_operation"],
-                        "method": _abort_task,
-                        "kwargs": {
-                            "task_def": task_dict["task_def"],
-                        },
+                },
+                {
+                    "task_dispatch_name": CUT_PREFIX,
+                    "callback": "abort",
+                    "operation": operation,
+                    "method": _abort_task,
+                    "kwargs": {
+                        "task_def": task_def,
                     },
-                ],
-            )
+                },
+            ],
+        )
 
-            task_count += 1
+        task_count += 1
 
         return 1, "", []  # output_file_list
 
@@ -1920,11 +2283,11 @@ class Video_Editor(DVD_Archiver_Base):
         clicked_frame = int(grid_col_value.value)
 
         if clicked_frame < 0:
-            self._video_handler.seek(0)
+            self._seek(0)
         elif clicked_frame >= self._frame_count:
-            self._video_handler.seek(self._frame_count - 1)  # frame count is zero based
+            self._seek(self._frame_count - 1)  # frame count is zero based
         else:
-            self._video_handler.seek(clicked_frame)
+            self._seek(clicked_frame)
 
         return None
 
@@ -2260,6 +2623,19 @@ class Video_Editor(DVD_Archiver_Base):
         Args:
             frame (qtG.QPixmap): THe video frame to be displayed
         """
+        if self._served_frame >= 0 and self._video_handler.state() != "playing":
+            # The frame server is showing the frame, the media player frame may be off
+            return None
+
+        self._display_frame(frame)
+
+        return None
+
+    def _display_frame(self, frame: qtG.QPixmap) -> None:
+        """Displays a video frame
+        Args:
+            frame (qtG.QPixmap): The video frame to be displayed
+        """
         self._video_display.guiwidget_get.setPixmap(
             frame.scaled(
                 self.display_width, self.display_height, qtC.Qt.KeepAspectRatio
@@ -2268,6 +2644,289 @@ class Video_Editor(DVD_Archiver_Base):
 
         return None
 
+    def _filmstrip_load(self) -> None:
+        """Loads the filmstrip of the source video file, making it in a background task if it is not cached"""
+        if self._filmstrip_cancel is not None:
+            self._filmstrip_cancel.request_cancellation()
+            self._filmstrip_cancel = None
+
+        self._filmstrip = None
+        self._filmstrip_display.guiwidget_get.clear()
+
+        if not self._video_file_input or self._frame_rate <= 0:
+            return None
+
+        video_file = self._video_file_input[0].video_path
+        duration = self._video_file_input[0].encoding_info.video_duration
+
+        self._filmstrip = Filmstrip_Cache().get(video_file, FILMSTRIP_THUMB_HEIGHT)
+
+        if self._filmstrip is not None:
+            self._filmstrip_draw()
+            return None
+
+        def _filmstrip_made(task_def: Task_Def) -> None:
+            """
+            Shows the filmstrip once it is made, if its video file is still the source
+
+            Args:
+                task_def (Task_Def): The task definition.
+            """
+            assert isinstance(task_def, Task_Def), f"{task_def=}. Must be Task_Def"
+
+            if self._filmstrip_cancel is filmstrip_cancel:
+                self._filmstrip_cancel = None
+
+            if (
+                filmstrip_cancel.is_cancellation_requested()
+                or not self._video_file_input
+                or self._video_file_input[0].video_path != video_file
+            ):
+                return None
+
+            self._filmstrip = Filmstrip_Cache().get(video_file, FILMSTRIP_THUMB_HEIGHT)
+
+            if self._filmstrip is not None:
+                self._filmstrip_draw()
+
+            return None
+
+        filmstrip_cancel = Cancel_Task()
+        self._filmstrip_cancel = filmstrip_cancel
+
+        task_def = Task_Def(
+            task_id=f"{FILMSTRIP_PREFIX}_{utils.Get_Unique_Id()}",
+            task_prefix=FILMSTRIP_PREFIX,
+            worker_function=dvdarch_utils.Generate_Filmstrip,
+            kwargs={
+                "video_file": video_file,
+                "frame_rate": float(self._frame_rate),
+                "duration": float(duration),
+                "cancellation_callback": filmstrip_cancel.is_cancellation_requested,
+            },
+            priority=PRIORITY_BACKGROUND,
+        )
+
+        Task_Dispatcher().submit_task(
+            task_def=task_def,
+            task_dispatch_methods=[
+                {
+                    "task_dispatch_name": FILMSTRIP_PREFIX,
+                    "callback": callback,
+                    "operation": "filmstrip",
+                    "method": _filmstrip_made,
+                    "kwargs": {
+                        "task_def": task_def,
+                    },
+                }
+                for callback in ("finish", "error", "abort")
+            ],
+        )
+
+        return None
+
+    def _filmstrip_draw(self) -> None:
+        """Draws the filmstrip under the video slider, a thumbnail for each stretch of the video it spans"""
+        if self._filmstrip is None or self._filmstrip.thumbnail_count == 0:
+            return None
+
+        thumbnail = qtG.QPixmap()
+
+        if not thumbnail.loadFromData(self._filmstrip.thumbnail_get(0)):
+            return None
+
+        strip_width = self.display_width
+        tile_width = max(
+            1, round(thumbnail.width() * FILMSTRIP_DISPLAY_HEIGHT / thumbnail.height())
+        )
+        strip = qtG.QPixmap(strip_width, FILMSTRIP_DISPLAY_HEIGHT)
+        strip.fill(qtC.Qt.GlobalColor.black)
+
+        painter = qtG.QPainter(strip)
+
+        for tile_left in range(0, strip_width, tile_width):
+            tile_frame = round(
+                (tile_left + tile_width / 2) / strip_width * max(0, self.get_last_frame)
+            )
+
+            if thumbnail.loadFromData(self._filmstrip.thumbnail_get(tile_frame)):
+                painter.drawPixmap(
+                    qtC.QRect(tile_left, 0, tile_width, FILMSTRIP_DISPLAY_HEIGHT),
+                    thumbnail,
+                )
+
+        painter.end()
+
+        self._filmstrip_display.guiwidget_get.setPixmap(strip)
+
+        return None
+
+    def _filmstrip_scrub(self, frame: int) -> bool:
+        """
+        Shows the filmstrip thumbnail of a frame while the video slider is dragged, no decoding is needed
+
+        Args:
+            frame (int): The frame number
+
+        Returns:
+            bool: True if the thumbnail was shown, False if there is no filmstrip or the video is playing
+        """
+        assert isinstance(frame, int), f"{frame=}. Must be int"
+
+        if self._filmstrip is None or self._video_handler.state() == "playing":
+            return False
+
+        thumbnail = qtG.QPixmap()
+
+        if not thumbnail.loadFromData(self._filmstrip.thumbnail_get(frame)):
+            return False
+
+        self._current_frame = frame
+        # Holds off the media player frames until the frame is seeked on release
+        self._served_frame = frame
+        self._display_frame(thumbnail)
+        self._frame_display.value_set(frame)
+
+        return True
+
+    def _propose_edit_points(self) -> None:
+        """
+        Adds edit points for the junk in the source video file to the edit list, analysing the file in a background
+        task if it has not been analysed before
+        """
+        if not self._video_file_input or self._analysis_cancel is not None:
+            return None  # Nothing to analyse or already analysing
+
+        video_file = self._video_file_input[0].video_path
+        analysis_series = Analysis_Cache().get(video_file)
+
+        if analysis_series is not None:
+            self._add_edit_points(Propose_Edit_Points(analysis_series))
+            return None
+
+        def _analysis_progress(task_def: Task_Def) -> None:
+            """
+            Shows the progress of the analysis
+
+            Args:
+                task_def (Task_Def): The task definition.
+            """
+            assert isinstance(task_def, Task_Def), f"{task_def=}. Must be Task_Def"
+
+            self._progress_bar.value_set(round(task_def.cargo["percentage"]))
+
+            return None
+
+        def _analysis_ended(task_def: Task_Def) -> None:
+            """
+            Adds the proposed edit points once the analysis is done, if its video file is still the source
+
+            Args:
+                task_def (Task_Def): The task definition.
+            """
+            assert isinstance(task_def, Task_Def), f"{task_def=}. Must be Task_Def"
+
+            if self._analysis_cancel is analysis_cancel:
+                self._analysis_cancel = None
+
+            self._progress_bar.value_set(0)
+
+            if (
+                analysis_cancel.is_cancellation_requested()
+                or "result_tuple" not in task_def.cargo
+                or not self._video_file_input
+                or self._video_file_input[0].video_path != video_file
+            ):
+                return None
+
+            task_error_no, task_message, worker_error_no, worker_message = (
+                Unpack_Result_Tuple(task_def)
+            )
+
+            if task_error_no == -1 or worker_error_no == -1:
+                popups.PopError(
+                    title="Propose Edit Points...",
+                    message=f"Video Analysis Failed : {worker_message or task_message}",
+                ).show()
+
+                return None
+
+            analysis_series = Analysis_Cache().get(video_file)
+
+            if analysis_series is not None:
+                self._add_edit_points(Propose_Edit_Points(analysis_series))
+
+            return None
+
+        analysis_cancel = Cancel_Task()
+        self._analysis_cancel = analysis_cancel
+        self._progress_bar.range_set(0, 100)
+
+        task_def = Task_Def(
+            task_id=f"{ANALYSIS_PREFIX}_{utils.Get_Unique_Id()}",
+            task_prefix=ANALYSIS_PREFIX,
+            worker_function=Analyse_Video,
+            kwargs={
+                "video_file": video_file,
+                "cancellation_callback": analysis_cancel.is_cancellation_requested,
+            },
+            priority=PRIORITY_BACKGROUND,
+        )
+
+        Task_Dispatcher().submit_task(
+            task_def=task_def,
+            task_dispatch_methods=[
+                {
+                    "task_dispatch_name": ANALYSIS_PREFIX,
+                    "callback": callback,
+                    "operation": "analysis",
+                    "method": method,
+                    "kwargs": {
+                        "task_def": task_def,
+                    },
+                }
+                for callback, method in (
+                    ("progress", _analysis_progress),
+                    ("finish", _analysis_ended),
+                    ("error", _analysis_ended),
+                    ("abort", _analysis_ended),
+                )
+            ],
+        )
+
+        return None
+
+    def _add_edit_points(self, edit_points: list[tuple[int, int, str]]) -> None:
+        """
+        Adds edit points to the edit list, leaving out any that overlap an edit point already in it
+
+        Args:
+            edit_points (list[tuple[int, int, str]]): The mark in frame, mark out frame and clip name of each edit point
+        """
+        assert isinstance(edit_points, list), f"{edit_points=}. Must be a list"
+
+        edit_list = self._get_edit_list()
+        new_edit_points = [
+            edit_point
+            for edit_point in edit_points
+            if not any(
+                edit_point[0] <= mark_out and mark_in <= edit_point[1]
+                for mark_in, mark_out, _ in edit_list
+            )
+        ]
+
+        if not new_edit_points:
+            popups.PopMessage(
+                title="Propose Edit Points...",
+                message="No New Edit Points Were Found",
+            ).show()
+
+            return None
+
+        self._populate_edit_cuts(sorted(edit_list + new_edit_points))
+
+        return None
+
     def _populate_edit_cuts(
         self,
         edit_cuts: tuple[tuple[int, int, str], ...] | list[tuple[int, int, str]],
@@ -2311,6 +2970,9 @@ class Video_Editor(DVD_Archiver_Base):
         Args:
             frame (int): The current-media player frame.
         """
+        if self._served_frame >= 0 and self._video_handler.state() != "playing":
+            return None
+
         self._sliding = True
 
         if self._video_slider is not None:
@@ -2323,17 +2985,118 @@ class Video_Editor(DVD_Archiver_Base):
 
     def _seek(self, frame: int) -> None:
         """
-        The _seek function seeks to that frame in the video handler.
+        The _seek function seeks to that frame in the video handler. When paused the frame is shown from the frame
+        server, which is frame accurate on long GOP video, and the media player follows along for playback. Until a
+        frame the frame server has to decode arrives, the media player's frame is shown.
 
         Args:
             frame: int: Set the current frame to a specific value
 
         """
         self._current_frame = frame
+
+        if self._video_handler.state() == "playing" or not self._serve_frame(frame):
+            self._served_frame = -1
+
         self._video_handler.seek(frame)
 
         return None
 
+    def _serve_frame(self, frame: int) -> bool:
+        """
+        Shows a frame from the frame server if it is cached. Otherwise asks the frame server for it, which never
+        blocks the GUI thread, and _frame_served shows it once it is decoded
+
+        Args:
+            frame (int): The frame number
+
+        Returns:
+            bool: True if the frame was shown, False if it is on its way or the frame server could not supply it
+        """
+        assert isinstance(frame, int), f"{frame=}. Must be int"
+
+        if self._frame_server is None or frame < 0:
+            return False
+
+        frame_server = self._frame_server
+        frame_data = frame_server.frame_request(
+            frame,
+            lambda frame_num, result, _, frame_data: (
+                self._frame_ready_signals.frame_ready.emit(
+                    frame_server, frame_num, result, frame_data
+                )
+            ),
+        )
+
+        if not frame_data:
+            return False
+
+        self._show_served_frame(frame, frame_data)
+
+        return True
+
+    def _frame_served(
+        self, frame_server: Frame_Server, frame: int, result: int, frame_data: bytes
+    ) -> None:
+        """
+        Shows a frame the frame server has decoded, if the playhead is still paused on it. Runs on the GUI thread
+
+        Args:
+            frame_server (Frame_Server): The frame server that decoded the frame
+            frame (int): The frame number
+            result (int): 1 if the frame was decoded, -1 if not and the media player's frame stays
+            frame_data (bytes): The RGB24 frame
+        """
+        if (
+            result != 1
+            or frame_server is not self._frame_server
+            or frame != self._current_frame
+            or self._video_handler.state() == "playing"
+        ):
+            return None
+
+        self._show_served_frame(frame, frame_data)
+
+        return None
+
+    def _show_served_frame(self, frame: int, frame_data: bytes) -> None:
+        """
+        Shows a frame from the frame server in place of the media player's frame
+
+        Args:
+            frame (int): The frame number
+            frame_data (bytes): The RGB24 frame
+        """
+        frame_image = qtG.QImage(
+            frame_data,
+            self._frame_server.output_width,
+            self._frame_server.output_height,
+            self._frame_server.output_width * 3,
+            qtG.QImage.Format.Format_RGB888,
+        )
+
+        self._served_frame = frame
+        self._display_frame(qtG.QPixmap.fromImage(frame_image))
+
+        if self._video_slider is not None:
+            self._video_slider.value_set(frame, block_signals=True)
+
+        self._frame_display.value_set(frame)
+
+        return None
+
+    def _playhead_frame(self) -> int:
+        """
+        Returns the frame at the playhead, the frame server's frame if it is showing one
+
+        Returns:
+            int: The frame number
+        """
+        if self._served_frame >= 0 and self._video_handler.state() != "playing":
+            return self._served_frame
+
+        return self._video_handler.current_frame()
+
     def _selection_end(self, event: qtg.Action) -> None:
         """Handler method for selecting the end of a media clip.
 
@@ -2346,7 +3109,7 @@ class Video_Editor(DVD_Archiver_Base):
         )
         assert hasattr(self, "_video_handler"), "Media source not set"
 
-        frame = self._video_handler.current_frame()
+        frame = self._playhead_frame()
         end_time = dvdarch_utils.Frame_Num_To_FFMPEG_Time(frame, self._frame_rate)
 
         if self._edit_list_grid.row_count <= 0:
@@ -2381,7 +3144,7 @@ class Video_Editor(DVD_Archiver_Base):
         )
         assert hasattr(self, "_video_handler"), "Media source not set"
 
-        frame = self._video_handler.current_frame()
+        frame = self._playhead_frame()
 
         start_time = dvdarch_utils.Frame_Num_To_FFMPEG_Time(frame, self._frame_rate)
 
@@ -2442,13 +3205,16 @@ class Video_Editor(DVD_Archiver_Base):
             None.
         """
         with qtg.sys_cursor(qtg.Cursor.hourglass):
-            seek_frame = self._video_handler.current_frame() - self._step_value
+            if self._step_key_frame:
+                seek_frame = self._key_frame_step(self._playhead_frame(), forward=False)
+            else:
+                seek_frame = self._playhead_frame() - self._step_value
             if seek_frame < 0:
                 seek_frame = 0
 
             if 0 <= seek_frame < self._frame_count:
                 self._video_handler.pause()
-                self._video_handler.seek(seek_frame)
+                self._seek(seek_frame)
 
         return None
 
@@ -2464,17 +3230,66 @@ class Video_Editor(DVD_Archiver_Base):
             None.
         """
         with qtg.sys_cursor(qtg.Cursor.hourglass):
-            seek_frame = self._video_handler.current_frame() + self._step_value
+            if self._step_key_frame:
+                seek_frame = self._key_frame_step(self._playhead_frame(), forward=True)
+            else:
+                seek_frame = self._playhead_frame() + self._step_value
 
             if seek_frame >= self._frame_count:
                 seek_frame = self._frame_count - 1
 
             if 0 <= seek_frame < self._frame_count:
                 self._video_handler.pause()
-                self._video_handler.seek(seek_frame)
+                self._seek(seek_frame)
 
         return None
 
+    def _key_frame_step(self, frame: int, forward: bool) -> int:
+        """
+        Finds the next or previous keyframe from a frame using the source file's keyframe index. The index is built
+        on the first key frame step and cached, later steps are a binary search.
+
+        Args:
+            frame (int): The frame to step from
+            forward (bool): True to step to the next keyframe, False to step to the previous keyframe
+
+        Returns:
+            int: The keyframe's frame number, or the adjacent frame if there is no keyframe in that direction
+        """
+        assert isinstance(frame, int), f"{frame=}. Must be int"
+        assert isinstance(forward, bool), f"{forward=}. Must be bool"
+
+        step_frame = frame + 1 if forward else frame - 1
+
+        if not self._video_file_input or self._frame_rate <= 0:
+            return step_frame
+
+        keyframe_index = dvdarch_utils.Get_Keyframe_Index(
+            self._video_file_input[0].video_path
+        )
+
+        if keyframe_index.error:
+            return step_frame
+
+        # Stops rounding landing back on the current keyframe
+        half_frame_time = 0.5 / self._frame_rate
+        # Frames are numbered from the first keyframe, as the player does
+        origin = keyframe_index.key_times[0]
+
+        if forward:
+            key_entry = keyframe_index.key_after(
+                origin + frame / self._frame_rate + half_frame_time
+            )
+        else:
+            key_entry = keyframe_index.key_at_or_before(
+                origin + frame / self._frame_rate - half_frame_time
+            )
+
+        if key_entry == -1:
+            return step_frame
+
+        return round((keyframe_index.key_times[key_entry] - origin) * self._frame_rate)
+
     def _step_unit(self, event: qtg.Action) -> None:
         """
         Sets the value of `self._step_value` based on the value of the `event` argument.
@@ -2493,8 +3308,9 @@ class Video_Editor(DVD_Archiver_Base):
             )
 
             step_str = value.data.lower()
+            self._step_key_frame = step_str == "key"
 
-            if step_str == "frame":
+            if step_str in ("frame", "key"):
                 self._step_value = 1
             elif step_str.endswith("s"):
                 try:
@@ -2623,6 +3439,7 @@ class Video_Editor(DVD_Archiver_Base):
             """
             step_definitions = [
                 ("Frame", "frame"),
+                ("Key Frame", "key"),
                 ("0.5 Sec", "0.5s"),
                 ("1   Sec", "1s"),
                 ("5   Sec", "5s"),
@@ -2765,6 +3582,13 @@ class Video_Editor(DVD_Archiver_Base):
                 single_step=1,
             )
 
+            self._filmstrip_display = qtg.Label(
+                tag="filmstrip",
+                width=self.display_width,
+                height=FILMSTRIP_DISPLAY_HEIGHT,
+                pixel_unit=True,
+            )
+
             self._source_file_label = qtg.Label(
                 tag="source_file",
                 label="Source:",
@@ -2784,6 +3608,7 @@ class Video_Editor(DVD_Archiver_Base):
             ).add_row(
                 self._video_display,
                 self._video_slider,
+                self._filmstrip_display,
                 video_button_container,
                 self._source_file_label,
             )
@@ -2861,6 +3686,13 @@ class Video_Editor(DVD_Archiver_Base):
                     tooltip="Delete Edit Points From Video",
                     width=2,
                 ),
+                qtg.Button(
+                    icon=file_utils.App_Path("grid-2.svg"),
+                    tag="propose_edit_points",
+                    callback=self.event_handler,
+                    tooltip="Propose Edit Points For Black, Blank And Silent Stretches",
+                    width=2,
+                ),
                 qtg.Spacer(width=4),
                 qtg.Button(
                     icon=file_utils.App_Path("x.svg"),
@@ -17,11 +17,13 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+import collections
 import dataclasses
 import datetime
 import inspect
+import time
 
-from typing import cast, Final, Callable
+from typing import cast, Final, Callable, Optional
 
 import platformdirs
 
@@ -34,11 +36,18 @@ import sys_consts
 import QTPYGUI.utils as utils
 
 from background_task_manager import Task_QManager, Task_Dispatcher, Unpack_Result_Tuple
-from break_circular import Cancel_All_Tasks, Task_Def
+from break_circular import (
+    PRIORITY_BACKGROUND,
+    Cancel_All_Tasks,
+    Cancel_Task,
+    Task_Def,
+)
 from dvd_menu_configuration import DVD_Menu_Config_Popup
+from proxy_cache import Proxy_Cache, Proxy_Wanted
 from reencode_options_popup import Reencode_Options
 from sys_config import (
     DVD_Archiver_Base,
+    Encoding_Details,
     Get_Video_Editor_Folder,
     Video_Data,
     Get_Project_Files,
@@ -88,6 +97,13 @@ class Video_File_Grid(DVD_Archiver_Base):
     _transcode_complete: bool = False
     _concatenating_complete: bool = False
     _final_report_triggered: bool = False
+    _probe_cancels: set[Cancel_Task] = dataclasses.field(
+        default_factory=set
+    )  # One for each file load still running
+    _proxy_pending: collections.deque = dataclasses.field(
+        default_factory=collections.deque
+    )  # Video files waiting on an edit proxy
+    _proxy_cancel: Cancel_Task | None = None  # Set while an edit proxy is made
 
     # Constants
     VIDEO_FILE_COL: Final[str] = "video_file"
@@ -353,17 +369,29 @@ class Video_File_Grid(DVD_Archiver_Base):
             # TODO Make user configurable perhaps
             self._delete_file_from_grid(video_file_input[0].vd_id)
 
+            def _children_inserted(rejected: str) -> None:
+                """
+                Reports any assembled children files that could not be inserted
+
+                Args:
+                    rejected (str): Information about the rejected files
+                """
+                if rejected:
+                    popups.PopError(
+                        title="Video File Error...", message=rejected
+                    ).show()
+
+                return None
+
             # Insert Assembled Children Files
-            rejected = self._insert_files_into_grid(
+            self._insert_files_into_grid(
                 selected_files=[
                     video_file_data for video_file_data in video_file_input[1:]
                 ],
                 debug=False,
+                insert_finished=_children_inserted,
             )
 
-            if rejected:
-                popups.PopError(title="Video File Error...", message=rejected).show()
-
         return None
 
     def _reset_new_state(self) -> None:
@@ -689,6 +717,28 @@ class Video_File_Grid(DVD_Archiver_Base):
                         self._db_settings.setting_set(
                             sys_consts.VF_AUTO_LEVELS_DBK, event.value
                         )
+                    case "edit_proxies":
+                        self._db_settings.setting_set(
+                            sys_consts.EDIT_PROXIES_DBK, event.value
+                        )
+
+                        if event.value:
+                            col_index = self._file_grid.colindex_get(
+                                self.VIDEO_FILE_COL
+                            )
+
+                            for row in range(self._file_grid.row_count):
+                                user_data: Video_Data = self._file_grid.userdata_get(
+                                    row=row, col=col_index
+                                )
+
+                                if user_data:
+                                    self._proxy_queue(user_data)
+                        else:
+                            self._proxy_pending.clear()
+
+                            if self._proxy_cancel is not None:
+                                self._proxy_cancel.request_cancellation()
                     case "dvd_menu_configuration":
                         DVD_Menu_Config_Popup(title="DVD Menu Configuration").show()
                     case "group_files":
@@ -707,6 +757,9 @@ class Video_File_Grid(DVD_Archiver_Base):
                             return None
 
                         self.load_video_input_files(event)
+                    case "stop_file_load":
+                        for probe_cancel in self._probe_cancels:
+                            probe_cancel.request_cancellation()
                     case "remove_files":
                         self._remove_files(event)
 
@@ -857,6 +910,19 @@ class Video_File_Grid(DVD_Archiver_Base):
                 value=False,
             )
 
+        if self._db_settings.setting_exist(sys_consts.EDIT_PROXIES_DBK):
+            event.value_set(
+                container_tag="control_buttons",
+                tag="edit_proxies",
+                value=self._db_settings.setting_get(sys_consts.EDIT_PROXIES_DBK),
+            )
+        else:
+            event.value_set(
+                container_tag="control_buttons",
+                tag="edit_proxies",
+                value=False,
+            )
+
         self._display_filename = True
         if self._db_settings.setting_exist(sys_consts.DISPLAY_FILE_NAMES_DBK):
             self._display_filename = cast(
@@ -1335,9 +1401,11 @@ class Video_File_Grid(DVD_Archiver_Base):
                             task_id=f"T_RE_{video_index}_{video_data.video_path}",
                             task_prefix=operation_action,
                             worker_function=dvdarch_utils.Transcode_Mezzanine,
+                            priority=PRIORITY_BACKGROUND,
                             kwargs={
                                 "input_file": video_data.video_path,
                                 "frame_rate": video_data.encoding_info.video_frame_rate,
+                                "duration": video_data.encoding_info.video_duration,
                                 "output_folder": transcode_folder,
                                 "width": video_data.encoding_info.video_width,
                                 "height": video_data.encoding_info.video_height,
@@ -1408,6 +1476,7 @@ class Video_File_Grid(DVD_Archiver_Base):
                             task_id=f"T_RE_{video_index}_{video_data.video_path}",
                             task_prefix=operation_action,
                             worker_function=dvdarch_utils.Transcode_DV,
+                            priority=PRIORITY_BACKGROUND,
                             kwargs={
                                 "input_file": video_data.video_path,
                                 "frame_rate": video_data.encoding_info.video_frame_rate,
@@ -1476,9 +1545,11 @@ class Video_File_Grid(DVD_Archiver_Base):
                             task_id=f"T_RE_{video_index}_{video_data.video_path}",
                             task_prefix=operation_action,
                             worker_function=dvdarch_utils.Transcode_H26x,
+                            priority=PRIORITY_BACKGROUND,
                             kwargs={
                                 "input_file": video_data.video_path,
                                 "frame_rate": video_data.encoding_info.video_frame_rate,
+                                "duration": video_data.encoding_info.video_duration,
                                 "output_folder": transcode_folder,
                                 "width": video_data.encoding_info.video_width,
                                 "height": video_data.encoding_info.video_height,
@@ -2230,11 +2301,13 @@ class Video_File_Grid(DVD_Archiver_Base):
             video_file_list=video_file_list,  # Pass by ref, Encoding_Info is not loaded here
         ).show()
 
-        if video_file_list:
-            with qtg.sys_cursor(qtg.Cursor.hourglass):
-                # Performs grid cleansing
-                rejected = self._insert_files_into_grid(video_file_list)
+        def _files_inserted(rejected: str) -> None:
+            """
+            Saves the grid and reports any rejected files, once the selected files are loaded
 
+            Args:
+                rejected (str): Information about the rejected files
+            """
             if self._file_grid.row_count > 0:
                 loaded_files = []
                 for row_index in reversed(range(self._file_grid.row_count)):
@@ -2262,22 +2335,31 @@ class Video_File_Grid(DVD_Archiver_Base):
                     width=80,
                 ).show()
 
+            return None
+
+        if video_file_list:
+            # Performs grid cleansing, files needing a probe are loaded by a background task
+            self._insert_files_into_grid(
+                video_file_list, insert_finished=_files_inserted
+            )
+
         return None
 
     def _insert_files_into_grid(
         self,
         selected_files: list[Video_Data],
         debug: bool = False,
-    ) -> str:
+        insert_finished: Optional[Callable[[str], None]] = None,
+    ) -> None:
         """
-        Inserts files into the file grid widget.
+        Inserts files into the file grid widget. Files without encoding info are probed concurrently by a background
+        task and their rows are added, in selection order, as the results arrive.
 
         Args:
             selected_files (list[Video_Data]): list of video file data
             debug (bool): Whether to print debug information
-
-        Returns:
-            str: A string containing information about any rejected files.
+            insert_finished (Optional[Callable[[str], None]]): Called with a string containing information about any
+                rejected files, once every file is inserted or rejected. Defaults to None
         """
         assert isinstance(selected_files, list), (
             f"{selected_files=}.  Must be a list of Video_Data objects"
@@ -2285,11 +2367,11 @@ class Video_File_Grid(DVD_Archiver_Base):
         assert all(isinstance(item, Video_Data) for item in selected_files), (
             f"{selected_files=}.  Must be a list of Video_Data objects"
         )
+        assert callable(insert_finished) or insert_finished is None, (
+            f"{insert_finished=}. Must be a function or None"
+        )
 
-        rejected = ""
-        rows_loaded = self._file_grid.row_count
-        row_index = 0
-        video_standard = ""
+        insert_state = {"rejected": "", "video_standard": ""}
 
         # Get video_standard - PAL/NTSC
         while self._file_grid.row_count > 0:
@@ -2300,168 +2382,444 @@ class Video_File_Grid(DVD_Archiver_Base):
             if grid_video_data is None:  # The First row is invalid, so remove it
                 self._file_grid.row_delete(0)
             else:
-                video_standard = grid_video_data.encoding_info.video_standard
+                insert_state["video_standard"] = (
+                    grid_video_data.encoding_info.video_standard
+                )
                 break
 
+        # Cleanse the grid of bad data and note the files already loaded
+        grid_video_paths = set()
+
+        for check_row_index in reversed(range(self._file_grid.row_count)):
+            grid_video_data: Video_Data = self._file_grid.userdata_get(
+                row=check_row_index,
+                col=self._file_grid.colindex_get(self.VIDEO_FILE_COL),
+            )
+
+            if grid_video_data is None:  # Invalid row so remove it
+                self._file_grid.row_delete(row=int(check_row_index))
+                continue
+
+            grid_video_paths.add(grid_video_data.video_path)
+
+        pending_files: collections.deque[Video_Data] = collections.deque()
+
         for file_video_data in selected_files:
-            # Check if file already loaded in grid and cleanse the grid of bad data
-            for check_row_index in reversed(range(self._file_grid.row_count)):
-                grid_video_data: Video_Data = self._file_grid.userdata_get(
-                    row=check_row_index,
-                    col=self._file_grid.colindex_get(self.VIDEO_FILE_COL),
+            if file_video_data.video_path not in grid_video_paths:
+                grid_video_paths.add(file_video_data.video_path)
+                pending_files.append(file_video_data)
+
+        probe_paths = {
+            file_video_data.video_path
+            for file_video_data in pending_files
+            if file_video_data.encoding_info.video_tracks <= 0
+            or file_video_data.encoding_info.video_standard
+            not in (
+                sys_consts.PAL,
+                sys_consts.NTSC,
+            )
+        }
+        encoding_infos: dict[str, Encoding_Details] = {}
+        probe_state = {"files_done": 0, "start_time": time.perf_counter()}
+
+        def _insert_ready_rows(flush: bool) -> None:
+            """
+            Inserts the pending files in selection order, stopping at the first file still being probed
+
+            Args:
+                flush (bool): True if probing is over, so a file without encoding info is rejected
+            """
+            while pending_files:
+                file_video_data = pending_files[0]
+
+                if file_video_data.video_path in probe_paths:
+                    if file_video_data.video_path in encoding_infos:
+                        file_video_data.encoding_info = encoding_infos.pop(
+                            file_video_data.video_path
+                        )
+                    elif flush:
+                        pending_files.popleft()
+                        insert_state["rejected"] += (
+                            f"{sys_consts.SDELIM}{file_video_data.video_path} :"
+                            f" {sys_consts.SDELIM}Loading Stopped \n"
+                        )
+                        continue
+                    else:
+                        break
+
+                pending_files.popleft()
+                self._insert_file_row(file_video_data, insert_state, debug)
+
+            return None
+
+        def _probe_progress(task_def: Task_Def) -> None:
+            """
+            Handles a file being probed, reporting the load throughput
+
+            Args:
+                task_def (Task_Def): Task Definition object
+            """
+            assert isinstance(task_def, Task_Def), (
+                f"{task_def=}. Must be an instance of Task_Def"
+            )
+
+            probe_state["files_done"] += 1
+            files_per_second = probe_state["files_done"] / max(
+                time.perf_counter() - probe_state["start_time"], 0.001
+            )
+
+            _insert_ready_rows(flush=False)
+
+            if self._component_event_handler:
+                self._component_event_handler(
+                    sys_consts.NOTIFICATION_EVENT,
+                    f"Loaded {probe_state['files_done']} Of {len(probe_paths)} Video Files"
+                    f" {sys_consts.SDELIM}{files_per_second:.1f}{sys_consts.SDELIM} Files/s",
                 )
 
-                if grid_video_data is None:  # Invalid row so remove it
-                    self._file_grid.row_delete(row=int(check_row_index))
-                    continue
+            return None
 
-                if grid_video_data.video_path == file_video_data.video_path:
-                    break
-            else:  # File not in the grid
-                if debug and not utils.Is_Complied():
-                    print(f"DBG FNIG {file_video_data}")
+        def _probe_finished(task_def: Task_Def) -> None:
+            """
+            Handles the end of the probe task, however it ended
 
-                if (
-                    file_video_data.encoding_info.video_tracks <= 0
-                    or file_video_data.encoding_info.video_standard
-                    not in (
-                        sys_consts.PAL,
-                        sys_consts.NTSC,
-                    )
-                ):
-                    file_video_data.encoding_info = (
-                        dvdarch_utils.Get_File_Encoding_Info(file_video_data.video_path)
-                    )
+            Args:
+                task_def (Task_Def): Task Definition object
+            """
+            assert isinstance(task_def, Task_Def), (
+                f"{task_def=}. Must be an instance of Task_Def"
+            )
 
-                if file_video_data.encoding_info.error:  # Error Occurred
-                    rejected += (
-                        "File Error"
-                        f" {sys_consts.SDELIM}{file_video_data.video_path} :"
-                        f"  {file_video_data.encoding_info.error}{sys_consts.SDELIM} \n"
-                    )
-                    if debug and not utils.Is_Complied():
-                        print(f"DBG FE {file_video_data}")
-                    continue
+            _insert_ready_rows(flush=True)
 
-                if video_standard == "":  # Only happens if no rows in grid
-                    video_standard = file_video_data.encoding_info.video_standard
+            self._probe_cancels.discard(probe_cancel)
 
-                if file_video_data.encoding_info.video_standard not in (
-                    sys_consts.PAL,
-                    sys_consts.NTSC,
-                ):
-                    rejected += (
-                        f"{sys_consts.SDELIM}{file_video_data.video_path} :"
-                        f" {sys_consts.SDELIM} Is Not PAL, NTSC \n"
-                    )
-                    if debug and not utils.Is_Complied():
-                        print(f"DBG VSB {file_video_data}")
-                    continue
+            if not self._probe_cancels:  # Another file load may still be running
+                self._control_container["stop_file_load"].enable_set(False)
+                self._enable_disable_buttons(FILE_CONTROL_GROUP, True)
 
-                if file_video_data.encoding_info.video_standard != video_standard:
-                    rejected += (
-                        f"{sys_consts.SDELIM}{file_video_data.video_path} ({file_video_data.encoding_info.video_standard}) :"
-                        f" {sys_consts.SDELIM} Is Not {video_standard} The Project Video Standard  \n"
-                    )
-                    if debug and not utils.Is_Complied():
-                        print(f"DBG VSM {file_video_data}")
-                    continue
+                if self._component_event_handler:
+                    self._component_event_handler(sys_consts.NOTIFICATION_EVENT, "")
 
-                if file_video_data.encoding_info.video_tracks == 0:
-                    rejected += (
-                        f"{sys_consts.SDELIM}{file_video_data.video_path} :"
-                        f" {sys_consts.SDELIM}No Video Track \n"
-                    )
-                    if debug and not utils.Is_Complied():
-                        print(f"DBG NVT {file_video_data}")
-                    continue
+            if insert_finished is not None:
+                insert_finished(insert_state["rejected"])
 
-                if file_video_data.encoding_info.video_frame_rate not in (
-                    sys_consts.PAL_FRAME_RATE,
-                    sys_consts.PAL_FIELD_RATE,
-                    sys_consts.NTSC_FRAME_RATE,
-                    sys_consts.NTSC_FIELD_RATE,
-                    30,
-                ):
-                    rejected += (
-                        f"{sys_consts.SDELIM}{file_video_data.video_path} :"
-                        f" {sys_consts.SDELIM}Frame Rate Not Pal Or NTSC \n"
-                    )
-                    if debug and not utils.Is_Complied():
-                        print(f"DBG FRE {file_video_data}")
-                    continue
+            return None
 
-                # Set default filter settings from database
-                if (
-                    self._db_settings.setting_exist(sys_consts.VF_NORMALISE_DBK)
-                    and self._db_settings.setting_get(sys_consts.VF_NORMALISE_DBK)
-                    is not None
-                ):
-                    file_video_data.video_file_settings.normalise = (
-                        self._db_settings.setting_get(sys_consts.VF_NORMALISE_DBK)
-                    )
+        def _probe_error(task_def: Task_Def) -> None:
+            """
+            Handles the probe task failing, the files not yet probed are rejected
 
-                if (
-                    self._db_settings.setting_exist(sys_consts.VF_DENOISE_DBK)
-                    and self._db_settings.setting_get(sys_consts.VF_DENOISE_DBK)
-                    is not None
-                ):
-                    file_video_data.video_file_settings.denoise = (
-                        self._db_settings.setting_get(sys_consts.VF_DENOISE_DBK)
-                    )
+            Args:
+                task_def (Task_Def): Task Definition object
+            """
+            assert isinstance(task_def, Task_Def), (
+                f"{task_def=}. Must be an instance of Task_Def"
+            )
 
-                if (
-                    self._db_settings.setting_exist(sys_consts.VF_WHITE_BALANCE_DBK)
-                    and self._db_settings.setting_get(sys_consts.VF_WHITE_BALANCE_DBK)
-                    is not None
-                ):
-                    file_video_data.video_file_settings.white_balance = (
-                        self._db_settings.setting_get(sys_consts.VF_WHITE_BALANCE_DBK)
-                    )
+            insert_state["rejected"] += (
+                f"{sys_consts.SDELIM}Loading Failed :"
+                f" {task_def.cargo.get('message', '')}{sys_consts.SDELIM} \n"
+            )
 
-                if (
-                    self._db_settings.setting_exist(sys_consts.VF_SHARPEN_DBK)
-                    and self._db_settings.setting_get(sys_consts.VF_SHARPEN_DBK)
-                    is not None
-                ):
-                    file_video_data.video_file_settings.sharpen = (
-                        self._db_settings.setting_get(sys_consts.VF_SHARPEN_DBK)
-                    )
+            return _probe_finished(task_def)
 
-                if (
-                    self._db_settings.setting_exist(sys_consts.VF_AUTO_LEVELS_DBK)
-                    and self._db_settings.setting_get(sys_consts.VF_AUTO_LEVELS_DBK)
-                    is not None
-                ):
-                    file_video_data.video_file_settings.auto_bright = (
-                        self._db_settings.setting_get(sys_consts.VF_AUTO_LEVELS_DBK)
-                    )
+        if not probe_paths:
+            _insert_ready_rows(flush=True)
 
-                toolbox = self._get_toolbox(file_video_data)
+            if insert_finished is not None:
+                insert_finished(insert_state["rejected"])
 
-                duration = str(
-                    datetime.timedelta(
-                        seconds=file_video_data.encoding_info.video_duration
-                    )
-                ).split(".")[0]
+            return None
 
-                if debug and not utils.Is_Complied():
-                    print(f"DBG PGR {file_video_data}")
+        probe_cancel = Cancel_Task()
+        self._probe_cancels.add(probe_cancel)
+        self._enable_disable_buttons(FILE_CONTROL_GROUP, False)
+        self._control_container["stop_file_load"].enable_set(True)
+
+        task_def = Task_Def(
+            task_id=f"T_PF_{time.time_ns()}",
+            task_prefix="probe_files",
+            worker_function=dvdarch_utils.Probe_Files_Batch,
+            kwargs={
+                "video_files": [
+                    file_video_data.video_path
+                    for file_video_data in pending_files
+                    if file_video_data.video_path in probe_paths
+                ],
+                "encoding_infos": encoding_infos,  # Pass by ref, filled as files are probed
+                "cancellation_callback": probe_cancel.is_cancellation_requested,
+            },
+        )
 
-                self._populate_grid_row(
-                    row_index=rows_loaded + row_index,
-                    video_data=file_video_data,
-                    duration=duration,
+        Task_Dispatcher().submit_task(
+            task_def=task_def,
+            task_dispatch_methods=[
+                {
+                    "task_dispatch_name": "T_DN_probe_files",
+                    "callback": callback,
+                    "operation": "probe_files",
+                    "method": method,
+                    "kwargs": {
+                        "task_def": task_def,
+                    },
+                }
+                for callback, method in (
+                    ("progress", _probe_progress),
+                    ("finish", _probe_finished),
+                    ("error", _probe_error),
+                    ("abort", _probe_finished),
                 )
+            ],
+        )
 
-                self._file_grid.row_widget_set(
-                    row=rows_loaded + row_index,
-                    col=self._file_grid.colindex_get(self.SETTINGS_COL),
-                    widget=toolbox,
+        return None
+
+    def _insert_file_row(
+        self, file_video_data: Video_Data, insert_state: dict, debug: bool = False
+    ) -> None:
+        """
+        Checks a probed file is acceptable and, if so, adds it to the end of the file grid
+
+        Args:
+            file_video_data (Video_Data): The video file data, with its encoding info
+            insert_state (dict): The "rejected" files information and the project "video_standard", both updated
+            debug (bool): Whether to print debug information
+        """
+        assert isinstance(file_video_data, Video_Data), (
+            f"{file_video_data=}. Must be an instance of Video_Data"
+        )
+        assert isinstance(insert_state, dict), f"{insert_state=}. Must be a dict"
+
+        if debug and not utils.Is_Complied():
+            print(f"DBG FNIG {file_video_data}")
+
+        if file_video_data.encoding_info.error:  # Error Occurred
+            insert_state["rejected"] += (
+                "File Error"
+                f" {sys_consts.SDELIM}{file_video_data.video_path} :"
+                f"  {file_video_data.encoding_info.error}{sys_consts.SDELIM} \n"
+            )
+            if debug and not utils.Is_Complied():
+                print(f"DBG FE {file_video_data}")
+            return None
+
+        if insert_state["video_standard"] == "":  # Only happens if no rows in grid
+            insert_state["video_standard"] = (
+                file_video_data.encoding_info.video_standard
+            )
+
+        if file_video_data.encoding_info.video_standard not in (
+            sys_consts.PAL,
+            sys_consts.NTSC,
+        ):
+            insert_state["rejected"] += (
+                f"{sys_consts.SDELIM}{file_video_data.video_path} :"
+                f" {sys_consts.SDELIM} Is Not PAL, NTSC \n"
+            )
+            if debug and not utils.Is_Complied():
+                print(f"DBG VSB {file_video_data}")
+            return None
+
+        if (
+            file_video_data.encoding_info.video_standard
+            != insert_state["video_standard"]
+        ):
+            insert_state["rejected"] += (
+                f"{sys_consts.SDELIM}{file_video_data.video_path} ({file_video_data.encoding_info.video_standard}) :"
+                f" {sys_consts.SDELIM} Is Not {insert_state['video_standard']} The Project Video Standard  \n"
+            )
+            if debug and not utils.Is_Complied():
+                print(f"DBG VSM {file_video_data}")
+            return None
+
+        if file_video_data.encoding_info.video_tracks == 0:
+            insert_state["rejected"] += (
+                f"{sys_consts.SDELIM}{file_video_data.video_path} :"
+                f" {sys_consts.SDELIM}No Video Track \n"
+            )
+            if debug and not utils.Is_Complied():
+                print(f"DBG NVT {file_video_data}")
+            return None
+
+        if file_video_data.encoding_info.video_frame_rate not in (
+            sys_consts.PAL_FRAME_RATE,
+            sys_consts.PAL_FIELD_RATE,
+            sys_consts.NTSC_FRAME_RATE,
+            sys_consts.NTSC_FIELD_RATE,
+            30,
+        ):
+            insert_state["rejected"] += (
+                f"{sys_consts.SDELIM}{file_video_data.video_path} :"
+                f" {sys_consts.SDELIM}Frame Rate Not Pal Or NTSC \n"
+            )
+            if debug and not utils.Is_Complied():
+                print(f"DBG FRE {file_video_data}")
+            return None
+
+        # Set default filter settings from database
+        if (
+            self._db_settings.setting_exist(sys_consts.VF_NORMALISE_DBK)
+            and self._db_settings.setting_get(sys_consts.VF_NORMALISE_DBK) is not None
+        ):
+            file_video_data.video_file_settings.normalise = (
+                self._db_settings.setting_get(sys_consts.VF_NORMALISE_DBK)
+            )
+
+        if (
+            self._db_settings.setting_exist(sys_consts.VF_DENOISE_DBK)
+            and self._db_settings.setting_get(sys_consts.VF_DENOISE_DBK) is not None
+        ):
+            file_video_data.video_file_settings.denoise = self._db_settings.setting_get(
+                sys_consts.VF_DENOISE_DBK
+            )
+
+        if (
+            self._db_settings.setting_exist(sys_consts.VF_WHITE_BALANCE_DBK)
+            and self._db_settings.setting_get(sys_consts.VF_WHITE_BALANCE_DBK)
+            is not None
+        ):
+            file_video_data.video_file_settings.white_balance = (
+                self._db_settings.setting_get(sys_consts.VF_WHITE_BALANCE_DBK)
+            )
+
+        if (
+            self._db_settings.setting_exist(sys_consts.VF_SHARPEN_DBK)
+            and self._db_settings.setting_get(sys_consts.VF_SHARPEN_DBK) is not None
+        ):
+            file_video_data.video_file_settings.sharpen = self._db_settings.setting_get(
+                sys_consts.VF_SHARPEN_DBK
+            )
+
+        if (
+            self._db_settings.setting_exist(sys_consts.VF_AUTO_LEVELS_DBK)
+            and self._db_settings.setting_get(sys_consts.VF_AUTO_LEVELS_DBK) is not None
+        ):
+            file_video_data.video_file_settings.auto_bright = (
+                self._db_settings.setting_get(sys_consts.VF_AUTO_LEVELS_DBK)
+            )
+
+        toolbox = self._get_toolbox(file_video_data)
+        row_index = self._file_grid.row_count
+
+        duration = str(
+            datetime.timedelta(seconds=file_video_data.encoding_info.video_duration)
+        ).split(".")[0]
+
+        if debug and not utils.Is_Complied():
+            print(f"DBG PGR {file_video_data}")
+
+        self._populate_grid_row(
+            row_index=row_index,
+            video_data=file_video_data,
+            duration=duration,
+        )
+
+        self._file_grid.row_widget_set(
+            row=row_index,
+            col=self._file_grid.colindex_get(self.SETTINGS_COL),
+            widget=toolbox,
+        )
+
+        self._proxy_queue(file_video_data)
+
+        return None
+
+    def _proxy_queue(self, video_data: Video_Data) -> None:
+        """
+        Queues the making of the edit proxy of a video file, if edit proxies are on and the file is heavy enough to
+        decode that the video editor is better off with a proxy
+
+        Args:
+            video_data (Video_Data): The video file data, with its encoding info
+        """
+        assert isinstance(video_data, Video_Data), (
+            f"{video_data=}. Must be an instance of Video_Data"
+        )
+
+        if not (
+            self._db_settings.setting_exist(sys_consts.EDIT_PROXIES_DBK)
+            and self._db_settings.setting_get(sys_consts.EDIT_PROXIES_DBK)
+        ):
+            return None
+
+        if (
+            not Proxy_Wanted(video_data.encoding_info)
+            or video_data.video_path in self._proxy_pending
+            or Proxy_Cache().get(video_data.video_path)
+        ):
+            return None
+
+        self._proxy_pending.append(video_data.video_path)
+
+        if self._proxy_cancel is None:
+            self._proxy_next()
+
+        return None
+
+    def _proxy_next(self) -> None:
+        """Starts making the next queued edit proxy as a background task, one proxy at a time"""
+
+        def _proxy_finished(task_def: Task_Def) -> None:
+            """
+            Handles the end of an edit proxy task, however it ended, and moves on to the next proxy
+
+            Args:
+                task_def (Task_Def): Task Definition object
+            """
+            assert isinstance(task_def, Task_Def), (
+                f"{task_def=}. Must be an instance of Task_Def"
+            )
+
+            if "result_tuple" in task_def.cargo:
+                task_error_no, task_message, worker_error_no, worker_message = (
+                    Unpack_Result_Tuple(task_def)
                 )
 
-                row_index += 1
-        return rejected
+                if (task_error_no == -1 or worker_error_no == -1) and DEBUG:
+                    print(f"DBG Edit Proxy Failed {worker_message or task_message}")
+
+            self._proxy_cancel = None
+
+            if not self._shutdown:
+                self._proxy_next()
+
+            return None
+
+        if not self._proxy_pending:
+            return None
+
+        video_file = self._proxy_pending.popleft()
+        self._proxy_cancel = Cancel_Task()
+
+        task_def = Task_Def(
+            task_id=f"T_EP_{time.time_ns()}",
+            task_prefix="edit_proxy",
+            worker_function=dvdarch_utils.Generate_Edit_Proxy,
+            kwargs={
+                "video_file": video_file,
+                "cancellation_callback": self._proxy_cancel.is_cancellation_requested,
+            },
+            priority=PRIORITY_BACKGROUND,
+        )
+
+        Task_Dispatcher().submit_task(
+            task_def=task_def,
+            task_dispatch_methods=[
+                {
+                    "task_dispatch_name": "T_DN_edit_proxy",
+                    "callback": callback,
+                    "operation": "edit_proxy",
+                    "method": _proxy_finished,
+                    "kwargs": {
+                        "task_def": task_def,
+                    },
+                }
+                for callback in ("finish", "error", "abort")
+            ],
+        )
+
+        return None
 
     def _get_toolbox(self, video_user_data: Video_Data) -> qtg.HBoxContainer:
         """Generates a GUI toolbox for use in the grid.
@@ -2833,6 +3191,14 @@ class Video_File_Grid(DVD_Archiver_Base):
                 tooltip="Select Video Files",
                 width=2,
             ),
+            "stop_file_load": qtg.Button(
+                text="Stop Load",
+                tag="stop_file_load",
+                callback=self.event_handler,
+                tooltip="Stop Loading The Selected Video Files",
+                enabled=False,
+                width=9,
+            ),
         }
 
         button_container = qtg.HBoxContainer(
@@ -2878,6 +3244,14 @@ class Video_File_Grid(DVD_Archiver_Base):
                     callback=self.event_handler,
                 ),
             ),
+            qtg.Checkbox(
+                tag="edit_proxies",
+                text="Edit Proxies",
+                checked=False,
+                tooltip="Make Low Resolution Copies Of HD Videos For Faster Editing",
+                width=13,
+                callback=self.event_handler,
+            ),
             qtg.Spacer(width=1),
             self._control_container["dvd_menu_configuration"],
             qtg.Spacer(width=1),
@@ -2891,6 +3265,7 @@ class Video_File_Grid(DVD_Archiver_Base):
             self._control_container["move_video_file_down"],
             qtg.Spacer(width=1),
             self._control_container["remove_files"],
+            self._control_container["stop_file_load"],
             self._control_container["select_files"],
         )
 